@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+OMEN Ledger Replay Script.
+
+Streams ledger partitions as JSON lines, migrated to the current schema,
+decoding segments in parallel worker processes. Output is in sequence
+order (partition, then its -late partition, then segment/frame order).
+
+Use for backfills and schema migrations across sealed partitions.
+
+Usage:
+    python scripts/replay_ledger.py --output replay.jsonl
+    python scripts/replay_ledger.py 2026-01-30 2026-01-31 --workers 8
+    python scripts/replay_ledger.py --since 2026-01-01 --until 2026-01-31 --sealed-only
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from omen.infrastructure.ledger import LedgerReader, VersionedLedgerReader
+
+# Configure logging (stderr, so stdout stays JSON lines)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+LEDGER_DIR = os.getenv("OMEN_LEDGER_BASE_PATH", "/data/ledger")
+
+
+def select_partitions(
+    reader: LedgerReader,
+    partitions: list[str],
+    since: str | None,
+    until: str | None,
+    sealed_only: bool,
+) -> list[str]:
+    """
+    Main partitions to replay, oldest first.
+
+    -late partitions are not listed separately: replay reads each one
+    right after its main partition.
+    """
+    if partitions:
+        return sorted(partitions)
+    selected = []
+    for info in reader.list_partitions():
+        if info.is_late:
+            continue
+        if since and info.partition_date < since:
+            continue
+        if until and info.partition_date > until:
+            continue
+        if sealed_only and not info.is_sealed:
+            continue
+        selected.append(info.partition_date)
+    return selected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OMEN Ledger Replay")
+    parser.add_argument(
+        "partitions",
+        nargs="*",
+        help="Partitions to replay (YYYY-MM-DD); default: all matching --since/--until",
+    )
+    parser.add_argument("--ledger-dir", default=LEDGER_DIR, help="Ledger base path")
+    parser.add_argument("--since", help="First partition date (inclusive)")
+    parser.add_argument("--until", help="Last partition date (inclusive)")
+    parser.add_argument(
+        "--sealed-only",
+        action="store_true",
+        help="Skip partitions that are still being written",
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Output JSONL file (default: stdout)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Decoder processes (default: CPU count; 1 = in-process)",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=None,
+        help="Segments in flight (default: 2 x workers)",
+    )
+    parser.add_argument(
+        "--no-migrate",
+        action="store_true",
+        help="Emit records in their stored schema version",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip CRC verification",
+    )
+    parser.add_argument(
+        "--no-late",
+        action="store_true",
+        help="Skip -late partitions",
+    )
+
+    args = parser.parse_args()
+
+    reader = LedgerReader(args.ledger_dir)
+    partitions = select_partitions(
+        reader, args.partitions, args.since, args.until, args.sealed_only
+    )
+    if not partitions:
+        logger.info("No partitions to replay in %s", args.ledger_dir)
+        return
+
+    logger.info(
+        "Replaying %d partitions from %s with %d workers",
+        len(partitions),
+        args.ledger_dir,
+        args.workers,
+    )
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    started = time.monotonic()
+    count = 0
+    try:
+        for event in VersionedLedgerReader(reader).replay(
+            partitions,
+            include_late=not args.no_late,
+            migrate_to_current=not args.no_migrate,
+            validate=not args.no_validate,
+            workers=args.workers,
+            max_pending=args.max_pending,
+        ):
+            out.write(event.model_dump_json())
+            out.write("\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        "Replayed %d records in %.2fs (%.0f records/s)",
+        count,
+        elapsed,
+        count / elapsed if elapsed > 0 else 0.0,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,10 @@ a unified signal stream with cross-source validation.
 ENHANCED: Now uses FallbackStrategy for graceful degradation when sources fail.
 """
 
+import asyncio
+import heapq
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterator, AsyncIterator, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -32,6 +35,8 @@ class SourceConfig:
     priority: int = 1  # Higher = more important
     weight: float = 1.0  # Weight in confidence calculation
     cache_ttl_seconds: int = 3600  # 1 hour default cache TTL for fallback
+    timeout_seconds: float = 15.0  # Per-source deadline for fetch_all_async
+    native_async: bool = False  # Use fetch_events_async instead of a worker thread
 
 
 @dataclass
@@ -46,23 +51,34 @@ class FetchResult:
     data_age_seconds: Optional[float] = None
 
 
+_MIN_OBSERVED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _observed_at(event: RawSignalEvent) -> datetime:
+    return event.observed_at or _MIN_OBSERVED_AT
+
+
 class MultiSourceAggregator:
     """
     Aggregates signals from multiple sources.
 
     Features:
-    - Fetches from all enabled sources in parallel
+    - Fetches from all enabled sources in parallel (fetch_all_async)
     - Deduplicates similar signals
     - Enables cross-source validation
     - Provides unified signal stream
     - GRACEFUL DEGRADATION: Returns cached data when sources fail
+      or miss their deadline
     """
 
-    def __init__(self, enable_fallback: bool = True):
+    def __init__(self, enable_fallback: bool = True, max_fetch_workers: int = 8):
         self._sources: dict[str, tuple[SignalSource, SourceConfig]] = {}
         self._enable_fallback = enable_fallback
         # Fallback caches per source for graceful degradation
         self._fallback_caches: dict[str, FallbackCache[list[RawSignalEvent]]] = {}
+        # Bounded pool for sync sources in fetch_all_async (created lazily)
+        self._max_fetch_workers = max_fetch_workers
+        self._executor: ThreadPoolExecutor | None = None
 
     def register_source(
         self,
@@ -220,34 +236,9 @@ class MultiSourceAggregator:
                 )
 
             except Exception as e:
-                if self._enable_fallback and name in self._fallback_caches:
-                    cached = self._fallback_caches[name].get_stale(cache_key)
-                    if cached:
-                        all_events.extend(cached.data)
-                        source_results[name] = FetchResult(
-                            events=cached.data,
-                            source_name=name,
-                            is_fallback=True,
-                            fallback_reason=str(e),
-                            data_freshness=cached.freshness_level,
-                            data_age_seconds=cached.age_seconds,
-                        )
-                    else:
-                        source_results[name] = FetchResult(
-                            events=[],
-                            source_name=name,
-                            is_fallback=True,
-                            fallback_reason=f"No cache: {e}",
-                            data_freshness="unavailable",
-                        )
-                else:
-                    source_results[name] = FetchResult(
-                        events=[],
-                        source_name=name,
-                        is_fallback=True,
-                        fallback_reason=str(e),
-                        data_freshness="unavailable",
-                    )
+                result = self._fallback_result(name, cache_key, str(e))
+                all_events.extend(result.events)
+                source_results[name] = result
 
         all_events.sort(
             key=lambda e: e.observed_at or datetime.min.replace(tzinfo=timezone.utc),
@@ -256,6 +247,176 @@ class MultiSourceAggregator:
 
         return all_events, source_results
 
+    def _fallback_result(self, name: str, cache_key: str, reason: str) -> FetchResult:
+        """FetchResult from the stale fallback cache (or an empty 'unavailable' one)."""
+        if self._enable_fallback and name in self._fallback_caches:
+            cached = self._fallback_caches[name].get_stale(cache_key)
+            if cached:
+                return FetchResult(
+                    events=cached.data,
+                    source_name=name,
+                    is_fallback=True,
+                    fallback_reason=reason,
+                    data_freshness=cached.freshness_level,
+                    data_age_seconds=cached.age_seconds,
+                )
+            return FetchResult(
+                events=[],
+                source_name=name,
+                is_fallback=True,
+                fallback_reason=f"No cache: {reason}",
+                data_freshness="unavailable",
+            )
+        return FetchResult(
+            events=[],
+            source_name=name,
+            is_fallback=True,
+            fallback_reason=reason,
+            data_freshness="unavailable",
+        )
+
+    @staticmethod
+    def _merge_newest_first(per_source: list[list[RawSignalEvent]]) -> list[RawSignalEvent]:
+        """
+        Merge per-source event lists newest first.
+
+        Each list is sorted on its own (sources usually return near-sorted
+        data), then combined with a k-way heap merge. Equal timestamps keep
+        source registration order, matching a stable sort of the
+        concatenation.
+        """
+        runs = [sorted(events, key=_observed_at, reverse=True) for events in per_source if events]
+        return list(heapq.merge(*runs, key=_observed_at, reverse=True))
+
+    async def fetch_all_async(
+        self,
+        limit_per_source: int = 50,
+        sources: list[str] | None = None,
+    ) -> list[RawSignalEvent]:
+        """
+        Fetch events from all enabled sources concurrently.
+
+        Same result as fetch_all, but total latency is bounded by the
+        slowest source (or its deadline) instead of the sum of all sources.
+        See fetch_all_with_metadata_async.
+        """
+        events, _ = await self.fetch_all_with_metadata_async(limit_per_source, sources)
+        return events
+
+    async def fetch_all_with_metadata_async(
+        self,
+        limit_per_source: int = 50,
+        sources: list[str] | None = None,
+    ) -> tuple[list[RawSignalEvent], dict[str, FetchResult]]:
+        """
+        Fetch from all enabled sources concurrently, with per-source metadata.
+
+        - Sources with native_async=True are awaited directly; sync sources
+          run on a bounded thread pool.
+        - Each source has its own deadline (SourceConfig.timeout_seconds).
+          A source that fails or misses it falls back to its stale cache;
+          a late live result still refreshes the cache for the next call.
+        - Results are merged newest first with a heap merge.
+        """
+        selected = [
+            (name, source, config)
+            for name, (source, config) in self._sources.items()
+            if config.enabled and (not sources or name in sources)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._fetch_source_async(name, source, config, limit_per_source)
+                for name, source, config in selected
+            )
+        )
+
+        fallback_sources = [
+            f"{r.source_name}({r.data_freshness})" for r in results if r.is_fallback
+        ]
+        if fallback_sources:
+            logger.warning(f"Used fallback data from: {fallback_sources}")
+
+        all_events = self._merge_newest_first([r.events for r in results])
+        logger.info(
+            f"Total events from all sources: {len(all_events)} "
+            f"(fallback: {len(fallback_sources)} sources)"
+        )
+        return all_events, {r.source_name: r for r in results}
+
+    async def _fetch_source_async(
+        self,
+        name: str,
+        source: SignalSource,
+        config: SourceConfig,
+        limit: int,
+    ) -> FetchResult:
+        """Fetch one source under its deadline, falling back to cache on failure."""
+        cache_key = f"{name}_events_{limit}"
+        try:
+            if config.native_async:
+                events = await asyncio.wait_for(
+                    self._collect_async(source, limit),
+                    timeout=config.timeout_seconds,
+                )
+            else:
+                future = self._get_executor().submit(
+                    lambda: list(source.fetch_events(limit=limit))
+                )
+                try:
+                    events = await asyncio.wait_for(
+                        asyncio.wrap_future(future),
+                        timeout=config.timeout_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    future.add_done_callback(
+                        lambda f: self._cache_late_result(name, cache_key, f)
+                    )
+                    raise
+        except asyncio.TimeoutError:
+            reason = f"deadline exceeded ({config.timeout_seconds}s)"
+            logger.warning(f"Live fetch for {name} missed its deadline, using fallback")
+            return self._fallback_result(name, cache_key, reason)
+        except Exception as e:
+            logger.warning(f"Live fetch failed for {name}: {e}")
+            return self._fallback_result(name, cache_key, str(e))
+
+        logger.info(f"Source {name} returned {len(events)} events (LIVE)")
+        if self._enable_fallback and events:
+            self._fallback_caches[name].set(cache_key, events, name)
+        return FetchResult(
+            events=events,
+            source_name=name,
+            is_fallback=False,
+            data_freshness="live",
+        )
+
+    @staticmethod
+    async def _collect_async(source: SignalSource, limit: int) -> list[RawSignalEvent]:
+        return [event async for event in source.fetch_events_async(limit=limit)]
+
+    def _cache_late_result(self, name: str, cache_key: str, future: Future) -> None:
+        """Keep a live result that arrived after the deadline for the next fallback."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        events = future.result()
+        if self._enable_fallback and events and name in self._fallback_caches:
+            self._fallback_caches[name].set(cache_key, events, name)
+            logger.info(f"Late result from {name} cached ({len(events)} events)")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_fetch_workers,
+                thread_name_prefix="source-fetch",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the fetch worker pool (recreated on next fetch_all_async)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def fetch_by_source(
         self,
         source_name: str,
@@ -576,4 +737,6 @@ def _register_default_sources(aggregator: MultiSourceAggregator) -> None:
 def reset_aggregator() -> None:
     """Reset the global aggregator (for testing)."""
     global _aggregator
+    if _aggregator is not None:
+        _aggregator.close()
     _aggregator = None
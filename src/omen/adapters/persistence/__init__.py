@@ -1,6 +1,7 @@
 """Persistence adapters."""
 
 from omen.adapters.persistence.in_memory_repository import InMemorySignalRepository
+from omen.adapters.persistence.async_in_memory_repository import AsyncInMemorySignalRepository
 from omen.adapters.persistence.schema_router import (
     Schema,
     GateStatus,
@@ -15,6 +16,7 @@ from omen.adapters.persistence.audit_logger import (
     AuditEntry,
     AuditLogger,
     log_attestation,
+    log_attestations,
 )
 
 # Lazy imports for PostgreSQL (requires asyncpg)
@@ -36,6 +38,7 @@ def get_postgres_factories():
 __all__ = [
     # Repositories
     "InMemorySignalRepository",
+    "AsyncInMemorySignalRepository",
     "get_postgres_repository",
     "get_postgres_factories",
     # Schema routing
@@ -51,4 +54,5 @@ __all__ = [
     "AuditEntry",
     "AuditLogger",
     "log_attestation",
+    "log_attestations",
 ]
@@ -0,0 +1,80 @@
+"""Async in-memory signal repository."""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Sequence
+
+from ...domain.models.omen_signal import OmenSignal
+
+DEFAULT_MAX_SIZE = 10_000
+
+
+class AsyncInMemorySignalRepository:
+    """
+    In-memory implementation of AsyncSignalRepository.
+
+    Bounded: once max_size signals are stored, saving a new one evicts
+    the oldest save. Signals are kept in save order (re-saving a
+    signal_id moves it to the newest position), so find_recent_async is
+    newest saved first. Methods never await, so they are safe to call
+    concurrently from one event loop.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize repository holding at most max_size signals."""
+        self.max_size = max(1, max_size)
+        self._signals: OrderedDict[str, OmenSignal] = OrderedDict()
+        self._signals_by_hash: dict[str, OmenSignal] = {}
+
+    async def save_async(self, signal: OmenSignal) -> None:
+        """Persist an OMEN signal, evicting the oldest when full."""
+        self._unindex(signal.signal_id)
+        while len(self._signals) >= self.max_size:
+            self._unindex(next(iter(self._signals)))
+        self._signals[signal.signal_id] = signal
+        if signal.input_event_hash is not None:
+            self._signals_by_hash[signal.input_event_hash] = signal
+
+    async def save_many_async(self, signals: Sequence[OmenSignal]) -> None:
+        """Persist a batch of signals; the last write for a signal_id wins."""
+        for signal in signals:
+            await self.save_async(signal)
+
+    def _unindex(self, signal_id: str) -> None:
+        """Drop a stored signal from every index (no-op if unknown)."""
+        old = self._signals.pop(signal_id, None)
+        if old is not None and self._signals_by_hash.get(old.input_event_hash) is old:
+            del self._signals_by_hash[old.input_event_hash]
+
+    async def find_by_id_async(self, signal_id: str) -> OmenSignal | None:
+        """Find signal by its OMEN ID."""
+        return self._signals.get(signal_id)
+
+    async def find_by_hash_async(self, input_event_hash: str) -> OmenSignal | None:
+        """Find signal by input event hash (idempotency)."""
+        return self._signals_by_hash.get(input_event_hash)
+
+    async def find_by_hashes_async(
+        self, input_event_hashes: Sequence[str]
+    ) -> dict[str, OmenSignal]:
+        """Bulk lookup by input event hash (idempotency for batches)."""
+        by_hash = self._signals_by_hash
+        return {h: by_hash[h] for h in input_event_hashes if h in by_hash}
+
+    async def find_recent_async(
+        self,
+        limit: int = 100,
+        since: datetime | None = None,
+    ) -> list[OmenSignal]:
+        """Find recent signals, newest saved first."""
+        recent: list[OmenSignal] = []
+        for signal in reversed(self._signals.values()):
+            if len(recent) >= limit:
+                break
+            if since is None or (signal.generated_at is not None and signal.generated_at >= since):
+                recent.append(signal)
+        return recent
+
+    async def count_async(self) -> int:
+        """Number of stored signals."""
+        return len(self._signals)
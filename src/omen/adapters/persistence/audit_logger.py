@@ -17,7 +17,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID, uuid4
 
 logger = logging.getLogger(__name__)
@@ -317,42 +317,7 @@ class AuditLogger:
         by triggers that prevent UPDATE/DELETE.
         """
         try:
-            await self._conn.execute(
-                """
-                INSERT INTO audit.operation_log (
-                    id, operation_id, trace_id, operation_type,
-                    target_schema, target_table, target_id,
-                    performed_by, source_ip, user_agent,
-                    old_value, new_value,
-                    attestation_id, source_type,
-                    reason, metadata, logged_at
-                ) VALUES (
-                    $1, $2, $3, $4::operation_type,
-                    $5, $6, $7,
-                    $8, $9, $10,
-                    $11, $12,
-                    $13, $14::source_type,
-                    $15, $16, $17
-                )
-                """,
-                entry.id,
-                entry.operation_id,
-                entry.trace_id,
-                entry.operation_type.value,
-                entry.target_schema,
-                entry.target_table,
-                entry.target_id,
-                entry.performed_by,
-                entry.source_ip,
-                entry.user_agent,
-                json.dumps(entry.old_value) if entry.old_value else None,
-                json.dumps(entry.new_value) if entry.new_value else None,
-                entry.attestation_id,
-                entry.source_type,
-                entry.reason,
-                json.dumps(entry.metadata) if entry.metadata else None,
-                entry.logged_at,
-            )
+            await self._conn.execute(_INSERT_ENTRY_SQL, *_entry_args(entry))
             logger.debug(
                 "Audit log: %s %s.%s id=%s",
                 entry.operation_type.value,
@@ -375,6 +340,72 @@ class AuditLogger:
             if os.environ.get("OMEN_ENV") == "development":
                 raise
 
+    async def write_entries(self, entries: Sequence[AuditEntry]) -> None:
+        """
+        Write a batch of audit entries in one executemany round-trip.
+
+        Used by bulk saves so a batch's audit trail lands in the same
+        transaction as its rows. Errors are handled as in _write_entry.
+        """
+        if not entries:
+            return
+        try:
+            await self._conn.executemany(
+                _INSERT_ENTRY_SQL, [_entry_args(entry) for entry in entries]
+            )
+            logger.debug("Audit log: wrote %d entries", len(entries))
+        except Exception as e:
+            logger.error(
+                "Failed to write %d audit log entries: %s",
+                len(entries),
+                e,
+            )
+            import os
+            if os.environ.get("OMEN_ENV") == "development":
+                raise
+
+
+_INSERT_ENTRY_SQL = """
+    INSERT INTO audit.operation_log (
+        id, operation_id, trace_id, operation_type,
+        target_schema, target_table, target_id,
+        performed_by, source_ip, user_agent,
+        old_value, new_value,
+        attestation_id, source_type,
+        reason, metadata, logged_at
+    ) VALUES (
+        $1, $2, $3, $4::operation_type,
+        $5, $6, $7,
+        $8, $9, $10,
+        $11, $12,
+        $13, $14::source_type,
+        $15, $16, $17
+    )
+"""
+
+
+def _entry_args(entry: AuditEntry) -> tuple:
+    """Positional parameters of _INSERT_ENTRY_SQL for an entry."""
+    return (
+        entry.id,
+        entry.operation_id,
+        entry.trace_id,
+        entry.operation_type.value,
+        entry.target_schema,
+        entry.target_table,
+        entry.target_id,
+        entry.performed_by,
+        entry.source_ip,
+        entry.user_agent,
+        json.dumps(entry.old_value) if entry.old_value else None,
+        json.dumps(entry.new_value) if entry.new_value else None,
+        entry.attestation_id,
+        entry.source_type,
+        entry.reason,
+        json.dumps(entry.metadata) if entry.metadata else None,
+        entry.logged_at,
+    )
+
 
 async def log_attestation(
     connection,
@@ -391,35 +422,7 @@ async def log_attestation(
         attestation: SignalAttestation to log
     """
     try:
-        await connection.execute(
-            """
-            INSERT INTO audit.source_attestations (
-                id, signal_id, source_id,
-                source_type, verification_method,
-                api_response_hash, raw_response_sample,
-                determination_reason, confidence,
-                attested_by, attested_at
-            ) VALUES (
-                $1, $2, $3,
-                $4::source_type, $5::verification_method,
-                $6, $7,
-                $8, $9,
-                $10, $11
-            )
-            ON CONFLICT (signal_id) DO NOTHING
-            """,
-            attestation.id,
-            attestation.signal_id,
-            attestation.source_id,
-            attestation.source_type.value,
-            attestation.verification_method.value,
-            attestation.api_response_hash,
-            attestation.raw_response_sample,
-            attestation.determination_reason,
-            attestation.confidence,
-            attestation.attested_by,
-            attestation.attested_at,
-        )
+        await connection.execute(_INSERT_ATTESTATION_SQL, *_attestation_args(attestation))
         logger.debug(
             "Logged attestation for signal %s: %s",
             attestation.signal_id,
@@ -432,3 +435,61 @@ async def log_attestation(
             e,
         )
         raise
+
+
+async def log_attestations(
+    connection,
+    attestations: Sequence,
+) -> None:
+    """
+    Log a batch of source attestations in one executemany round-trip.
+
+    Args:
+        connection: asyncpg connection
+        attestations: SignalAttestations to log
+    """
+    if not attestations:
+        return
+    try:
+        await connection.executemany(
+            _INSERT_ATTESTATION_SQL, [_attestation_args(a) for a in attestations]
+        )
+        logger.debug("Logged %d attestations", len(attestations))
+    except Exception as e:
+        logger.error("Failed to log %d attestations: %s", len(attestations), e)
+        raise
+
+
+_INSERT_ATTESTATION_SQL = """
+    INSERT INTO audit.source_attestations (
+        id, signal_id, source_id,
+        source_type, verification_method,
+        api_response_hash, raw_response_sample,
+        determination_reason, confidence,
+        attested_by, attested_at
+    ) VALUES (
+        $1, $2, $3,
+        $4::source_type, $5::verification_method,
+        $6, $7,
+        $8, $9,
+        $10, $11
+    )
+    ON CONFLICT (signal_id) DO NOTHING
+"""
+
+
+def _attestation_args(attestation) -> tuple:
+    """Positional parameters of _INSERT_ATTESTATION_SQL for an attestation."""
+    return (
+        attestation.id,
+        attestation.signal_id,
+        attestation.source_id,
+        attestation.source_type.value,
+        attestation.verification_method.value,
+        attestation.api_response_hash,
+        attestation.raw_response_sample,
+        attestation.determination_reason,
+        attestation.confidence,
+        attestation.attested_by,
+        attestation.attested_at,
+    )
@@ -1,24 +1,59 @@
 """In-memory signal repository."""
 
-from typing import Dict
-from datetime import datetime
+from bisect import bisect_left
+from typing import Dict, Sequence
+from datetime import datetime, timezone
 
 from ...application.ports.signal_repository import SignalRepository
 from ...domain.models.omen_signal import OmenSignal
 
+_MIN_GENERATED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _sort_key(signal: OmenSignal) -> tuple[datetime, str]:
+    """Time-order key: (generated_at, signal_id). Missing timestamps sort oldest."""
+    return (signal.generated_at or _MIN_GENERATED_AT, signal.signal_id)
+
 
 class InMemorySignalRepository(SignalRepository):
-    """In-memory implementation of SignalRepository."""
+    """
+    In-memory implementation of SignalRepository.
+
+    Signals are kept in a time-ordered index keyed by (generated_at,
+    signal_id), stored oldest first so inserts, `since` filters and
+    keyset pages are bisect lookups. Reads walk the index from the end
+    (newest first). Id, hash and event id lookups use secondary dicts.
+    """
 
     def __init__(self):
         """Initialize in-memory repository."""
         self._signals_by_id: Dict[str, OmenSignal] = {}
         self._signals_by_hash: Dict[str, OmenSignal] = {}
         self._signals_by_event_id: Dict[str, list[OmenSignal]] = {}
-        self._signals_list: list[OmenSignal] = []
+        # Parallel, ascending by _sort_key
+        self._keys: list[tuple[datetime, str]] = []
+        self._ordered: list[OmenSignal] = []
 
     def save(self, signal: OmenSignal) -> None:
-        """Persist an OMEN signal (pure contract)."""
+        """Persist an OMEN signal (pure contract). Re-saving a signal_id replaces it."""
+        self._store(signal)
+
+    def save_many(self, signals: Sequence[OmenSignal]) -> None:
+        """Persist a batch of signals; the last write for a signal_id wins."""
+        for signal in signals:
+            self._store(signal)
+
+    def _store(self, signal: OmenSignal) -> None:
+        """Upsert one signal into the time-ordered index and lookup maps."""
+        self._unindex(signal.signal_id)
+        self._index(signal)
+        key = _sort_key(signal)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._ordered.insert(i, signal)
+
+    def _index(self, signal: OmenSignal) -> None:
+        """Update the id/hash/event lookup maps for a signal."""
         self._signals_by_id[signal.signal_id] = signal
         if getattr(signal, "input_event_hash", None) is not None:
             self._signals_by_hash[signal.input_event_hash] = signal
@@ -27,11 +62,20 @@ class InMemorySignalRepository(SignalRepository):
             self._signals_by_event_id[event_key] = []
         self._signals_by_event_id[event_key].append(signal)
 
-        # Update list (remove old if exists, add new)
-        self._signals_list = [s for s in self._signals_list if s.signal_id != signal.signal_id]
-        self._signals_list.append(signal)
-        # Sort by generated_at descending
-        self._signals_list.sort(key=lambda s: s.generated_at, reverse=True)
+    def _unindex(self, signal_id: str) -> None:
+        """Drop a stored signal from every index (no-op if unknown)."""
+        old = self._signals_by_id.pop(signal_id, None)
+        if old is None:
+            return
+        if self._signals_by_hash.get(old.input_event_hash) is old:
+            del self._signals_by_hash[old.input_event_hash]
+        siblings = self._signals_by_event_id.get(old.source_event_id, [])
+        siblings[:] = [s for s in siblings if s.signal_id != signal_id]
+        if not siblings:
+            self._signals_by_event_id.pop(old.source_event_id, None)
+        i = bisect_left(self._keys, _sort_key(old))
+        del self._keys[i]
+        del self._ordered[i]
 
     def find_by_id(self, signal_id: str) -> OmenSignal | None:
         """Find signal by its OMEN ID."""
@@ -41,9 +85,20 @@ class InMemorySignalRepository(SignalRepository):
         """Find signal by input event hash."""
         return self._signals_by_hash.get(input_event_hash)
 
+    def find_by_hashes(self, input_event_hashes: Sequence[str]) -> dict[str, OmenSignal]:
+        """Bulk lookup by input event hash (idempotency for batches)."""
+        by_hash = self._signals_by_hash
+        return {h: by_hash[h] for h in input_event_hashes if h in by_hash}
+
     def find_by_event_id(self, event_id: str) -> list[OmenSignal]:
         """Find all signals generated from a source event."""
-        return self._signals_by_event_id.get(event_id, [])
+        return list(self._signals_by_event_id.get(event_id, []))
+
+    def _lower_bound(self, since: datetime | None) -> int:
+        """Index of the oldest signal with generated_at >= since."""
+        if since is None:
+            return 0
+        return bisect_left(self._keys, (since,))
 
     def find_recent(
         self,
@@ -51,14 +106,26 @@ class InMemorySignalRepository(SignalRepository):
         offset: int = 0,
         since: datetime | None = None,
     ) -> list[OmenSignal]:
-        """Find recent signals with pagination."""
-        signals = self._signals_list
-        if since is not None:
-            signals = [s for s in signals if s.generated_at >= since]
-        return signals[offset : offset + limit]
+        """Find recent signals with pagination (newest first)."""
+        lo = self._lower_bound(since)
+        hi = len(self._ordered) - offset
+        if hi <= lo or limit <= 0:
+            return []
+        return self._ordered[max(lo, hi - limit) : hi][::-1]
+
+    def find_page(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        since: datetime | None = None,
+    ) -> list[OmenSignal]:
+        """Keyset page (newest first) of signals strictly older than `after`."""
+        lo = self._lower_bound(since)
+        hi = len(self._ordered) if after is None else bisect_left(self._keys, after)
+        if hi <= lo or limit <= 0:
+            return []
+        return self._ordered[max(lo, hi - limit) : hi][::-1]
 
     def count(self, since: datetime | None = None) -> int:
         """Count total signals, optionally only those after since."""
-        if since is None:
-            return len(self._signals_list)
-        return sum(1 for s in self._signals_list if s.generated_at >= since)
+        return len(self._ordered) - self._lower_bound(since)
@@ -17,8 +17,9 @@ from __future__ import annotations
 import json
 import logging
 import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, TYPE_CHECKING
 from uuid import UUID
 
 from ...application.ports.signal_repository import SignalRepository, AsyncSignalRepository
@@ -36,13 +37,242 @@ from .schema_router import (
     RoutingDecision,
     determine_schema,
 )
-from .audit_logger import AuditLogger, log_attestation
+from .audit_logger import (
+    AuditEntry,
+    AuditLogger,
+    OperationType,
+    log_attestation,
+    log_attestations,
+)
 
 if TYPE_CHECKING:
     import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Columns covered by the keyset indexes (V1_0_6); list views read only these
+SUMMARY_COLUMNS = (
+    "signal_id, generated_at, title, probability, confidence_score, "
+    "confidence_level, signal_type, status, category, source_type"
+)
+
+# omen_signals has no source_type; it carries the ids and provider the API list shows
+OMEN_SIGNALS_SUMMARY_COLUMNS = (
+    "signal_id, generated_at, title, probability, confidence_score, "
+    "confidence_level, signal_type, status, category, source_event_id, trace_id, "
+    "probability_source"
+)
+
+
+@dataclass(frozen=True)
+class SignalSummary:
+    """
+    List-view projection of a stored signal.
+
+    Read from indexed columns only, without fetching or re-validating the
+    JSON payload. Load the full OmenSignal with find_by_id_in_schema.
+    """
+
+    signal_id: str
+    generated_at: datetime
+    title: str
+    probability: Optional[float]
+    confidence_score: Optional[float]
+    confidence_level: Optional[str]
+    signal_type: Optional[str]
+    status: Optional[str]
+    category: Optional[str]
+    source_type: Optional[str] = None
+    source_event_id: Optional[str] = None
+    trace_id: Optional[str] = None
+    probability_source: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row) -> "SignalSummary":
+        """Build from a row of SUMMARY_COLUMNS or OMEN_SIGNALS_SUMMARY_COLUMNS."""
+        return cls(
+            signal_id=row["signal_id"],
+            generated_at=row["generated_at"],
+            title=row["title"],
+            probability=row["probability"],
+            confidence_score=row["confidence_score"],
+            confidence_level=row["confidence_level"],
+            signal_type=row["signal_type"],
+            status=row["status"],
+            category=row["category"],
+            source_type=row.get("source_type"),
+            source_event_id=row.get("source_event_id"),
+            trace_id=row.get("trace_id"),
+            probability_source=row.get("probability_source"),
+        )
+
+
+def _signal_filters(
+    source_type: Optional[SourceType] = None,
+    signal_type: Optional[str] = None,
+    since: Optional[datetime] = None,
+    after: Optional[tuple[datetime, str]] = None,
+) -> tuple[list[str], list]:
+    """
+    WHERE conditions and params for schema signal queries.
+
+    `after` is a (generated_at, signal_id) keyset position: only rows
+    strictly older are matched, as a row comparison the
+    (generated_at DESC, signal_id DESC) index can seek to.
+    """
+    conditions: list[str] = []
+    params: list = []
+
+    if source_type:
+        params.append(source_type.value)
+        conditions.append(f"source_type = ${len(params)}::source_type")
+
+    if signal_type:
+        params.append(signal_type)
+        conditions.append(f"signal_type = ${len(params)}")
+
+    if since:
+        params.append(since)
+        conditions.append(f"generated_at >= ${len(params)}")
+
+    if after is not None:
+        params.extend(after)
+        conditions.append(f"(generated_at, signal_id) < (${len(params) - 1}, ${len(params)})")
+
+    return conditions, params
+
+
+def _where(conditions: list[str]) -> str:
+    return "WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+async def _planner_row_estimate(conn, table: str, conditions: list[str], params: list) -> int:
+    """Row count the planner expects for a filtered scan (no table read)."""
+    plan = await conn.fetchval(
+        f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} {_where(conditions)}",
+        *params,
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# Column order of _signal_row (legacy omen_signals table)
+SIGNAL_COLUMNS = (
+    "signal_id",
+    "source_event_id",
+    "trace_id",
+    "input_event_hash",
+    "title",
+    "description",
+    "probability",
+    "confidence_score",
+    "confidence_level",
+    "signal_type",
+    "status",
+    "category",
+    "tags",
+    "geographic",
+    "temporal",
+    "evidence",
+    "payload",
+    "generated_at",
+    "probability_source",
+)
+
+# Column order of _schema_signal_row (demo.signals / live.signals)
+SCHEMA_SIGNAL_COLUMNS = (
+    "signal_id",
+    "source_event_id",
+    "trace_id",
+    "input_event_hash",
+    "source_type",
+    "attestation_id",
+    *SIGNAL_COLUMNS[4:-1],
+    "ingested_from",
+    "api_response_hash",
+)
+
+
+def _signal_row(signal: OmenSignal, trace_id: Optional[str] = None) -> tuple:
+    """Values of SIGNAL_COLUMNS for a signal."""
+    return (
+        signal.signal_id,
+        signal.source_event_id,
+        trace_id or getattr(signal, "trace_id", None),
+        getattr(signal, "input_event_hash", None),
+        signal.title,
+        getattr(signal, "description", None),
+        signal.probability,
+        signal.confidence_score,
+        signal.confidence_level.value if signal.confidence_level else None,
+        signal.signal_type.value if signal.signal_type else None,
+        signal.status.value if signal.status else None,
+        signal.category.value if signal.category else None,
+        json.dumps(list(signal.tags) if signal.tags else []),
+        json.dumps(signal.geographic.model_dump(mode="json")) if signal.geographic else None,
+        json.dumps(signal.temporal.model_dump(mode="json")) if signal.temporal else None,
+        json.dumps([e.model_dump(mode="json") for e in signal.evidence] if signal.evidence else []),
+        signal.model_dump_json(),
+        signal.generated_at,
+        getattr(signal, "probability_source", None),
+    )
+
+
+def _schema_signal_row(
+    signal: OmenSignal,
+    attestation: SignalAttestation,
+    trace_id: Optional[str] = None,
+) -> tuple:
+    """Values of SCHEMA_SIGNAL_COLUMNS for an attested signal."""
+    row = _signal_row(signal, trace_id)
+    return (
+        *row[:4],
+        attestation.source_type.value,
+        attestation.id,
+        *row[4:-1],
+        attestation.source_id,
+        attestation.api_response_hash,
+    )
+
+
+def _last_per_signal_id(rows: list[tuple]) -> list[tuple]:
+    """
+    Drop all but the last row per signal_id (column 0).
+
+    One INSERT ... ON CONFLICT DO UPDATE cannot touch the same row twice.
+    """
+    return list({row[0]: row for row in rows}.values())
+
+
+async def _copy_upsert(
+    conn,
+    table: str,
+    columns: Sequence[str],
+    rows: list[tuple],
+    update_sql: str,
+) -> None:
+    """
+    Upsert rows into table via COPY into a temp stage and one merge.
+
+    The stage has the target's column types but no constraints and is
+    dropped at commit, so this must run inside a transaction.
+    """
+    column_list = ", ".join(columns)
+    await conn.execute(
+        f"CREATE TEMP TABLE _signals_stage ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    )
+    await conn.copy_records_to_table("_signals_stage", records=rows, columns=list(columns))
+    await conn.execute(
+        f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {column_list} FROM _signals_stage
+        ON CONFLICT (signal_id) DO UPDATE SET {update_sql}
+        """
+    )
+    await conn.execute("DROP TABLE _signals_stage")
+
 
 class PostgresSignalRepository(SignalRepository):
     """
@@ -137,9 +367,13 @@ class PostgresSignalRepository(SignalRepository):
                     evidence JSONB DEFAULT '[]',
                     payload JSONB NOT NULL,
                     generated_at TIMESTAMPTZ NOT NULL,
+                    probability_source VARCHAR(64),
                     created_at TIMESTAMPTZ DEFAULT NOW(),
                     updated_at TIMESTAMPTZ DEFAULT NOW()
                 );
+                -- Added after the first release; older rows keep NULL
+                ALTER TABLE omen_signals
+                    ADD COLUMN IF NOT EXISTS probability_source VARCHAR(64);
                 
                 -- Indexes for common queries
                 CREATE INDEX IF NOT EXISTS idx_omen_signals_signal_id 
@@ -150,6 +384,8 @@ class PostgresSignalRepository(SignalRepository):
                     ON omen_signals(source_event_id);
                 CREATE INDEX IF NOT EXISTS idx_omen_signals_generated_at 
                     ON omen_signals(generated_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_omen_signals_keyset 
+                    ON omen_signals(generated_at DESC, signal_id DESC);
                 CREATE INDEX IF NOT EXISTS idx_omen_signals_type 
                     ON omen_signals(signal_type);
             """)
@@ -173,6 +409,12 @@ class PostgresSignalRepository(SignalRepository):
 
         asyncio.get_event_loop().run_until_complete(self.save_async(signal))
 
+    def save_many(self, signals: Sequence[OmenSignal]) -> None:
+        """Sync bulk save - wraps save_many_async."""
+        import asyncio
+
+        asyncio.get_event_loop().run_until_complete(self.save_many_async(signals))
+
     def find_by_id(self, signal_id: str) -> Optional[OmenSignal]:
         """Sync find by ID."""
         import asyncio
@@ -187,6 +429,14 @@ class PostgresSignalRepository(SignalRepository):
             self.find_by_hash_async(input_event_hash)
         )
 
+    def find_by_hashes(self, input_event_hashes: Sequence[str]) -> dict[str, OmenSignal]:
+        """Sync bulk find by hash."""
+        import asyncio
+
+        return asyncio.get_event_loop().run_until_complete(
+            self.find_by_hashes_async(input_event_hashes)
+        )
+
     def find_by_event_id(self, event_id: str) -> list[OmenSignal]:
         """Sync find by event ID."""
         import asyncio
@@ -203,14 +453,27 @@ class PostgresSignalRepository(SignalRepository):
         import asyncio
 
         return asyncio.get_event_loop().run_until_complete(
-            self.find_recent_async(limit=limit, since=since)
+            self.find_recent_async(limit=limit, offset=offset, since=since)
+        )
+
+    def find_page(
+        self,
+        limit: int = 100,
+        after: Optional[tuple[datetime, str]] = None,
+        since: Optional[datetime] = None,
+    ) -> list[OmenSignal]:
+        """Sync keyset page."""
+        import asyncio
+
+        return asyncio.get_event_loop().run_until_complete(
+            self.find_page_async(limit=limit, after=after, since=since)
         )
 
     def count(self, since: Optional[datetime] = None) -> int:
         """Sync count."""
         import asyncio
 
-        return asyncio.get_event_loop().run_until_complete(self._count_async(since))
+        return asyncio.get_event_loop().run_until_complete(self.count_async(since))
 
     # === Async interface (AsyncSignalRepository) ===
 
@@ -228,34 +491,42 @@ class PostgresSignalRepository(SignalRepository):
                     signal_id, source_event_id, trace_id, input_event_hash,
                     title, description, probability, confidence_score,
                     confidence_level, signal_type, status, category,
-                    tags, geographic, temporal, evidence, payload, generated_at
+                    tags, geographic, temporal, evidence, payload, generated_at,
+                    probability_source
                 ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, 
-                          $13, $14, $15, $16, $17, $18)
+                          $13, $14, $15, $16, $17, $18, $19)
                 ON CONFLICT (signal_id) DO UPDATE SET
                     payload = EXCLUDED.payload,
                     updated_at = NOW()
             """,
-                signal.signal_id,
-                signal.source_event_id,
-                getattr(signal, "trace_id", None),
-                getattr(signal, "input_event_hash", None),
-                signal.title,
-                getattr(signal, "description", None),
-                signal.probability,
-                signal.confidence_score,
-                signal.confidence_level.value if signal.confidence_level else None,
-                signal.signal_type.value if signal.signal_type else None,
-                signal.status.value if signal.status else None,
-                signal.category.value if signal.category else None,
-                json.dumps(list(signal.tags) if signal.tags else []),
-                json.dumps(signal.geographic.model_dump()) if signal.geographic else None,
-                json.dumps(signal.temporal.model_dump()) if signal.temporal else None,
-                json.dumps([e.model_dump() for e in signal.evidence] if signal.evidence else []),
-                signal.model_dump_json(),
-                signal.generated_at,
+                *_signal_row(signal),
             )
             logger.debug("Saved signal %s to PostgreSQL", signal.signal_id)
 
+    async def save_many_async(self, signals: Sequence[OmenSignal]) -> None:
+        """
+        Persist a batch of signals with the same UPSERT semantics as save_async.
+
+        Rows are COPYed into a temp table and merged with a single
+        INSERT ... SELECT ... ON CONFLICT, in one transaction. If a batch
+        repeats a signal_id, the last occurrence wins.
+        """
+        self._ensure_initialized()
+        if not signals:
+            return
+
+        rows = _last_per_signal_id([_signal_row(signal) for signal in signals])
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await _copy_upsert(
+                    conn,
+                    "omen_signals",
+                    SIGNAL_COLUMNS,
+                    rows,
+                    "payload = EXCLUDED.payload, updated_at = NOW()",
+                )
+        logger.debug("Saved %d signals to PostgreSQL", len(rows))
+
     async def find_by_id_async(self, signal_id: str) -> Optional[OmenSignal]:
         """Find signal by ID."""
         self._ensure_initialized()
@@ -280,6 +551,25 @@ class PostgresSignalRepository(SignalRepository):
                 return OmenSignal.model_validate_json(row["payload"])
             return None
 
+    async def find_by_hashes_async(
+        self, input_event_hashes: Sequence[str]
+    ) -> dict[str, OmenSignal]:
+        """Bulk idempotency check: one query for a whole batch of hashes."""
+        self._ensure_initialized()
+        if not input_event_hashes:
+            return {}
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT input_event_hash, payload FROM omen_signals "
+                "WHERE input_event_hash = ANY($1::text[])",
+                list(input_event_hashes),
+            )
+            return {
+                row["input_event_hash"]: OmenSignal.model_validate_json(row["payload"])
+                for row in rows
+            }
+
     async def _find_by_event_id_async(self, event_id: str) -> list[OmenSignal]:
         """Find all signals from a source event."""
         self._ensure_initialized()
@@ -295,36 +585,101 @@ class PostgresSignalRepository(SignalRepository):
         self,
         limit: int = 100,
         since: Optional[datetime] = None,
+        offset: int = 0,
     ) -> list[OmenSignal]:
-        """Find recent signals."""
+        """Find recent signals (OFFSET paging; prefer find_page_async)."""
         self._ensure_initialized()
 
-        query = "SELECT payload FROM omen_signals"
-        params = []
+        conditions, params = _signal_filters(since=since)
+        params.extend([limit, offset])
+        query = f"""
+            SELECT payload FROM omen_signals
+            {_where(conditions)}
+            ORDER BY generated_at DESC, signal_id DESC
+            LIMIT ${len(params) - 1} OFFSET ${len(params)}
+        """
 
-        if since:
-            params.append(since)
-            query += " WHERE generated_at >= $1"
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+            return [OmenSignal.model_validate_json(row["payload"]) for row in rows]
 
-        query += " ORDER BY generated_at DESC LIMIT $" + str(len(params) + 1)
+    async def find_page_async(
+        self,
+        limit: int = 100,
+        after: Optional[tuple[datetime, str]] = None,
+        since: Optional[datetime] = None,
+    ) -> list[OmenSignal]:
+        """
+        Keyset page, newest first, ordered by (generated_at, signal_id).
+
+        Seeks idx_omen_signals_keyset past `after` instead of skipping
+        rows, so deep pages cost the same as the first one.
+        """
+        self._ensure_initialized()
+
+        conditions, params = _signal_filters(since=since, after=after)
         params.append(limit)
+        query = f"""
+            SELECT payload FROM omen_signals
+            {_where(conditions)}
+            ORDER BY generated_at DESC, signal_id DESC
+            LIMIT ${len(params)}
+        """
 
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
             return [OmenSignal.model_validate_json(row["payload"]) for row in rows]
 
-    async def _count_async(self, since: Optional[datetime] = None) -> int:
-        """Count signals."""
+    async def find_summaries_async(
+        self,
+        limit: int = 100,
+        after: Optional[tuple[datetime, str]] = None,
+        since: Optional[datetime] = None,
+    ) -> list[SignalSummary]:
+        """
+        Keyset page of SignalSummary rows, same order as find_page_async.
+
+        Selects OMEN_SIGNALS_SUMMARY_COLUMNS only, so list views neither
+        fetch nor validate the JSON payload.
+        """
         self._ensure_initialized()
 
+        conditions, params = _signal_filters(since=since, after=after)
+        params.append(limit)
+        query = f"""
+            SELECT {OMEN_SIGNALS_SUMMARY_COLUMNS} FROM omen_signals
+            {_where(conditions)}
+            ORDER BY generated_at DESC, signal_id DESC
+            LIMIT ${len(params)}
+        """
+
         async with self._pool.acquire() as conn:
-            if since:
-                result = await conn.fetchval(
-                    "SELECT COUNT(*) FROM omen_signals WHERE generated_at >= $1", since
-                )
-            else:
-                result = await conn.fetchval("SELECT COUNT(*) FROM omen_signals")
-            return result or 0
+            rows = await conn.fetch(query, *params)
+            return [SignalSummary.from_row(row) for row in rows]
+
+    async def count_async(
+        self,
+        since: Optional[datetime] = None,
+        estimate: bool = False,
+    ) -> int:
+        """
+        Count signals.
+
+        With estimate=True the answer is the planner's row estimate
+        (omen_signals has no trigger-maintained counter); use it for list
+        view totals.
+        """
+        self._ensure_initialized()
+
+        conditions, params = _signal_filters(since=since)
+
+        async with self._pool.acquire() as conn:
+            if estimate:
+                return await _planner_row_estimate(conn, "omen_signals", conditions, params)
+            result = await conn.fetchval(
+                f"SELECT COUNT(*) FROM omen_signals {_where(conditions)}", *params
+            )
+            return int(result or 0)
 
     async def exists(self, input_event_hash: str) -> bool:
         """Check if signal with hash exists (fast idempotency check)."""
@@ -417,28 +772,7 @@ class PostgresSignalRepository(SignalRepository):
                         attestation_id = EXCLUDED.attestation_id,
                         updated_at = NOW()
                     """,
-                    signal.signal_id,
-                    signal.source_event_id,
-                    trace_id or getattr(signal, "trace_id", None),
-                    getattr(signal, "input_event_hash", None),
-                    attestation.source_type.value,
-                    attestation.id,
-                    signal.title,
-                    getattr(signal, "description", None),
-                    signal.probability,
-                    signal.confidence_score,
-                    signal.confidence_level.value if signal.confidence_level else None,
-                    signal.signal_type.value if signal.signal_type else None,
-                    signal.status.value if signal.status else None,
-                    signal.category.value if signal.category else None,
-                    json.dumps(list(signal.tags) if signal.tags else []),
-                    json.dumps(signal.geographic.model_dump()) if signal.geographic else None,
-                    json.dumps(signal.temporal.model_dump()) if signal.temporal else None,
-                    json.dumps([e.model_dump() for e in signal.evidence] if signal.evidence else []),
-                    signal.model_dump_json(),
-                    signal.generated_at,
-                    attestation.source_id,
-                    attestation.api_response_hash,
+                    *_schema_signal_row(signal, attestation, trace_id),
                 )
 
                 # Log attestation to audit schema
@@ -467,6 +801,100 @@ class PostgresSignalRepository(SignalRepository):
         )
         return decision
 
+    async def save_many_with_attestation(
+        self,
+        items: Sequence[tuple[OmenSignal, SignalAttestation]],
+        gate_result: Optional[GateCheckResult] = None,
+        trace_id: Optional[str] = None,
+        performed_by: Optional[str] = None,
+    ) -> list[RoutingDecision]:
+        """
+        Save a batch of signals with attestation and schema routing.
+
+        Same routing, upsert and audit semantics as save_with_attestation,
+        in one transaction: per target schema, existing rows are read with
+        one query, new rows are COPYed into a temp table and merged with one
+        INSERT ... SELECT ... ON CONFLICT, and attestations and audit
+        entries are written with executemany. If a batch repeats a
+        signal_id for a schema, the last occurrence is stored and audited.
+
+        Args:
+            items: (signal, attestation) pairs
+            gate_result: Optional pre-computed gate check result
+            trace_id: Request trace ID for audit trail
+            performed_by: Who/what is performing the operation
+
+        Returns:
+            RoutingDecision for each item, in input order
+
+        Raises:
+            RuntimeError: If repository not initialized
+        """
+        self._ensure_initialized()
+
+        decisions = [self._schema_router.route(a, gate_result) for _, a in items]
+        by_schema: dict[str, dict[str, tuple[OmenSignal, SignalAttestation]]] = {}
+        for (signal, attestation), decision in zip(items, decisions):
+            by_schema.setdefault(decision.schema.value, {})[signal.signal_id] = (
+                signal,
+                attestation,
+            )
+        if not by_schema:
+            return decisions
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                entries: list[AuditEntry] = []
+                for schema, batch in by_schema.items():
+                    table = f"{schema}.signals"
+
+                    # Existing rows (for audit logging)
+                    existing = await conn.fetch(
+                        f"SELECT signal_id, payload FROM {table} "
+                        "WHERE signal_id = ANY($1::text[])",
+                        list(batch),
+                    )
+                    old_values = {row["signal_id"]: json.loads(row["payload"]) for row in existing}
+
+                    await _copy_upsert(
+                        conn,
+                        table,
+                        SCHEMA_SIGNAL_COLUMNS,
+                        [_schema_signal_row(s, a, trace_id) for s, a in batch.values()],
+                        "payload = EXCLUDED.payload, "
+                        "source_type = EXCLUDED.source_type, "
+                        "attestation_id = EXCLUDED.attestation_id, "
+                        "updated_at = NOW()",
+                    )
+
+                    await log_attestations(conn, [a for _, a in batch.values()])
+
+                    entries.extend(
+                        AuditEntry(
+                            operation_type=OperationType.UPSERT,
+                            target_schema=schema,
+                            target_table="signals",
+                            target_id=signal.signal_id,
+                            old_value=old_values.get(signal.signal_id),
+                            new_value=json.loads(signal.model_dump_json()),
+                            attestation_id=attestation.id,
+                            source_type=attestation.source_type.value,
+                            trace_id=trace_id,
+                            performed_by=performed_by or "system",
+                            reason=f"Signal ingestion from {attestation.source_id}",
+                        )
+                        for signal, attestation in batch.values()
+                    )
+
+                await AuditLogger(conn).write_entries(entries)
+
+        logger.info(
+            "Saved %d signals (%s)",
+            len(entries),
+            ", ".join(f"{schema}: {len(batch)}" for schema, batch in by_schema.items()),
+        )
+        return decisions
+
     async def find_by_id_in_schema(
         self,
         signal_id: str,
@@ -503,10 +931,15 @@ class PostgresSignalRepository(SignalRepository):
         source_type: Optional[SourceType] = None,
         signal_type: Optional[str] = None,
         since: Optional[datetime] = None,
+        after: Optional[tuple[datetime, str]] = None,
     ) -> list[OmenSignal]:
         """
         Find recent signals in a specific schema with filters.
 
+        Results are newest first, ordered by (generated_at, signal_id).
+        Pass `after` (see api.pagination.cursor_keyset) instead of `offset`
+        to page: OFFSET reads and discards every skipped row.
+
         Args:
             schema: Schema to search (default: demo)
             limit: Maximum number of results
@@ -514,6 +947,8 @@ class PostgresSignalRepository(SignalRepository):
             source_type: Filter by source type (REAL, MOCK, HYBRID)
             signal_type: Filter by signal type
             since: Only signals after this timestamp
+            after: (generated_at, signal_id) of the last item of the
+                previous page; only strictly older signals are returned
 
         Returns:
             List of matching signals
@@ -522,86 +957,111 @@ class PostgresSignalRepository(SignalRepository):
 
         table = f"{schema.value}.signals"
 
-        # Build query with filters
-        conditions = []
-        params = []
-        param_idx = 1
+        conditions, params = _signal_filters(source_type, signal_type, since, after)
+        params.extend([limit, offset])
+
+        query = f"""
+            SELECT payload FROM {table}
+            {_where(conditions)}
+            ORDER BY generated_at DESC, signal_id DESC
+            LIMIT ${len(params) - 1} OFFSET ${len(params)}
+        """
+
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+            return [OmenSignal.model_validate_json(row["payload"]) for row in rows]
+
+    async def find_summaries_in_schema(
+        self,
+        schema: Schema = Schema.DEMO,
+        limit: int = 100,
+        after: Optional[tuple[datetime, str]] = None,
+        source_type: Optional[SourceType] = None,
+        signal_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> list[SignalSummary]:
+        """
+        Keyset page of signal summaries for list views.
+
+        Same ordering and filters as find_recent_in_schema, but selects
+        only SUMMARY_COLUMNS, which the covering keyset index holds, so
+        the payload is neither fetched nor validated.
 
-        if source_type:
-            conditions.append(f"source_type = ${param_idx}::source_type")
-            params.append(source_type.value)
-            param_idx += 1
+        Args:
+            schema: Schema to search (default: demo)
+            limit: Maximum number of results
+            after: (generated_at, signal_id) of the last item of the
+                previous page; only strictly older signals are returned
+            source_type: Filter by source type (REAL, MOCK, HYBRID)
+            signal_type: Filter by signal type
+            since: Only signals after this timestamp
 
-        if signal_type:
-            conditions.append(f"signal_type = ${param_idx}")
-            params.append(signal_type)
-            param_idx += 1
+        Returns:
+            List of SignalSummary, newest first
+        """
+        self._ensure_initialized()
 
-        if since:
-            conditions.append(f"generated_at >= ${param_idx}")
-            params.append(since)
-            param_idx += 1
+        table = f"{schema.value}.signals"
 
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+        conditions, params = _signal_filters(source_type, signal_type, since, after)
+        params.append(limit)
 
         query = f"""
-            SELECT payload FROM {table}
-            {where_clause}
-            ORDER BY generated_at DESC
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
+            SELECT {SUMMARY_COLUMNS} FROM {table}
+            {_where(conditions)}
+            ORDER BY generated_at DESC, signal_id DESC
+            LIMIT ${len(params)}
         """
-        params.extend([limit, offset])
 
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
-            return [OmenSignal.model_validate_json(row["payload"]) for row in rows]
+            return [SignalSummary.from_row(row) for row in rows]
 
     async def count_in_schema(
         self,
         schema: Schema = Schema.DEMO,
         source_type: Optional[SourceType] = None,
         since: Optional[datetime] = None,
+        estimate: bool = False,
     ) -> int:
         """
         Count signals in a specific schema.
 
+        With estimate=True the table is not scanned: totals without `since`
+        come from the trigger-maintained system.signal_counts table, and
+        `since` filters use the planner's row estimate. Use it for list
+        view totals; keep exact counts for reporting.
+
         Args:
             schema: Schema to count (default: demo)
             source_type: Filter by source type
             since: Only count signals after this timestamp
+            estimate: Answer from counters / planner statistics
 
         Returns:
-            Number of matching signals
+            Number of matching signals (approximate if estimate and since)
         """
         self._ensure_initialized()
 
         table = f"{schema.value}.signals"
 
-        conditions = []
-        params = []
-        param_idx = 1
-
-        if source_type:
-            conditions.append(f"source_type = ${param_idx}::source_type")
-            params.append(source_type.value)
-            param_idx += 1
-
-        if since:
-            conditions.append(f"generated_at >= ${param_idx}")
-            params.append(since)
-            param_idx += 1
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
-
-        query = f"SELECT COUNT(*) FROM {table} {where_clause}"
+        conditions, params = _signal_filters(source_type=source_type, since=since)
 
         async with self._pool.acquire() as conn:
-            result = await conn.fetchval(query, *params)
-            return result or 0
+            if estimate and since is None:
+                result = await conn.fetchval(
+                    "SELECT SUM(signal_count) FROM system.signal_counts "
+                    "WHERE schema_name = $1 AND ($2::source_type IS NULL OR source_type = $2)",
+                    schema.value,
+                    source_type.value if source_type else None,
+                )
+            elif estimate:
+                result = await _planner_row_estimate(conn, table, conditions, params)
+            else:
+                result = await conn.fetchval(
+                    f"SELECT COUNT(*) FROM {table} {_where(conditions)}", *params
+                )
+            return int(result or 0)
 
     async def get_schema_stats(self) -> dict:
         """
@@ -149,6 +149,23 @@ def create_page_response(
     )
 
 
+def cursor_keyset(data: Optional[CursorData]) -> Optional[tuple[datetime, str]]:
+    """
+    Keyset position (timestamp, id) from cursor data.
+
+    Used by repositories that page on (generated_at, signal_id) instead of
+    OFFSET. Returns None if the cursor lacks either field or the timestamp
+    is malformed.
+    """
+    if data is None or not data.last_id or not data.last_timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(data.last_timestamp), data.last_id
+    except ValueError:
+        logger.warning("Invalid cursor timestamp: %s", data.last_timestamp)
+        return None
+
+
 # Common pagination parameters
 class PaginationParams(BaseModel):
     """Common pagination query parameters."""
@@ -129,8 +129,8 @@ async def get_multi_source_signals(
     if sources:
         source_filter = [s.strip() for s in sources.split(",")]
 
-    # Fetch from all sources
-    events = aggregator.fetch_all(
+    # Fetch from all sources concurrently (bounded by the slowest source)
+    events = await aggregator.fetch_all_async(
         limit_per_source=limit_per_source,
         sources=source_filter,
     )
@@ -131,19 +131,11 @@ async def stream_prices(
             err = json.dumps({"type": "error", "message": f"WebSocket unavailable: {e}"})
             yield f"event: error\ndata: {err}\n\n"
 
-        # Stream updates (with keepalive)
+        # Stream conflated updates: one chunk per drain, payloads encoded once per update
         try:
-            async for update in streamer.stream():
-                data = json.dumps(
-                    {
-                        "signal_id": update.signal_id,
-                        "probability": update.new_probability,
-                        "previous_probability": update.old_probability,
-                        "change_percent": update.change_percent,
-                        "timestamp": update.timestamp,
-                    }
-                )
-                yield f"data: {data}\n\n"
+            async for updates in streamer.stream_batches():
+                if updates:
+                    yield "".join(f"data: {update.sse_data}\n\n" for update in updates)
         except Exception as e:
             logger.exception("SSE stream error: %s", e)
             yield f"event: error\ndata: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
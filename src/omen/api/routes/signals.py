@@ -16,6 +16,7 @@ from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from omen.api.dependencies import get_repository, get_signal_only_pipeline
+from omen.api.pagination import create_page_response, cursor_keyset, decode_cursor
 from omen.api.models.responses import (
     EvidenceResponse,
     GeographicContextResponse,
@@ -29,12 +30,13 @@ from omen.api.route_dependencies import (
     require_signals_write,
     require_stats_read,
 )
-from omen.application.ports.signal_repository import SignalRepository
+from omen.application.ports.signal_repository import AsyncSignalRepository, SignalRepository
 from omen.application.signal_pipeline import SignalOnlyPipeline
 from omen.domain.models.omen_signal import OmenSignal
+from omen.domain.models.raw_signal import RawSignalEvent
 from omen.infrastructure.debug.rejection_tracker import get_rejection_tracker
 from omen.infrastructure.security.unified_auth import AuthContext
-from omen.infrastructure.security.redaction import redact_for_api
+from omen.infrastructure.security.redaction import redact_for_api, redact_summary_for_api
 
 router = APIRouter()
 
@@ -48,6 +50,29 @@ def _generate_live_signal_id() -> str:
     return f"OMEN-LIVE{hash_hex}"
 
 
+async def _save_many(repository: SignalRepository, signals: list[OmenSignal]) -> None:
+    """
+    One bulk write for a batch of signals.
+
+    Awaits save_many_async on async repositories (PostgreSQL), whose sync
+    save_many runs its own event loop and fails inside a request.
+    """
+    if isinstance(repository, AsyncSignalRepository):
+        await repository.save_many_async(signals)
+    else:
+        repository.save_many(signals)
+
+
+async def _find_by_hashes(
+    repository: SignalRepository, events: list[RawSignalEvent]
+) -> dict[str, OmenSignal]:
+    """One bulk idempotency lookup for a batch of raw events, awaited when async."""
+    hashes = [e.input_event_hash for e in events]
+    if isinstance(repository, AsyncSignalRepository):
+        return await repository.find_by_hashes_async(hashes)
+    return repository.find_by_hashes(hashes)
+
+
 @router.post(
     "/refresh",
     summary="Refresh live signals from real sources",
@@ -97,29 +122,33 @@ async def refresh_live_signals(
         # Filter by liquidity
         filtered = [e for e in raw_list if e.market.current_liquidity_usd >= min_liquidity][:limit]
 
-        results = pipeline.process_batch(filtered)
+        existing = await _find_by_hashes(repository, filtered)
+        results = pipeline.process_batch(filtered, existing=existing)
 
         signals_created = 0
         signal_ids = []
+        live_signals = []
         for r in results:
-            if r.success and r.signal is not None:
+            if r.success and r.signal is not None and not r.deduplicated:
                 # Override signal_id to use LIVE prefix for real data
                 signal_dict = r.signal.model_dump()
                 signal_dict["signal_id"] = _generate_live_signal_id()
-                live_signal = OmenSignal.model_validate(signal_dict)
-                
-                # Save to repository
-                repository.save(live_signal)
-                signals_created += 1
-                signal_ids.append(live_signal.signal_id)
-                
-                # Log activity
-                activity.log_signal_generated(
-                    signal_id=live_signal.signal_id,
-                    title=live_signal.title,
-                    confidence_label=live_signal.confidence_level.value,
-                    confidence_level=str(live_signal.confidence_score),
-                )
+                live_signals.append(OmenSignal.model_validate(signal_dict))
+
+        # Save to repository (one bulk write for the batch)
+        await _save_many(repository, live_signals)
+
+        for live_signal in live_signals:
+            signals_created += 1
+            signal_ids.append(live_signal.signal_id)
+
+            # Log activity
+            activity.log_signal_generated(
+                signal_id=live_signal.signal_id,
+                title=live_signal.title,
+                confidence_label=live_signal.confidence_level.value,
+                confidence_level=str(live_signal.confidence_score),
+            )
 
         processing_time = (time.perf_counter() - start_time) * 1000
         
@@ -131,6 +160,7 @@ async def refresh_live_signals(
             "success": True,
             "events_fetched": len(raw_list),
             "events_filtered": len(filtered),
+            "events_deduplicated": sum(1 for r in results if r.deduplicated),
             "signals_created": signals_created,
             "processing_time_ms": processing_time,
             "message": f"Created {signals_created} live signals from {len(raw_list)} Polymarket events",
@@ -323,12 +353,17 @@ async def create_signals_batch(
 
         filtered = [e for e in raw_list if e.market.current_liquidity_usd >= min_liquidity][:limit]
 
-        results = pipeline.process_batch(filtered)
+        existing = await _find_by_hashes(repository, filtered)
+        results = pipeline.process_batch(filtered, existing=existing)
 
         signals_out = []
         valid_signals = []
         for r in results:
             if r.success and r.signal is not None and r.signal.confidence_score >= min_confidence:
+                if r.deduplicated:
+                    # Already stored under its LIVE id: return it, don't save again
+                    signals_out.append(_pure_signal_to_response(r.signal))
+                    continue
                 # Override signal_id to use LIVE prefix for real data
                 signal_dict = r.signal.model_dump()
                 signal_dict["signal_id"] = _generate_live_signal_id()
@@ -336,15 +371,18 @@ async def create_signals_batch(
                 
                 signals_out.append(_pure_signal_to_response(live_signal))
                 valid_signals.append(live_signal)
-                # Save to repository
-                repository.save(live_signal)
-                # Log signal generation
-                activity.log_signal_generated(
-                    signal_id=live_signal.signal_id,
-                    title=live_signal.title,
-                    confidence_label=live_signal.confidence_level.value,
-                    confidence_level=str(live_signal.confidence_score),
-                )
+
+        # Save to repository (one bulk write for the batch)
+        await _save_many(repository, valid_signals)
+
+        for live_signal in valid_signals:
+            # Log signal generation
+            activity.log_signal_generated(
+                signal_id=live_signal.signal_id,
+                title=live_signal.title,
+                confidence_label=live_signal.confidence_level.value,
+                confidence_level=str(live_signal.confidence_score),
+            )
 
         n = len(results)
         passed = sum(1 for r in results if r.success and r.signal is not None)
@@ -356,7 +394,7 @@ async def create_signals_batch(
             events_received=n,
             events_validated=passed,
             events_rejected=rejected,
-            signals_generated=len(signals_out),
+            signals_generated=len(valid_signals),
             processing_time_ms=processing_time,
             signals=valid_signals,
         )
@@ -401,8 +439,11 @@ List recent signals with pagination.
 **Query Parameters:**
 - `limit`: Max signals to return (default: 100, max: 1000)
 - `offset`: Pagination offset (default: 0)
+- `cursor`: Keyset cursor from a previous response's `next_cursor`
 - `since`: Only return signals after this timestamp (ISO 8601)
 - `mode`: Filter by mode: 'live' (real signals only), 'demo' (demo signals only), or 'all' (default)
+- `view`: 'full' (default) returns the standard signal contract; 'summary' returns
+  list-view fields only and, on PostgreSQL, an estimated `total`
 
 **Example Request:**
 ```
@@ -411,7 +452,7 @@ GET /api/v1/signals/?limit=10&mode=live
 
 **Response includes:**
 - List of redacted signals
-- Pagination metadata (total, limit, offset)
+- Pagination metadata (total, total_is_estimate, limit, offset, next_cursor)
 - Data mode indicator
     """,
     responses={
@@ -432,8 +473,10 @@ GET /api/v1/signals/?limit=10&mode=live
                             }
                         ],
                         "total": 150,
+                        "total_is_estimate": False,
                         "limit": 100,
                         "offset": 0,
+                        "next_cursor": None,
                         "data_mode": "live",
                     }
                 }
@@ -444,12 +487,18 @@ GET /api/v1/signals/?limit=10&mode=live
 async def list_signals(
     limit: int = Query(default=100, le=1000, description="Maximum number of signals to return"),
     offset: int = Query(default=0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(
+        default=None, description="Cursor from a previous response (next_cursor)"
+    ),
     since: datetime | None = Query(
         default=None, description="Only return signals after this timestamp"
     ),
     mode: Literal["live", "demo", "all"] | None = Query(
         default=None, description="Filter by mode: live (real only), demo (demo only), all"
     ),
+    view: Literal["full", "summary"] = Query(
+        default="full", description="Item shape: full signal contract or list-view summary"
+    ),
     repository: SignalRepository = Depends(get_repository),
     auth: AuthContext = Depends(require_signals_read),  # RBAC: read:signals
 ) -> dict:
@@ -461,8 +510,66 @@ async def list_signals(
     - live: Only signals without "DEMO" in their ID (real signals)
     - demo: Only signals with "DEMO" in their ID
     - all/None: All signals
+
+    Without a mode filter, the first page (offset 0) and any page requested
+    with `cursor` use keyset pagination on (generated_at, signal_id) and
+    return `next_cursor` for the following page.
+
+    Every page has the same item shape: the standard redacted signal, or
+    with view=summary the list-view fields only. Async repositories
+    (PostgreSQL) are awaited; with view=summary their keyset pages come
+    from the payload-free summary projection and `total` is the planner
+    estimate, flagged by `total_is_estimate`.
     """
-    signals = repository.find_recent(limit=limit * 2 if mode else limit, offset=0 if mode else offset, since=since)
+    is_async = isinstance(repository, AsyncSignalRepository)
+    summary = view == "summary"
+    to_api = redact_summary_for_api if summary else redact_for_api
+    total_is_estimate = False
+
+    if not mode and (cursor is not None or offset == 0):
+        after = None
+        if cursor is not None:
+            after = cursor_keyset(decode_cursor(cursor))
+            if after is None:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        if is_async and summary:
+            items = await repository.find_summaries_async(
+                limit=limit + 1, after=after, since=since
+            )
+            total = await repository.count_async(since=since, estimate=True)
+            total_is_estimate = True
+        elif is_async:
+            items = await repository.find_page_async(limit=limit + 1, after=after, since=since)
+            total = await repository.count_async(since=since)
+        else:
+            items = repository.find_page(limit=limit + 1, after=after, since=since)
+            total = repository.count(since=since)
+        page = create_page_response(
+            items,
+            limit,
+            get_item_id=lambda s: s.signal_id,
+            get_item_timestamp=lambda s: (
+                s.generated_at or datetime.min.replace(tzinfo=timezone.utc)
+            ),
+        )
+        return {
+            "signals": [to_api(s) for s in page.items],
+            "total": total,
+            "total_is_estimate": total_is_estimate,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": page.next_cursor,
+            "data_mode": "all",
+        }
+
+    fetch_limit = limit * 2 if mode else limit
+    fetch_offset = 0 if mode else offset
+    if is_async:
+        signals = await repository.find_recent_async(
+            limit=fetch_limit, since=since, offset=fetch_offset
+        )
+    else:
+        signals = repository.find_recent(limit=fetch_limit, offset=fetch_offset, since=since)
     
     # Filter by mode
     if mode == "live":
@@ -474,16 +581,20 @@ async def list_signals(
     
     # Apply pagination after filtering
     if mode:
-        total_filtered = len(signals)
+        total = len(signals)
         signals = signals[offset:offset + limit]
+    elif is_async:
+        total = await repository.count_async(since=since)
     else:
-        total_filtered = repository.count(since=since)
+        total = repository.count(since=since)
     
     return {
-        "signals": [redact_for_api(s) for s in signals],
-        "total": total_filtered if mode else repository.count(since=since),
+        "signals": [to_api(s) for s in signals],
+        "total": total,
+        "total_is_estimate": False,
         "limit": limit,
         "offset": offset,
+        "next_cursor": None,
         "data_mode": mode or "all",
     }
 
@@ -61,7 +61,7 @@ class ConnectionManager:
         """Get active connections (for backward compatibility)."""
         dm = self._get_distributed()
         # Return local connections from the signals channel
-        return dm.pubsub._local_connections.get(dm.CHANNEL_SIGNALS, set())
+        return dm.pubsub.get_local_connections(dm.CHANNEL_SIGNALS)
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new connection."""
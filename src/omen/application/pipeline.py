@@ -15,6 +15,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Sequence
+import asyncio
 import logging
 
 from ..domain.models.common import RulesetVersion, ImpactDomain
@@ -35,7 +36,7 @@ from ..infrastructure.activity.activity_logger import get_activity_logger
 from ..infrastructure.realtime.price_streamer import get_price_streamer
 from ..infrastructure.debug.rejection_tracker import get_rejection_tracker
 
-from .ports.signal_repository import SignalRepository
+from .ports.signal_repository import AsyncSignalRepository, SignalRepository
 from .ports.output_publisher import OutputPublisher
 from .dto.pipeline_result import PipelineResult, PipelineStats
 
@@ -76,7 +77,7 @@ class OmenPipeline:
         self,
         validator: SignalValidator,
         enricher: SignalEnricher,
-        repository: SignalRepository | None = None,
+        repository: SignalRepository | AsyncSignalRepository | None = None,
         publisher: OutputPublisher | None = None,
         dead_letter_queue: DeadLetterQueue | None = None,
         config: PipelineConfig | None = None,
@@ -144,10 +145,8 @@ class OmenPipeline:
 
         try:
             return self._process_single_inner(event, stats, ctx)
-        except OmenError as e:
-            return self._handle_omen_error(event, e, stats, ctx)
         except Exception as e:
-            return self._handle_unexpected_error(event, e, stats, ctx)
+            return self._handle_error(event, e, stats, ctx)
 
     def _process_single_inner(
         self,
@@ -156,113 +155,300 @@ class OmenPipeline:
         ctx: ProcessingContext,
     ) -> PipelineResult:
         started_at = ctx.processing_time
-        
+
         # === REDIS CACHE CHECK (fast path) ===
-        try:
-            from ..infrastructure.redis import get_redis_state_manager
-            redis_manager = get_redis_state_manager()
-            cache_key = f"signal:{event.input_event_hash}"
-            
-            if redis_manager.is_connected:
-                import asyncio
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    cached = asyncio.run(redis_manager.cache_get(cache_key))
-                    if cached:
-                        logger.debug("Signal cache hit for %s", event.event_id)
-                        stats.events_deduplicated = 1
-                        stats.processing_time_ms = (
-                            datetime.now(timezone.utc) - started_at
-                        ).total_seconds() * 1000
-                        # Reconstruct signal from cache
-                        from ..domain.models.omen_signal import OmenSignal
-                        signal = OmenSignal.model_validate(cached)
-                        return PipelineResult(
-                            success=True,
-                            signals=[signal],
-                            stats=stats,
-                            cached=True,
-                        )
-        except Exception as e:
-            logger.debug("Redis cache check failed (non-fatal): %s", e)
-        
+        cached_signal = self._cache_lookup([event]).get(event.input_event_hash)
+        if cached_signal is not None:
+            logger.debug("Signal cache hit for %s", event.event_id)
+            return self._cache_hit_result(cached_signal, stats, started_at)
+
         # === IDEMPOTENCY CHECK (database fallback) ===
         if self._repository:
             existing = self._repository.find_by_hash(event.input_event_hash)
             if existing:
-                logger.info(
-                    "Event %s already processed, returning cached result",
-                    event.event_id,
-                )
-                stats.events_deduplicated = 1
-                stats.processing_time_ms = (
-                    datetime.now(timezone.utc) - started_at
-                ).total_seconds() * 1000
-                result = PipelineResult(
-                    success=True,
-                    signals=[existing],
-                    stats=stats,
-                    cached=True,
-                )
-                self._record_metrics(result)
-                return result
+                return self._deduplicated_result(event, existing, stats, started_at)
 
         # === LAYER 2: VALIDATION ===
         outcome = self._validator.validate(event, context=ctx)
         if not outcome.passed:
+            return self._rejected_result(event, outcome, stats, started_at)
+
+        # === LAYER 2.5: CROSS-SOURCE CORRELATION (optional) ===
+        correlation = self._correlate([event])[0]
+
+        # === LAYERS 3-4: ENRICHMENT + PURE OMEN SIGNAL ===
+        result = self._generate_signal(event, outcome, correlation, stats, started_at)
+        if not result.signals:
+            return result
+
+        # === CACHE, PERSIST & PUBLISH ===
+        self._cache_store([(event, signal) for signal in result.signals])
+        if not self._config.enable_dry_run:
+            self._persist(result.signals)
+            for signal in result.signals:
+                self._publish(signal)
+        return self._finish_generated(result, started_at)
+
+    # =========================================================================
+    # STAGES - shared by process_single and process_batch
+    # =========================================================================
+
+    @staticmethod
+    def _elapsed_ms(started_at: datetime) -> float:
+        return (datetime.now(timezone.utc) - started_at).total_seconds() * 1000
+
+    def _cache_lookup(self, events: Sequence[RawSignalEvent]) -> dict[str, OmenSignal]:
+        """
+        Look up previously generated signals in Redis, keyed by input hash.
+
+        Only runs when no event loop is running (sync callers); inside a loop
+        the Redis client cannot be driven synchronously and the check is
+        skipped - async callers should use process_single_async, which
+        awaits Redis directly. Any failure is treated as a cache miss.
+        """
+        try:
+            from ..infrastructure.redis import get_redis_state_manager
+            redis_manager = get_redis_state_manager()
+            if not redis_manager.is_connected:
+                return {}
+            import asyncio
             try:
-                tracker = get_rejection_tracker()
-                first_result = outcome.results[0] if outcome.results else None
-                tracker.record_rejection(
-                    event_id=str(event.event_id),
-                    stage="validation",
-                    reason=outcome.rejection_reason or "unknown",
-                    title=event.title,
-                    probability=event.probability,
-                    liquidity=event.market.current_liquidity_usd,
-                    keywords_found=list(event.keywords) if event.keywords else [],
-                    rule_name=first_result.rule_name if first_result else None,
-                    rule_version=first_result.rule_version if first_result else None,
-                )
-            except Exception as e:
-                logger.warning("Failed to record validation rejection: %s", e)
-            logger.info(
-                "Event %s rejected at validation: %s",
-                event.event_id,
-                outcome.rejection_reason or "unknown",
-            )
-            stats.events_rejected_validation = 1
-            
-            # Record quality metrics for rejected validation
+                asyncio.get_running_loop()
+                return {}
+            except RuntimeError:
+                pass
+            keys = {f"signal:{e.input_event_hash}": e.input_event_hash for e in events}
+            cached = asyncio.run(redis_manager.cache_get_many(list(keys)))
+            return {
+                keys[key]: OmenSignal.model_validate(value)
+                for key, value in cached.items()
+                if value
+            }
+        except Exception as e:
+            logger.debug("Redis cache check failed (non-fatal): %s", e)
+            return {}
+
+    def _cache_store(self, pairs: Sequence[tuple[RawSignalEvent, OmenSignal]]) -> None:
+        """Cache generated signals in Redis for fast lookup (sync callers only)."""
+        if not pairs:
+            return
+        try:
+            from ..infrastructure.redis import get_redis_state_manager
+            redis_manager = get_redis_state_manager()
+            if not redis_manager.is_connected:
+                return
+            import asyncio
             try:
-                quality_metrics = get_quality_metrics()
-                quality_metrics.record_validation(passed=False, results=outcome.results or [])
-            except Exception as e:
-                logger.debug("Failed to record quality metrics: %s", e)
-            stats.processing_time_ms = (
-                datetime.now(timezone.utc) - started_at
-            ).total_seconds() * 1000
-            result = PipelineResult(
-                success=True,
-                signals=[],
-                validation_failures=outcome.results or [],
-                stats=stats,
+                asyncio.get_running_loop()
+                return
+            except RuntimeError:
+                pass
+            asyncio.run(redis_manager.cache_set_many(
+                {
+                    f"signal:{event.input_event_hash}": signal.model_dump(mode='json')
+                    for event, signal in pairs
+                },
+                ttl=3600,  # 1 hour TTL
+            ))
+            logger.debug("Cached %d signal(s) in Redis", len(pairs))
+        except Exception as e:
+            logger.debug("Failed to cache signal in Redis: %s", e)
+
+    def _cache_hit_result(
+        self,
+        signal: OmenSignal,
+        stats: PipelineStats,
+        started_at: datetime,
+    ) -> PipelineResult:
+        stats.events_deduplicated = 1
+        stats.processing_time_ms = self._elapsed_ms(started_at)
+        return PipelineResult(
+            success=True,
+            signals=[signal],
+            stats=stats,
+            cached=True,
+        )
+
+    def _deduplicated_result(
+        self,
+        event: RawSignalEvent,
+        existing: OmenSignal,
+        stats: PipelineStats,
+        started_at: datetime,
+    ) -> PipelineResult:
+        logger.info(
+            "Event %s already processed, returning cached result",
+            event.event_id,
+        )
+        stats.events_deduplicated = 1
+        stats.processing_time_ms = self._elapsed_ms(started_at)
+        result = PipelineResult(
+            success=True,
+            signals=[existing],
+            stats=stats,
+            cached=True,
+        )
+        self._record_metrics(result)
+        return result
+
+    def _rejected_result(
+        self,
+        event: RawSignalEvent,
+        outcome: ValidationOutcome,
+        stats: PipelineStats,
+        started_at: datetime,
+    ) -> PipelineResult:
+        try:
+            tracker = get_rejection_tracker()
+            first_result = outcome.results[0] if outcome.results else None
+            tracker.record_rejection(
+                event_id=str(event.event_id),
+                stage="validation",
+                reason=outcome.rejection_reason or "unknown",
+                title=event.title,
+                probability=event.probability,
+                liquidity=event.market.current_liquidity_usd,
+                keywords_found=list(event.keywords) if event.keywords else [],
+                rule_name=first_result.rule_name if first_result else None,
+                rule_version=first_result.rule_version if first_result else None,
             )
+        except Exception as e:
+            logger.warning("Failed to record validation rejection: %s", e)
+        logger.info(
+            "Event %s rejected at validation: %s",
+            event.event_id,
+            outcome.rejection_reason or "unknown",
+        )
+        stats.events_rejected_validation = 1
+        
+        # Record quality metrics for rejected validation
+        try:
+            quality_metrics = get_quality_metrics()
+            quality_metrics.record_validation(passed=False, results=outcome.results or [])
+        except Exception as e:
+            logger.debug("Failed to record quality metrics: %s", e)
+        stats.processing_time_ms = self._elapsed_ms(started_at)
+        result = PipelineResult(
+            success=True,
+            signals=[],
+            validation_failures=outcome.results or [],
+            stats=stats,
+        )
+        try:
+            activity = get_activity_logger()
+            rule_name = outcome.results[0].rule_name if outcome.results else "validation"
+            activity.log_event_validated(
+                event_id=str(event.event_id),
+                market_id=str(event.market.market_id),
+                rule_name=rule_name,
+                passed=False,
+                reason=outcome.rejection_reason,
+            )
+        except Exception as e:
+            logger.warning("Failed to log validation activity: %s", e)
+        self._record_metrics(result)
+        return result
+
+    def _correlate(self, events: Sequence[RawSignalEvent]) -> list[tuple[float, str]]:
+        """
+        Run cross-source correlation for validated events.
+
+        Returns one (confidence_adjustment, correlation_summary) pair per
+        event. Outside an event loop all events share a single loop and are
+        correlated concurrently; failures degrade to (0.0, "").
+        """
+        neutral = [(0.0, "") for _ in events]
+        if self._orchestrator is None or not events:
+            return neutral
+
+        import asyncio
+        import concurrent.futures
+
+        # ✅ FIX: Properly handle async correlation in both sync and async contexts
+        correlation_results: list = [None] * len(events)
+        try:
             try:
-                activity = get_activity_logger()
-                rule_name = outcome.results[0].rule_name if outcome.results else "validation"
-                activity.log_event_validated(
-                    event_id=str(event.event_id),
-                    market_id=str(event.market.market_id),
-                    rule_name=rule_name,
-                    passed=False,
-                    reason=outcome.rejection_reason,
+                loop = asyncio.get_running_loop()
+                # Already in async context (e.g., FastAPI)
+                # Use run_coroutine_threadsafe to properly await in the event loop
+                futures = [
+                    asyncio.run_coroutine_threadsafe(
+                        self._orchestrator.process_signal(event), loop
+                    )
+                    for event in events
+                ]
+                # Wait for results with one shared timeout
+                concurrent.futures.wait(futures, timeout=10.0)
+                for i, (event, future) in enumerate(zip(events, futures)):
+                    if not future.done():
+                        future.cancel()
+                        logger.warning(
+                            "Cross-source correlation timed out for %s", event.event_id
+                        )
+                    elif future.exception() is not None:
+                        logger.debug(
+                            "Cross-source correlation in async context failed: %s",
+                            future.exception(),
+                        )
+                    else:
+                        correlation_results[i] = future.result()
+            except RuntimeError:
+                # No running loop - create one (sync context)
+                async def _gather() -> list:
+                    return await asyncio.gather(
+                        *(self._orchestrator.process_signal(event) for event in events),
+                        return_exceptions=True,
+                    )
+
+                for i, outcome in enumerate(asyncio.run(_gather())):
+                    if isinstance(outcome, Exception):
+                        logger.warning(
+                            "Cross-source correlation failed (non-fatal): %s", outcome
+                        )
+                    else:
+                        correlation_results[i] = outcome
+        except Exception as e:
+            logger.warning("Cross-source correlation failed (non-fatal): %s", e)
+            return neutral
+
+        correlations: list[tuple[float, str]] = []
+        for event, correlation_result in zip(events, correlation_results):
+            if correlation_result is None:
+                correlations.append((0.0, ""))
+                continue
+            correlation_adjustment = correlation_result.confidence_adjustment
+            correlation_summary = correlation_result.correlation_summary
+            if abs(correlation_adjustment) > 0.01:
+                logger.info(
+                    "✅ Cross-source correlation for %s: adjustment=%.2f, summary=%s",
+                    event.event_id,
+                    correlation_adjustment,
+                    correlation_summary[:100] if correlation_summary else "N/A",
                 )
-            except Exception as e:
-                logger.warning("Failed to log validation activity: %s", e)
-            self._record_metrics(result)
-            return result
+            else:
+                logger.debug(
+                    "Cross-source correlation for %s: no significant adjustment (%.4f)",
+                    event.event_id,
+                    correlation_adjustment,
+                )
+            correlations.append((correlation_adjustment, correlation_summary))
+        return correlations
+
+    def _generate_signal(
+        self,
+        event: RawSignalEvent,
+        outcome: ValidationOutcome,
+        correlation: tuple[float, str],
+        stats: PipelineStats,
+        started_at: datetime,
+    ) -> PipelineResult:
+        """
+        Enrich a validated event and build its OmenSignal.
+
+        Results without signals are final (metrics already recorded). A
+        result carrying a signal still has to be cached, persisted,
+        published and passed to _finish_generated by the caller.
+        """
         validated_signal = outcome.signal
         assert validated_signal is not None
         stats.events_validated = 1
@@ -286,58 +472,7 @@ class OmenPipeline:
         except Exception as e:
             logger.warning("Failed to log validation activity: %s", e)
 
-        # === LAYER 2.5: CROSS-SOURCE CORRELATION (optional) ===
-        correlation_adjustment = 0.0
-        correlation_summary = ""
-        
-        if self._orchestrator is not None:
-            try:
-                import asyncio
-                import concurrent.futures
-                
-                # ✅ FIX: Properly handle async correlation in both sync and async contexts
-                correlation_result = None
-                
-                try:
-                    loop = asyncio.get_running_loop()
-                    # Already in async context (e.g., FastAPI)
-                    # Use run_coroutine_threadsafe to properly await in the event loop
-                    future = asyncio.run_coroutine_threadsafe(
-                        self._orchestrator.process_signal(event),
-                        loop
-                    )
-                    try:
-                        # Wait for result with timeout
-                        correlation_result = future.result(timeout=10.0)
-                    except concurrent.futures.TimeoutError:
-                        logger.warning("Cross-source correlation timed out for %s", event.event_id)
-                    except Exception as e:
-                        logger.debug("Cross-source correlation in async context failed: %s", e)
-                except RuntimeError:
-                    # No running loop - create one (sync context)
-                    correlation_result = asyncio.run(
-                        self._orchestrator.process_signal(event)
-                    )
-                
-                if correlation_result is not None:
-                    correlation_adjustment = correlation_result.confidence_adjustment
-                    correlation_summary = correlation_result.correlation_summary
-                    
-                    if abs(correlation_adjustment) > 0.01:
-                        logger.info(
-                            "✅ Cross-source correlation for %s: adjustment=%.2f, summary=%s",
-                            event.event_id,
-                            correlation_adjustment,
-                            correlation_summary[:100] if correlation_summary else "N/A",
-                        )
-                    else:
-                        logger.debug(
-                            "Cross-source correlation for %s: no significant adjustment (%.4f)",
-                            event.event_id,
-                            correlation_adjustment,
-                        )
-            except Exception as e:
-                logger.warning("Cross-source correlation failed (non-fatal): %s", e)
+        correlation_adjustment, correlation_summary = correlation
         
         # === GET SOURCE TRUST WEIGHT ===
         source_trust = 0.85  # Default
@@ -382,9 +517,7 @@ class OmenPipeline:
                 )
             except Exception as e2:
                 logger.warning("Failed to record generation rejection: %s", e2)
-            stats.processing_time_ms = (
-                datetime.now(timezone.utc) - started_at
-            ).total_seconds() * 1000
+            stats.processing_time_ms = self._elapsed_ms(started_at)
             result = PipelineResult(success=True, signals=[], stats=stats)
             self._record_metrics(result)
             return result
@@ -407,9 +540,7 @@ class OmenPipeline:
                 signal.confidence_score,
                 self._config.min_confidence_for_output,
             )
-            stats.processing_time_ms = (
-                datetime.now(timezone.utc) - started_at
-            ).total_seconds() * 1000
+            stats.processing_time_ms = self._elapsed_ms(started_at)
             result = PipelineResult(success=True, signals=[], stats=stats)
             self._record_metrics(result)
             return result
@@ -428,7 +559,6 @@ class OmenPipeline:
         except Exception as e:
             logger.warning("Failed to record passed signal: %s", e)
 
-        signals: list[OmenSignal] = [signal]
         stats.signals_generated = 1
 
         try:
@@ -501,65 +631,62 @@ class OmenPipeline:
             self._trust_manager.record_signal_accuracy(source_name, True)
         except Exception as e:
             logger.debug("Failed to record signal accuracy: %s", e)
-        
-        # Cache signal in Redis for fast lookup
+
+        return PipelineResult(success=True, signals=[signal], stats=stats)
+
+    def _persist(self, signals: Sequence[OmenSignal]) -> None:
+        """Persist signals in one bulk write, falling back to per-signal saves."""
+        if not self._repository or not signals:
+            return
+        if len(signals) > 1:
+            try:
+                self._repository.save_many(signals)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Bulk persist of %d signals failed, saving individually: %s",
+                    len(signals),
+                    e,
+                )
+        for signal in signals:
+            try:
+                self._repository.save(signal)
+            except PersistenceError as e:
+                logger.error("Failed to persist signal: %s", e)
+            except Exception as e:
+                logger.error(
+                    "Unexpected error persisting signal %s: %s",
+                    signal.signal_id,
+                    e,
+                    exc_info=True,
+                )
+
+    def _publish(self, signal: OmenSignal) -> None:
+        """Publish one signal; re-raises only if fail_on_publish_error is set."""
+        if not self._publisher:
+            return
         try:
-            from ..infrastructure.redis import get_redis_state_manager
-            redis_manager = get_redis_state_manager()
-            cache_key = f"signal:{event.input_event_hash}"
-            
-            if redis_manager.is_connected:
-                import asyncio
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    asyncio.run(redis_manager.cache_set(
-                        cache_key,
-                        signal.model_dump(mode='json'),
-                        ttl=3600,  # 1 hour TTL
-                    ))
-                    logger.debug("Cached signal %s in Redis", signal.signal_id)
+            self._publisher.publish(signal)
+        except PublishError as e:
+            logger.error(
+                "Failed to publish signal %s: %s",
+                signal.signal_id,
+                e,
+            )
+            if self._config.fail_on_publish_error:
+                raise
         except Exception as e:
-            logger.debug("Failed to cache signal in Redis: %s", e)
-
-        # === PERSIST & PUBLISH (with error handling) ===
-        if not self._config.enable_dry_run:
-            for signal in signals:
-                if self._repository:
-                    try:
-                        self._repository.save(signal)
-                    except PersistenceError as e:
-                        logger.error("Failed to persist signal: %s", e)
-                    except Exception as e:
-                        logger.error(
-                            "Unexpected error persisting signal %s: %s",
-                            signal.signal_id,
-                            e,
-                            exc_info=True,
-                        )
-                if self._publisher:
-                    try:
-                        self._publisher.publish(signal)
-                    except PublishError as e:
-                        logger.error(
-                            "Failed to publish signal %s: %s",
-                            signal.signal_id,
-                            e,
-                        )
-                        if self._config.fail_on_publish_error:
-                            raise
-                    except Exception as e:
-                        logger.error(
-                            "Unexpected error publishing signal %s: %s",
-                            signal.signal_id,
-                            e,
-                            exc_info=True,
-                        )
-                        if self._config.fail_on_publish_error:
-                            raise
+            logger.error(
+                "Unexpected error publishing signal %s: %s",
+                signal.signal_id,
+                e,
+                exc_info=True,
+            )
+            if self._config.fail_on_publish_error:
+                raise
 
-        stats.processing_time_ms = (datetime.now(timezone.utc) - started_at).total_seconds() * 1000
-        result = PipelineResult(success=True, signals=signals, stats=stats)
+    def _finish_generated(self, result: PipelineResult, started_at: datetime) -> PipelineResult:
+        result.stats.processing_time_ms = self._elapsed_ms(started_at)
         self._record_metrics(result)
         return result
 
@@ -635,23 +762,196 @@ class OmenPipeline:
     def process_batch(
         self,
         events: Sequence[RawSignalEvent],
+        context: ProcessingContext | None = None,
     ) -> list[PipelineResult]:
-        """Process multiple events. Each event is processed independently."""
-        results = []
-        for event in events:
+        """
+        Process multiple events as one vectorized batch.
+
+        Each stage runs once over the whole batch: a single bulk Redis and
+        repository idempotency lookup, each validation rule applied across
+        every event (SignalValidator.validate_batch), correlation for all
+        validated events in one loop, then one bulk persist/publish. Results
+        are returned in input order and match process_single event for event;
+        the only difference is that all events share one ProcessingContext.
+
+        Args:
+            events: Raw signal events to process.
+            context: Processing context shared by the batch. If None, creates
+                a new context. Pass explicit context for deterministic replay.
+        """
+        if not events:
+            return []
+        ctx = context or ProcessingContext.create(self._config.ruleset_version)
+        logger.info("Processing batch of %d events", len(events))
+        return self._process_batch_inner(list(events), ctx)
+
+    def _process_batch_inner(
+        self,
+        events: list[RawSignalEvent],
+        ctx: ProcessingContext,
+    ) -> list[PipelineResult]:
+        started_at = ctx.processing_time
+        results: list[PipelineResult | None] = [None] * len(events)
+        stats = [PipelineStats(events_received=1) for _ in events]
+
+        # Repeated inputs within one batch are handled in a follow-up round,
+        # after this round has persisted, so they dedupe exactly as they
+        # would when processed one by one.
+        first: list[int] = []
+        repeats: list[int] = []
+        seen: set[str] = set()
+        for i, event in enumerate(events):
+            input_hash = event.input_event_hash
+            (repeats if input_hash in seen else first).append(i)
+            seen.add(input_hash)
+
+        # === REDIS CACHE CHECK (fast path, one round-trip) ===
+        cached = self._cache_lookup([events[i] for i in first])
+        pending: list[int] = []
+        for i in first:
+            cached_signal = cached.get(events[i].input_event_hash)
+            if cached_signal is not None:
+                logger.debug("Signal cache hit for %s", events[i].event_id)
+                results[i] = self._cache_hit_result(cached_signal, stats[i], started_at)
+            else:
+                pending.append(i)
+
+        # === IDEMPOTENCY CHECK (one bulk repository lookup) ===
+        if self._repository and pending:
+            try:
+                existing = self._repository.find_by_hashes(
+                    [events[i].input_event_hash for i in pending]
+                )
+            except Exception as e:
+                logger.warning(
+                    "Bulk idempotency lookup failed, processing batch per event: %s", e
+                )
+                return self._process_batch_sequential(events, results)
+            remaining = []
+            for i in pending:
+                found = existing.get(events[i].input_event_hash)
+                if found is not None:
+                    results[i] = self._deduplicated_result(
+                        events[i], found, stats[i], started_at
+                    )
+                else:
+                    remaining.append(i)
+            pending = remaining
+
+        # === LAYER 2: VALIDATION (rule-major over the batch) ===
+        outcomes = self._validate_batch([events[i] for i in pending], ctx, stats, pending, results)
+        passed: list[int] = []
+        for i, outcome in zip(pending, outcomes):
+            if outcome is None:
+                continue
+            if outcome.passed:
+                passed.append(i)
+            else:
+                results[i] = self._rejected_result(events[i], outcome, stats[i], started_at)
+
+        # === LAYER 2.5: CROSS-SOURCE CORRELATION ===
+        correlations = self._correlate([events[i] for i in passed])
+        outcome_by_index = dict(zip(pending, outcomes))
+
+        # === LAYERS 3-4: ENRICHMENT + PURE OMEN SIGNAL ===
+        generated: list[int] = []
+        for i, correlation in zip(passed, correlations):
+            try:
+                results[i] = self._generate_signal(
+                    events[i], outcome_by_index[i], correlation, stats[i], started_at
+                )
+            except Exception as e:
+                results[i] = self._handle_error(events[i], e, stats[i], ctx)
+                continue
+            if results[i].signals:
+                generated.append(i)
+
+        # === CACHE, PERSIST & PUBLISH (bulk) ===
+        self._cache_store(
+            [(events[i], signal) for i in generated for signal in results[i].signals]
+        )
+        if not self._config.enable_dry_run:
+            self._persist([signal for i in generated for signal in results[i].signals])
+        for i in generated:
+            try:
+                if not self._config.enable_dry_run:
+                    for signal in results[i].signals:
+                        self._publish(signal)
+                results[i] = self._finish_generated(results[i], started_at)
+            except Exception as e:
+                results[i] = self._handle_error(events[i], e, stats[i], ctx)
+
+        if repeats:
+            for i, result in zip(
+                repeats, self._process_batch_inner([events[i] for i in repeats], ctx)
+            ):
+                results[i] = result
+
+        return [r for r in results if r is not None]
+
+    def _validate_batch(
+        self,
+        events: list[RawSignalEvent],
+        ctx: ProcessingContext,
+        stats: list[PipelineStats],
+        indices: list[int],
+        results: list[PipelineResult | None],
+    ) -> list[ValidationOutcome | None]:
+        """
+        Validate pending events in one batch call.
+
+        Falls back to per-event validation if the batch call raises, so a
+        single bad event fails alone: its error result is stored in results
+        and its outcome is None.
+        """
+        try:
+            return self._validator.validate_batch(events, context=ctx)
+        except Exception as e:
+            logger.warning("Batch validation failed, validating per event: %s", e)
+        outcomes: list[ValidationOutcome | None] = []
+        for i, event in zip(indices, events):
             try:
-                result = self.process_single(event)
-                results.append(result)
+                outcomes.append(self._validator.validate(event, context=ctx))
+            except Exception as e:
+                results[i] = self._handle_error(event, e, stats[i], ctx)
+                outcomes.append(None)
+        return outcomes
+
+    def _handle_error(
+        self,
+        event: RawSignalEvent,
+        error: Exception,
+        stats: PipelineStats,
+        ctx: ProcessingContext,
+    ) -> PipelineResult:
+        """Route a per-event failure the same way process_single does."""
+        if isinstance(error, OmenError):
+            return self._handle_omen_error(event, error, stats, ctx)
+        return self._handle_unexpected_error(event, error, stats, ctx)
+
+    def _process_batch_sequential(
+        self,
+        events: Sequence[RawSignalEvent],
+        results: list[PipelineResult | None] | None = None,
+    ) -> list[PipelineResult]:
+        """Per-event fallback; entries already present in results are kept."""
+        out = []
+        for i, event in enumerate(events):
+            if results is not None and results[i] is not None:
+                out.append(results[i])
+                continue
+            try:
+                out.append(self.process_single(event))
             except Exception as e:
                 logger.error("Failed to process event %s: %s", event.event_id, e)
-                results.append(
+                out.append(
                     PipelineResult(
                         success=False,
                         error=str(e),
                         stats=PipelineStats(events_received=1, events_failed=1),
                     )
                 )
-        return results
+        return out
 
     # =========================================================================
     # ASYNC METHODS - For proper FastAPI integration
@@ -715,7 +1015,7 @@ class OmenPipeline:
         
         # === IDEMPOTENCY CHECK ===
         if self._repository:
-            existing = self._repository.find_by_hash(event.input_event_hash)
+            existing = await self._find_by_hash_async(event.input_event_hash)
             if existing:
                 logger.info("Event %s already processed", event.event_id)
                 stats.events_deduplicated = 1
@@ -731,8 +1031,12 @@ class OmenPipeline:
                 self._record_metrics(result)
                 return result
 
-        # === LAYER 2: VALIDATION ===
-        outcome = self._validator.validate(event, context=ctx)
+        # === LAYER 2: VALIDATION (CPU-bound, off the event loop) ===
+        loop = asyncio.get_running_loop()
+        outcome = await loop.run_in_executor(
+            None,
+            lambda: self._validator.validate(event, context=ctx),
+        )
         if not outcome.passed:
             try:
                 tracker = get_rejection_tracker()
@@ -813,7 +1117,10 @@ class OmenPipeline:
             "validation_results": validated_signal.validation_results,
             "correlation_summary": correlation_summary,
         }
-        enrichment = self._enricher.enrich(event, validation_context)
+        enrichment = await loop.run_in_executor(
+            None,
+            lambda: self._enricher.enrich(event, validation_context),
+        )
 
         # === LAYER 4: PURE OMEN SIGNAL ===
         try:
@@ -862,17 +1169,9 @@ class OmenPipeline:
 
         # === PERSIST & PUBLISH ===
         if not self._config.enable_dry_run:
+            await self._persist_async(signals)
             for sig in signals:
-                if self._repository:
-                    try:
-                        self._repository.save(sig)
-                    except Exception as e:
-                        logger.error("Failed to persist signal: %s", e)
-                if self._publisher:
-                    try:
-                        self._publisher.publish(sig)
-                    except Exception as e:
-                        logger.error("Failed to publish signal: %s", e)
+                await self._publish_async(sig)
 
         stats.processing_time_ms = (
             datetime.now(timezone.utc) - started_at
@@ -881,6 +1180,67 @@ class OmenPipeline:
         self._record_metrics(result)
         return result
 
+    async def _find_by_hash_async(self, input_event_hash: str) -> OmenSignal | None:
+        """
+        Idempotency lookup that never blocks the event loop.
+
+        Uses find_by_hash_async when the repository implements
+        AsyncSignalRepository (e.g. PostgresSignalRepository, whose sync
+        methods cannot run inside a loop); otherwise runs the sync lookup
+        in the default executor.
+        """
+        if isinstance(self._repository, AsyncSignalRepository):
+            return await self._repository.find_by_hash_async(input_event_hash)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._repository.find_by_hash, input_event_hash
+        )
+
+    async def _persist_async(self, signals: Sequence[OmenSignal]) -> None:
+        """Async counterpart of _persist (same per-signal error handling)."""
+        if not self._repository or not signals:
+            return
+        if not isinstance(self._repository, AsyncSignalRepository):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._persist, signals)
+            return
+        for signal in signals:
+            try:
+                await self._repository.save_async(signal)
+            except PersistenceError as e:
+                logger.error("Failed to persist signal: %s", e)
+            except Exception as e:
+                logger.error(
+                    "Unexpected error persisting signal %s: %s",
+                    signal.signal_id,
+                    e,
+                    exc_info=True,
+                )
+
+    async def _publish_async(self, signal: OmenSignal) -> None:
+        """Async counterpart of _publish, using the publisher's publish_async."""
+        if not self._publisher:
+            return
+        try:
+            await self._publisher.publish_async(signal)
+        except PublishError as e:
+            logger.error(
+                "Failed to publish signal %s: %s",
+                signal.signal_id,
+                e,
+            )
+            if self._config.fail_on_publish_error:
+                raise
+        except Exception as e:
+            logger.error(
+                "Unexpected error publishing signal %s: %s",
+                signal.signal_id,
+                e,
+                exc_info=True,
+            )
+            if self._config.fail_on_publish_error:
+                raise
+
     async def process_batch_async(
         self,
         events: Sequence[RawSignalEvent],
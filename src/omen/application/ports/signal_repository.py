@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, Sequence, runtime_checkable
 
 if TYPE_CHECKING:
     from ...domain.models.omen_signal import OmenSignal
@@ -67,6 +67,32 @@ class SignalRepository(ABC):
         """
         ...
 
+    def find_by_hashes(self, input_event_hashes: Sequence[str]) -> "dict[str, OmenSignal]":
+        """
+        Bulk idempotency lookup for a batch of input event hashes.
+
+        Returns a mapping of hash -> stored signal for every hash that has
+        already been processed; unknown hashes are omitted. The default
+        delegates to find_by_hash; adapters should override it with a single
+        round-trip.
+        """
+        found: dict[str, OmenSignal] = {}
+        for input_event_hash in input_event_hashes:
+            signal = self.find_by_hash(input_event_hash)
+            if signal is not None:
+                found[input_event_hash] = signal
+        return found
+
+    def save_many(self, signals: "Sequence[OmenSignal]") -> None:
+        """
+        Persist a batch of OMEN signals.
+
+        The default saves one signal at a time; adapters should override it
+        with a bulk write.
+        """
+        for signal in signals:
+            self.save(signal)
+
     @abstractmethod
     def find_by_event_id(self, event_id: str) -> "list[OmenSignal]":
         """Find all signals generated from a source event."""
@@ -89,6 +115,38 @@ class SignalRepository(ABC):
         """
         ...
 
+    def find_page(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        since: datetime | None = None,
+    ) -> "list[OmenSignal]":
+        """
+        Keyset pagination, newest first, ordered by (generated_at, signal_id).
+
+        Args:
+            limit: Maximum results to return.
+            after: (generated_at, signal_id) of the last item of the previous
+                page; only strictly older signals are returned.
+            since: If set, only return signals with generated_at >= since.
+
+        The default walks find_recent; adapters should override it with an
+        index seek.
+        """
+        page: list[OmenSignal] = []
+        offset = 0
+        chunk = max(limit, 100)
+        while len(page) < limit:
+            batch = self.find_recent(limit=chunk, offset=offset, since=since)
+            if not batch:
+                break
+            for signal in batch:
+                key = (signal.generated_at, signal.signal_id)
+                if after is None or (key[0] is not None and key < after):
+                    page.append(signal)
+            offset += len(batch)
+        return page[:limit]
+
     @abstractmethod
     def count(self, since: datetime | None = None) -> int:
         """Count total signals, optionally only those after since."""
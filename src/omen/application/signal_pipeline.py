@@ -9,7 +9,7 @@ No impact translation. Impact assessment is RiskCast's responsibility.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 from ..domain.models.common import RulesetVersion
 from ..domain.models.context import ProcessingContext
@@ -28,6 +28,7 @@ class SignalProcessingResult:
     signal: Optional[OmenSignal] = None
     rejection_stage: Optional[str] = None
     rejection_reason: Optional[str] = None
+    deduplicated: bool = False
 
 
 class SignalOnlyPipeline:
@@ -64,7 +65,14 @@ class SignalOnlyPipeline:
 
         # === STAGE 1: VALIDATION ===
         outcome: ValidationOutcome = self._validator.validate(event, context=ctx)
+        return self._from_outcome(event, outcome)
 
+    def _from_outcome(
+        self,
+        event: RawSignalEvent,
+        outcome: ValidationOutcome,
+    ) -> SignalProcessingResult:
+        """Record a rejection, or enrich and generate the OmenSignal."""
         if not outcome.passed:
             self._tracker.record_rejection(
                 event_id=str(event.event_id),
@@ -141,9 +149,34 @@ class SignalOnlyPipeline:
 
     def process_batch(
         self,
-        events: list[RawSignalEvent],
+        events: Sequence[RawSignalEvent],
         context: ProcessingContext | None = None,
+        existing: Mapping[str, OmenSignal] | None = None,
     ) -> list[SignalProcessingResult]:
-        """Process multiple events through the signal-only pipeline."""
+        """
+        Process multiple events as one batch.
+
+        Validation runs rule-major over the whole batch
+        (SignalValidator.validate_batch), so outcomes match process() event
+        for event. Events whose input_event_hash is in `existing` (the
+        caller's bulk idempotency lookup, e.g. find_by_hashes) skip the
+        pipeline and return the stored signal with deduplicated=True.
+        Results are in input order.
+        """
         ctx = context or ProcessingContext.create(self._ruleset_version)
-        return [self.process(evt, context=ctx) for evt in events]
+        existing = existing or {}
+        results: list[SignalProcessingResult | None] = [None] * len(events)
+        pending: list[int] = []
+        for i, event in enumerate(events):
+            stored = existing.get(event.input_event_hash)
+            if stored is not None:
+                results[i] = SignalProcessingResult(
+                    success=True, signal=stored, deduplicated=True
+                )
+            else:
+                pending.append(i)
+
+        outcomes = self._validator.validate_batch([events[i] for i in pending], ctx)
+        for i, outcome in zip(pending, outcomes):
+            results[i] = self._from_outcome(events[i], outcome)
+        return results
@@ -30,6 +30,9 @@ class RetentionConfig(BaseSettings):
     compress_after_days: int = Field(default=7, description="Compress sealed segments after N days")
     compression_algorithm: str = Field(default="gzip", description="gzip, zstd, lz4")
     compression_level: int = Field(default=6, ge=1, le=9, description="Gzip level 1-9")
+    columnar_export: bool = Field(
+        default=False, description="Write numpy column files for sealed partitions"
+    )
     # Archive
     archive_path: Optional[str] = Field(
         default=None, description="Archive path (None = base/_archive)"
@@ -497,6 +497,7 @@ class OmenSignal(BaseModel):
         signal_type, impact_hints = _classifier.classify(
             title=event.title,
             description=event.description,
+            search_text=event.search_text,
         )
 
         # === STATUS: Determine from confidence ===
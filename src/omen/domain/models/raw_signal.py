@@ -5,6 +5,7 @@ normalized into a common internal format.
 """
 
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any
 from pydantic import BaseModel, Field, field_validator, computed_field
 
@@ -12,6 +13,10 @@ from omen.application.ports.time_provider import utc_now
 from .common import EventId, MarketId, GeoLocation, ProbabilityMovement, generate_deterministic_hash
 
 
+# cached_property values stored in RawSignalEvent.__dict__
+_MEMOIZED = ("input_event_hash", "search_text")
+
+
 class MarketMetadata(BaseModel):
     """
     Metadata about the source prediction market.
@@ -97,11 +102,14 @@ class RawSignalEvent(BaseModel):
         return list(set(k.lower().strip() for k in v if k.strip()))
 
     @computed_field
-    @property
+    @cached_property
     def input_event_hash(self) -> str:
         """
         Deterministic hash covering ALL fields that define event identity.
 
+        Computed once per instance (the model is frozen) and reused by every
+        stage and by serialization.
+
         IMPORTANT: If any of these fields change, the hash changes.
         This is the canonical "event fingerprint" for deduplication.
 
@@ -145,6 +153,19 @@ class RawSignalEvent(BaseModel):
         )
         return generate_deterministic_hash(hash_input)
 
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased "title description" text shared by rules and the enricher."""
+        return f"{self.title} {self.description or ''}".lower()
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the event; memoized values are dropped when fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _MEMOIZED:
+                copied.__dict__.pop(name, None)
+        return copied
+
     @property
     def has_sufficient_liquidity(self) -> bool:
         """Quick check for minimum liquidity threshold."""
@@ -5,6 +5,9 @@ Contains validation metadata for auditability.
 """
 
 from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any
+
 from pydantic import BaseModel, Field, computed_field
 
 from omen.application.ports.time_provider import utc_now
@@ -85,15 +88,23 @@ class ValidatedSignal(BaseModel):
         return len(critical_failures) == 0
 
     @computed_field
-    @property
+    @cached_property
     def deterministic_trace_id(self) -> str:
         """
         Trace ID for this validation run.
 
         Deterministic: same input + same ruleset → same trace ID.
+        Computed once per instance (the model is frozen).
         """
         return generate_deterministic_hash(
             self.original_event.input_event_hash, self.ruleset_version, "validated"
         )
 
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the signal; the memoized trace ID is dropped when fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("deterministic_trace_id", None)
+        return copied
+
     model_config = {"frozen": True}
@@ -3,10 +3,9 @@ Geographic Relevance Validation.
 
 Validates that a signal is relevant to logistics chokepoints or regions.
 Uses both chokepoint keywords and expanded logistics keyword database.
-Logistics keywords use word-boundary matching (see keywords.get_matched_keywords).
+Logistics keywords use word-boundary matching (see keywords.match_event).
 """
 
-import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from math import atan2, cos, radians, sin, sqrt
@@ -17,7 +16,7 @@ from ...models.validated_signal import ValidationResult
 from ...models.common import ValidationStatus, GeoLocation
 from ...models.explanation import ExplanationStep
 from ..base import Rule
-from .keywords import get_matched_keywords, calculate_relevance_score
+from .keywords import calculate_relevance_score, logistics_keywords_in, match_event
 
 # Known logistics chokepoints with coordinates
 CHOKEPOINTS: dict[str, GeoLocation] = {
@@ -77,15 +76,12 @@ class GeographicRelevanceRule(Rule[RawSignalEvent, ValidationResult]):
         """Check geographic relevance via chokepoints and/or logistics keywords."""
         matched_chokepoints: list[str] = []
         match_reasons: list[str] = []
-        event_text = f"{input_data.title} {input_data.description or ''}".lower()
-        event_keywords = set(k.lower() for k in input_data.keywords)
+        matches = match_event(input_data)
 
         # Chokepoint keyword matches (whole-word in text to avoid "sport" matching "port")
         for chokepoint, keywords in GEO_KEYWORDS.items():
             for kw in keywords:
-                in_keywords = kw in event_keywords
-                in_text = bool(re.search(r"\b" + re.escape(kw) + r"\b", event_text))
-                if in_keywords or in_text:
+                if kw in matches.tags or kw in matches.text_words:
                     if chokepoint not in matched_chokepoints:
                         matched_chokepoints.append(chokepoint)
                         match_reasons.append(f"keyword '{kw}' → {chokepoint}")
@@ -101,7 +97,7 @@ class GeographicRelevanceRule(Rule[RawSignalEvent, ValidationResult]):
                         match_reasons.append(f"location within {distance:.0f}km of {cp_name}")
 
         # Expanded: any logistics keyword match counts as relevant
-        logistics_matched = get_matched_keywords(event_text)
+        logistics_matched = logistics_keywords_in(matches.text_words)
         if matched_chokepoints:
             score = min(1.0, len(matched_chokepoints) * 0.3 + 0.4)
             return ValidationResult(
@@ -3,9 +3,20 @@ Comprehensive logistics keyword database.
 
 Organized by category for maintainability and reuse across validation rules.
 Uses word-boundary matching so "port" does not match "sport", "strike" not "striker".
+
+All vocabularies (logistics, semantic risk categories, chokepoint keywords,
+category inference, off-topic blocklist) are compiled into one shared
+Aho-Corasick automaton (see KeywordMatcher / match_event), so each event's
+text is scanned once and every rule reads its hits from the same result.
 """
 
-import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from omen.domain.models.raw_signal import RawSignalEvent
 
 LOGISTICS_KEYWORDS: dict[str, list[str]] = {
     "maritime": [
@@ -166,20 +177,233 @@ LOGISTICS_KEYWORDS: dict[str, list[str]] = {
     ],
 }
 
-# Flatten for easy lookup (single set of lowercase keywords)
-_ALL_LOGISTICS_KEYWORDS: set[str] = set()
-for category_keywords in LOGISTICS_KEYWORDS.values():
-    _ALL_LOGISTICS_KEYWORDS.update(kw.lower() for kw in category_keywords)
+# Category inference for validated signals (substring match on title/description,
+# exact match on event keyword tags). Checked in order; first hit wins.
+CATEGORY_INFERENCE_KEYWORDS: dict[str, list[str]] = {
+    "GEOPOLITICAL": ["war", "conflict", "attack", "geopolitical"],
+    "LABOR": ["strike", "labor", "union"],
+    "INFRASTRUCTURE": ["port", "canal", "infrastructure", "shipping"],
+    "CLIMATE": ["climate", "weather", "storm"],
+    "REGULATORY": ["regulation", "policy", "law"],
+    "ECONOMIC": ["economic", "market", "trade"],
+}
+
+# Chokepoint aliases -> canonical chokepoint name (same matching as above)
+CHOKEPOINT_ALIASES: dict[str, str] = {
+    "suez canal": "Suez Canal",
+    "suez": "Suez Canal",
+    "red sea": "Red Sea",
+    "bab el-mandeb": "Bab el-Mandeb Strait",
+    "strait of malacca": "Strait of Malacca",
+    "panama canal": "Panama Canal",
+}
+
+# Flatten for easy lookup (deduplicated lowercase keywords, in category order)
+_LOGISTICS_KEYWORD_ORDER: list[str] = list(
+    dict.fromkeys(kw.lower() for kws in LOGISTICS_KEYWORDS.values() for kw in kws)
+)
+_ALL_LOGISTICS_KEYWORDS: set[str] = set(_LOGISTICS_KEYWORD_ORDER)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same notion of a word character as regex \\w on str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher over a fixed vocabulary (Aho-Corasick automaton).
+
+    One left-to-right pass over the text reports every occurrence of every
+    keyword, including overlapping ones ("taiwan strait" and "strait").
+    Each occurrence is also tagged as whole-word or not, using the same
+    boundary semantics as ``re.search(r"\\b" + re.escape(kw) + r"\\b", text)``,
+    so callers can use either whole-word or substring matching from the
+    same scan. Keywords are matched case-sensitively; callers lowercase.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for kw in dict.fromkeys(keywords):
+            if kw:
+                self._insert(kw)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str) -> None:
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (keyword,)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> list[tuple[int, str, bool]]:
+        """
+        Find all keyword occurrences in text.
+
+        Returns:
+            (end_offset, keyword, is_whole_word) per occurrence, in text order.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: list[tuple[int, str, bool]] = []
+        state = 0
+        n = len(text)
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                after_is_word = end < n and _is_word_char(text[end])
+                for kw in out[state]:
+                    start = end - len(kw)
+                    before_is_word = start > 0 and _is_word_char(text[start - 1])
+                    whole = (
+                        before_is_word != _is_word_char(kw[0])
+                        and after_is_word != _is_word_char(kw[-1])
+                    )
+                    hits.append((end, kw, whole))
+        return hits
+
+
+@dataclass(frozen=True)
+class EventKeywordMatches:
+    """
+    Keyword hits for one event, from a single scan of its text.
+
+    ``text_*`` cover "title description" (lowercased); ``all_*`` additionally
+    cover the event's keyword tags appended to that text, as the semantic
+    relevance rule reads them. ``tags`` are the lowercased keyword tags.
+    """
+
+    text_words: frozenset[str]
+    text_substrings: frozenset[str]
+    all_words: frozenset[str]
+    all_substrings: frozenset[str]
+    tags: frozenset[str]
+
+
+_shared_matcher: KeywordMatcher | None = None
+_shared_matcher_lock = Lock()
+_MATCH_CACHE_SIZE = 2048
+_match_cache: "OrderedDict[tuple, EventKeywordMatches]" = OrderedDict()
+_match_cache_lock = Lock()
+
+
+def get_shared_matcher() -> KeywordMatcher:
+    """Matcher compiled from every keyword vocabulary used by the validation layer."""
+    global _shared_matcher
+    if _shared_matcher is None:
+        with _shared_matcher_lock:
+            if _shared_matcher is None:
+                from .geographic_relevance_rule import GEO_KEYWORDS
+                from .semantic_relevance_rule import OFF_TOPIC_BLOCKLIST, RISK_CATEGORIES
+
+                vocabulary: list[str] = list(_LOGISTICS_KEYWORD_ORDER)
+                vocabulary.extend(OFF_TOPIC_BLOCKLIST)
+                for risk_keywords in RISK_CATEGORIES.values():
+                    vocabulary.extend(risk_keywords)
+                for geo_keywords in GEO_KEYWORDS.values():
+                    vocabulary.extend(geo_keywords)
+                for category_keywords in CATEGORY_INFERENCE_KEYWORDS.values():
+                    vocabulary.extend(category_keywords)
+                vocabulary.extend(CHOKEPOINT_ALIASES)
+                _shared_matcher = KeywordMatcher(kw.lower() for kw in vocabulary)
+    return _shared_matcher
+
+
+def match_text(
+    title: str,
+    description: str | None,
+    keywords: Iterable[str],
+    search_text: str | None = None,
+) -> EventKeywordMatches:
+    """
+    Scan an event's text once against the shared vocabulary.
+
+    Results are memoized (bounded LRU) so every rule, the validator and the
+    enricher reuse the same scan for the same event. search_text is the
+    precomputed lowercased "title description", if the caller has it.
+    """
+    tags = tuple(keywords)
+    cache_key = (title, description, tags)
+    with _match_cache_lock:
+        cached = _match_cache.get(cache_key)
+        if cached is not None:
+            _match_cache.move_to_end(cache_key)
+            return cached
+
+    base = search_text or f"{title} {description or ''}".lower()
+    full = f"{base} {' '.join(tags)}".lower()
+    text_words: set[str] = set()
+    text_substrings: set[str] = set()
+    all_words: set[str] = set()
+    all_substrings: set[str] = set()
+    base_len = len(base)
+    for end, kw, whole in get_shared_matcher().scan(full):
+        all_substrings.add(kw)
+        if whole:
+            all_words.add(kw)
+        if end <= base_len:
+            text_substrings.add(kw)
+            # At end == base_len the next char of the full text is the
+            # separating space, i.e. a boundary exactly like end-of-string.
+            if whole:
+                text_words.add(kw)
+
+    matches = EventKeywordMatches(
+        text_words=frozenset(text_words),
+        text_substrings=frozenset(text_substrings),
+        all_words=frozenset(all_words),
+        all_substrings=frozenset(all_substrings),
+        tags=frozenset(k.lower() for k in tags),
+    )
+    with _match_cache_lock:
+        _match_cache[cache_key] = matches
+        if len(_match_cache) > _MATCH_CACHE_SIZE:
+            _match_cache.popitem(last=False)
+    return matches
+
+
+def match_event(event: "RawSignalEvent") -> EventKeywordMatches:
+    """Shared keyword scan for a RawSignalEvent (see match_text)."""
+    return match_text(event.title, event.description, event.keywords, event.search_text)
+
+
+def logistics_keywords_in(words: Iterable[str]) -> list[str]:
+    """Logistics keywords among matched words, in keyword-database order."""
+    found = set(words)
+    return [kw for kw in _LOGISTICS_KEYWORD_ORDER if kw in found]
 
 
 def get_matched_keywords(text: str) -> list[str]:
     """Find logistics keywords in text using whole-word match (no substring: port≠sport, strike≠striker)."""
     if not text:
         return []
-    text_lower = text.lower()
-    return [
-        kw for kw in _ALL_LOGISTICS_KEYWORDS if re.search(r"\b" + re.escape(kw) + r"\b", text_lower)
-    ]
+    words = {kw for _, kw, whole in get_shared_matcher().scan(text.lower()) if whole}
+    return logistics_keywords_in(words)
 
 
 def get_keyword_categories(keywords: list[str]) -> dict[str, list[str]]:
@@ -6,7 +6,6 @@ Uses word-boundary matching so "port"≠"sport", "strike"≠"striker".
 Rejects obvious sports/entertainment content via blocklist.
 """
 
-import re
 from datetime import datetime, timezone
 
 from omen.application.ports.time_provider import utc_now
@@ -15,6 +14,7 @@ from ...models.validated_signal import ValidationResult
 from ...models.common import ValidationStatus
 from ...models.explanation import ExplanationStep
 from ..base import Rule
+from .keywords import match_event
 
 # Cụm từ thể thao/giải trí — nếu có trong text thì loại ngay (không phải logistics)
 OFF_TOPIC_BLOCKLIST: set[str] = {
@@ -126,19 +126,14 @@ class SemanticRelevanceRule(Rule[RawSignalEvent, ValidationResult]):
     def version(self) -> str:
         return "2.0.0"
 
-    def _word_match(self, keyword: str, text: str) -> bool:
-        """True if keyword appears as whole word in text."""
-        return bool(re.search(r"\b" + re.escape(keyword) + r"\b", text))
-
     def apply(self, input_data: RawSignalEvent) -> ValidationResult:
         """Check semantic relevance. Reject off-topic (sports) first; then require whole-word risk keywords."""
-        text = (
-            f"{input_data.title} {input_data.description or ''} " f"{' '.join(input_data.keywords)}"
-        ).lower()
+        # One shared scan of "title description keywords" (see keywords.match_event)
+        matches = match_event(input_data)
 
         # Chặn thể thao / giải trí
         for phrase in OFF_TOPIC_BLOCKLIST:
-            if phrase in text:
+            if phrase in matches.all_substrings:
                 return ValidationResult(
                     rule_name=self.name,
                     rule_version=self.version,
@@ -150,7 +145,7 @@ class SemanticRelevanceRule(Rule[RawSignalEvent, ValidationResult]):
         # Find matching categories (whole-word only)
         category_matches: dict[str, list[str]] = {}
         for category, keywords in RISK_CATEGORIES.items():
-            matched = [kw for kw in keywords if self._word_match(kw, text)]
+            matched = [kw for kw in keywords if kw in matches.all_words]
             if matched:
                 category_matches[category] = matched
 
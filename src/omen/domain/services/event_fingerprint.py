@@ -13,10 +13,14 @@ Example:
     All three would generate similar fingerprints, enabling cross-validation.
 """
 
+import random
 import re
-from hashlib import sha256
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b, sha256
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from omen.domain.models.raw_signal import RawSignalEvent
 
@@ -161,12 +165,46 @@ class EventFingerprint:
         timestamp = event.observed_at or datetime.now(timezone.utc)
         return timestamp.strftime("%Y-%m-%d")
     
+    @classmethod
+    def shingles(cls, event: RawSignalEvent) -> frozenset[str]:
+        """
+        Token shingles describing what the event is about.
+        
+        Title words (stop words and short words removed), keyword tags,
+        location names and the date bucket, each prefixed by its kind so a
+        title word and an identical keyword tag count as different features.
+        Jaccard similarity over these sets measures real content overlap.
+        """
+        tokens: set[str] = set()
+        
+        title_clean = re.sub(r'[^a-z0-9\s]', '', (event.title or "").lower())
+        for word in title_clean.split():
+            if len(word) > 2 and word not in cls.STOP_WORDS:
+                tokens.add("t:" + word)
+        
+        for keyword in event.keywords or []:
+            keyword = keyword.lower().strip()
+            if keyword:
+                tokens.add("k:" + keyword)
+        
+        for location in cls._normalize_location(event).split(" "):
+            if location:
+                tokens.add("l:" + location)
+        for loc in event.inferred_locations or []:
+            if getattr(loc, "name", None):
+                tokens.add("l:" + loc.name.lower())
+        
+        tokens.add("d:" + cls._get_date_bucket(event))
+        return frozenset(sys.intern(t) for t in tokens)
+    
     @classmethod
     def similarity(cls, fp1: str, fp2: str) -> float:
         """
         Calculate similarity between two fingerprints.
         
-        Uses character-level comparison for speed.
+        Uses character-level comparison for speed. Note this compares hash
+        strings, not content; EventFingerprintCache uses jaccard() over
+        shingles instead.
         
         Args:
             fp1: First fingerprint
@@ -192,29 +230,118 @@ class EventFingerprint:
             return 0.0
         
         return intersection / union
+    
+    @staticmethod
+    def jaccard(shingles1: frozenset[str], shingles2: frozenset[str]) -> float:
+        """Jaccard similarity of two shingle sets (0.0 to 1.0)."""
+        if not shingles1 or not shingles2:
+            return 0.0
+        intersection = len(shingles1 & shingles2)
+        return intersection / (len(shingles1) + len(shingles2) - intersection)
+
+
+class MinHasher:
+    """
+    MinHash signatures with banded LSH keys.
+    
+    With ``bands`` bands of ``rows`` rows, two sets with Jaccard similarity
+    J become LSH candidates with probability 1 - (1 - J^rows)^bands. The
+    defaults (20 x 3) give ~99% recall at J=0.6 and ~75% at J=0.4.
+    Hashing uses blake2b so signatures are stable across processes.
+    """
+    
+    _PRIME = (1 << 61) - 1
+    _MAX_HASH = (1 << 32) - 1
+    
+    def __init__(self, bands: int = 20, rows: int = 3, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        num_perm = bands * rows
+        self._perms = [
+            (rng.randrange(1, self._PRIME), rng.randrange(0, self._PRIME))
+            for _ in range(num_perm)
+        ]
+    
+    @staticmethod
+    def _token_hash(token: str) -> int:
+        return int.from_bytes(blake2b(token.encode(), digest_size=8).digest(), "big")
+    
+    def signature(self, shingles: frozenset[str]) -> list[int]:
+        """MinHash signature (bands * rows values) of a shingle set."""
+        prime, max_hash = self._PRIME, self._MAX_HASH
+        hashes = [self._token_hash(t) for t in shingles] or [0]
+        return [
+            min(((a * h + b) % prime) & max_hash for h in hashes)
+            for a, b in self._perms
+        ]
+    
+    def band_keys(self, shingles: frozenset[str]) -> tuple[int, ...]:
+        """One LSH bucket key per band."""
+        sig = self.signature(shingles)
+        rows = self.rows
+        return tuple(hash(tuple(sig[i * rows:(i + 1) * rows])) for i in range(self.bands))
+
+
+@dataclass
+class _CachedEvent:
+    """Cache entry for one event."""
+    
+    event_id: str
+    fingerprint: str
+    source: str
+    title: str
+    added_at: datetime
+    shingles: frozenset[str]
+    band_keys: tuple[int, ...]
+    bucket: int
 
 
 class EventFingerprintCache:
     """
     In-memory cache of recent event fingerprints for cross-source matching.
     
-    This enables O(1) lookup for matching events when a new signal arrives.
+    Candidate lookup is sub-linear: each event's shingle set is MinHashed
+    into banded LSH buckets, and only events sharing at least one bucket are
+    scored (exact Jaccard over shingles). Entries are grouped in time
+    buckets so TTL expiry drops whole buckets and size eviction removes the
+    oldest entries first, both in O(1) amortized per event.
     For distributed deployments, use Redis-backed cache instead.
     """
     
-    def __init__(self, max_size: int = 1000, ttl_hours: int = 24):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_hours: int = 24,
+        bucket_minutes: int = 60,
+        hasher: Optional[MinHasher] = None,
+    ):
         """
         Initialize fingerprint cache.
         
         Args:
             max_size: Maximum number of fingerprints to cache
             ttl_hours: Time-to-live for cached fingerprints
+            bucket_minutes: Width of the time buckets used for eviction
+            hasher: MinHash/LSH parameters (default: 20 bands x 3 rows)
         """
         self.max_size = max_size
         self.ttl_hours = ttl_hours
-        self._cache: dict[str, dict] = {}  # fingerprint -> event info
+        self._bucket_seconds = max(1, bucket_minutes * 60)
+        self._hasher = hasher or MinHasher()
+        self._cache: dict[str, _CachedEvent] = {}  # event_id -> entry
+        # bucket index -> event_ids added in that bucket (insertion ordered)
+        self._time_buckets: "OrderedDict[int, dict[str, None]]" = OrderedDict()
+        # one dict per LSH band: band key -> event_ids
+        self._bands: list[dict[int, set[str]]] = [{} for _ in range(self._hasher.bands)]
         self._fingerprint_to_events: dict[str, list[str]] = {}  # fingerprint -> event_ids
     
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
+    
+    def _bucket_of(self, ts: datetime) -> int:
+        return int(ts.timestamp()) // self._bucket_seconds
+    
     def add(self, event: RawSignalEvent) -> str:
         """
         Add event to cache and return its fingerprint.
@@ -225,25 +352,35 @@ class EventFingerprintCache:
         Returns:
             Generated fingerprint
         """
-        fingerprint = EventFingerprint.generate(event)
+        now = self._now()
+        self._expire(now)
         
-        # Store event info
-        self._cache[event.event_id] = {
-            "fingerprint": fingerprint,
-            "source": event.market.source,
-            "title": event.title,
-            "added_at": datetime.now(timezone.utc),
-        }
-        
-        # Index by fingerprint
-        if fingerprint not in self._fingerprint_to_events:
-            self._fingerprint_to_events[fingerprint] = []
-        self._fingerprint_to_events[fingerprint].append(event.event_id)
-        
-        # Enforce size limit (LRU-style)
-        while len(self._cache) > self.max_size:
-            oldest_id = next(iter(self._cache))
-            self._remove_event(oldest_id)
+        fingerprint = EventFingerprint.generate(event)
+        shingles = EventFingerprint.shingles(event)
+        
+        # Re-adding an event refreshes it (and moves it to the newest bucket)
+        self._remove_event(event.event_id)
+        
+        entry = _CachedEvent(
+            event_id=event.event_id,
+            fingerprint=fingerprint,
+            source=event.market.source,
+            title=event.title,
+            added_at=now,
+            shingles=shingles,
+            band_keys=self._hasher.band_keys(shingles),
+            bucket=self._bucket_of(now),
+        )
+        self._cache[event.event_id] = entry
+        self._time_buckets.setdefault(entry.bucket, {})[event.event_id] = None
+        for band, key in zip(self._bands, entry.band_keys):
+            band.setdefault(key, set()).add(event.event_id)
+        self._fingerprint_to_events.setdefault(fingerprint, []).append(event.event_id)
+        
+        # Enforce size limit (oldest bucket first, insertion order within it)
+        while len(self._cache) > self.max_size and self._time_buckets:
+            oldest_bucket = next(iter(self._time_buckets.values()))
+            self._remove_event(next(iter(oldest_bucket)))
         
         return fingerprint
     
@@ -256,6 +393,10 @@ class EventFingerprintCache:
         """
         Find cached events similar to the given event.
         
+        Similarity is the Jaccard overlap of title words, keywords,
+        locations and date (see EventFingerprint.shingles); only LSH
+        candidates are scored.
+        
         Args:
             event: Event to match
             min_similarity: Minimum similarity threshold
@@ -264,91 +405,90 @@ class EventFingerprintCache:
         Returns:
             List of matching event info dicts
         """
-        fingerprint = EventFingerprint.generate(event)
-        matches = []
+        shingles = EventFingerprint.shingles(event)
+        cutoff = self._now() - timedelta(hours=self.ttl_hours)
         
-        # Check exact fingerprint match first (fastest)
-        if fingerprint in self._fingerprint_to_events:
-            for event_id in self._fingerprint_to_events[fingerprint]:
-                if event_id == event.event_id:
-                    continue
-                    
-                cached = self._cache.get(event_id)
-                if not cached:
-                    continue
-                    
-                if exclude_source and cached["source"] == exclude_source:
-                    continue
-                    
+        candidates: set[str] = set()
+        for band, key in zip(self._bands, self._hasher.band_keys(shingles)):
+            bucket = band.get(key)
+            if bucket:
+                candidates |= bucket
+        candidates.discard(event.event_id)
+        
+        matches = []
+        for event_id in candidates:
+            cached = self._cache.get(event_id)
+            if cached is None or cached.added_at < cutoff:
+                continue
+            if exclude_source and cached.source == exclude_source:
+                continue
+            similarity = EventFingerprint.jaccard(shingles, cached.shingles)
+            if similarity >= min_similarity:
                 matches.append({
                     "event_id": event_id,
-                    "source": cached["source"],
-                    "title": cached["title"],
-                    "similarity": 1.0,
-                    "fingerprint": fingerprint,
+                    "source": cached.source,
+                    "title": cached.title,
+                    "similarity": similarity,
+                    "fingerprint": cached.fingerprint,
                 })
         
-        # Check similar fingerprints (slower but catches variations)
-        for cached_fp, event_ids in self._fingerprint_to_events.items():
-            if cached_fp == fingerprint:
-                continue
-                
-            similarity = EventFingerprint.similarity(fingerprint, cached_fp)
-            if similarity >= min_similarity:
-                for event_id in event_ids:
-                    if event_id == event.event_id:
-                        continue
-                        
-                    cached = self._cache.get(event_id)
-                    if not cached:
-                        continue
-                        
-                    if exclude_source and cached["source"] == exclude_source:
-                        continue
-                    
-                    matches.append({
-                        "event_id": event_id,
-                        "source": cached["source"],
-                        "title": cached["title"],
-                        "similarity": similarity,
-                        "fingerprint": cached_fp,
-                    })
-        
-        # Sort by similarity descending
-        matches.sort(key=lambda m: m["similarity"], reverse=True)
+        # Sort by similarity descending (event_id breaks ties deterministically)
+        matches.sort(key=lambda m: (-m["similarity"], m["event_id"]))
         
         return matches
     
     def _remove_event(self, event_id: str) -> None:
         """Remove event from cache."""
-        if event_id not in self._cache:
+        cached = self._cache.pop(event_id, None)
+        if cached is None:
             return
-            
-        cached = self._cache.pop(event_id)
-        fingerprint = cached.get("fingerprint")
-        
-        if fingerprint and fingerprint in self._fingerprint_to_events:
-            self._fingerprint_to_events[fingerprint] = [
-                eid for eid in self._fingerprint_to_events[fingerprint]
-                if eid != event_id
-            ]
-            if not self._fingerprint_to_events[fingerprint]:
-                del self._fingerprint_to_events[fingerprint]
+        
+        bucket = self._time_buckets.get(cached.bucket)
+        if bucket is not None:
+            bucket.pop(event_id, None)
+            if not bucket:
+                del self._time_buckets[cached.bucket]
+        
+        for band, key in zip(self._bands, cached.band_keys):
+            ids = band.get(key)
+            if ids is not None:
+                ids.discard(event_id)
+                if not ids:
+                    del band[key]
+        
+        ids = self._fingerprint_to_events.get(cached.fingerprint)
+        if ids is not None:
+            ids.remove(event_id)
+            if not ids:
+                del self._fingerprint_to_events[cached.fingerprint]
+    
+    def _expire(self, now: datetime) -> int:
+        """Drop every time bucket that lies entirely before the TTL cutoff."""
+        cutoff_bucket = self._bucket_of(now - timedelta(hours=self.ttl_hours))
+        removed = 0
+        while self._time_buckets:
+            bucket_id, event_ids = next(iter(self._time_buckets.items()))
+            if bucket_id >= cutoff_bucket:
+                break
+            for event_id in list(event_ids):
+                self._remove_event(event_id)
+                removed += 1
+        return removed
     
     def clear_expired(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
-        from datetime import timedelta
-        
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.ttl_hours)
-        expired = [
-            event_id for event_id, info in self._cache.items()
-            if info["added_at"] < cutoff
-        ]
-        
-        for event_id in expired:
-            self._remove_event(event_id)
-        
-        return len(expired)
+        now = self._now()
+        removed = self._expire(now)
+        
+        # The boundary bucket may still hold a few expired entries
+        cutoff = now - timedelta(hours=self.ttl_hours)
+        for bucket in list(self._time_buckets.values())[:1]:
+            for event_id in list(bucket):
+                if self._cache[event_id].added_at < cutoff:
+                    self._remove_event(event_id)
+                    removed += 1
+        
+        return removed
     
     @property
     def size(self) -> int:
@@ -356,7 +496,8 @@ class EventFingerprintCache:
         return len(self._cache)
 
 
-# Global cache instance
+# Global cache instance (LSH lookup keeps large caches cheap)
+DEFAULT_CACHE_SIZE = 50_000
 _fingerprint_cache: Optional[EventFingerprintCache] = None
 
 
@@ -364,7 +505,7 @@ def get_fingerprint_cache() -> EventFingerprintCache:
     """Get or create the global fingerprint cache."""
     global _fingerprint_cache
     if _fingerprint_cache is None:
-        _fingerprint_cache = EventFingerprintCache()
+        _fingerprint_cache = EventFingerprintCache(max_size=DEFAULT_CACHE_SIZE)
     return _fingerprint_cache
 
 
@@ -180,6 +180,7 @@ class SignalClassifier:
         self,
         title: str,
         description: Optional[str] = None,
+        search_text: Optional[str] = None,
     ) -> tuple[SignalType, ImpactHints]:
         """
         Classify signal and generate routing hints.
@@ -190,11 +191,14 @@ class SignalClassifier:
         - metadata (trace_id, source_event_id, generated_at, observed_at)
         - numeric fields (probability, confidence, liquidity)
 
+        search_text: precomputed lowercased "title description"
+            (RawSignalEvent.search_text); built from title/description if omitted.
+
         Returns:
             (SignalType, ImpactHints) — classification and routing metadata
         """
         # Combine ONLY content fields
-        text = f"{title} {description or ''}".lower()
+        text = search_text or f"{title} {description or ''}".lower()
 
         signal_type = self._classify_type(text)
         direction = self._detect_direction(text, signal_type)
@@ -17,9 +17,10 @@ from __future__ import annotations
 
 from omen.domain.models.raw_signal import RawSignalEvent
 from omen.domain.rules.validation.keywords import (
-    get_matched_keywords,
     get_keyword_categories,
     calculate_relevance_score,
+    logistics_keywords_in,
+    match_event,
 )
 
 # Geographic term lists for extraction (lowercase)
@@ -78,10 +79,10 @@ class SignalEnricher:
 
         Returns enrichment dict suitable for OmenSignal.from_validated_event.
         """
-        text = f"{event.title} {event.description or ''}".lower()
+        text = event.search_text
 
-        # Extract keywords via logistics keyword DB
-        keywords = get_matched_keywords(text)
+        # Extract keywords via logistics keyword DB (shared scan with the rules)
+        keywords = logistics_keywords_in(match_event(event).text_words)
         keyword_categories = get_keyword_categories(keywords)
 
         # Geographic context from text
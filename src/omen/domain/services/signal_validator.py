@@ -5,7 +5,7 @@ NOTE: No logging in domain layer - errors are captured in ValidationOutcome.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence
 
 from omen.domain.models.raw_signal import RawSignalEvent
 from omen.domain.models.validated_signal import ValidatedSignal, ValidationResult
@@ -32,6 +32,11 @@ from omen.domain.rules.validation.cross_source_validation import (
     CrossSourceValidationRule,
     SourceDiversityRule,
 )
+from omen.domain.rules.validation.keywords import (
+    CATEGORY_INFERENCE_KEYWORDS,
+    CHOKEPOINT_ALIASES,
+    match_event,
+)
 from omen.domain.rules.validation.news_quality_rule import NewsQualityGateRule
 from omen.domain.rules.validation.commodity_context_rule import CommodityContextRule
 from omen.domain.rules.validation.ais_validation import (
@@ -204,43 +209,114 @@ class SignalValidator:
         explanation_chain = ExplanationChain.create(context)
 
         for i, rule in enumerate(self.rules, start=1):
-            try:
-                result = rule.apply(signal)
-                validation_results.append(result)
+            explanation_chain, rejection = self._apply_rule(
+                rule, i, signal, context, validation_results, explanation_chain
+            )
+            if rejection is not None:
+                return rejection
+
+        return self._build_outcome(signal, context, validation_results, explanation_chain)
+
+    def validate_batch(
+        self,
+        signals: Sequence[RawSignalEvent],
+        context: ProcessingContext,
+    ) -> List[ValidationOutcome]:
+        """
+        Validate a batch of events, running each rule across the whole batch.
+
+        Rules are applied rule-major: rule 1 over every event, then rule 2
+        over the events that survived it, and so on. Event order is kept
+        within each rule, so stateful rules (e.g. the cross-source
+        fingerprint cache) see the same sequence as repeated validate()
+        calls and every outcome is identical to the per-event path.
+
+        Returns:
+            One ValidationOutcome per input event, in input order.
+        """
+        results: List[List[ValidationResult]] = [[] for _ in signals]
+        chains = [ExplanationChain.create(context) for _ in signals]
+        outcomes: List[ValidationOutcome | None] = [None] * len(signals)
+        active = list(range(len(signals)))
+
+        for i, rule in enumerate(self.rules, start=1):
+            if not active:
+                break
+            survivors = []
+            for idx in active:
+                chains[idx], rejection = self._apply_rule(
+                    rule, i, signals[idx], context, results[idx], chains[idx]
+                )
+                if rejection is not None:
+                    outcomes[idx] = rejection
+                else:
+                    survivors.append(idx)
+            active = survivors
+
+        for idx in active:
+            outcomes[idx] = self._build_outcome(signals[idx], context, results[idx], chains[idx])
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    def _apply_rule(
+        self,
+        rule: Rule,
+        step_id: int,
+        signal: RawSignalEvent,
+        context: ProcessingContext,
+        validation_results: List[ValidationResult],
+        explanation_chain: ExplanationChain,
+    ) -> tuple[ExplanationChain, ValidationOutcome | None]:
+        """
+        Apply one rule to one event.
+
+        Appends to validation_results and returns the extended explanation
+        chain, plus a rejection outcome if validation must stop here.
+        """
+        try:
+            result = rule.apply(signal)
+            validation_results.append(result)
+
+            explanation_step = rule.explain(
+                signal, result, processing_time=context.processing_time
+            )
+            explanation_step = explanation_step.model_copy(update={"step_id": step_id})
+            explanation_chain = explanation_chain.add_step(explanation_step)
 
-                explanation_step = rule.explain(
-                    signal, result, processing_time=context.processing_time
+            if result.status != ValidationStatus.PASSED:
+                return explanation_chain, ValidationOutcome(
+                    passed=False,
+                    signal=None,
+                    rejection_reason=result.reason,
+                    results=tuple(validation_results),
                 )
-                explanation_step = explanation_step.model_copy(update={"step_id": i})
-                explanation_chain = explanation_chain.add_step(explanation_step)
-
-                if result.status != ValidationStatus.PASSED:
-                    return ValidationOutcome(
-                        passed=False,
-                        signal=None,
-                        rejection_reason=result.reason,
-                        results=tuple(validation_results),
-                    )
-            except Exception as e:
-                # Error captured in ValidationResult - no logging in domain layer
-                # Application layer should handle logging if needed
-                error_result = ValidationResult(
-                    rule_name=rule.name,
-                    rule_version=rule.version,
-                    status=ValidationStatus.REJECTED_RULE_ERROR,
-                    score=0.0,
-                    reason=f"Rule error: {str(e)}",
+        except Exception as e:
+            # Error captured in ValidationResult - no logging in domain layer
+            # Application layer should handle logging if needed
+            error_result = ValidationResult(
+                rule_name=rule.name,
+                rule_version=rule.version,
+                status=ValidationStatus.REJECTED_RULE_ERROR,
+                score=0.0,
+                reason=f"Rule error: {str(e)}",
+            )
+            validation_results.append(error_result)
+            if self._fail_on_rule_error:
+                return explanation_chain, ValidationOutcome(
+                    passed=False,
+                    signal=None,
+                    rejection_reason=f"Rule {rule.name} errored: {e}",
+                    results=tuple(validation_results),
                 )
-                validation_results.append(error_result)
-                if self._fail_on_rule_error:
-                    return ValidationOutcome(
-                        passed=False,
-                        signal=None,
-                        rejection_reason=f"Rule {rule.name} errored: {e}",
-                        results=tuple(validation_results),
-                    )
-
-        # All rules passed
+        return explanation_chain, None
+
+    def _build_outcome(
+        self,
+        signal: RawSignalEvent,
+        context: ProcessingContext,
+        validation_results: List[ValidationResult],
+        explanation_chain: ExplanationChain,
+    ) -> ValidationOutcome:
+        """Build the passing outcome once every rule has accepted the event."""
         overall_score = (
             sum(r.score for r in validation_results) / len(validation_results)
             if validation_results
@@ -277,53 +353,19 @@ class SignalValidator:
 
     def _infer_category(self, signal: RawSignalEvent) -> SignalCategory:
         """Infer signal category from content."""
-        content_lower = (signal.title + " " + (signal.description or "")).lower()
-        keywords_lower = [k.lower() for k in signal.keywords]
-
-        if any(
-            kw in content_lower or kw in keywords_lower
-            for kw in ["war", "conflict", "attack", "geopolitical"]
-        ):
-            return SignalCategory.GEOPOLITICAL
-        if any(kw in content_lower or kw in keywords_lower for kw in ["strike", "labor", "union"]):
-            return SignalCategory.LABOR
-        if any(
-            kw in content_lower or kw in keywords_lower
-            for kw in ["port", "canal", "infrastructure", "shipping"]
-        ):
-            return SignalCategory.INFRASTRUCTURE
-        if any(
-            kw in content_lower or kw in keywords_lower for kw in ["climate", "weather", "storm"]
-        ):
-            return SignalCategory.CLIMATE
-        if any(
-            kw in content_lower or kw in keywords_lower for kw in ["regulation", "policy", "law"]
-        ):
-            return SignalCategory.REGULATORY
-        if any(
-            kw in content_lower or kw in keywords_lower for kw in ["economic", "market", "trade"]
-        ):
-            return SignalCategory.ECONOMIC
-
+        matches = match_event(signal)
+        for category, keywords in CATEGORY_INFERENCE_KEYWORDS.items():
+            if any(kw in matches.text_substrings or kw in matches.tags for kw in keywords):
+                return SignalCategory[category]
         return SignalCategory.UNKNOWN
 
     def _extract_chokepoints(self, signal: RawSignalEvent) -> List[str]:
         """Extract logistics chokepoints from signal."""
         chokepoints = []
-        content_lower = (signal.title + " " + (signal.description or "")).lower()
-        keywords_lower = [k.lower() for k in signal.keywords]
-
-        chokepoint_keywords = {
-            "suez canal": "Suez Canal",
-            "suez": "Suez Canal",
-            "red sea": "Red Sea",
-            "bab el-mandeb": "Bab el-Mandeb Strait",
-            "strait of malacca": "Strait of Malacca",
-            "panama canal": "Panama Canal",
-        }
-
-        for keyword, chokepoint in chokepoint_keywords.items():
-            if keyword in content_lower or keyword in keywords_lower:
+        matches = match_event(signal)
+
+        for keyword, chokepoint in CHOKEPOINT_ALIASES.items():
+            if keyword in matches.text_substrings or keyword in matches.tags:
                 if chokepoint not in chokepoints:
                     chokepoints.append(chokepoint)
 
@@ -0,0 +1,89 @@
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- V1.0.6: Keyset Pagination Indexes and Signal Counters
+-- ═══════════════════════════════════════════════════════════════════════════════
+--
+-- Creates:
+--   1. Covering keyset indexes on (generated_at DESC, signal_id DESC) for
+--      demo.signals and live.signals. List pages seek to the cursor and
+--      read summary columns from the index (INCLUDE) instead of the heap.
+--   2. system.signal_counts: per-schema, per-source_type row counts kept
+--      current by triggers, so unfiltered totals are a single-row read.
+--
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- PART 1: Covering Keyset Indexes
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+CREATE INDEX IF NOT EXISTS idx_demo_signals_keyset
+    ON demo.signals(generated_at DESC, signal_id DESC)
+    INCLUDE (source_type, signal_type, category, status, probability,
+             confidence_score, confidence_level, title);
+
+CREATE INDEX IF NOT EXISTS idx_live_signals_keyset
+    ON live.signals(generated_at DESC, signal_id DESC)
+    INCLUDE (source_type, signal_type, category, status, probability,
+             confidence_score, confidence_level, title);
+
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- PART 2: Maintained Signal Counts
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+-- ─────────────────────────────────────────────────────────────────────────────────
+-- system.signal_counts - Row counts per schema and source type
+-- ─────────────────────────────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS system.signal_counts (
+    schema_name VARCHAR(16) NOT NULL,
+    source_type source_type NOT NULL,
+    signal_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (schema_name, source_type)
+);
+
+COMMENT ON TABLE system.signal_counts IS
+    'Signal row counts per schema and source_type, maintained by triggers on demo.signals and live.signals';
+
+-- ─────────────────────────────────────────────────────────────────────────────────
+-- Function to keep system.signal_counts in step with the signals tables
+-- ─────────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION system.track_signal_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE system.signal_counts
+            SET signal_count = signal_count - 1
+            WHERE schema_name = TG_TABLE_SCHEMA AND source_type = OLD.source_type;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO system.signal_counts (schema_name, source_type, signal_count)
+            VALUES (TG_TABLE_SCHEMA, NEW.source_type, 1)
+            ON CONFLICT (schema_name, source_type)
+            DO UPDATE SET signal_count = system.signal_counts.signal_count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Apply to demo.signals
+DROP TRIGGER IF EXISTS track_demo_signals_count ON demo.signals;
+CREATE TRIGGER track_demo_signals_count
+    AFTER INSERT OR DELETE OR UPDATE OF source_type ON demo.signals
+    FOR EACH ROW
+    EXECUTE FUNCTION system.track_signal_count();
+
+-- Apply to live.signals
+DROP TRIGGER IF EXISTS track_live_signals_count ON live.signals;
+CREATE TRIGGER track_live_signals_count
+    AFTER INSERT OR DELETE OR UPDATE OF source_type ON live.signals
+    FOR EACH ROW
+    EXECUTE FUNCTION system.track_signal_count();
+
+-- ─────────────────────────────────────────────────────────────────────────────────
+-- Backfill from existing rows
+-- ─────────────────────────────────────────────────────────────────────────────────
+DELETE FROM system.signal_counts;
+
+INSERT INTO system.signal_counts (schema_name, source_type, signal_count)
+    SELECT 'demo', source_type, COUNT(*) FROM demo.signals GROUP BY source_type
+    UNION ALL
+    SELECT 'live', source_type, COUNT(*) FROM live.signals GROUP BY source_type;
@@ -1,6 +1,7 @@
 """Emitter: dual-path signal emission (ledger-first, hot path to RiskCast)."""
 
 from omen.infrastructure.emitter.signal_emitter import (
+    BatchConfig,
     DuplicateSignalError,
     EmitResult,
     EmitStatus,
@@ -14,6 +15,7 @@ __all__ = [
     "EmitResult",
     "EmitStatus",
     "RetryConfig",
+    "BatchConfig",
     "HotPathError",
     "DuplicateSignalError",
 ]
@@ -21,7 +21,7 @@ import httpx
 
 from omen.domain.models.omen_signal import OmenSignal
 from omen.domain.models.signal_event import SignalEvent, generate_input_event_hash
-from omen.infrastructure.ledger import LedgerWriteError, LedgerWriter
+from omen.infrastructure.ledger import AsyncLedgerWriter, LedgerWriteError, LedgerWriter
 from omen.infrastructure.resilience.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -95,6 +95,14 @@ def _record_emit_metrics(event: SignalEvent, result: EmitResult, duration: float
         logger.debug("Emit metrics record failed: %s", e)
 
 
+@dataclass
+class BatchConfig:
+    """Hot path micro-batching configuration (opt-in)."""
+
+    max_batch_size: int = 50
+    max_delay_ms: int = 20
+
+
 @dataclass
 class RetryConfig:
     """Retry configuration."""
@@ -160,23 +168,39 @@ class SignalEmitter:
     CRITICAL INVARIANT:
     Signal MUST be written to ledger BEFORE hot path push.
     This ensures reconcile can always recover from hot path failures.
+
+    Pass an AsyncLedgerWriter to keep ledger appends and fsyncs off the
+    event loop: emit awaits its durability future before the hot path.
     """
 
     def __init__(
         self,
-        ledger: LedgerWriter,
+        ledger: LedgerWriter | AsyncLedgerWriter,
         riskcast_url: str,
         api_key: str,
         retry_config: Optional[RetryConfig] = None,
         circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
+        batch_config: Optional[BatchConfig] = None,
     ):
+        """
+        Args:
+            batch_config: If set, hot path pushes are micro-batched: signals
+                are collected for up to max_delay_ms (or max_batch_size) and
+                sent in one request to the RiskCast batch ingest endpoint.
+        """
         self.ledger = ledger
         self.riskcast_url = riskcast_url.rstrip("/")
         self.api_key = api_key
         self.retry_config = retry_config or RetryConfig()
+        self.batch_config = batch_config
         self.backpressure = BackpressureController()
         self._client: Optional[httpx.AsyncClient] = None
 
+        # Micro-batching state: events waiting for the next batch push
+        self._pending: list[tuple[SignalEvent, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.Task] = None
+        self._batch_tasks: set[asyncio.Task] = set()
+
         self._circuit_breaker = CircuitBreaker(
             name=CIRCUIT_NAME_RISKCAST,
             config=circuit_breaker_config
@@ -213,9 +237,14 @@ class SignalEmitter:
         Close HTTP client and release resources. Called during graceful shutdown.
 
         Ensures:
+        - Pending micro-batched signals are pushed
         - HTTP client connections are closed
         - Resources are released
         """
+        if self._pending:
+            self._start_batch_flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
         if self._client:
             try:
                 await self._client.aclose()
@@ -254,7 +283,15 @@ class SignalEmitter:
 
         # === STEP 1: Write to ledger (MUST succeed) ===
         try:
-            event = self.ledger.write(event)
+            if isinstance(self.ledger, AsyncLedgerWriter):
+                # Resolves once the frame is fsync'd on the ledger I/O thread
+                event = await self.ledger.write(event)
+            elif getattr(self.ledger, "group_commit", False) is True:
+                # Group commit blocks until a shared fsync covers the frame;
+                # wait in a worker thread so concurrent emits share the batch.
+                event = await asyncio.to_thread(self.ledger.write, event)
+            else:
+                event = self.ledger.write(event)
             logger.info(
                 "Ledger write OK: %s -> %s",
                 event.signal_id,
@@ -283,7 +320,12 @@ class SignalEmitter:
         await self.backpressure.wait_if_needed()
 
         try:
-            kind, ack_id = await self._circuit_breaker.call(self._push_to_riskcast_wrapped, event)
+            if self.batch_config is not None:
+                kind, ack_id = await self._submit_to_batch(event)
+            else:
+                kind, ack_id = await self._circuit_breaker.call(
+                    self._push_to_riskcast_wrapped, event
+                )
             self.backpressure.record_success()
             if kind == "duplicate":
                 logger.info("Duplicate signal (already processed): %s", event.signal_id)
@@ -397,6 +439,132 @@ class SignalEmitter:
 
         raise HotPathError(f"Max retries exceeded: {last_error}")
 
+    # === Micro-batching ===
+
+    async def _submit_to_batch(self, event: SignalEvent) -> tuple[str, Optional[str]]:
+        """
+        Queue event for the next batch push and wait for its own outcome.
+
+        Returns (kind, ack_id) like _push_to_riskcast_wrapped; raises
+        CircuitBreakerOpen or HotPathError if the batch (or this item) failed.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((event, future))
+
+        if len(self._pending) >= self.batch_config.max_batch_size:
+            self._start_batch_flush()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.create_task(self._flush_after_delay())
+
+        return await future
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.batch_config.max_delay_ms / 1000)
+        self._batch_timer = None
+        if self._pending:
+            self._start_batch_flush()
+
+    def _start_batch_flush(self) -> None:
+        """Hand the pending events to a background batch push."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+        self._batch_timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush_batch(self, batch: list[tuple[SignalEvent, asyncio.Future]]) -> None:
+        """Push one batch through the circuit breaker and resolve each caller."""
+        events = [event for event, _ in batch]
+        try:
+            outcomes = await self._circuit_breaker.call(self._push_batch_to_riskcast, events)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _push_batch_to_riskcast(
+        self,
+        events: list[SignalEvent],
+    ) -> list[tuple[str, Optional[str]] | HotPathError]:
+        """
+        Push a batch to RiskCast batch ingest with retry.
+
+        Returns one outcome per event: ("delivered" | "duplicate", ack_id),
+        or a HotPathError for an item RiskCast rejected. Raises HotPathError
+        (counted once by the circuit breaker) if the whole batch failed.
+        Falls back to per-signal pushes if RiskCast has no batch endpoint.
+        """
+        url = f"{self.riskcast_url}/api/v1/signals/ingest/batch"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        body = '{"events":[' + ",".join(e.model_dump_json() for e in events) + "]}"
+
+        last_error: Optional[str] = None
+
+        for attempt in range(self.retry_config.max_attempts):
+            try:
+                response = await self._client.post(url, content=body, headers=headers)
+
+                if response.status_code == 200:
+                    items = response.json().get("results", [])
+                    if len(items) != len(events):
+                        raise HotPathError(
+                            f"Batch ingest returned {len(items)} results for {len(events)} events"
+                        )
+                    return [self._batch_item_outcome(item) for item in items]
+
+                if response.status_code in (404, 405):
+                    return await self._push_individually(events)
+
+                if response.status_code in self.retry_config.retryable_status_codes:
+                    last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                    await self._wait_before_retry(attempt)
+                    continue
+
+                raise HotPathError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            except httpx.RequestError as e:
+                last_error = str(e)
+                await self._wait_before_retry(attempt)
+
+        raise HotPathError(f"Max retries exceeded: {last_error}")
+
+    @staticmethod
+    def _batch_item_outcome(item: dict) -> tuple[str, Optional[str]] | HotPathError:
+        status_code = item.get("status_code")
+        if status_code == 200:
+            return ("delivered", item.get("ack_id", "unknown"))
+        if status_code == 409:
+            return ("duplicate", item.get("ack_id"))
+        return HotPathError(f"HTTP {status_code}: {str(item.get('detail', ''))[:200]}")
+
+    async def _push_individually(
+        self,
+        events: list[SignalEvent],
+    ) -> list[tuple[str, Optional[str]] | HotPathError]:
+        """Per-signal fallback for RiskCast deployments without batch ingest."""
+        outcomes: list[tuple[str, Optional[str]] | HotPathError] = []
+        for event in events:
+            try:
+                outcomes.append(await self._push_to_riskcast_wrapped(event))
+            except HotPathError as e:
+                outcomes.append(e)
+        if all(isinstance(o, HotPathError) for o in outcomes):
+            raise outcomes[0]
+        return outcomes
+
     async def _wait_before_retry(self, attempt: int) -> None:
         """Calculate and wait for retry backoff."""
         delay_ms = min(
@@ -1,10 +1,12 @@
 """Ledger: WAL-framed append-only storage for SignalEvent."""
 
+from omen.infrastructure.ledger.async_writer import AsyncLedgerWriter
 from omen.infrastructure.ledger.reader import LedgerReader, PartitionInfo
 from omen.infrastructure.ledger.versioned_reader import VersionedLedgerReader
 from omen.infrastructure.ledger.writer import LedgerWriteError, LedgerWriter
 
 __all__ = [
+    "AsyncLedgerWriter",
     "LedgerWriter",
     "LedgerReader",
     "LedgerWriteError",
@@ -0,0 +1,164 @@
+"""
+Async Ledger Writer
+
+Non-blocking front end for LedgerWriter, for use from the event loop.
+
+LedgerWriter.write takes the partition FileLock, opens, appends and
+fsyncs on the calling thread; called from a coroutine that stalls every
+other task for the duration of an fsync. AsyncLedgerWriter hands writes
+to one dedicated I/O thread that owns the LedgerWriter:
+
+- submit() queues an event and returns an asyncio future (the
+  durability future) that resolves to the written SignalEvent, or fails
+  with LedgerWriteError, once its frame has been fsync'd.
+- The I/O thread drains whatever is queued (up to max_batch) and writes
+  it with LedgerWriter.write_batch, so concurrent emits share fsyncs.
+
+Frames keep the WAL framing and ordering of LedgerWriter; a future never
+resolves before its frame is durable, so callers can keep ledger-first
+ordering by awaiting it before any other side effect.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from functools import partial
+from typing import Optional
+
+from omen.domain.models.signal_event import SignalEvent
+from omen.infrastructure.ledger.writer import (
+    GROUP_COMMIT_MAX_BATCH,
+    LedgerWriteError,
+    LedgerWriter,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 10_000
+
+# (event, loop of the caller, durability future)
+_Submission = tuple[SignalEvent, asyncio.AbstractEventLoop, asyncio.Future]
+
+
+def _resolve(future: asyncio.Future, result: SignalEvent | BaseException) -> None:
+    """Complete a durability future on its loop (the caller may have given up)."""
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+class AsyncLedgerWriter:
+    """
+    LedgerWriter driven by a dedicated I/O thread with a submission queue.
+
+    Usage:
+        ledger = AsyncLedgerWriter(LedgerWriter(base_path))
+        event = await ledger.write(event)  # returns once durable
+        ...
+        await ledger.flush_and_close()
+
+    The wrapped LedgerWriter must not be written to directly while the
+    I/O thread runs. Cancelling a waiting caller does not withdraw its
+    write: the frame is still appended.
+    """
+
+    def __init__(
+        self,
+        writer: LedgerWriter,
+        max_batch: int = GROUP_COMMIT_MAX_BATCH,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.writer = writer
+        self.max_batch = max(1, max_batch)
+        self._queue: "queue.Queue[Optional[_Submission]]" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ledger-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, event: SignalEvent) -> asyncio.Future:
+        """
+        Queue a write without waiting for it.
+
+        Returns the durability future. Raises LedgerWriteError if the
+        writer is closed or max_pending writes are already queued.
+        """
+        if self._closed:
+            raise LedgerWriteError("AsyncLedgerWriter is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            self._queue.put_nowait((event, loop, future))
+        except queue.Full:
+            raise LedgerWriteError("Ledger write queue full") from None
+        return future
+
+    async def write(self, event: SignalEvent) -> SignalEvent:
+        """
+        Write an event; returns it with ledger metadata once its frame is durable.
+
+        Waits (off the loop) for queue space instead of failing when full.
+        Raises LedgerWriteError on I/O failure or if the writer is closed.
+        """
+        if self._closed:
+            raise LedgerWriteError("AsyncLedgerWriter is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        item = (event, loop, future)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            await loop.run_in_executor(None, partial(self._queue.put, item))
+        return await future
+
+    async def flush_and_close(self) -> None:
+        """
+        Drain queued writes, stop the I/O thread and close the LedgerWriter.
+        Called during graceful shutdown.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.to_thread(self._queue.put, None)
+        await asyncio.to_thread(self._thread.join)
+        logger.info("AsyncLedgerWriter flush_and_close: queue drained, writer closed.")
+
+    def _run(self) -> None:
+        """I/O thread: write queued events in batches until the close sentinel."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+        try:
+            self.writer.close()
+        except OSError as e:
+            logger.error("AsyncLedgerWriter: error closing ledger writer: %s", e)
+
+    def _write_batch(self, batch: list[_Submission]) -> None:
+        try:
+            results: list = self.writer.write_batch([event for event, _, _ in batch])
+        except Exception as e:
+            logger.exception("Ledger batch write failed: %s", e)
+            error = e if isinstance(e, LedgerWriteError) else LedgerWriteError(str(e))
+            results = [error] * len(batch)
+        for (_, loop, future), result in zip(batch, results):
+            try:
+                loop.call_soon_threadsafe(_resolve, future, result)
+            except RuntimeError:
+                # Caller's loop already closed; the write itself stands
+                logger.debug("Dropped durability ack for closed event loop")
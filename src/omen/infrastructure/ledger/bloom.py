@@ -0,0 +1,75 @@
+"""
+Ledger Bloom Filter — compact membership test for segment pruning.
+
+Sealed partition manifests carry one filter per segment over its
+deterministic_trace_ids, so trace queries skip segments (and their
+sidecar indexes) that cannot contain any requested id. A negative answer
+is exact; a positive one may be a false positive at roughly the
+configured rate and is confirmed against the segment index.
+
+Serialized form (JSON-friendly):
+  {"bits": m, "hashes": k, "data": "<base64 bit array>"}
+"""
+
+import base64
+import math
+from hashlib import blake2b
+from typing import Iterable
+
+DEFAULT_FP_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings (double hashing on blake2b)."""
+
+    def __init__(self, num_bits: int, num_hashes: int, data: bytes | None = None):
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        size = (self.num_bits + 7) // 8
+        self._bits = bytearray(data) if data is not None else bytearray(size)
+        if len(self._bits) != size:
+            raise ValueError(f"Bloom data is {len(self._bits)} bytes, expected {size}")
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        """Filter sized for `capacity` keys at about `fp_rate` false positives."""
+        n = max(1, capacity)
+        m = math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2))
+        k = round(m / n * math.log(2))
+        return cls(m, k)
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        keys = list(keys)
+        bloom = cls.for_capacity(len(keys), fp_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def might_contain_any(self, keys: Iterable[str]) -> bool:
+        return any(key in self for key in keys)
+
+    def to_dict(self) -> dict:
+        return {
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "data": base64.b64encode(bytes(self._bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BloomFilter":
+        return cls(data["bits"], data["hashes"], base64.b64decode(data["data"]))
@@ -0,0 +1,251 @@
+"""
+Ledger Columnar Export — fixed-width column files for sealed partitions.
+
+Analytics over sealed partitions (daily counts, confidence histograms,
+calibration buckets) need a handful of numeric fields from every record.
+Decoding each frame into a SignalEvent for that is the slow path, so a
+sealed partition may carry a companion ``_columns/`` directory of numpy
+``.npy`` arrays, one row per record in sequence order:
+
+  emitted_at.npy        int64    microseconds since the Unix epoch (UTC)
+  probability.npy       float64
+  confidence_score.npy  float64
+  category.npy          uint8    code into dictionary["categories"]
+  source.npy            int32    code into dictionary["sources"]
+  signal_id.npy         int32    code into dictionary["signal_ids"]
+
+``dictionary.json`` holds the code tables, the format version and the
+row count. Category codes follow SignalCategory declaration order (other
+values are appended), so category codes agree across partitions.
+
+Columns are memory-mapped on load, so scans touch only the columns they
+use. They are derived data: built from the segments at seal time and
+left uncompressed by lifecycle compression. Requires numpy.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Mapping, Optional
+
+import numpy as np
+
+from omen.domain.models.omen_signal import SignalCategory
+from omen.infrastructure.ledger.segment_index import iter_frames, parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+COLUMNS_DIR = "_columns"
+COLUMNAR_VERSION = 1
+DICTIONARY_FILE = "dictionary.json"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_US = np.datetime64(0, "us")
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode(value: str, codes: dict[str, int]) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(codes)
+    return code
+
+
+def write_partition_columns(partition_dir: Path) -> Optional[Path]:
+    """
+    Build ``_columns/`` for a partition from its segments (.wal and .wal.gz).
+
+    CRC-invalid or undecodable records are skipped, as LedgerReader does.
+    The directory is built under a temporary name and renamed into place.
+    Returns the columns directory, or None if the partition has no records.
+    """
+    emitted_at: list[int] = []
+    probability: list[float] = []
+    confidence: list[float] = []
+    category: list[int] = []
+    source: list[int] = []
+    signal_id: list[int] = []
+    categories = {c.value: i for i, c in enumerate(SignalCategory)}
+    sources: dict[str, int] = {}
+    signal_ids: dict[str, int] = {}
+
+    for segment in sorted(partition_dir.glob("signals-*.wal*")):
+        opener = gzip.open if segment.suffix == ".gz" else open
+        with opener(segment, "rb") as f:
+            for offset, _, crc, payload in iter_frames(f):
+                if zlib.crc32(payload) & 0xFFFFFFFF != crc:
+                    logger.error("CRC mismatch in %s at offset %s", segment.name, offset)
+                    continue
+                try:
+                    data = json.loads(payload)
+                    signal = data["signal"]
+                    ts = parse_timestamp(data["emitted_at"])
+                    row = (
+                        (ts - _EPOCH) // _MICROSECOND,
+                        float(signal["probability"]),
+                        float(signal["confidence_score"]),
+                        _encode(signal["category"], categories),
+                        _encode(signal.get("probability_source") or "", sources),
+                        _encode(data["signal_id"], signal_ids),
+                    )
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    logger.error("Invalid record in %s at offset %s: %s", segment.name, offset, e)
+                    continue
+                emitted_at.append(row[0])
+                probability.append(row[1])
+                confidence.append(row[2])
+                category.append(row[3])
+                source.append(row[4])
+                signal_id.append(row[5])
+
+    if not emitted_at:
+        return None
+
+    target = partition_dir / COLUMNS_DIR
+    temp = partition_dir / (COLUMNS_DIR + ".tmp")
+    shutil.rmtree(temp, ignore_errors=True)
+    temp.mkdir()
+    np.save(temp / "emitted_at.npy", np.array(emitted_at, dtype=np.int64))
+    np.save(temp / "probability.npy", np.array(probability, dtype=np.float64))
+    np.save(temp / "confidence_score.npy", np.array(confidence, dtype=np.float64))
+    np.save(temp / "category.npy", np.array(category, dtype=np.uint8))
+    np.save(temp / "source.npy", np.array(source, dtype=np.int32))
+    np.save(temp / "signal_id.npy", np.array(signal_id, dtype=np.int32))
+    (temp / DICTIONARY_FILE).write_text(
+        json.dumps(
+            {
+                "version": COLUMNAR_VERSION,
+                "record_count": len(emitted_at),
+                "categories": list(categories),
+                "sources": list(sources),
+                "signal_ids": list(signal_ids),
+            },
+            separators=(",", ":"),
+        )
+    )
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(temp, target)
+    return target
+
+
+def _buckets(values: np.ndarray, bins: int) -> np.ndarray:
+    """Bucket index of each value in [0, 1]: min(int(v * bins), bins - 1)."""
+    return np.clip((values * bins).astype(np.int64), 0, bins - 1)
+
+
+@dataclass
+class ColumnarPartition:
+    """Memory-mapped columns of one partition (see module docstring for layout)."""
+
+    emitted_at: np.ndarray
+    probability: np.ndarray
+    confidence_score: np.ndarray
+    category: np.ndarray
+    source: np.ndarray
+    signal_id: np.ndarray
+    categories: list[str]
+    sources: list[str]
+    signal_ids: list[str]
+
+    @classmethod
+    def load(cls, partition_dir: Path) -> Optional["ColumnarPartition"]:
+        """Map a partition's columns; None if missing, unreadable or another version."""
+        columns_dir = partition_dir / COLUMNS_DIR
+        try:
+            dictionary = json.loads((columns_dir / DICTIONARY_FILE).read_text())
+            if dictionary.get("version") != COLUMNAR_VERSION:
+                return None
+            arrays = {
+                name: np.load(columns_dir / f"{name}.npy", mmap_mode="r")
+                for name in (
+                    "emitted_at",
+                    "probability",
+                    "confidence_score",
+                    "category",
+                    "source",
+                    "signal_id",
+                )
+            }
+        except (OSError, ValueError):
+            return None
+        if any(len(a) != dictionary["record_count"] for a in arrays.values()):
+            logger.warning("Column length mismatch in %s, ignoring", columns_dir)
+            return None
+        return cls(
+            **arrays,
+            categories=dictionary["categories"],
+            sources=dictionary["sources"],
+            signal_ids=dictionary["signal_ids"],
+        )
+
+    def __len__(self) -> int:
+        return len(self.emitted_at)
+
+    def emitted_at_datetime64(self) -> np.ndarray:
+        """emitted_at as datetime64[us] (UTC)."""
+        return _EPOCH_US + self.emitted_at.astype("timedelta64[us]")
+
+    def daily_counts(self) -> dict[str, int]:
+        """Records per UTC day of emitted_at (YYYY-MM-DD -> count)."""
+        days, counts = np.unique(
+            self.emitted_at_datetime64().astype("datetime64[D]"), return_counts=True
+        )
+        return {str(day): int(count) for day, count in zip(days, counts)}
+
+    def category_counts(self) -> dict[str, int]:
+        """Records per signal category."""
+        counts = np.bincount(self.category, minlength=len(self.categories))
+        return {name: int(counts[i]) for i, name in enumerate(self.categories) if counts[i]}
+
+    def confidence_histogram(self, bins: int = 10) -> list[int]:
+        """Counts of confidence_score in `bins` equal-width buckets over [0, 1]."""
+        return np.bincount(_buckets(self.confidence_score, bins), minlength=bins).tolist()
+
+    def calibration_buckets(
+        self,
+        outcomes: Optional[Mapping[str, bool]] = None,
+        bins: int = 10,
+    ) -> list[dict]:
+        """
+        Per-probability-bucket stats, bucketed as the calibration endpoint does.
+
+        Each bucket has its range, record count, mean predicted probability
+        and mean confidence. With `outcomes` (signal_id -> occurred), also
+        the number of resolved records and the observed outcome rate.
+        """
+        bucket = _buckets(self.probability, bins)
+        count = np.bincount(bucket, minlength=bins)
+        prob_sum = np.bincount(bucket, weights=self.probability, minlength=bins)
+        conf_sum = np.bincount(bucket, weights=self.confidence_score, minlength=bins)
+
+        if outcomes is not None:
+            known = np.array([sid in outcomes for sid in self.signal_ids], dtype=bool)
+            occurred = np.array([bool(outcomes.get(sid)) for sid in self.signal_ids], dtype=bool)
+            resolved = known[self.signal_id]
+            resolved_count = np.bincount(bucket[resolved], minlength=bins)
+            occurred_count = np.bincount(
+                bucket[resolved & occurred[self.signal_id]], minlength=bins
+            )
+
+        precision = 1 if bins <= 10 else 2
+        buckets = []
+        for i in range(bins):
+            n = int(count[i])
+            entry = {
+                "bucket_range": f"{i / bins:.{precision}f}-{(i + 1) / bins:.{precision}f}",
+                "count": n,
+                "predicted_avg": float(prob_sum[i] / n) if n else None,
+                "confidence_avg": float(conf_sum[i] / n) if n else None,
+            }
+            if outcomes is not None:
+                r = int(resolved_count[i])
+                entry["resolved"] = r
+                entry["actual_rate"] = float(occurred_count[i] / r) if r else None
+            buckets.append(entry)
+        return buckets
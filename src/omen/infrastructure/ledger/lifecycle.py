@@ -164,6 +164,13 @@ class LedgerLifecycleManager:
                 os.chmod(segment, 0o444)
             except OSError as e:
                 logger.warning("Could not chmod %s: %s", segment, e)
+        if self.config.columnar_export:
+            try:
+                from omen.infrastructure.ledger.columnar import write_partition_columns
+
+                write_partition_columns(partition.path)
+            except Exception as e:
+                logger.warning("Columnar export failed for %s: %s", partition.date, e)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Compression
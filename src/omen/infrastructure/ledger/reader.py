@@ -11,24 +11,45 @@ Frame format:
 Recovery:
 - Partial trailing frame is detected and skipped
 - CRC mismatch is logged and skipped
+
+Queries (time range, category, trace ids) prune whole segments of sealed
+partitions using the per-segment stats in ``_manifest.json`` (emitted_at
+range, category histogram, trace id bloom filter), then run a cheap check
+on each record's raw JSON bytes and decode only the records that pass.
 """
 
 import gzip
 import json
 import logging
+import os
+import re
 import struct
 import zlib
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
 from omen.domain.models.signal_event import SignalEvent
+from omen.infrastructure.ledger.bloom import BloomFilter
+from omen.infrastructure.ledger.segment_index import (
+    SegmentIndex,
+    index_path_for,
+    parse_timestamp,
+    read_frames_at,
+)
+
+if TYPE_CHECKING:
+    from omen.infrastructure.ledger.columnar import ColumnarPartition
 
 logger = logging.getLogger(__name__)
 
 FRAME_HEADER_SIZE = 8
 
+# Top-level emitted_at in a compact SignalEvent JSON payload (it precedes
+# the nested signal, and quotes inside string values are escaped)
+_EMITTED_AT_RE = re.compile(rb'"emitted_at":"([^"]*)"')
+
 
 @dataclass
 class PartitionInfo:
@@ -61,6 +82,10 @@ class LedgerReader:
 
     def __init__(self, base_path: str | Path):
         self.base_path = Path(base_path)
+        # segment path -> (segment size/mtime when indexed, index)
+        self._segment_indexes: dict[str, tuple[tuple[int, int], SegmentIndex]] = {}
+        # partition dir -> (manifest mtime, segment stats by file name)
+        self._segment_stats: dict[str, tuple[int, dict[str, dict]]] = {}
 
     def list_partitions(self) -> list[PartitionInfo]:
         """List all partitions with metadata."""
@@ -150,8 +175,14 @@ class LedgerReader:
         self,
         segment_path: Path,
         validate: bool,
+        prefilter: Optional[Callable[[bytes], bool]] = None,
     ) -> Iterator[SignalEvent]:
-        """Read framed records from segment file (.wal or .wal.gz)."""
+        """
+        Read framed records from segment file (.wal or .wal.gz).
+
+        If prefilter is given, it is applied to each raw payload first and
+        records it rejects are skipped without CRC check or decode.
+        """
         opener = gzip.open if segment_path.suffix == ".gz" else open
         with opener(segment_path, "rb") as f:
             record_num = 0
@@ -183,6 +214,9 @@ class LedgerReader:
 
                 record_num += 1
 
+                if prefilter is not None and not prefilter(payload):
+                    continue
+
                 if validate:
                     actual_crc = zlib.crc32(payload) & 0xFFFFFFFF
                     if actual_crc != expected_crc:
@@ -207,6 +241,19 @@ class LedgerReader:
                     )
                     continue
 
+    def read_columns(self, partition_date: str) -> Optional["ColumnarPartition"]:
+        """
+        Memory-mapped columns of a sealed partition, if it has them.
+
+        Returns None when the partition has no (current) columnar export or
+        numpy is not installed; callers then fall back to read_partition.
+        """
+        try:
+            from omen.infrastructure.ledger.columnar import ColumnarPartition
+        except ImportError:
+            return None
+        return ColumnarPartition.load(self.base_path / partition_date)
+
     def _count_records_in_segment(self, segment_path: Path) -> int:
         """Count valid records in segment (.wal or .wal.gz)."""
         count = 0
@@ -232,12 +279,70 @@ class LedgerReader:
         partition_date: str,
         signal_id: str,
     ) -> Optional[SignalEvent]:
-        """Get specific signal by ID."""
-        for event in self.read_partition(partition_date):
-            if event.signal_id == signal_id:
-                return event
+        """
+        Get specific signal by ID.
+
+        Uses the per-segment offset index: one slice and one decode per
+        lookup instead of a partition scan.
+        """
+        for segment in self.partition_segments(partition_date, include_late=True):
+            offset = self._get_segment_index(segment).signals.get(signal_id)
+            if offset is None:
+                continue
+            for _, payload in read_frames_at(segment, [offset]):
+                event = self._decode_event(segment, payload)
+                if event is not None and event.signal_id == signal_id:
+                    return event
         return None
 
+    def partition_segments(self, partition_date: str, include_late: bool = True) -> list[Path]:
+        """
+        Segment files of a partition (and its -late partition), in read order.
+
+        Lets callers such as VersionedLedgerReader.replay schedule per-segment
+        work without scanning the partition themselves.
+        """
+        dirs = [self.base_path / partition_date]
+        if include_late:
+            dirs.append(self.base_path / f"{partition_date}-late")
+        segments: list[Path] = []
+        for partition_dir in dirs:
+            if partition_dir.exists():
+                segments.extend(sorted(partition_dir.glob("signals-*.wal*")))
+        return segments
+
+    def _get_segment_index(self, segment: Path) -> SegmentIndex:
+        """
+        Offset index for a segment.
+
+        Loaded from the sidecar (or rebuilt lazily) and cached until the
+        segment changes. A rebuilt index for a sealed segment is written
+        back as its sidecar so later readers skip the scan.
+        """
+        key = str(segment)
+        stat = segment.stat()
+        version = (stat.st_size, stat.st_mtime_ns)
+        cached = self._segment_indexes.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        had_sidecar = index_path_for(segment).exists()
+        index = SegmentIndex.load_or_build(segment)
+        if not had_sidecar and (segment.suffix == ".gz" or not os.access(segment, os.W_OK)):
+            try:
+                index.save(index_path_for(segment))
+            except OSError as e:
+                logger.debug("Could not persist rebuilt index for %s: %s", segment.name, e)
+        self._segment_indexes[key] = (version, index)
+        return index
+
+    def _decode_event(self, segment: Path, payload: bytes) -> Optional[SignalEvent]:
+        try:
+            return SignalEvent(**json.loads(payload.decode("utf-8")))
+        except Exception as e:
+            logger.error("Invalid JSON in %s: %s", segment.name, e)
+            return None
+
     def get_partition_highwater(self, partition_date: str) -> tuple[int, int]:
         """
         Get highwater mark for partition.
@@ -260,6 +365,70 @@ class LedgerReader:
         count = sum(self._count_records_in_segment(s) for s in partition_dir.glob("signals-*.wal*"))
         return (count, 0)
 
+    def _get_segment_stats(self, partition_dir: Path) -> dict[str, dict]:
+        """
+        Per-segment pruning stats from a sealed partition's manifest.
+
+        Keyed by uncompressed segment file name; empty for unsealed
+        partitions and manifests written before the stats existed.
+        Cached until the manifest changes.
+        """
+        manifest_file = partition_dir / "_manifest.json"
+        try:
+            mtime = manifest_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        key = str(partition_dir)
+        cached = self._segment_stats.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            manifest = json.loads(manifest_file.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable manifest %s: %s", manifest_file, e)
+            return {}
+        stats = {
+            entry["file"]: entry
+            for entry in manifest.get("segments", [])
+            if "min_emitted_at" in entry
+        }
+        self._segment_stats[key] = (mtime, stats)
+        return stats
+
+    def _pruned_segments(
+        self,
+        partition_dir: Path,
+        keep: Callable[[dict], bool],
+    ) -> Iterator[Path]:
+        """Segments of a partition whose manifest stats pass keep (no stats: kept)."""
+        if not partition_dir.exists():
+            return
+        stats = self._get_segment_stats(partition_dir)
+        for segment in sorted(partition_dir.glob("signals-*.wal*")):
+            entry = stats.get(segment.name.removesuffix(".gz"))
+            if entry is None or keep(entry):
+                yield segment
+
+    def _query_dates(
+        self,
+        start_date: date,
+        end_date: date,
+        keep: Callable[[dict], bool],
+        prefilter: Callable[[bytes], bool],
+        validate: bool,
+    ) -> Iterator[SignalEvent]:
+        """Stream prefiltered records from the daily (and -late) partitions in range."""
+        current = start_date
+        while current <= end_date:
+            partition = current.isoformat()
+            for partition_dir in (
+                self.base_path / partition,
+                self.base_path / f"{partition}-late",
+            ):
+                for segment in self._pruned_segments(partition_dir, keep):
+                    yield from self._read_segment(segment, validate, prefilter)
+            current = date.fromordinal(current.toordinal() + 1)
+
     def query_by_time_range(
         self,
         start: datetime,
@@ -270,34 +439,58 @@ class LedgerReader:
         Query signals by time range.
 
         Uses emitted_at for filtering. Scans partitions that may contain
-        signals in [start, end].
+        signals in [start, end], skipping sealed segments whose emitted_at
+        range does not overlap and records whose raw emitted_at is outside
+        it.
         """
-        current = start.date()
-        end_date = end.date()
 
-        while current <= end_date:
-            partition = current.isoformat()
-            for event in self.read_partition(partition, validate=validate):
-                if start <= event.emitted_at <= end:
-                    yield event
-            current = date.fromordinal(current.toordinal() + 1)
+        def keep(entry: dict) -> bool:
+            lo = parse_timestamp(entry.get("min_emitted_at"))
+            hi = parse_timestamp(entry.get("max_emitted_at"))
+            if lo is None or hi is None:
+                return entry.get("record_count", 1) > 0
+            return lo <= end and hi >= start
+
+        def prefilter(payload: bytes) -> bool:
+            match = _EMITTED_AT_RE.search(payload)
+            emitted_at = parse_timestamp(match.group(1).decode()) if match else None
+            return emitted_at is None or start <= emitted_at <= end
+
+        for event in self._query_dates(start.date(), end.date(), keep, prefilter, validate):
+            if start <= event.emitted_at <= end:
+                yield event
 
     def query_by_trace_ids(
         self,
         trace_ids: list[str],
         validate: bool = True,
     ) -> list[SignalEvent]:
-        """Query signals by trace IDs (scans all partitions)."""
+        """
+        Query signals by trace IDs.
+
+        Sealed segments whose trace bloom filter rules out every id are
+        skipped without loading their index. Remaining segments look the
+        ids up in their offset index and decode only the matching records
+        (CRC is always checked on indexed reads).
+        """
         trace_set = set(trace_ids)
         results: list[SignalEvent] = []
+        if not trace_set:
+            return results
+
+        def keep(entry: dict) -> bool:
+            bloom = entry.get("trace_bloom")
+            return bloom is None or BloomFilter.from_dict(bloom).might_contain_any(trace_set)
 
         for partition_info in self.list_partitions():
-            for event in self.read_partition(
-                partition_info.partition_date,
-                validate=validate,
-            ):
-                if event.deterministic_trace_id in trace_set:
-                    results.append(event)
+            partition_dir = self.base_path / partition_info.partition_date
+            for segment in self._pruned_segments(partition_dir, keep):
+                traces = self._get_segment_index(segment).traces
+                offsets = [o for t in trace_set for o in traces.get(t, ())]
+                for _, payload in read_frames_at(segment, offsets):
+                    event = self._decode_event(segment, payload)
+                    if event is not None and event.deterministic_trace_id in trace_set:
+                        results.append(event)
 
         return results
 
@@ -308,13 +501,22 @@ class LedgerReader:
         end_date: date,
         validate: bool = True,
     ) -> Iterator[SignalEvent]:
-        """Query signals by category within date range."""
-        current = start_date
+        """
+        Query signals by category within date range.
 
-        while current <= end_date:
-            partition = current.isoformat()
-            for event in self.read_partition(partition, validate=validate):
-                cat = event.signal.category
-                if (cat.value if hasattr(cat, "value") else str(cat)) == category:
-                    yield event
-            current = date.fromordinal(current.toordinal() + 1)
+        Sealed segments whose category histogram lacks the category are
+        skipped; only records whose raw bytes contain the category value
+        are decoded.
+        """
+        needle = b'"category":' + json.dumps(category).encode("utf-8")
+
+        def keep(entry: dict) -> bool:
+            return category in entry.get("categories", {})
+
+        def prefilter(payload: bytes) -> bool:
+            return needle in payload
+
+        for event in self._query_dates(start_date, end_date, keep, prefilter, validate):
+            cat = event.signal.category
+            if (cat.value if hasattr(cat, "value") else str(cat)) == category:
+                yield event
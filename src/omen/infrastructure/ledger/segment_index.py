@@ -0,0 +1,309 @@
+"""
+Ledger Segment Index — sidecar offsets for point lookups.
+
+Each WAL segment ``signals-NNN.wal`` may have a sidecar ``signals-NNN.idx``
+mapping signal_id and deterministic_trace_id to the byte offset of the
+record's frame header, so a reader fetches one record with a single slice
+instead of decoding the whole partition.
+
+Sidecar format (JSON):
+  {
+    "version": 3,
+    "segment": "signals-001.wal",
+    "size_bytes": <end offset of the last indexed frame>,
+    "record_count": <indexed records>,
+    "frame_count": <complete frames, including CRC-invalid ones>,
+    "crc32": <running CRC-32 of bytes [0, size_bytes), or null if unknown>,
+    "signals": {signal_id: offset},
+    "traces": {trace_id: [offset, ...]},
+    "min_emitted_at": <ISO 8601 or null>,
+    "max_emitted_at": <ISO 8601 or null>,
+    "categories": {category: count}
+  }
+
+The emitted_at range and category histogram let readers skip whole
+segments; LedgerWriter copies them (plus a trace id bloom filter) into
+the sealed partition manifest. frame_count and crc32 are the writer's
+running counters: sealing takes the manifest record count and checksum
+from them instead of re-reading the segment.
+
+The index is derived data: it is written by LedgerWriter at rollover,
+seal, close and every INDEX_CHECKPOINT_RECORDS frames of the active
+segment (so a restarted writer only scans frames past the checkpoint),
+and rebuilt (or extended from ``size_bytes``) whenever it is missing
+or behind the segment. Offsets refer to the uncompressed segment bytes, so
+an index stays valid after lifecycle compression to ``.wal.gz``.
+"""
+
+import gzip
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from omen.infrastructure.ledger.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 3
+FRAME_HEADER_SIZE = 8
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp as written by pydantic (``Z`` suffix allowed)."""
+    if not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def index_path_for(segment_path: Path) -> Path:
+    """Sidecar path for a segment (``signals-001.wal[.gz]`` -> ``signals-001.idx``)."""
+    name = segment_path.name
+    if name.endswith(".gz"):
+        name = name[: -len(".gz")]
+    return segment_path.with_name(Path(name).stem + ".idx")
+
+
+def iter_frames(f: BinaryIO, start: int = 0) -> Iterator[tuple[int, int, int, bytes]]:
+    """
+    Yield (offset, end, crc, payload) for each complete frame from start.
+
+    Stops silently at a partial trailing frame.
+    """
+    offset = start
+    if start:
+        f.seek(start)
+    while True:
+        header = f.read(FRAME_HEADER_SIZE)
+        if len(header) < FRAME_HEADER_SIZE:
+            return
+        length, crc = struct.unpack(">II", header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return
+        end = offset + FRAME_HEADER_SIZE + length
+        yield offset, end, crc, payload
+        offset = end
+
+
+@dataclass
+class SegmentIndex:
+    """In-memory signal_id / trace_id -> frame offset index for one segment."""
+
+    segment: str
+    size_bytes: int = 0
+    record_count: int = 0
+    signals: dict[str, int] = field(default_factory=dict)
+    traces: dict[str, list[int]] = field(default_factory=dict)
+    min_emitted_at: Optional[datetime] = None
+    max_emitted_at: Optional[datetime] = None
+    categories: dict[str, int] = field(default_factory=dict)
+    frame_count: int = 0
+    crc32: Optional[int] = 0  # None once a gap makes the running checksum unknown
+
+    def add_frame(self, offset: int, header: bytes, payload: bytes) -> None:
+        """Count a complete frame at offset and fold it into the running checksum."""
+        if self.crc32 is not None and offset == self.size_bytes:
+            self.crc32 = zlib.crc32(payload, zlib.crc32(header, self.crc32))
+        else:
+            self.crc32 = None
+        self.frame_count += 1
+        self.size_bytes = max(self.size_bytes, offset + len(header) + len(payload))
+
+    def checksum(self) -> Optional[str]:
+        """Manifest checksum of bytes [0, size_bytes) (``crc32:<hex>``), if known."""
+        return f"crc32:{self.crc32:08x}" if self.crc32 is not None else None
+
+    def add(
+        self,
+        signal_id: str,
+        trace_id: Optional[str],
+        offset: int,
+        end: int,
+        emitted_at: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> None:
+        """Record one frame written at offset and ending at end (first write of an id wins)."""
+        self.signals.setdefault(signal_id, offset)
+        if trace_id:
+            self.traces.setdefault(trace_id, []).append(offset)
+        if emitted_at is not None:
+            if self.min_emitted_at is None or emitted_at < self.min_emitted_at:
+                self.min_emitted_at = emitted_at
+            if self.max_emitted_at is None or emitted_at > self.max_emitted_at:
+                self.max_emitted_at = emitted_at
+        if category:
+            self.categories[category] = self.categories.get(category, 0) + 1
+        self.record_count += 1
+        self.size_bytes = max(self.size_bytes, end)
+
+    def manifest_stats(self) -> dict:
+        """Pruning stats for the segment's entry in a sealed partition manifest."""
+        return {
+            "min_emitted_at": _isoformat(self.min_emitted_at),
+            "max_emitted_at": _isoformat(self.max_emitted_at),
+            "categories": dict(self.categories),
+            "trace_bloom": BloomFilter.from_keys(self.traces).to_dict(),
+        }
+
+    def extend_from(self, f: BinaryIO) -> None:
+        """Index frames after size_bytes (CRC-invalid or undecodable frames are skipped)."""
+        for offset, end, crc, payload in iter_frames(f, self.size_bytes):
+            self.add_frame(offset, struct.pack(">II", len(payload), crc), payload)
+            if zlib.crc32(payload) & 0xFFFFFFFF != crc:
+                continue
+            try:
+                data = json.loads(payload)
+                signal_id = data["signal_id"]
+                category = (data.get("signal") or {}).get("category")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+            self.add(
+                signal_id,
+                data.get("deterministic_trace_id"),
+                offset,
+                end,
+                emitted_at=parse_timestamp(data.get("emitted_at")),
+                category=category,
+            )
+
+    @classmethod
+    def build(cls, segment_path: Path) -> "SegmentIndex":
+        """Build an index by scanning a segment (.wal or .wal.gz)."""
+        index = cls(segment=segment_path.name.removesuffix(".gz"))
+        opener = gzip.open if segment_path.suffix == ".gz" else open
+        with opener(segment_path, "rb") as f:
+            index.extend_from(f)
+        return index
+
+    @classmethod
+    def load(cls, index_path: Path) -> Optional["SegmentIndex"]:
+        """Load a sidecar; returns None if missing, unreadable or another version."""
+        try:
+            data = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        return cls(
+            segment=data["segment"],
+            size_bytes=data["size_bytes"],
+            record_count=data["record_count"],
+            signals=data["signals"],
+            traces=data["traces"],
+            min_emitted_at=parse_timestamp(data.get("min_emitted_at")),
+            max_emitted_at=parse_timestamp(data.get("max_emitted_at")),
+            categories=data.get("categories", {}),
+            frame_count=data["frame_count"],
+            crc32=data.get("crc32"),
+        )
+
+    @classmethod
+    def load_or_build(cls, segment_path: Path) -> "SegmentIndex":
+        """
+        Load the segment's sidecar and bring it up to date.
+
+        Plain segments are extended from the indexed size when they have
+        grown and rebuilt when they have shrunk; a missing or unreadable
+        sidecar is rebuilt from the segment.
+        """
+        index = cls.load(index_path_for(segment_path))
+        if index is None:
+            return cls.build(segment_path)
+        if segment_path.suffix == ".gz":
+            return index
+        size = segment_path.stat().st_size
+        if size < index.size_bytes:
+            return cls.build(segment_path)
+        if size > index.size_bytes:
+            with open(segment_path, "rb") as f:
+                index.extend_from(f)
+        return index
+
+    def save(self, index_path: Path) -> None:
+        """Write the sidecar atomically (temp + replace; no fsync, it is derived data)."""
+        temp = index_path.with_name(index_path.name + ".tmp")
+        temp.write_text(
+            json.dumps(
+                {
+                    "version": INDEX_VERSION,
+                    "segment": self.segment,
+                    "size_bytes": self.size_bytes,
+                    "record_count": self.record_count,
+                    "signals": self.signals,
+                    "traces": self.traces,
+                    "min_emitted_at": _isoformat(self.min_emitted_at),
+                    "max_emitted_at": _isoformat(self.max_emitted_at),
+                    "categories": self.categories,
+                    "frame_count": self.frame_count,
+                    "crc32": self.crc32,
+                },
+                separators=(",", ":"),
+            )
+        )
+        os.replace(temp, index_path)
+
+
+def read_frames_at(segment_path: Path, offsets: list[int]) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield (offset, payload) for frames at the given offsets, CRC-checked.
+
+    Plain segments are memory-mapped so each record costs one slice;
+    compressed segments fall back to seeking in the gzip stream.
+    Frames that are truncated or fail CRC are logged and skipped.
+    """
+    if not offsets:
+        return
+    if segment_path.suffix == ".gz":
+        with gzip.open(segment_path, "rb") as f:
+            for offset in sorted(offsets):
+                f.seek(offset)
+                header = f.read(FRAME_HEADER_SIZE)
+                payload = f.read(_frame_length(header))
+                if _check_frame(segment_path, offset, header, payload):
+                    yield offset, payload
+        return
+
+    with open(segment_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for offset in sorted(offsets):
+                start = offset + FRAME_HEADER_SIZE
+                header = m[offset:start]
+                payload = m[start : start + _frame_length(header)]
+                if _check_frame(segment_path, offset, header, payload):
+                    yield offset, payload
+
+
+def _frame_length(header: bytes) -> int:
+    return struct.unpack(">I", header[:4])[0] if len(header) == FRAME_HEADER_SIZE else 0
+
+
+def _check_frame(segment_path: Path, offset: int, header: bytes, payload: bytes) -> bool:
+    if len(header) < FRAME_HEADER_SIZE:
+        logger.warning("Indexed offset %s beyond end of %s", offset, segment_path.name)
+        return False
+    length, expected_crc = struct.unpack(">II", header)
+    if len(payload) < length:
+        logger.warning("Partial payload at offset %s of %s", offset, segment_path.name)
+        return False
+    if zlib.crc32(payload) & 0xFFFFFFFF != expected_crc:
+        logger.error("CRC mismatch in %s at offset %s", segment_path.name, offset)
+        return False
+    return True
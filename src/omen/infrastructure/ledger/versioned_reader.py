@@ -2,17 +2,68 @@
 Versioned Ledger Reader
 
 Reads ledger records and automatically migrates to current schema.
+
+`replay` is the bulk path for backfills and migrations: segments are
+decoded (CRC check, JSON parse, schema migration, validation) in a
+process pool and streamed back in sequence order, with at most
+`max_pending` segments in flight so memory is bounded by segment size
+(MAX_SEGMENT_SIZE_BYTES), not partition size.
 """
 
+import gzip
+import json
 import logging
+import os
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from omen.domain.models.signal_event import SignalEvent
 from omen.domain.schema.registry import SCHEMA_REGISTRY, SchemaVersion
 from omen.infrastructure.ledger.reader import LedgerReader
+from omen.infrastructure.ledger.segment_index import iter_frames
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_segment(segment: str, validate: bool, migrate: bool) -> list[SignalEvent]:
+    """
+    Decode one segment into events, in frame order (runs in pool workers).
+
+    Mirrors LedgerReader._read_segment: stops at a partial trailing frame
+    and skips CRC-invalid or undecodable records. Records that fail
+    migration are returned unmigrated, as in read_partition.
+    """
+    path = Path(segment)
+    events: list[SignalEvent] = []
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        for offset, _, crc, payload in iter_frames(f):
+            if validate and zlib.crc32(payload) & 0xFFFFFFFF != crc:
+                logger.error("CRC mismatch in %s at offset %s", path.name, offset)
+                continue
+            try:
+                data = json.loads(payload)
+            except ValueError as e:
+                logger.error("Invalid JSON in %s at offset %s: %s", path.name, offset, e)
+                continue
+            if migrate:
+                try:
+                    events.append(SignalEvent.model_validate(SCHEMA_REGISTRY.migrate(data)))
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        "Failed to migrate event %s: %s", data.get("signal_id"), e
+                    )
+            try:
+                events.append(SignalEvent.model_validate(data))
+            except Exception as e:
+                logger.error("Invalid record in %s at offset %s: %s", path.name, offset, e)
+    return events
+
+
 class VersionedLedgerReader:
     """
     Wrapper around LedgerReader that handles schema migration.
@@ -111,3 +162,58 @@ class VersionedLedgerReader:
             version = event.schema_version
             versions[version] = versions.get(version, 0) + 1
         return versions
+
+    def replay(
+        self,
+        partition_dates: Iterable[str],
+        include_late: bool = True,
+        migrate_to_current: bool = True,
+        validate: bool = True,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[SignalEvent]:
+        """
+        Stream partitions in sequence order, decoding segments in parallel.
+
+        Each segment is one task: workers verify CRC, parse, migrate and
+        validate it, and results are yielded in partition/segment/frame
+        order. Only `max_pending` segments are queued or held at once.
+
+        Args:
+            partition_dates: Partitions to replay, in order
+            include_late: Replay each partition's -late partition after it
+            migrate_to_current: Migrate old schemas to current
+            validate: If True, verify CRC
+            workers: Worker processes (default: CPU count); <= 1 decodes in-process
+            max_pending: Segments in flight (default: 2 x workers)
+
+        Note: workers see migrations registered at import time; with a
+        non-fork start method, runtime SCHEMA_REGISTRY additions are lost.
+        """
+        segments = (
+            str(segment)
+            for partition_date in partition_dates
+            for segment in self._reader.partition_segments(partition_date, include_late)
+        )
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers <= 1:
+            for segment in segments:
+                yield from _decode_segment(segment, validate, migrate_to_current)
+            return
+
+        max_pending = max(1, max_pending or 2 * workers)
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending: deque[Future] = deque()
+        try:
+            for segment in segments:
+                pending.append(
+                    pool.submit(_decode_segment, segment, validate, migrate_to_current)
+                )
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Abandoned early (or failed): cancel queued segments and wait only
+            # for the ones already running, so no worker outlives the replay
+            pool.shutdown(wait=True, cancel_futures=True)
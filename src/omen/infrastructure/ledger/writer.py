@@ -19,15 +19,18 @@ import logging
 import os
 import struct
 import sys
+import threading
 import time
 import zlib
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Sequence
 
-from filelock import FileLock
+from filelock import FileLock, Timeout
 
 from omen.domain.models.signal_event import SignalEvent
+from omen.infrastructure.ledger.segment_index import SegmentIndex, index_path_for
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +50,15 @@ MAX_SEGMENT_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
 MAX_SEGMENT_RECORDS = 10_000
 SEAL_GRACE_PERIOD_HOURS = 6
 LATE_SEAL_GRACE_DAYS = 3  # Late partitions seal after 3 days
+PARTITION_LOCK_TIMEOUT_S = 30.0  # give up on a partition held by another writer
+
+# Group commit (opt-in): one fsync covers every frame appended meanwhile
+GROUP_COMMIT_MAX_DELAY_MS = 2.0
+GROUP_COMMIT_MAX_BATCH = 256
+
+# Persist the active segment's sidecar index every N frames (restart recovery)
+INDEX_CHECKPOINT_RECORDS = 1000
+CHECKSUM_CHUNK_BYTES = 1024 * 1024  # fallback whole-file checksum read size
 
 
 # Frame format
@@ -102,13 +114,48 @@ class LedgerWriter:
     - Crash-safe (partial writes detectable)
     - Single-writer per partition (file lock)
     - Immutable segments after rollover
+
+    Group commit (opt-in, ``group_commit=True``):
+    segment handles stay open and the partition lock is held while they
+    are, frames from concurrent callers (threads) are appended as they
+    arrive, and one fsync per batch makes them all durable. A batch is
+    flushed after ``group_commit_max_delay_ms`` or once
+    ``group_commit_max_batch`` frames are pending. write() still returns
+    only after the caller's own frame has been fsync'd.
+
+    Columnar export (opt-in, ``columnar_export=True``): sealing a
+    partition also writes its ``_columns/`` numpy companion for
+    vectorized analytics (see ledger.columnar).
     """
 
-    def __init__(self, base_path: str | Path):
+    def __init__(
+        self,
+        base_path: str | Path,
+        group_commit: bool = False,
+        group_commit_max_delay_ms: float = GROUP_COMMIT_MAX_DELAY_MS,
+        group_commit_max_batch: int = GROUP_COMMIT_MAX_BATCH,
+        columnar_export: bool = False,
+    ):
         self.base_path = Path(base_path)
+        self.columnar_export = columnar_export  # write _columns/ on seal (needs numpy)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self._current_segments: dict[str, Path] = {}  # partition -> current segment
-        self._record_counts: dict[str, int] = {}  # segment -> record count
+        self._segment_indexes: dict[str, SegmentIndex] = {}  # segment -> offset index
+        self._unsynced: set[str] = set()  # segments with deferred fsync (write_batch)
+
+        # Group commit state
+        self.group_commit = group_commit
+        self._max_delay_s = group_commit_max_delay_ms / 1000.0
+        self._max_batch = max(1, group_commit_max_batch)
+        self._append_lock = threading.Lock()  # serializes appends in this process
+        self._commit_cond = threading.Condition()
+        self._open_segments: dict[str, BinaryIO] = {}  # segment -> open handle
+        self._partition_locks: dict[str, FileLock] = {}  # partition dir -> held lock
+        self._dirty: dict[str, list[int]] = {}  # segment -> tickets not yet fsync'd
+        self._appended_ticket = 0  # last frame appended
+        self._synced_ticket = 0  # last frame known durable
+        self._flush_in_progress = False
+        self._failed_tickets: dict[int, OSError] = {}  # ticket -> error of its covering fsync
 
     def write(self, event: SignalEvent) -> SignalEvent:
         """
@@ -131,8 +178,80 @@ class LedgerWriter:
                 LEDGER_WRITE_DURATION.observe(time.perf_counter() - start)
             raise LedgerWriteError(str(e)) from e
 
+    def write_batch(
+        self, events: Sequence[SignalEvent]
+    ) -> "list[SignalEvent | LedgerWriteError]":
+        """
+        Write several signals in order, sharing fsyncs between them.
+
+        Frames are appended without fsync, then each touched segment is
+        fsync'd once (group commit mode: the batch waits for the group
+        fsyncs covering its frames). Results are positional: the written
+        event, or a LedgerWriteError if its append or covering fsync
+        failed. No event is returned as written before its frame is
+        durable.
+        """
+        start = time.perf_counter()
+        results: list[SignalEvent | LedgerWriteError] = []
+        tickets: list[tuple[int, int]] = []  # (result position, commit ticket)
+        unsynced: dict[str, list[int]] = {}  # segment -> result positions
+        for event in events:
+            try:
+                written, segment_file, ticket = self._append_event(event, sync=False)
+            except LedgerWriteError as e:
+                results.append(e)
+                continue
+            except OSError as e:
+                results.append(LedgerWriteError(str(e)))
+                continue
+            if self.group_commit:
+                tickets.append((len(results), ticket))
+            else:
+                unsynced.setdefault(str(segment_file), []).append(len(results))
+            results.append(written)
+
+        for i, ticket in tickets:
+            try:
+                self._wait_durable(ticket)
+            except OSError as e:
+                results[i] = LedgerWriteError(str(e))
+        for segment, positions in unsynced.items():
+            try:
+                self._sync_segment(Path(segment))
+            except OSError as e:
+                for i in positions:
+                    results[i] = LedgerWriteError(str(e))
+
+        if _LEDGER_METRICS_AVAILABLE:
+            duration = time.perf_counter() - start
+            for result in results:
+                if isinstance(result, LedgerWriteError):
+                    LEDGER_WRITES.labels(partition="unknown", result="error").inc()
+                else:
+                    partition = result.ledger_partition or "unknown"
+                    LEDGER_WRITES.labels(partition=partition, result="success").inc()
+                LEDGER_WRITE_DURATION.observe(duration)
+        return results
+
     def _write_impl(self, event: SignalEvent) -> SignalEvent:
         """Internal write path; callers use write() which wraps OSError."""
+        event, _, ticket = self._append_event(event)
+        if self.group_commit:
+            # Durability ack: wait until a group fsync covers this frame
+            self._wait_durable(ticket)
+        return event
+
+    def _append_event(self, event: SignalEvent, sync: bool = True) -> tuple[SignalEvent, Path, int]:
+        """
+        Append one framed record under the partition guard.
+
+        Returns (event with ledger metadata, segment, commit ticket). In
+        default mode the frame is fsync'd unless sync is False, in which
+        case the segment is left in _unsynced for _sync_segment. In group
+        commit mode the frame is durable once _wait_durable(ticket)
+        returns (ticket is 0 in default mode).
+        """
+        ticket = 0
         # Determine partition (use UTC; support both naive and aware datetime)
         emitted = event.emitted_at
         if emitted.tzinfo is None:
@@ -152,14 +271,13 @@ class LedgerWriter:
         partition_dir.mkdir(parents=True, exist_ok=True)
 
         # Acquire partition lock (single-writer guarantee)
-        lock_file = partition_dir / "_LOCK"
-
-        with FileLock(str(lock_file)):
+        with self._partition_guard(partition_dir):
             # Get or create current segment
             segment_file = self._get_or_create_current_segment(partition_dir)
 
-            # Per-segment record index (1-based)
-            record_index = self._increment_record_count(segment_file)
+            # Per-segment record index (1-based), from the index's running frame count
+            index = self._get_segment_index(segment_file)
+            record_index = index.frame_count + 1
             # Partition-wide monotonic sequence: (segment_ordinal << 32) | record_index
             segment_ordinal = int(segment_file.stem.split("-")[1])
             ledger_sequence = (segment_ordinal << 32) | record_index
@@ -175,11 +293,33 @@ class LedgerWriter:
                 exclude_none=True,
             ).encode("utf-8")
 
-            # Write framed record
-            self._append_framed_record(segment_file, payload_bytes)
+            # Write framed record; fold it into the running counters and index its offset
+            header = _frame_header(payload_bytes)
+            if self.group_commit:
+                offset, ticket = self._append_to_open_segment(segment_file, header, payload_bytes)
+            else:
+                offset = self._append_framed_record(segment_file, header, payload_bytes, sync)
+            index.add_frame(offset, header, payload_bytes)
+            category = event.signal.category
+            index.add(
+                event.signal_id,
+                event.deterministic_trace_id,
+                offset,
+                offset + FRAME_HEADER_SIZE + len(payload_bytes),
+                emitted_at=event.emitted_at,
+                category=getattr(category, "value", category),
+            )
 
             # Check if segment needs rollover
-            self._maybe_rollover(partition_dir, segment_file)
+            try:
+                rolled = self._maybe_rollover(partition_dir, segment_file)
+            except OSError:
+                if ticket:
+                    with self._commit_cond:
+                        self._failed_tickets.pop(ticket, None)  # raised to this caller
+                raise
+            if not rolled:
+                self._maybe_checkpoint_index(segment_file, index)
 
         logger.debug(
             "Ledger write: %s -> %s/%s",
@@ -188,37 +328,291 @@ class LedgerWriter:
             ledger_sequence,
         )
 
-        return event
+        return event, segment_file, ticket
 
-    def _append_framed_record(self, segment_file: Path, payload_bytes: bytes) -> None:
+    def _append_framed_record(
+        self,
+        segment_file: Path,
+        header: bytes,
+        payload_bytes: bytes,
+        sync: bool = True,
+    ) -> int:
         """
         Append framed record to segment.
 
-        Frame format: [u32 length][u32 crc32][payload]
+        Frame format: [u32 length][u32 crc32][payload] (header from _frame_header)
 
         Crash-safe: partial frame is detectable and truncatable.
+        With sync=False the fsync is deferred to _sync_segment.
+        Returns the byte offset of the frame header.
         """
-        crc = zlib.crc32(payload_bytes) & 0xFFFFFFFF
-        header = struct.pack(">II", len(payload_bytes), crc)
-
         with open(segment_file, "ab") as f:
+            offset = f.tell()
             f.write(header + payload_bytes)
             f.flush()
+            if sync:
+                os.fsync(f.fileno())
+            else:
+                self._unsynced.add(str(segment_file))
+        return offset
+
+    def _sync_segment(self, segment_file: Path) -> None:
+        """fsync a segment with deferred (sync=False) frames; no-op if none are pending."""
+        key = str(segment_file)
+        if key not in self._unsynced:
+            return
+        with open(segment_file, "rb") as f:
+            os.fsync(f.fileno())
+        self._unsynced.discard(key)
+
+    def _get_segment_index(self, segment: Path) -> SegmentIndex:
+        """Offset index for a segment, loaded or rebuilt from disk on first use."""
+        key = str(segment)
+        index = self._segment_indexes.get(key)
+        if index is None:
+            index = SegmentIndex.load_or_build(segment)
+            self._segment_indexes[key] = index
+        return index
+
+    def _write_segment_index(self, segment: Path) -> Optional[SegmentIndex]:
+        """
+        Persist the segment's sidecar index and drop it from the cache.
+
+        The index is derived data, so failures are logged, not raised;
+        readers rebuild a missing sidecar lazily. Returns the index, or
+        None if it could not be built.
+        """
+        index = self._segment_indexes.pop(str(segment), None)
+        try:
+            if index is None:
+                index = SegmentIndex.load_or_build(segment)
+            index.save(index_path_for(segment))
+        except OSError as e:
+            logger.warning("Could not write segment index for %s: %s", segment.name, e)
+        return index
+
+    def _maybe_checkpoint_index(self, segment: Path, index: SegmentIndex) -> None:
+        """
+        Persist the active segment's sidecar every INDEX_CHECKPOINT_RECORDS frames.
+
+        A restarted writer then extends the checkpoint instead of scanning
+        the whole segment to recover its frame count and checksum.
+        """
+        if index.frame_count % INDEX_CHECKPOINT_RECORDS:
+            return
+        try:
+            index.save(index_path_for(segment))
+        except OSError as e:
+            logger.debug("Could not checkpoint segment index for %s: %s", segment.name, e)
+
+    def _checkpoint_indexes(self) -> None:
+        """Persist every cached segment index (shutdown)."""
+        for key, index in list(self._segment_indexes.items()):
+            try:
+                index.save(index_path_for(Path(key)))
+            except OSError as e:
+                logger.debug("Could not checkpoint segment index for %s: %s", key, e)
+
+    @contextmanager
+    def _partition_guard(self, partition_dir: Path) -> Iterator[None]:
+        """
+        Single-writer guard for a partition.
+
+        Default mode takes the partition FileLock per write. Group commit
+        mode holds it for as long as the partition has open segment
+        handles and serializes in-process appends with a thread lock.
+        """
+        if not self.group_commit:
+            lock = FileLock(str(partition_dir / "_LOCK"))
+            _acquire_partition_lock(lock, partition_dir)
+            try:
+                yield
+            finally:
+                lock.release()
+            return
+
+        with self._append_lock:
+            key = str(partition_dir)
+            if key not in self._partition_locks:
+                lock = FileLock(str(partition_dir / "_LOCK"))
+                _acquire_partition_lock(lock, partition_dir)
+                self._partition_locks[key] = lock
+            yield
+
+    def _append_to_open_segment(
+        self, segment_file: Path, header: bytes, payload_bytes: bytes
+    ) -> tuple[int, int]:
+        """
+        Append framed record to the segment's open handle without fsync.
+
+        Caller holds _append_lock. Returns (frame offset, commit ticket);
+        the frame is durable once _synced_ticket >= ticket. The handle is
+        unbuffered, so a short write is retried; if the frame cannot be
+        written in full it is truncated away and no ticket is issued.
+        """
+        key = str(segment_file)
+        f = self._open_segments.get(key)
+        if f is None:
+            f = open(segment_file, "ab", buffering=0)
+            self._open_segments[key] = f
+
+        offset = f.tell()
+        frame = memoryview(header + payload_bytes)
+        try:
+            written = 0
+            while written < len(frame):
+                n = f.write(frame[written:])
+                if not n:
+                    raise OSError(f"short write to {segment_file.name} at offset {offset}")
+                written += n
+        except BaseException:
+            try:
+                f.truncate(offset)
+            except OSError as e:
+                logger.error(
+                    "Could not truncate torn frame in %s at offset %d: %s",
+                    segment_file.name, offset, e,
+                )
+            raise
+
+        with self._commit_cond:
+            self._appended_ticket += 1
+            ticket = self._appended_ticket
+            self._dirty.setdefault(key, []).append(ticket)
+            if ticket - self._synced_ticket >= self._max_batch:
+                self._commit_cond.notify_all()
+        return offset, ticket
+
+    def _wait_durable(self, ticket: int) -> None:
+        """
+        Block until the frame with this ticket has been fsync'd.
+
+        The first waiter without a flush in progress becomes the leader: it
+        waits for the batch window (or a full batch), then fsyncs every
+        dirty segment once on behalf of all pending frames.
+        Raises OSError if the fsync covering this frame failed, in a group
+        flush or when its segment was closed (rollover, close).
+        """
+        while True:
+            with self._commit_cond:
+                while True:
+                    error = self._failed_tickets.pop(ticket, None)
+                    if error is not None:
+                        raise error
+                    if self._synced_ticket >= ticket:
+                        return
+                    if not self._flush_in_progress:
+                        break
+                    self._commit_cond.wait()
+
+                self._flush_in_progress = True
+                self._commit_cond.wait_for(
+                    lambda: self._appended_ticket - self._synced_ticket >= self._max_batch,
+                    timeout=self._max_delay_s,
+                )
+            self._group_fsync()
+
+    def _group_fsync(self) -> None:
+        """
+        Leader side of _wait_durable: fsync each dirty segment once.
+
+        A failed fsync fails exactly the tickets appended to that segment
+        since its last flush; other segments' frames are still acked.
+        """
+        try:
+            # Snapshot under the append lock, fsync outside it so appends continue
+            with self._append_lock:
+                target = self._appended_ticket
+                with self._commit_cond:
+                    pending = [
+                        (os.dup(self._open_segments[k].fileno()), tickets)
+                        for k, tickets in self._dirty.items()
+                        if k in self._open_segments
+                    ]
+                    self._dirty.clear()
+
+            failed: dict[int, OSError] = {}
+            try:
+                for fd, tickets in pending:
+                    try:
+                        os.fsync(fd)
+                    except OSError as e:
+                        failed.update(dict.fromkeys(tickets, e))
+            finally:
+                for fd, _ in pending:
+                    os.close(fd)
+
+            with self._commit_cond:
+                self._failed_tickets.update(failed)
+                self._synced_ticket = max(self._synced_ticket, target)
+        finally:
+            with self._commit_cond:
+                self._flush_in_progress = False
+                self._commit_cond.notify_all()
+
+    def _close_open_segment(self, segment_file: Path) -> None:
+        """
+        fsync and close a segment's open handle (group commit mode).
+
+        Caller holds _append_lock. This fsync covers the segment's frames
+        not yet group-flushed; if it fails, each of their tickets fails.
+        """
+        key = str(segment_file)
+        f = self._open_segments.pop(key, None)
+        if f is None:
+            return
+        with self._commit_cond:
+            tickets = self._dirty.pop(key, [])
+        try:
             os.fsync(f.fileno())
+        except OSError as e:
+            with self._commit_cond:
+                self._failed_tickets.update(dict.fromkeys(tickets, e))
+                self._commit_cond.notify_all()
+            raise
+        finally:
+            f.close()
+
+    def _release_partition(self, partition_dir: Path) -> None:
+        """Close the partition's open segments and release its held lock."""
+        for key in [k for k in self._open_segments if Path(k).parent == partition_dir]:
+            self._close_open_segment(Path(key))
+        lock = self._partition_locks.pop(str(partition_dir), None)
+        if lock is not None:
+            lock.release()
+
+    def close(self) -> None:
+        """
+        Checkpoint segment indexes; in group commit mode also fsync and
+        close open segment handles and release partition locks.
+        """
+        if not self.group_commit:
+            self._checkpoint_indexes()
+            return
+        with self._append_lock:
+            for partition_key in list(self._partition_locks):
+                self._release_partition(Path(partition_key))
+            for key in list(self._open_segments):
+                self._close_open_segment(Path(key))
+            self._checkpoint_indexes()
 
     async def flush_and_close(self) -> None:
         """
         Flush and close any resources. Called during graceful shutdown.
 
-        This writer does not keep file handles open; each write uses
-        open/fsync/close. So this is a no-op except for logging.
-        Ensures any future implementation that keeps handles open can
-        flush and close here.
+        In default mode each write is already fsync'd and closed, so this
+        only checkpoints segment indexes and logs. In group commit mode
+        open segment handles are fsync'd and closed and partition locks
+        released.
         """
-        logger.info(
-            "LedgerWriter flush_and_close: no open file handles "
-            "(each write is already fsync'd and closed)."
-        )
+        self.close()
+        if not self.group_commit:
+            logger.info(
+                "LedgerWriter flush_and_close: no open file handles "
+                "(each write is already fsync'd and closed)."
+            )
+            return
+        logger.info("LedgerWriter flush_and_close: open segments fsync'd and closed.")
 
     def _get_or_create_current_segment(self, partition_dir: Path) -> Path:
         """
@@ -268,37 +662,44 @@ class LedgerWriter:
         self._current_segments[str(partition_dir)] = segment
 
     def _is_segment_writable(self, segment: Path) -> bool:
-        """Check if segment is writable (not sealed)."""
+        """Check if segment is writable (not sealed) and under its size/record limits."""
         if not os.access(segment, os.W_OK):
             return False
-        if segment.stat().st_size >= MAX_SEGMENT_SIZE_BYTES:
-            return False
-        count = self._get_record_count(segment)
-        if count >= MAX_SEGMENT_RECORDS:
-            return False
-        return True
+        index = self._get_segment_index(segment)
+        return (
+            index.size_bytes < MAX_SEGMENT_SIZE_BYTES
+            and index.frame_count < MAX_SEGMENT_RECORDS
+        )
 
-    def _maybe_rollover(self, partition_dir: Path, segment_file: Path) -> None:
+    def _maybe_rollover(self, partition_dir: Path, segment_file: Path) -> bool:
         """
-        Check if segment needs rollover.
+        Check if segment needs rollover (from the index's running counters).
 
         If limits exceeded:
         1. Seal current segment (chmod 444)
         2. Create new segment
         3. Update _CURRENT pointer
+
+        Returns True if the segment was rolled over.
         """
-        size = segment_file.stat().st_size
-        count = self._get_record_count(segment_file)
+        index = self._get_segment_index(segment_file)
+        size = index.size_bytes
+        count = index.frame_count
 
         needs_rollover = size >= MAX_SEGMENT_SIZE_BYTES or count >= MAX_SEGMENT_RECORDS
 
         if not needs_rollover:
-            return
+            return False
 
+        if self.group_commit:
+            self._close_open_segment(segment_file)
+        else:
+            self._sync_segment(segment_file)  # deferred batch frames durable before sealing
         try:
             segment_file.chmod(0o444)
         except OSError:
             pass  # Windows may not support chmod the same way
+        self._write_segment_index(segment_file)
         logger.info(
             "Segment sealed: %s (%s records, %s bytes)",
             segment_file.name,
@@ -311,38 +712,9 @@ class LedgerWriter:
         new_segment.touch()
 
         self._set_current_segment(partition_dir, new_segment)
-        self._record_counts.pop(str(segment_file), None)
 
         logger.info("Segment rollover: %s -> %s", segment_file.name, new_segment.name)
-
-    def _get_record_count(self, segment: Path) -> int:
-        """Get record count for segment (cached)."""
-        key = str(segment)
-
-        if key not in self._record_counts:
-            count = 0
-            try:
-                with open(segment, "rb") as f:
-                    while True:
-                        header = f.read(FRAME_HEADER_SIZE)
-                        if len(header) < FRAME_HEADER_SIZE:
-                            break
-                        length, _ = struct.unpack(">II", header)
-                        payload = f.read(length)
-                        if len(payload) < length:
-                            break
-                        count += 1
-            except OSError:
-                pass
-            self._record_counts[key] = count
-
-        return self._record_counts[key]
-
-    def _increment_record_count(self, segment: Path) -> int:
-        """Increment and return record count."""
-        count = self._get_record_count(segment) + 1
-        self._record_counts[str(segment)] = count
-        return count
+        return True
 
     def _is_sealed(self, partition_dir: Path) -> bool:
         """Check if partition is sealed."""
@@ -372,47 +744,86 @@ class LedgerWriter:
         if self._is_sealed(partition_dir):
             return
 
+        if self.group_commit:
+            with self._append_lock:
+                self._release_partition(partition_dir)
+
+        indexes: dict[str, SegmentIndex] = {}
         for segment in partition_dir.glob("signals-*.wal"):
             if os.access(segment, os.W_OK):
                 try:
                     segment.chmod(0o444)
                 except OSError:
                     pass
+            if not index_path_for(segment).exists() or str(segment) in self._segment_indexes:
+                index = self._write_segment_index(segment)
+                if index is not None:
+                    indexes[segment.name] = index
 
-        manifest = self._create_manifest(partition_dir, partition_date)
+        manifest = self._create_manifest(partition_dir, partition_date, indexes)
         manifest_file = partition_dir / "_manifest.json"
         _atomic_write_text(manifest_file, json.dumps(manifest, indent=2))
 
+        if self.columnar_export:
+            self._write_columns(partition_dir)
+
         (partition_dir / "_SEALED").touch()
         self._current_segments.pop(str(partition_dir), None)
 
         logger.info("Partition sealed: %s", partition_date)
 
-    def _create_manifest(self, partition_dir: Path, partition_date: str) -> dict:
-        """Create partition manifest with highwater mark."""
+    def _write_columns(self, partition_dir: Path) -> None:
+        """Write the columnar companion; a failure is logged and does not block the seal."""
+        try:
+            from omen.infrastructure.ledger.columnar import write_partition_columns
+
+            write_partition_columns(partition_dir)
+        except ImportError:
+            logger.warning(
+                "numpy not installed, skipping columnar export for %s", partition_dir.name
+            )
+        except (OSError, ValueError, OverflowError) as e:
+            logger.warning("Columnar export failed for %s: %s", partition_dir.name, e)
+
+    def _create_manifest(
+        self,
+        partition_dir: Path,
+        partition_date: str,
+        indexes: Optional[dict[str, SegmentIndex]] = None,
+    ) -> dict:
+        """
+        Create partition manifest with highwater mark.
+
+        Record counts and checksums come from each segment's index (the
+        writer's running counters, or its sidecar extended past the last
+        checkpoint), so segments are not re-read. Each segment entry also
+        carries the pruning stats from the index (emitted_at range,
+        category histogram, trace id bloom filter) so readers can skip
+        segments without opening them.
+        """
+        indexes = indexes or {}
         segments = []
         total_records = 0
         max_sequence = 0
 
         for segment in sorted(partition_dir.glob("signals-*.wal")):
-            count = self._get_record_count(segment)
+            index = indexes.get(segment.name) or SegmentIndex.load_or_build(segment)
+            count = index.frame_count
             size = segment.stat().st_size
-            with open(segment, "rb") as f:
-                content = f.read()
-            checksum = f"crc32:{zlib.crc32(content) & 0xFFFFFFFF:08x}"
             segments.append(
                 {
                     "file": segment.name,
                     "record_count": count,
                     "size_bytes": size,
-                    "checksum": checksum,
+                    "checksum": _segment_checksum(segment, index, size),
+                    **index.manifest_stats(),
                 }
             )
             total_records += count
             max_sequence = max(max_sequence, total_records)
 
         return {
-            "schema_version": "1.0.0",
+            "schema_version": "1.1.0",
             "partition_date": partition_date,
             "sealed_at": datetime.now(timezone.utc).isoformat(),
             "total_records": total_records,
@@ -467,7 +878,40 @@ class LedgerWriter:
         return to_seal
 
 
+def _frame_header(payload_bytes: bytes) -> bytes:
+    """Frame header for a payload: [u32 length][u32 crc32]."""
+    return struct.pack(">II", len(payload_bytes), zlib.crc32(payload_bytes) & 0xFFFFFFFF)
+
+
+def _segment_checksum(segment: Path, index: SegmentIndex, size: int) -> str:
+    """
+    CRC-32 of the whole segment file, as ``crc32:<hex>``.
+
+    Taken from the index's running checksum when it covers the file; a
+    partial tail or a gap falls back to a chunked read of the file.
+    """
+    if index.size_bytes == size:
+        checksum = index.checksum()
+        if checksum is not None:
+            return checksum
+    crc = 0
+    with open(segment, "rb") as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_BYTES), b""):
+            crc = zlib.crc32(chunk, crc)
+    return f"crc32:{crc & 0xFFFFFFFF:08x}"
+
+
 class LedgerWriteError(Exception):
     """Ledger write failed."""
 
     pass
+
+
+def _acquire_partition_lock(lock: FileLock, partition_dir: Path) -> None:
+    """Take a partition lock, raising LedgerWriteError instead of blocking forever."""
+    try:
+        lock.acquire(timeout=PARTITION_LOCK_TIMEOUT_S)
+    except Timeout as e:
+        raise LedgerWriteError(
+            f"Partition {partition_dir.name} is locked by another writer"
+        ) from e
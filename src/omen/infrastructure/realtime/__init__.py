@@ -1,5 +1,9 @@
 """Real-time infrastructure components."""
 
+from omen.infrastructure.realtime.fanout import (
+    SlowConsumerPolicy,
+    WebSocketFanout,
+)
 from omen.infrastructure.realtime.redis_pubsub import (
     RedisPubSubManager,
     RedisMessage,
@@ -14,4 +18,6 @@ __all__ = [
     "get_pubsub_manager",
     "initialize_pubsub",
     "shutdown_pubsub",
+    "SlowConsumerPolicy",
+    "WebSocketFanout",
 ]
@@ -21,6 +21,7 @@ from typing import Any, Dict, Optional, Set
 
 from fastapi import WebSocket
 
+from omen.infrastructure.realtime.fanout import SlowConsumerPolicy
 from omen.infrastructure.realtime.redis_pubsub import (
     RedisPubSubManager,
     RedisMessage,
@@ -36,6 +37,8 @@ class DistributedConnectionManager:
 
     Replaces in-memory ConnectionManager for horizontal scaling.
     Uses Redis Pub/Sub for cross-instance message broadcasting.
+    Price ticks are coalesced per signal for slow clients; other
+    channels drop the oldest queued message.
     """
 
     # Standard channels
@@ -46,6 +49,7 @@ class DistributedConnectionManager:
 
     def __init__(self, pubsub: Optional[RedisPubSubManager] = None):
         self.pubsub = pubsub or get_pubsub_manager()
+        self.pubsub.fanout.set_channel_policy(self.CHANNEL_PRICES, SlowConsumerPolicy.COALESCE)
         self._initialized = False
         self._lock = asyncio.Lock()
 
@@ -97,9 +101,8 @@ class DistributedConnectionManager:
     ) -> None:
         """Accept WebSocket connection and track it."""
         await websocket.accept()
-        self.pubsub.add_local_connection(channel, websocket)
 
-        # Send welcome message
+        # Send welcome message (before broadcasts start queuing for it)
         await websocket.send_json(
             {
                 "type": "connected",
@@ -109,6 +112,7 @@ class DistributedConnectionManager:
                 "redis_connected": self.pubsub.is_connected,
             }
         )
+        self.pubsub.add_local_connection(channel, websocket)
 
         logger.info(
             "WebSocket connected to channel %s (local connections: %d)",
@@ -167,6 +171,7 @@ class DistributedConnectionManager:
         return await self.pubsub.broadcast_to_local(
             self.CHANNEL_PRICES,
             message,
+            key=price_data.get("signal_id"),
         )
 
     async def broadcast_alert(self, alert_data: Dict[str, Any]) -> int:
@@ -228,6 +233,7 @@ class DistributedConnectionManager:
         await self.pubsub.broadcast_to_local(
             self.CHANNEL_PRICES,
             {"type": "price", "data": message.payload},
+            key=message.payload.get("signal_id"),
         )
 
     async def _handle_alert_broadcast(self, message: RedisMessage) -> None:
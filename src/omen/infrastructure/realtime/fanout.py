@@ -0,0 +1,260 @@
+"""
+Encode-once WebSocket fan-out with per-connection send queues.
+
+A broadcast serializes the message once and enqueues the frame on every
+connection of the channel; each connection has its own bounded queue
+and writer task, so a slow client only delays itself. When a queue is
+full the channel's slow-consumer policy applies:
+
+- drop_oldest: discard the oldest queued frame
+- coalesce: replace the queued frame with the same key (e.g. the
+  previous price tick for a signal); unkeyed frames fall back to
+  drop_oldest
+- disconnect: close the connection (code 1013, try again later)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 256
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's send queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once for every connection (datetimes via str)."""
+    return json.dumps(message, separators=(",", ":"), default=str)
+
+
+class ConnectionSender:
+    """
+    Bounded send queue and writer task for one WebSocket.
+
+    enqueue() never awaits; the writer task (started on first enqueue)
+    sends frames in order with send_text. on_closed is called once when
+    the connection fails or is disconnected by policy.
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        on_closed: Optional[Callable[["ConnectionSender"], None]] = None,
+    ):
+        self.websocket = websocket
+        self.max_queue = max(1, max_queue)
+        self.policy = policy
+        self.dropped = 0  # frames discarded or replaced by policy
+        self.closed = False
+        self._on_closed = on_closed
+        self._queue: Deque[List[Any]] = deque()  # [key, frame]
+        self._keyed: Dict[Hashable, List[Any]] = {}  # coalesce key -> queued entry
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Frames queued and not yet handed to the socket."""
+        return len(self._queue)
+
+    def enqueue(self, frame: str, key: Optional[Hashable] = None) -> bool:
+        """Queue a frame; returns False if the connection is (now) closed."""
+        if self.closed:
+            return False
+        if self.policy == SlowConsumerPolicy.COALESCE and key is not None:
+            entry = self._keyed.get(key)
+            if entry is not None:
+                entry[1] = frame  # keep its place in the queue
+                self.dropped += 1
+                return True
+        if len(self._queue) >= self.max_queue:
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                logger.warning("Disconnecting slow WebSocket consumer (%d queued)", len(self._queue))
+                self._close(WS_CLOSE_TRY_AGAIN_LATER)
+                return False
+            self._forget(self._queue.popleft())
+            self.dropped += 1
+        entry = [key, frame]
+        self._queue.append(entry)
+        if self.policy == SlowConsumerPolicy.COALESCE and key is not None:
+            self._keyed[key] = entry
+        self._start()
+        return True
+
+    async def drain(self) -> None:
+        """Wait until every queued frame has been sent (or the sender closed)."""
+        if self._idle is not None and not self.closed:
+            await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the writer without closing the socket (client already gone)."""
+        self.closed = True
+        self._queue.clear()
+        self._keyed.clear()
+        if self._task is not None and not self._in_writer():
+            self._task.cancel()
+        if self._idle is not None:
+            self._idle.set()
+
+    def _in_writer(self) -> bool:
+        try:
+            return asyncio.current_task() is self._task
+        except RuntimeError:  # no running loop (shutdown from sync code)
+            return False
+
+    def _forget(self, entry: List[Any]) -> None:
+        key = entry[0]
+        if key is not None and self._keyed.get(key) is entry:
+            del self._keyed[key]
+
+    def _start(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+        self._idle.clear()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Writer: send queued frames in order until closed."""
+        while not self.closed:
+            if not self._queue:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            entry = self._queue.popleft()
+            self._forget(entry)
+            try:
+                await self.websocket.send_text(entry[1])
+            except Exception:
+                # Connection closed by the client
+                self._close(None)
+                return
+
+    def _close(self, code: Optional[int]) -> None:
+        self.close()
+        if code is not None:
+            asyncio.get_running_loop().create_task(self._close_socket(code))
+        if self._on_closed is not None:
+            self._on_closed(self)
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception as e:
+            logger.debug("Error closing slow WebSocket consumer: %s", e)
+
+
+class WebSocketFanout:
+    """
+    Local WebSocket connections per channel, with encode-once broadcast.
+
+    Connections that fail or are disconnected by policy are removed
+    automatically.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+    ):
+        self.max_queue = max_queue
+        self.policy = policy
+        self._channel_policies: Dict[str, SlowConsumerPolicy] = {}
+        self._senders: Dict[str, Dict[Any, ConnectionSender]] = {}
+
+    def set_channel_policy(self, channel: str, policy: SlowConsumerPolicy) -> None:
+        """Slow-consumer policy for connections added to channel from now on."""
+        self._channel_policies[channel] = policy
+
+    def add(self, channel: str, websocket: Any) -> None:
+        """Track a connection on channel."""
+        senders = self._senders.setdefault(channel, {})
+        if websocket in senders:
+            return
+        senders[websocket] = ConnectionSender(
+            websocket,
+            max_queue=self.max_queue,
+            policy=self._channel_policies.get(channel, self.policy),
+            on_closed=lambda sender: self._discard(channel, sender),
+        )
+
+    def remove(self, channel: str, websocket: Any) -> None:
+        """Stop tracking a connection and its writer."""
+        sender = self._senders.get(channel, {}).pop(websocket, None)
+        if sender is not None:
+            sender.close()
+
+    def _discard(self, channel: str, sender: ConnectionSender) -> None:
+        senders = self._senders.get(channel, {})
+        if senders.get(sender.websocket) is sender:
+            del senders[sender.websocket]
+
+    def connections(self, channel: str) -> Set[Any]:
+        """Connections currently tracked on channel."""
+        return set(self._senders.get(channel, {}))
+
+    def count(self, channel: Optional[str] = None) -> int:
+        """Connections on channel, or on all channels."""
+        if channel is not None:
+            return len(self._senders.get(channel, {}))
+        return sum(len(senders) for senders in self._senders.values())
+
+    @property
+    def channel_count(self) -> int:
+        return len(self._senders)
+
+    def broadcast(
+        self,
+        channel: str,
+        message: Dict[str, Any],
+        key: Optional[Hashable] = None,
+    ) -> int:
+        """
+        Encode message once and queue it on every connection of channel.
+
+        key identifies messages that supersede each other (coalesce
+        policy). Returns the number of connections it was queued for.
+        """
+        senders = self._senders.get(channel)
+        if not senders:
+            return 0
+        frame = encode_message(message)
+        return sum(sender.enqueue(frame, key) for sender in list(senders.values()))
+
+    async def drain(self, channel: Optional[str] = None) -> None:
+        """Wait until queued frames are sent on channel (or all channels)."""
+        channels = [channel] if channel is not None else list(self._senders)
+        senders = [s for c in channels for s in self._senders.get(c, {}).values()]
+        await asyncio.gather(*(sender.drain() for sender in senders))
+
+    def dropped(self, channel: Optional[str] = None) -> int:
+        """Frames dropped or coalesced across live connections."""
+        channels = [channel] if channel is not None else list(self._senders)
+        return sum(s.dropped for c in channels for s in self._senders.get(c, {}).values())
+
+    def close(self) -> None:
+        """Stop every writer and forget all connections."""
+        for senders in self._senders.values():
+            for sender in senders.values():
+                sender.close()
+        self._senders.clear()
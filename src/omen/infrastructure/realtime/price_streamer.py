@@ -4,13 +4,21 @@ Real-time price streaming service for UI.
 Pipeline registers signals via register_signal(signal_id, token_id, initial_price).
 API subscribes via subscribe_signals(signal_ids) and streams updates from stream().
 
-Uses broadcast pattern: one WebSocket listener broadcasts to multiple SSE clients.
+Conflating stream: one WebSocket listener records the latest update per
+signal in a shared, sequence-ordered change log. Each SSE client keeps a
+cursor and drains the signals that changed since its last drain, at its
+own pace, so a tick costs O(1) whatever the number of clients and a
+drain costs O(changed signals). Intermediate ticks a client did not
+drain in time are conflated into the latest one.
 """
 
 import asyncio
+import json
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 from omen.adapters.inbound.polymarket.websocket_client import (
@@ -30,6 +38,20 @@ class SignalPriceUpdate:
     old_probability: float
     change_percent: float
     timestamp: str
+    sequence: int = field(default=0, compare=False)  # position in the change log
+
+    @cached_property
+    def sse_data(self) -> str:
+        """SSE payload, encoded once and shared by every subscriber."""
+        return json.dumps(
+            {
+                "signal_id": self.signal_id,
+                "probability": self.new_probability,
+                "previous_probability": self.old_probability,
+                "change_percent": self.change_percent,
+                "timestamp": self.timestamp,
+            }
+        )
 
 
 def get_price_streamer() -> "PriceStreamer":
@@ -47,8 +69,9 @@ class PriceStreamer:
     """
     Service that streams real-time price updates.
 
-    Uses broadcast pattern: one background task reads from WebSocket and
-    broadcasts to all subscribed SSE clients via asyncio.Queue.
+    One background task reads from WebSocket and records each update in
+    the change log (latest update per signal, oldest change first);
+    subscribers and callbacks drain it from their own cursors.
     """
 
     def __init__(self) -> None:
@@ -57,9 +80,12 @@ class PriceStreamer:
         self._token_signal_map: dict[str, str] = {}  # token_id -> signal_id
         self._last_prices: dict[str, float] = {}  # token_id -> last price
         self._callbacks: list[Callable[[SignalPriceUpdate], None]] = []
-        # Broadcast to multiple SSE clients
-        self._subscribers: list[asyncio.Queue[SignalPriceUpdate]] = []
+        # Change log: signal_id -> latest update, ordered by update.sequence
+        self._changes: OrderedDict[str, SignalPriceUpdate] = OrderedDict()
+        self._sequence = 0
+        self._changed = asyncio.Event()  # set (and replaced) on every change
         self._broadcaster_task: Optional[asyncio.Task] = None
+        self._callback_task: Optional[asyncio.Task] = None
         self._started = False
 
     async def start(self) -> None:
@@ -72,6 +98,8 @@ class PriceStreamer:
             # Start the broadcaster task
             if self._broadcaster_task is None or self._broadcaster_task.done():
                 self._broadcaster_task = asyncio.create_task(self._broadcast_loop())
+            if self._callback_task is None or self._callback_task.done():
+                self._callback_task = asyncio.create_task(self._callback_loop())
         except Exception as e:
             logger.warning("WebSocket connect failed: %s", e)
             raise
@@ -79,59 +107,106 @@ class PriceStreamer:
     async def stop(self) -> None:
         """Stop the price streaming service."""
         self._started = False
-        if self._broadcaster_task and not self._broadcaster_task.done():
-            self._broadcaster_task.cancel()
-            try:
-                await self._broadcaster_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._broadcaster_task, self._callback_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         await self._ws_client.disconnect()
 
     async def _broadcast_loop(self) -> None:
-        """Background task that reads WebSocket and broadcasts to all subscribers."""
+        """Background task that reads WebSocket and records updates in the change log."""
         try:
             async for price_update in self._ws_client.listen():
-                token_id = price_update.token_id
-                if token_id not in self._token_signal_map:
-                    continue
-
-                signal_id = self._token_signal_map[token_id]
-                old_price = self._last_prices.get(token_id, 0.5)
-                new_price = price_update.price
-
-                self._last_prices[token_id] = new_price
-
-                if old_price > 0:
-                    change_percent = ((new_price - old_price) / old_price) * 100
-                else:
-                    change_percent = 0.0
-
-                update = SignalPriceUpdate(
-                    signal_id=signal_id,
-                    new_probability=new_price,
-                    old_probability=old_price,
-                    change_percent=change_percent,
-                    timestamp=price_update.timestamp.isoformat(),
-                )
-
-                # Call callbacks
-                for callback in self._callbacks:
-                    try:
-                        callback(update)
-                    except Exception:
-                        pass
-
-                # Broadcast to all SSE subscribers
-                for queue in list(self._subscribers):
-                    try:
-                        queue.put_nowait(update)
-                    except asyncio.QueueFull:
-                        pass  # Drop if subscriber is slow
+                self._record(price_update)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.exception("Broadcaster loop error: %s", e)
 
+    def _record(self, price_update: PriceUpdate) -> Optional[SignalPriceUpdate]:
+        """Map a tick to its signal and make it the signal's latest change (O(1))."""
+        token_id = price_update.token_id
+        signal_id = self._token_signal_map.get(token_id)
+        if signal_id is None:
+            return None
+
+        old_price = self._last_prices.get(token_id, 0.5)
+        new_price = price_update.price
+        self._last_prices[token_id] = new_price
+
+        if old_price > 0:
+            change_percent = ((new_price - old_price) / old_price) * 100
+        else:
+            change_percent = 0.0
+
+        self._sequence += 1
+        update = SignalPriceUpdate(
+            signal_id=signal_id,
+            new_probability=new_price,
+            old_probability=old_price,
+            change_percent=change_percent,
+            timestamp=price_update.timestamp.isoformat(),
+            sequence=self._sequence,
+        )
+        self._changes[signal_id] = update
+        self._changes.move_to_end(signal_id)
+
+        # Wake every drain waiting on this generation
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return update
+
+    def changes_since(self, cursor: int) -> list[SignalPriceUpdate]:
+        """Latest update of every signal changed after cursor, oldest change first."""
+        changed: list[SignalPriceUpdate] = []
+        for update in reversed(self._changes.values()):
+            if update.sequence <= cursor:
+                break
+            changed.append(update)
+        changed.reverse()
+        return changed
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the latest change (a new subscriber's start cursor)."""
+        return self._sequence
+
+    async def drain(
+        self, cursor: int, timeout: float = 30.0
+    ) -> tuple[list[SignalPriceUpdate], int]:
+        """
+        Wait for changes after cursor and return (updates, new cursor).
+
+        Returns at once if changes are pending; otherwise waits up to
+        timeout seconds and returns ([], cursor) if nothing changed.
+        """
+        changed = self.changes_since(cursor)
+        if not changed:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return [], cursor
+            changed = self.changes_since(cursor)
+        return changed, changed[-1].sequence if changed else cursor
+
+    async def _callback_loop(self) -> None:
+        """Run on_update callbacks from their own cursor, off the broadcaster loop."""
+        cursor = self._sequence
+        try:
+            while True:
+                updates, cursor = await self.drain(cursor)
+                for update in updates:
+                    for callback in self._callbacks:
+                        try:
+                            callback(update)
+                        except Exception as e:
+                            logger.debug("Price update callback failed: %s", e)
+        except asyncio.CancelledError:
+            pass
+
     def register_signal(self, signal_id: str, token_id: str, initial_price: float) -> None:
         """Register a signal for price updates. Called by the pipeline when a signal is generated."""
         self._signal_token_map[signal_id] = token_id
@@ -155,7 +230,12 @@ class PriceStreamer:
         return signal_id in self._signal_token_map
 
     def on_update(self, callback: Callable[[SignalPriceUpdate], None]) -> None:
-        """Register callback for signal price updates."""
+        """
+        Register callback for signal price updates.
+
+        Callbacks run in their own task after the tick is recorded; like
+        subscribers, they may see only the latest of several quick ticks.
+        """
         self._callbacks.append(callback)
 
     async def subscribe_signals(self, signal_ids: list[str]) -> list[str]:
@@ -173,26 +253,28 @@ class PriceStreamer:
                 logger.warning("Subscribe failed: %s", e)
         return subscribed
 
-    async def stream(self):
+    async def stream_batches(self) -> AsyncIterator[list[SignalPriceUpdate]]:
+        """
+        Stream conflated batches: the latest update of each signal that
+        changed since the previous batch.
+
+        Starts from the current cursor (no history). Yields an empty
+        batch after 30s without changes (SSE keepalive).
+        """
+        cursor = self._sequence
+        while True:
+            updates, cursor = await self.drain(cursor)
+            yield updates
+
+    async def stream(self) -> AsyncIterator[SignalPriceUpdate]:
         """
         Stream price updates as SignalPriceUpdate.
 
-        Each caller gets its own Queue to receive broadcasts.
+        Each caller drains the shared change log at its own pace.
         Usage:
             async for update in streamer.stream():
                 broadcast_to_ui(update)
         """
-        queue: asyncio.Queue[SignalPriceUpdate] = asyncio.Queue(maxsize=100)
-        self._subscribers.append(queue)
-        try:
-            while True:
-                try:
-                    update = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield update
-                except asyncio.TimeoutError:
-                    # No update in 30s, continue waiting (SSE keepalive)
-                    continue
-        finally:
-            # Remove from subscribers when SSE client disconnects
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+        async for updates in self.stream_batches():
+            for update in updates:
+                yield update
@@ -28,6 +28,8 @@ from typing import Any, Callable, Dict, Optional, Set
 
 from pydantic import BaseModel, Field
 
+from omen.infrastructure.realtime.fanout import WebSocketFanout
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,8 @@ class RedisPubSubManager:
 
     Replaces in-memory ConnectionManager for horizontal scaling.
     Falls back to local-only mode if Redis is unavailable.
+    Local delivery goes through a WebSocketFanout (encode once, one
+    bounded send queue per connection).
     """
 
     def __init__(
@@ -54,6 +58,7 @@ class RedisPubSubManager:
         redis_url: Optional[str] = None,
         instance_id: Optional[str] = None,
         channel_prefix: str = "omen:realtime:",
+        fanout: Optional[WebSocketFanout] = None,
     ):
         self.redis_url = redis_url or os.getenv("REDIS_URL")
         self.instance_id = instance_id or self._generate_instance_id()
@@ -65,7 +70,7 @@ class RedisPubSubManager:
         self._connected = False
 
         # Local WebSocket connections (per instance)
-        self._local_connections: Dict[str, Set[Any]] = {}
+        self.fanout = fanout or WebSocketFanout()
 
         # Message handlers
         self._handlers: Dict[str, Callable] = {}
@@ -143,6 +148,7 @@ class RedisPubSubManager:
         if self._redis:
             await self._redis.close()
 
+        self.fanout.close()
         self._connected = False
         logger.info("Redis Pub/Sub disconnected")
 
@@ -244,62 +250,54 @@ class RedisPubSubManager:
 
     def add_local_connection(self, channel: str, websocket: Any) -> None:
         """Add WebSocket connection to local tracking."""
-        if channel not in self._local_connections:
-            self._local_connections[channel] = set()
-        self._local_connections[channel].add(websocket)
+        self.fanout.add(channel, websocket)
         logger.debug(
             "Added local connection to %s (total: %d)",
             channel,
-            len(self._local_connections[channel]),
+            self.fanout.count(channel),
         )
 
     def remove_local_connection(self, channel: str, websocket: Any) -> None:
         """Remove WebSocket connection from local tracking."""
-        if channel in self._local_connections:
-            self._local_connections[channel].discard(websocket)
-            logger.debug(
-                "Removed local connection from %s (total: %d)",
-                channel,
-                len(self._local_connections[channel]),
-            )
+        self.fanout.remove(channel, websocket)
+        logger.debug(
+            "Removed local connection from %s (total: %d)",
+            channel,
+            self.fanout.count(channel),
+        )
+
+    def get_local_connections(self, channel: str) -> Set[Any]:
+        """Local WebSocket connections on a channel."""
+        return self.fanout.connections(channel)
 
     async def broadcast_to_local(
         self,
         channel: str,
         message: Dict[str, Any],
+        key: Optional[str] = None,
     ) -> int:
-        """Broadcast to local WebSocket connections."""
-        connections = self._local_connections.get(channel, set())
-        sent = 0
-        disconnected = []
-
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-                sent += 1
-            except Exception:
-                # Connection closed, mark for removal
-                disconnected.append(websocket)
-
-        # Clean up disconnected
-        for ws in disconnected:
-            self._local_connections[channel].discard(ws)
+        """
+        Broadcast to local WebSocket connections.
 
-        return sent
+        The message is encoded once and queued per connection; delivery
+        happens on each connection's writer task, so this never waits on
+        a slow client. key marks messages that supersede each other on
+        channels with the coalesce policy. Returns connections queued to.
+        """
+        return self.fanout.broadcast(channel, message, key)
 
     def get_local_connection_count(self, channel: Optional[str] = None) -> int:
         """Get count of local connections."""
-        if channel:
-            return len(self._local_connections.get(channel, set()))
-        return sum(len(conns) for conns in self._local_connections.values())
+        return self.fanout.count(channel)
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the pub/sub system."""
         return {
             "instance_id": self.instance_id,
             "redis_connected": self._connected,
-            "local_channels": len(self._local_connections),
+            "local_channels": self.fanout.channel_count,
             "local_connections": self.get_local_connection_count(),
+            "local_dropped_messages": self.fanout.dropped(),
             "subscribed_channels": len(self._handlers),
         }
 
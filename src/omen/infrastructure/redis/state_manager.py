@@ -29,7 +29,7 @@ import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -207,7 +207,70 @@ class RedisStateManager:
         
         self._fallback_cache.pop(full_key, None)
         return True
-    
+
+    async def cache_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several cache values in one round-trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of key -> value for keys that were found (missing or
+            expired keys are omitted)
+        """
+        if not keys:
+            return {}
+
+        if self._connected and self._redis:
+            try:
+                full_keys = [f"{self.PREFIX_CACHE}{key}" for key in keys]
+                values = await self._redis.mget(full_keys)
+                return {
+                    key: json.loads(value)
+                    for key, value in zip(keys, values)
+                    if value
+                }
+            except Exception as e:
+                logger.error("Redis cache_get_many error: %s", e)
+
+        found: Dict[str, Any] = {}
+        for key in keys:
+            value = await self.cache_get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def cache_set_many(self, items: Dict[str, Any], ttl: int = 300) -> bool:
+        """
+        Set several cache values with the same TTL in one pipelined round-trip.
+
+        Args:
+            items: Mapping of key -> value (values are JSON serialized)
+            ttl: Time-to-live in seconds (default 5 minutes)
+
+        Returns:
+            True if successful
+        """
+        if not items:
+            return True
+
+        if self._connected and self._redis:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(
+                            f"{self.PREFIX_CACHE}{key}", ttl, json.dumps(value, default=str)
+                        )
+                    await pipe.execute()
+                return True
+            except Exception as e:
+                logger.error("Redis cache_set_many error: %s", e)
+
+        for key, value in items.items():
+            await self.cache_set(key, value, ttl=ttl)
+        return True
+
     async def cache_exists(self, key: str) -> bool:
         """Check if cache key exists."""
         full_key = f"{self.PREFIX_CACHE}{key}"
@@ -20,6 +20,8 @@ from typing import Optional, Protocol
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from omen.infrastructure.security.key_resolver import invalidate_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -227,6 +229,7 @@ class ApiKeyManager:
 
         updated_record = ApiKeyRecord(**{**record.model_dump(), "is_active": False})
         self.storage.update(updated_record)
+        invalidate_key(key_id)
 
         logger.info("Revoked API key: %s", key_id)
         return True
@@ -235,6 +238,7 @@ class ApiKeyManager:
         """Permanently delete an API key."""
         result = self.storage.delete(key_id)
         if result:
+            invalidate_key(key_id)
             logger.info("Deleted API key: %s", key_id)
         return result
 
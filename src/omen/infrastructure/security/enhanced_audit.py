@@ -10,18 +10,58 @@ Provides comprehensive audit logging for:
 - System configuration changes
 
 Compliant with SOC 2, GDPR, and financial regulations.
+
+File output goes through AuditFileSink: log() only queues the event; a
+dedicated I/O thread serializes queued events, hash-chains them and
+appends each batch with one write + fsync per flush interval, so the
+request path never touches the disk. Each record carries seq, prev_hash
+and hash (SHA-256 over prev_hash + the record as written), so deleted,
+reordered or edited records break the chain; verify_audit_chain()
+checks a file. When the queue is full the event is dropped (ERROR and
+CRITICAL events first wait briefly for space) and the writer records
+an audit.overflow entry with the count, so gaps are part of the chain.
+Several processes (e.g. gunicorn workers) may share one audit file:
+each batch takes an exclusive fcntl lock, re-reads the chain head from
+the file and appends under the lock, so they extend a single chain.
 """
 
+import atexit
+import hashlib
 import json
 import logging
+import os
+import queue
+import threading
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from uuid import uuid4
 
+try:
+    import fcntl
+
+    _FLOCK_AVAILABLE = True
+except ImportError:  # Windows: single-process audit files only
+    _FLOCK_AVAILABLE = False
+
 from omen.application.ports.time_provider import utc_now
 
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+DEFAULT_FLUSH_INTERVAL = 0.2
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_MAX_BATCH = 1_000
+DEFAULT_BLOCK_TIMEOUT = 0.1
+
+# Chain head scan reads the file backwards in chunks of this size
+_TAIL_CHUNK = 65536
+
+# Appended to each record: ,"prev_hash":"<64 hex>","hash":"<64 hex>"}
+_CHAIN_SUFFIX_LEN = len(',"prev_hash":"","hash":""}') + 128
+
 
 class AuditEventType(str, Enum):
     """Types of audit events."""
@@ -136,6 +176,308 @@ class AuditEvent:
         return json.dumps(self.to_dict(), default=str)
 
 
+class AuditChainError(Exception):
+    """An audit log record does not continue the hash chain."""
+
+    def __init__(self, line_number: int, reason: str):
+        super().__init__(f"Audit chain broken at line {line_number}: {reason}")
+        self.line_number = line_number
+        self.reason = reason
+
+
+def _chain_hash(prev_hash: str, payload: str) -> str:
+    return hashlib.sha256(f"{prev_hash}{payload}".encode()).hexdigest()
+
+
+def _chain_record(record: dict[str, Any], prev_hash: str) -> tuple[str, str]:
+    """Serialize record and append prev_hash/hash fields; returns (line, hash)."""
+    payload = json.dumps(record, separators=(",", ":"), default=str)
+    digest = _chain_hash(prev_hash, payload)
+    line = f'{payload[:-1]},"prev_hash":"{prev_hash}","hash":"{digest}"}}'
+    return line, digest
+
+
+def _chain_head(f) -> tuple[int, str]:
+    """
+    (last seq, last hash) of an open binary audit file, or a fresh chain.
+
+    Reads backwards until it finds the last complete record, so records
+    longer than one chunk are handled; a torn final line (crash during
+    a write) is skipped and the chain continues from the record before it.
+    """
+    pos = f.seek(0, os.SEEK_END)
+    tail = b""
+    while pos > 0:
+        step = min(pos, _TAIL_CHUNK)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        lines = tail.split(b"\n")
+        for raw in reversed(lines if pos == 0 else lines[1:]):
+            if not raw.strip():
+                continue
+            try:
+                last = json.loads(raw)
+            except ValueError:
+                continue  # torn line
+            if "hash" in last and "seq" in last:
+                return int(last["seq"]), last["hash"]
+            return 0, GENESIS_HASH  # unchained legacy file
+    return 0, GENESIS_HASH
+
+
+def _read_chain_head(path: str) -> tuple[int, str]:
+    """(last seq, last hash) of an existing audit file, or a fresh chain."""
+    try:
+        with open(path, "rb") as f:
+            return _chain_head(f)
+    except FileNotFoundError:
+        return 0, GENESIS_HASH
+
+
+def verify_audit_chain(path: str) -> int:
+    """
+    Verify the hash chain of an audit file; returns the number of chained records.
+
+    Unchained lines before the first chained record (written before
+    chaining was enabled) are skipped. Raises AuditChainError at the
+    first record that does not continue the chain.
+    """
+    prev_hash: Optional[str] = None
+    count = 0
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise AuditChainError(line_number, "record is not valid JSON") from None
+            if "hash" not in record:
+                if prev_hash is None:
+                    continue  # legacy prefix
+                raise AuditChainError(line_number, "record is not chained")
+            suffix = f',"prev_hash":"{record.get("prev_hash")}","hash":"{record["hash"]}"}}'
+            if not line.endswith(suffix) or len(suffix) != _CHAIN_SUFFIX_LEN:
+                raise AuditChainError(line_number, "malformed chain fields")
+            if prev_hash is not None and record["prev_hash"] != prev_hash:
+                raise AuditChainError(line_number, "prev_hash does not match previous record")
+            payload = line[:-_CHAIN_SUFFIX_LEN] + "}"
+            if _chain_hash(record["prev_hash"], payload) != record["hash"]:
+                raise AuditChainError(line_number, "hash does not match record")
+            prev_hash = record["hash"]
+            count += 1
+    return count
+
+
+class AuditFileSink:
+    """
+    Append-only, hash-chained audit file written by a dedicated I/O thread.
+
+    submit() never blocks on I/O: it queues the event (bounded queue) and
+    returns. The I/O thread collects events for up to flush_interval
+    (or max_batch events), then appends the batch with one write and
+    one fsync. The chain continues across restarts from the file's last
+    record.
+
+    Overflow: INFO/DEBUG/WARNING events are dropped when the queue is
+    full; ERROR/CRITICAL events wait up to block_timeout for space
+    first. Drops are counted in get_stats() and written to the file as
+    an audit.overflow record ahead of the next batch.
+
+    The chain head is re-read from the file under an exclusive lock for
+    every batch, so sinks in several processes can append to one file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT,
+        fsync: bool = True,
+    ):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.block_timeout = block_timeout
+        self.fsync = fsync
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a+b")
+        self._queue: "queue.Queue[Union[AuditEvent, threading.Event, None]]" = queue.Queue(
+            maxsize=max_queue
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "batches": 0,
+            "write_errors": 0,
+            "high_water": 0,
+        }
+        self._unreported_drops = 0
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, event: "AuditEvent") -> bool:
+        """Queue an event for writing; returns False if it was dropped."""
+        if self._closed:
+            self._count_drop()
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if event.severity not in (AuditSeverity.ERROR, AuditSeverity.CRITICAL):
+                self._count_drop()
+                return False
+            with self._lock:
+                self._stats["blocked"] += 1
+            try:
+                self._queue.put(event, timeout=self.block_timeout)
+            except queue.Full:
+                self._count_drop()
+                return False
+        with self._lock:
+            self._stats["submitted"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["high_water"]:
+                self._stats["high_water"] = depth
+        return True
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self._stats["dropped"] += 1
+            self._unreported_drops += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is written; False on timeout."""
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Write queued events, stop the I/O thread and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def _run(self) -> None:
+        """I/O thread: batch queued events per flush interval until the close sentinel."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch and not isinstance(batch[-1], threading.Event):
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+        if self._unreported_drops:
+            self._write_batch([])  # record drops since the last batch
+        try:
+            self._file.close()
+        except OSError as e:
+            logger.error("AuditFileSink: error closing %s: %s", self.path, e)
+
+    def _write_batch(self, batch: list) -> None:
+        events = [item for item in batch if isinstance(item, AuditEvent)]
+        with self._lock:
+            drops, self._unreported_drops = self._unreported_drops, 0
+        records = [event.to_dict() for event in events]
+        if drops:
+            records.insert(0, {
+                "event_type": "audit.overflow",
+                "severity": AuditSeverity.WARNING.value,
+                "timestamp": utc_now().isoformat(),
+                "description": f"{drops} audit events dropped: queue full",
+                "details": {"dropped": drops},
+            })
+
+        if records:
+            try:
+                self._append_chained(records)
+            except OSError as e:
+                logger.error("AuditFileSink: failed to write %d records: %s", len(records), e)
+                with self._lock:
+                    self._stats["write_errors"] += 1
+                    self._stats["dropped"] += len(events)
+            else:
+                with self._lock:
+                    self._stats["written"] += len(events)
+                    self._stats["batches"] += 1
+
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _append_chained(self, records: list[dict[str, Any]]) -> None:
+        """Chain records onto the file's current head and append them, under the file lock."""
+        fd = self._file.fileno()
+        if _FLOCK_AVAILABLE:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            seq, head = _chain_head(self._file)
+            lines = []
+            for record in records:
+                seq += 1
+                record["seq"] = seq
+                line, head = _chain_record(record, head)
+                lines.append(line)
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            end = self._file.seek(0, os.SEEK_END)
+            if end:
+                self._file.seek(end - 1)
+                if self._file.read(1) != b"\n":
+                    data = b"\n" + data  # terminate a torn line
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            if _FLOCK_AVAILABLE:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+_LOG_LEVELS = {
+    AuditSeverity.CRITICAL: logging.CRITICAL,
+    AuditSeverity.ERROR: logging.ERROR,
+    AuditSeverity.WARNING: logging.WARNING,
+}
+
+
 class EnhancedAuditLogger:
     """
     Enhanced audit logging system.
@@ -154,22 +496,21 @@ class EnhancedAuditLogger:
         log_to_file: bool = True,
         log_file_path: str = "logs/audit.log",
         enable_console: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_MAX_QUEUE,
     ):
         self.logger = logging.getLogger(logger_name)
         self.logger.setLevel(logging.INFO)
         
-        # File handler
+        # File sink (async, batched, hash-chained)
+        self._sink: Optional[AuditFileSink] = None
         if log_to_file:
             try:
-                import os
-                os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-                
-                file_handler = logging.FileHandler(log_file_path)
-                file_handler.setLevel(logging.INFO)
-                file_handler.setFormatter(
-                    logging.Formatter("%(message)s")
+                self._sink = AuditFileSink(
+                    log_file_path,
+                    flush_interval=flush_interval,
+                    max_queue=max_queue,
                 )
-                self.logger.addHandler(file_handler)
             except Exception as e:
                 print(f"Warning: Could not set up audit log file: {e}")
         
@@ -182,32 +523,33 @@ class EnhancedAuditLogger:
             )
             self.logger.addHandler(console_handler)
         
-        # Event buffer for batch processing
-        self._event_buffer: list[AuditEvent] = []
-        self._buffer_size = 100
+        # Without a file sink, events still go through standard logging
+        self._emit_to_logging = enable_console or self._sink is None
 
     def log(self, event: AuditEvent) -> None:
-        """Log an audit event."""
-        log_line = event.to_json()
-        
-        if event.severity == AuditSeverity.CRITICAL:
-            self.logger.critical(log_line)
-        elif event.severity == AuditSeverity.ERROR:
-            self.logger.error(log_line)
-        elif event.severity == AuditSeverity.WARNING:
-            self.logger.warning(log_line)
-        else:
-            self.logger.info(log_line)
+        """Log an audit event (queued for the file sink; never blocks on disk I/O)."""
+        if self._sink is not None:
+            self._sink.submit(event)
         
-        # Buffer for batch processing
-        self._event_buffer.append(event)
-        if len(self._event_buffer) >= self._buffer_size:
-            self._flush_buffer()
-
-    def _flush_buffer(self) -> None:
-        """Flush event buffer (for batch processing to SIEM/database)."""
-        # In production, this would send to SIEM, database, etc.
-        self._event_buffer.clear()
+        if self._emit_to_logging:
+            self.logger.log(_LOG_LEVELS.get(event.severity, logging.INFO), event.to_json())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued events are written to the audit file."""
+        if self._sink is None:
+            return True
+        return self._sink.flush(timeout)
+
+    def close(self) -> None:
+        """Flush queued events and stop the file sink."""
+        if self._sink is not None:
+            self._sink.close()
+
+    def get_stats(self) -> dict[str, int]:
+        """Audit sink counters (submitted, written, dropped, blocked, queued, ...)."""
+        if self._sink is None:
+            return {}
+        return self._sink.get_stats()
 
     # Convenience methods for common events
     def log_auth_success(
@@ -382,13 +724,27 @@ _audit_logger: Optional[EnhancedAuditLogger] = None
 
 
 def get_audit_logger() -> EnhancedAuditLogger:
-    """Get the singleton audit logger instance."""
+    """Get the singleton audit logger instance.
+
+    The audit file defaults to ``logs/audit.log`` and can be moved with
+    ``OMEN_AUDIT_LOG_PATH``.
+    """
     global _audit_logger
     if _audit_logger is None:
-        _audit_logger = EnhancedAuditLogger()
+        _audit_logger = EnhancedAuditLogger(
+            log_file_path=os.getenv("OMEN_AUDIT_LOG_PATH", "logs/audit.log"),
+        )
     return _audit_logger
 
 
+def shutdown_audit_logger() -> None:
+    """Flush and close the singleton audit logger, if it was created."""
+    global _audit_logger
+    if _audit_logger is not None:
+        _audit_logger.close()
+        _audit_logger = None
+
+
 # Convenience functions
 def audit_auth_success(actor_id: str, **kwargs) -> None:
     """Log authentication success."""
@@ -0,0 +1,163 @@
+"""
+API key resolution for authenticate().
+
+Maps a presented API key to the principal it authenticates in O(1):
+
+- Configured keys (OMEN_SECURITY_API_KEYS) are indexed by a keyed digest
+  (HMAC-SHA256 with a per-process secret), so lookup cost does not grow
+  with the number of keys. The digest is a dict key rather than the key
+  itself; without the secret an attacker cannot steer digests, so the
+  lookup leaks nothing useful through timing.
+- Keys verified by ApiKeyManager are kept in a short-TTL LRU under the
+  same digest, so repeat requests skip re-hashing and storage lookups.
+
+Revoking or deleting a key (api_key_manager, key_rotation) calls
+invalidate_key(); the TTL bounds staleness for changes made elsewhere
+(another process, direct storage edits).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping, Optional
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class ResolvedKey:
+    """Principal an API key authenticates as."""
+
+    key_id: str
+    scopes: tuple[str, ...]
+    expires_at: Optional[datetime] = None
+
+
+class ApiKeyResolver:
+    """
+    Keyed-digest index of configured keys plus an LRU of verified keys.
+
+    Not a source of truth: misses fall through to the verify callback
+    (ApiKeyManager), and only successful verifications are cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        secret: Optional[bytes] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._secret = secret or secrets.token_bytes(32)
+        self._static: dict[bytes, ResolvedKey] = {}
+        self._static_source: Any = None
+        self._verified: OrderedDict[bytes, tuple[ResolvedKey, float]] = OrderedDict()
+        self._verified_source: Any = None
+        self._hits = 0
+        self._misses = 0
+
+    def digest(self, api_key: str) -> bytes:
+        """Keyed digest used as the lookup key (never the plaintext)."""
+        return hmac.new(self._secret, api_key.encode(), hashlib.sha256).digest()
+
+    def set_static_keys(self, keys: Mapping[str, ResolvedKey], source: Any = None) -> None:
+        """Index configured keys (plaintext -> principal); source identifies the config."""
+        self._static = {self.digest(key): principal for key, principal in keys.items()}
+        self._static_source = source
+
+    def has_static_source(self, source: Any) -> bool:
+        """True if the static index was built from this config object."""
+        return self._static_source is source and source is not None
+
+    def resolve(
+        self,
+        api_key: str,
+        verify: Callable[[str], Optional[ResolvedKey]],
+        source: Any = None,
+    ) -> Optional[ResolvedKey]:
+        """
+        Principal for api_key, or None if it is not valid.
+
+        verify is called on a miss; source identifies what verify checks
+        against (e.g. the ApiKeyManager) and the cache is dropped when it
+        changes.
+        """
+        digest = self.digest(api_key)
+        principal = self._static.get(digest)
+        if principal is not None:
+            return principal
+
+        if source is not self._verified_source:
+            self._verified.clear()
+            self._verified_source = source
+
+        now = time.monotonic()
+        entry = self._verified.get(digest)
+        if entry is not None:
+            principal, deadline = entry
+            if now < deadline:
+                self._verified.move_to_end(digest)
+                self._hits += 1
+                return principal
+            del self._verified[digest]
+
+        self._misses += 1
+        principal = verify(api_key)
+        if principal is not None:
+            self._remember(digest, principal, now)
+        return principal
+
+    def _remember(self, digest: bytes, principal: ResolvedKey, now: float) -> None:
+        deadline = now + self.ttl_seconds
+        if principal.expires_at is not None:
+            remaining = (principal.expires_at - datetime.now(timezone.utc)).total_seconds()
+            deadline = min(deadline, now + remaining)
+        self._verified[digest] = (principal, deadline)
+        self._verified.move_to_end(digest)
+        while len(self._verified) > self.max_entries:
+            self._verified.popitem(last=False)
+
+    def invalidate(self, key_id: str) -> int:
+        """Forget cached verifications of key_id; returns entries removed."""
+        stale = [d for d, (principal, _) in self._verified.items() if principal.key_id == key_id]
+        for digest in stale:
+            del self._verified[digest]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Forget every cached verification (static index is kept)."""
+        self._verified.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "static_keys": len(self._static),
+            "cached_keys": len(self._verified),
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+        }
+
+
+# Global resolver instance
+_key_resolver: Optional[ApiKeyResolver] = None
+
+
+def get_key_resolver() -> ApiKeyResolver:
+    """Get or create the global API key resolver."""
+    global _key_resolver
+    if _key_resolver is None:
+        _key_resolver = ApiKeyResolver()
+    return _key_resolver
+
+
+def invalidate_key(key_id: str) -> None:
+    """Drop cached verifications of a revoked or deleted key."""
+    if _key_resolver is not None:
+        _key_resolver.invalidate(key_id)
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import Protocol
 
+from omen.infrastructure.security.key_resolver import invalidate_key
+
 
 @dataclass
 class ApiKey:
@@ -110,6 +112,7 @@ class ApiKeyManager:
         if api_key:
             api_key.revoked = True
             self.store.save(api_key)
+            invalidate_key(key_id)
 
     def rotate_key(self, old_key_id: str) -> tuple[str, ApiKey]:
         """Rotate key: generate new and revoke old."""
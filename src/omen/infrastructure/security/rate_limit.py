@@ -3,6 +3,8 @@ Rate limiting for OMEN API.
 """
 
 import asyncio
+import math
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Callable, Awaitable
@@ -78,6 +80,155 @@ class TokenBucketRateLimiter:
                 return False, headers
 
 
+def sliding_window_estimate(
+    previous: int, current: int, now: float, window_start: float, window_seconds: float
+) -> float:
+    """
+    Requests in the sliding window ending at now, from two fixed-window counts.
+
+    The previous window's count is weighted by how much of it still
+    overlaps the sliding window (requests assumed evenly spread).
+    """
+    overlap = 1.0 - (now - window_start) / window_seconds
+    return previous * max(0.0, overlap) + current
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one sliding-window check (shared by in-memory and Redis limiters)."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: float  # epoch seconds when the current fixed window ends
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(self.reset_at)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.reset_at - time.time())))
+        return headers
+
+
+@dataclass
+class SlidingWindowCounter:
+    """Two-bucket sliding window state for one client: O(1) memory at any limit."""
+
+    window_start: float
+    window_seconds: float
+    current: int = 0
+    previous: int = 0
+
+    def roll(self, now: float) -> None:
+        """Advance to the fixed window containing now."""
+        elapsed = int((now - self.window_start) // self.window_seconds)
+        if elapsed <= 0:
+            return
+        self.previous = self.current if elapsed == 1 else 0
+        self.current = 0
+        self.window_start += elapsed * self.window_seconds
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding window counter rate limiter (in-memory).
+
+    At most `limit` requests per sliding `window_seconds`, estimated from
+    the counts of the current and previous fixed windows: constant time
+    and memory per request, whatever the limit. Only allowed requests
+    are counted. Same algorithm and headers as RedisRateLimiter, so the
+    in-memory fallback behaves like the distributed limiter.
+    """
+
+    SWEEP_EVERY = 10_000  # hits between sweeps of idle clients
+
+    def __init__(self, requests_per_window: int = 100, window_seconds: int = 60):
+        self.requests_per_window = requests_per_window
+        self.window_seconds = window_seconds
+        self._counters: dict[str, SlidingWindowCounter] = {}
+        self._hits = 0
+
+    def hit(
+        self,
+        client_id: str,
+        limit: int | None = None,
+        window_seconds: float | None = None,
+        now: float | None = None,
+    ) -> RateLimitDecision:
+        """Count a request for client_id if it is under the limit."""
+        limit = self.requests_per_window if limit is None else limit
+        window = float(window_seconds or self.window_seconds)
+        now = time.time() if now is None else now
+
+        counter = self._counters.get(client_id)
+        if counter is None or counter.window_seconds != window:
+            counter = SlidingWindowCounter(window_start=now - now % window, window_seconds=window)
+            self._counters[client_id] = counter
+        counter.roll(now)
+
+        used = sliding_window_estimate(
+            counter.previous, counter.current, now, counter.window_start, window
+        )
+        allowed = used + 1 <= limit
+        if allowed:
+            counter.current += 1
+            used += 1
+
+        self._hits += 1
+        if self._hits % self.SWEEP_EVERY == 0:
+            self._sweep(now)
+
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(0, int(limit - used)),
+            reset_at=counter.window_start + window,
+        )
+
+    def remaining(
+        self,
+        client_id: str,
+        limit: int | None = None,
+        window_seconds: float | None = None,
+        now: float | None = None,
+    ) -> int:
+        """Requests left in the sliding window, without counting one."""
+        limit = self.requests_per_window if limit is None else limit
+        counter = self._counters.get(client_id)
+        if counter is None:
+            return limit
+        now = time.time() if now is None else now
+        counter.roll(now)
+        used = sliding_window_estimate(
+            counter.previous, counter.current, now, counter.window_start, counter.window_seconds
+        )
+        return max(0, int(limit - used))
+
+    async def check(self, client_id: str) -> tuple[bool, dict[str, str]]:
+        """Check if request is allowed. Returns (allowed, headers_dict)."""
+        decision = self.hit(client_id)
+        return decision.allowed, decision.headers()
+
+    def _sweep(self, now: float) -> None:
+        """Forget clients idle for two full windows (their estimate is 0)."""
+        idle = [
+            key
+            for key, c in self._counters.items()
+            if now - c.window_start >= 2 * c.window_seconds
+        ]
+        for key in idle:
+            del self._counters[key]
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "tracked_keys": len(self._counters),
+            "total_entries": len(self._counters),  # one fixed-size counter per key
+        }
+
+
 import os
 import logging
 
@@ -128,7 +128,7 @@ def _compute_provenance(signal: OmenSignal) -> dict[str, Any]:
     
     return {
         "source_id": signal.source_event_id,
-        "provider_name": signal.probability_source,
+        "provider_name": getattr(signal, "probability_source", None),
         "provider_type": provider_type,
         "fetched_at": generated_at.isoformat() if hasattr(generated_at, 'isoformat') else str(generated_at),
         "freshness_seconds": round(freshness, 2),
@@ -168,3 +168,29 @@ def redact_for_api(
     )
     data["data_provenance"] = provenance
     return data
+
+
+def redact_summary_for_api(summary: Any) -> dict[str, Any]:
+    """
+    List-view fields of a SignalSummary or OmenSignal (view=summary).
+
+    Same keys as the "minimal" detail level plus the list metadata the
+    summary carries; fetch the signal by ID for the full contract.
+    """
+    def value(field: Any) -> Any:
+        return getattr(field, "value", field)
+
+    return {
+        "signal_id": summary.signal_id,
+        "source_event_id": summary.source_event_id,
+        "title": summary.title,
+        "probability": summary.probability,
+        "confidence_level": value(summary.confidence_level),
+        "confidence_score": summary.confidence_score,
+        "category": value(summary.category),
+        "signal_type": value(summary.signal_type),
+        "status": value(summary.status),
+        "trace_id": summary.trace_id,
+        "generated_at": summary.generated_at.isoformat(),
+        "data_provenance": _compute_provenance(summary),
+    }
@@ -2,7 +2,9 @@
 Redis-backed Rate Limiter.
 
 Enables distributed rate limiting across multiple instances.
-Uses sliding window algorithm for accurate rate limiting.
+Uses the sliding window counter algorithm (see SlidingWindowRateLimiter):
+two fixed-window counters per client, read and updated in one pipelined
+round trip without Lua scripts.
 """
 
 from __future__ import annotations
@@ -12,6 +14,11 @@ import time
 from datetime import datetime, timezone
 from typing import Optional
 
+from omen.infrastructure.security.rate_limit import (
+    RateLimitDecision,
+    sliding_window_estimate,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +29,9 @@ class RedisRateLimiter:
     Uses sliding window counter algorithm for accurate, distributed rate limiting.
     Supports multiple OMEN instances sharing rate limit state.
 
+    Each client has one counter per fixed window ({prefix}{client}:{index}),
+    so a check costs O(1) Redis work and memory regardless of the limit.
+
     Requires:
     - redis library: pip install redis
     - Redis server
@@ -77,15 +87,22 @@ class RedisRateLimiter:
         if not self._initialized:
             raise RuntimeError("Redis rate limiter not initialized. Call await initialize() first.")
 
+    def _window_keys(self, client_key: str, now: float) -> tuple[str, str, float]:
+        """Current and previous window counter keys, and the current window start."""
+        index = int(now // self.window_seconds)
+        base = f"{self.key_prefix}{client_key}"
+        return f"{base}:{index}", f"{base}:{index - 1}", index * self.window_seconds
+
     async def is_allowed(self, client_key: str) -> tuple[bool, dict[str, str]]:
         """
         Check if request is allowed under rate limit.
 
-        Uses sliding window counter:
-        1. Remove expired entries from sorted set
-        2. Count current entries
-        3. If under limit, add current timestamp
-        4. Return rate limit headers
+        Uses sliding window counter, in one pipelined round trip:
+        1. INCR the current window counter (optimistic)
+        2. EXPIRE it after two windows (it is still read as "previous")
+        3. GET the previous window counter
+        The previous count is weighted by its overlap with the sliding
+        window. A denied request is un-counted with a DECR.
 
         Args:
             client_key: Unique identifier for client (API key or IP)
@@ -95,47 +112,32 @@ class RedisRateLimiter:
         """
         self._ensure_initialized()
 
-        key = f"{self.key_prefix}{client_key}"
         now = time.time()
-        window_start = now - self.window_seconds
-
-        pipe = self._redis.pipeline()
-
-        # Remove entries outside window
-        pipe.zremrangebyscore(key, 0, window_start)
-
-        # Count current entries
-        pipe.zcard(key)
-
-        # Add current request (optimistic - will be there for next check)
-        pipe.zadd(key, {str(now): now})
+        current_key, previous_key, window_start = self._window_keys(client_key, now)
 
-        # Set expiry to window size (cleanup)
-        pipe.expire(key, self.window_seconds + 1)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.incr(current_key)
+        pipe.expire(current_key, 2 * self.window_seconds)
+        pipe.get(previous_key)
+        current, _, previous = await pipe.execute()
 
-        results = await pipe.execute()
-        current_count = results[1]
+        used = sliding_window_estimate(
+            int(previous or 0), int(current), now, window_start, self.window_seconds
+        )
+        allowed = used <= self.requests_per_minute
 
-        # Check if allowed
-        allowed = current_count < self.requests_per_minute
-
-        # If not allowed, remove the optimistically added entry
+        # If not allowed, remove the optimistically counted request
         if not allowed:
-            await self._redis.zrem(key, str(now))
-
-        remaining = max(0, self.requests_per_minute - current_count - (1 if allowed else 0))
-        reset_time = int(now + self.window_seconds)
+            await self._redis.decr(current_key)
+            used -= 1
 
-        headers = {
-            "X-RateLimit-Limit": str(self.requests_per_minute),
-            "X-RateLimit-Remaining": str(remaining),
-            "X-RateLimit-Reset": str(reset_time),
-        }
-
-        if not allowed:
-            headers["Retry-After"] = str(self.window_seconds)
-
-        return allowed, headers
+        decision = RateLimitDecision(
+            allowed=allowed,
+            limit=self.requests_per_minute,
+            remaining=max(0, int(self.requests_per_minute - used)),
+            reset_at=window_start + self.window_seconds,
+        )
+        return allowed, decision.headers()
 
     async def get_usage(self, client_key: str) -> dict:
         """
@@ -146,21 +148,21 @@ class RedisRateLimiter:
         """
         self._ensure_initialized()
 
-        key = f"{self.key_prefix}{client_key}"
         now = time.time()
-        window_start = now - self.window_seconds
-
-        # Count entries in current window
-        count = await self._redis.zcount(key, window_start, now)
+        current_key, previous_key, window_start = self._window_keys(client_key, now)
+        current, previous = await self._redis.mget(current_key, previous_key)
+        used = sliding_window_estimate(
+            int(previous or 0), int(current or 0), now, window_start, self.window_seconds
+        )
 
         return {
             "client_key": client_key,
-            "current_requests": count,
+            "current_requests": int(used),
             "limit": self.requests_per_minute,
-            "remaining": max(0, self.requests_per_minute - count),
+            "remaining": max(0, int(self.requests_per_minute - used)),
             "window_seconds": self.window_seconds,
             "reset_at": datetime.fromtimestamp(
-                now + self.window_seconds, tz=timezone.utc
+                window_start + self.window_seconds, tz=timezone.utc
             ).isoformat(),
         }
 
@@ -168,8 +170,8 @@ class RedisRateLimiter:
         """Reset rate limit for a client (admin use)."""
         self._ensure_initialized()
 
-        key = f"{self.key_prefix}{client_key}"
-        await self._redis.delete(key)
+        current_key, previous_key, _ = self._window_keys(client_key, time.time())
+        await self._redis.delete(current_key, previous_key)
         logger.info("Rate limit reset for client: %s", client_key)
 
     async def close(self) -> None:
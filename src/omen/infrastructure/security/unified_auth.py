@@ -33,8 +33,6 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-import secrets
-import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Dict, List, Optional, Any
@@ -43,6 +41,9 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader, APIKeyQuery
 from pydantic import BaseModel
 
+from omen.infrastructure.security.key_resolver import ResolvedKey, get_key_resolver
+from omen.infrastructure.security.rate_limit import SlidingWindowRateLimiter
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -160,50 +161,27 @@ class AuthContext:
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter.
-    
-    Note: For multi-process deployments, replace with Redis.
+    In-memory rate limiter (sliding window counter).
+
+    Constant time and memory per key, whatever max_requests is; see
+    SlidingWindowRateLimiter. RedisRateLimiter applies the same
+    algorithm across processes.
     """
     
     def __init__(self):
-        self._requests: Dict[str, List[float]] = {}
+        self._limiter = SlidingWindowRateLimiter()
         
     def is_allowed(self, key: str, max_requests: int, window_seconds: int) -> bool:
         """Check if request is allowed under rate limit."""
-        now = time.time()
-        window_start = now - window_seconds
-        
-        # Clean old entries
-        if key in self._requests:
-            self._requests[key] = [t for t in self._requests[key] if t > window_start]
-        else:
-            self._requests[key] = []
-            
-        # Check limit
-        if len(self._requests[key]) >= max_requests:
-            return False
-            
-        # Record request
-        self._requests[key].append(now)
-        return True
+        return self._limiter.hit(key, max_requests, window_seconds).allowed
         
     def get_remaining(self, key: str, max_requests: int, window_seconds: int) -> int:
         """Get remaining requests in current window."""
-        now = time.time()
-        window_start = now - window_seconds
-        
-        if key not in self._requests:
-            return max_requests
-            
-        recent = [t for t in self._requests[key] if t > window_start]
-        return max(0, max_requests - len(recent))
+        return self._limiter.remaining(key, max_requests, window_seconds)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiter statistics."""
-        return {
-            "tracked_keys": len(self._requests),
-            "total_entries": sum(len(v) for v in self._requests.values()),
-        }
+        return self._limiter.get_stats()
 
 # Global rate limiter
 rate_limiter = RateLimiter()
@@ -305,6 +283,12 @@ class AuditLogger:
             self._get_client_ip(request),
         )
         
+    def get_stats(self) -> Dict[str, Any]:
+        """Enhanced audit sink counters (drops, backpressure, queue depth)."""
+        if self._enhanced_logger:
+            return self._enhanced_logger.get_stats()
+        return {}
+        
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP from request."""
         forwarded = request.headers.get("X-Forwarded-For")
@@ -368,6 +352,78 @@ def _rate_limit_error(remaining: int, window: int) -> HTTPException:
     )
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# KEY RESOLUTION
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Full access scopes for authenticated API keys
+_API_KEY_SCOPES = (
+    "read:signals",
+    "write:signals",
+    "read:partners",
+    "write:partners",
+    "read:multi-source",
+    "read:methodology",
+    "read:activity",
+    "read:stats",
+    "read:storage",
+    "write:storage",
+    "read:realtime",
+    "read:live-mode",
+    "write:live-mode",
+)
+
+
+def _verify_managed_key(manager: Any, api_key: str) -> Optional[ResolvedKey]:
+    """Check ApiKeyManager for programmatic keys."""
+    try:
+        record = manager.verify_key(api_key)
+    except Exception as e:
+        logger.debug("ApiKeyManager check failed: %s", e)
+        return None
+    if not record:
+        return None
+    return ResolvedKey(
+        key_id=record.key_id,
+        scopes=_API_KEY_SCOPES,
+        expires_at=getattr(record, "expires_at", None),
+    )
+
+
+def _resolve_api_key(api_key: str) -> Optional[ResolvedKey]:
+    """
+    Resolve an API key to its principal in O(1) (see key_resolver).
+
+    Configured keys are re-indexed when the security config object
+    changes; ApiKeyManager verifications are cached briefly.
+    """
+    from omen.infrastructure.security.config import get_security_config
+    
+    resolver = get_key_resolver()
+    security_config = get_security_config()
+    if not resolver.has_static_source(security_config):
+        resolver.set_static_keys(
+            {
+                valid_key: ResolvedKey(f"api_user_{_hash_key(valid_key)}", _API_KEY_SCOPES)
+                for valid_key in security_config.get_api_keys()
+            },
+            source=security_config,
+        )
+    
+    try:
+        from omen.infrastructure.security.api_key_manager import get_api_key_manager
+        manager = get_api_key_manager()
+    except Exception as e:
+        logger.debug("ApiKeyManager unavailable: %s", e)
+        manager = None
+    
+    return resolver.resolve(
+        api_key,
+        lambda key: _verify_managed_key(manager, key) if manager is not None else None,
+        source=manager,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CORE AUTH FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -460,55 +516,21 @@ async def authenticate(
             )
             raise _rate_limit_error(remaining, config.rate_limit_window)
     
-    # STEP 4: Validate API key
-    from omen.infrastructure.security.config import get_security_config
-    
-    security_config = get_security_config()
-    valid_keys = security_config.get_api_keys()
-    
-    # Check against configured keys (using constant-time comparison)
-    key_id = None
-    for i, valid_key in enumerate(valid_keys):
-        if secrets.compare_digest(api_key, valid_key):
-            key_id = f"api_user_{key_hash}"
-            break
+    # STEP 4: Validate API key (configured keys, then ApiKeyManager)
+    principal = _resolve_api_key(api_key)
     
-    # Also check ApiKeyManager for programmatic keys
-    if key_id is None:
-        try:
-            from omen.infrastructure.security.api_key_manager import get_api_key_manager
-            manager = get_api_key_manager()
-            record = manager.verify_key(api_key)
-            if record:
-                key_id = record.key_id
-        except Exception as e:
-            logger.debug("ApiKeyManager check failed: %s", e)
-    
-    if key_id is None:
+    if principal is None:
         audit.log_auth_failure(request, f"Invalid API key (hash: {key_hash})")
         raise _invalid_key_error()
     
+    key_id = principal.key_id
+    
     # STEP 5: Create context and log success
-    # Full access scopes for authenticated API keys
     context = AuthContext(
         user_id=key_id,
         api_key_hash=key_hash,
         is_development_bypass=False,
-        scopes=[
-            "read:signals",
-            "write:signals",
-            "read:partners",
-            "write:partners",
-            "read:multi-source",
-            "read:methodology",
-            "read:activity",
-            "read:stats",
-            "read:storage",
-            "write:storage",
-            "read:realtime",
-            "read:live-mode",
-            "write:live-mode",
-        ],
+        scopes=list(principal.scopes),
     )
     
     audit.log_auth_success(request, context)
@@ -619,6 +641,8 @@ def get_auth_health() -> Dict[str, Any]:
         },
         "api_keys_configured": len(config.valid_keys),
         "rate_limiter_stats": rate_limiter.get_stats(),
+        "key_resolver_stats": get_key_resolver().get_stats(),
+        "audit_stats": audit.get_stats(),
         "issues": issues,
         "checked_at": datetime.now(timezone.utc).isoformat(),
     }
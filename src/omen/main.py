@@ -487,6 +487,14 @@ async def lifespan(app: FastAPI):  # type: ignore[arg-type]
     
     await graceful_shutdown(timeout_seconds=30)
 
+    # Write queued audit events and stop the audit writer thread
+    try:
+        from omen.infrastructure.security.enhanced_audit import shutdown_audit_logger
+        await asyncio.to_thread(shutdown_audit_logger)
+        logger.info("Audit log flushed")
+    except Exception as e:
+        logger.error("Error flushing audit log: %s", e)
+
     # Shutdown distributed components
     try:
         await shutdown_connection_manager()
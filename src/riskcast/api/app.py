@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Run database migrations on startup."""
+    """Run database migrations on startup; close store connections on shutdown."""
     try:
         from omen.infrastructure.database.migrations import run_riskcast_migrations
 
@@ -23,6 +23,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Migrations on startup failed (non-fatal): %s", e)
     yield
+    try:
+        from riskcast.infrastructure.signal_store import close_store
+
+        await close_store()
+    except Exception as e:
+        logger.warning("SignalStore close on shutdown failed: %s", e)
 
 
 app = FastAPI(title="RiskCast", version="0.1.0", lifespan=lifespan)
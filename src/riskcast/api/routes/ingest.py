@@ -2,6 +2,8 @@
 RiskCast Ingest API
 
 POST /api/v1/signals/ingest — accept SignalEvent, persist, return ack_id.
+POST /api/v1/signals/ingest/batch — accept N SignalEvents, persist in one
+transaction, return a per-signal ack/duplicate.
 Dedupe by signal_id: 409 with original ack_id on duplicate.
 Persist-before-ack: store BEFORE returning 200.
 """
@@ -15,7 +17,7 @@ from fastapi.responses import JSONResponse
 
 from omen.domain.models.signal_event import SignalEvent
 
-from riskcast.infrastructure.signal_store import get_store
+from riskcast.infrastructure.signal_store import ProcessedSignal, get_store
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["ingest"])
@@ -58,3 +60,73 @@ async def ingest_signal(request: Request) -> JSONResponse:
             {"ack_id": ack_id, "duplicate": True},
             status_code=409,
         )
+
+
+MAX_BATCH_SIZE = 500
+
+
+@router.post("/signals/ingest/batch")
+async def ingest_signals_batch(request: Request) -> JSONResponse:
+    """
+    Ingest a batch of signals: {"events": [SignalEvent, ...]}.
+
+    Valid events are stored in one transaction. The response lists one
+    result per input event, in order, with the same semantics as the
+    single-signal endpoint: status_code 200 + ack_id on first accept,
+    409 + original ack_id + duplicate on a repeated signal_id, 400 +
+    detail for an invalid event (not stored).
+    """
+    try:
+        body = await request.json()
+        raw_events = body["events"]
+        if not isinstance(raw_events, list):
+            raise ValueError("'events' must be a list")
+    except Exception as e:
+        logger.warning("Invalid batch ingest body: %s", e)
+        return JSONResponse({"detail": str(e)}, status_code=400)
+    if len(raw_events) > MAX_BATCH_SIZE:
+        return JSONResponse(
+            {"detail": f"Batch too large: {len(raw_events)} > {MAX_BATCH_SIZE}"},
+            status_code=413,
+        )
+
+    source = request.headers.get("X-Replay-Source", "hot_path")
+    now = datetime.now(timezone.utc)
+    results: list[dict] = [{} for _ in raw_events]
+    valid: list[tuple[int, SignalEvent]] = []
+    for i, raw in enumerate(raw_events):
+        try:
+            valid.append((i, SignalEvent.model_validate(raw)))
+        except Exception as e:
+            logger.warning("Invalid event %s in batch ingest: %s", i, e)
+            signal_id = raw.get("signal_id") if isinstance(raw, dict) else None
+            results[i] = {"signal_id": signal_id, "status_code": 400, "detail": str(e)}
+
+    store = get_store()
+    stored = await store.store_many(
+        [
+            ProcessedSignal(
+                signal_id=event.signal_id,
+                trace_id=event.deterministic_trace_id,
+                source_event_id=event.source_event_id,
+                ack_id="",
+                processed_at=now,
+                emitted_at=event.emitted_at,
+                source=source,
+                signal_data=event.model_dump(mode="json"),
+            )
+            for _, event in valid
+        ]
+    )
+    for (i, event), (ack_id, is_new) in zip(valid, stored):
+        if is_new:
+            results[i] = {"signal_id": event.signal_id, "status_code": 200, "ack_id": ack_id}
+        else:
+            results[i] = {
+                "signal_id": event.signal_id,
+                "status_code": 409,
+                "ack_id": ack_id,
+                "duplicate": True,
+            }
+
+    return JSONResponse({"results": results}, status_code=200)
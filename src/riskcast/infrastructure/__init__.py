@@ -8,6 +8,7 @@ from riskcast.infrastructure.reconcile_state import (
 from riskcast.infrastructure.signal_store import (
     ProcessedSignal,
     SignalStore,
+    close_store,
     get_store,
 )
 
@@ -15,6 +16,7 @@ __all__ = [
     "ProcessedSignal",
     "SignalStore",
     "get_store",
+    "close_store",
     "ReconcileState",
     "ReconcileStateStore",
     "get_reconcile_store",
@@ -1,21 +1,28 @@
 """
 Signal Store v2 — Async SQLite
 
-True async database operations with aiosqlite.
+Non-blocking SQLite access over long-lived connections: one writer with a
+batched write queue, plus a small reader pool.
 """
 
+import asyncio
+import concurrent.futures
 import json
 import logging
+import queue
+import sqlite3
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-import aiosqlite
+from typing import Callable, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class ProcessedSignal:
@@ -31,87 +38,241 @@ class ProcessedSignal:
     signal_data: dict
 
 
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS processed_signals (
+        signal_id TEXT PRIMARY KEY,
+        trace_id TEXT NOT NULL,
+        source_event_id TEXT NOT NULL,
+        ack_id TEXT NOT NULL UNIQUE,
+        processed_at TEXT NOT NULL,
+        emitted_at TEXT NOT NULL,
+        partition_date TEXT NOT NULL,
+        source TEXT NOT NULL,
+        signal_data TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_partition_date
+    ON processed_signals(partition_date)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trace_id
+    ON processed_signals(trace_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_source
+    ON processed_signals(source)
+    """,
+]
+
+_INSERT_SQL = """
+    INSERT INTO processed_signals
+    (signal_id, trace_id, source_event_id, ack_id,
+     processed_at, emitted_at, partition_date, source, signal_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+BUSY_TIMEOUT_MS = 10000  # wait for writers in other processes
+
+
+def _new_ack_id() -> str:
+    return f"riskcast-ack-{uuid.uuid4().hex[:16]}"
+
+
+def _row_to_processed(row: sqlite3.Row) -> ProcessedSignal:
+    return ProcessedSignal(
+        signal_id=row["signal_id"],
+        trace_id=row["trace_id"],
+        source_event_id=row["source_event_id"],
+        ack_id=row["ack_id"],
+        processed_at=datetime.fromisoformat(row["processed_at"]),
+        emitted_at=datetime.fromisoformat(row["emitted_at"]),
+        source=row["source"],
+        signal_data=json.loads(row["signal_data"]),
+    )
+
+
 class SignalStore:
     """
     Async signal storage with SQLite.
 
-    Uses aiosqlite for non-blocking operations.
-    WAL mode for concurrent read/write.
+    WAL mode for concurrent read/write. Connections are long-lived:
+    - One writer connection on a dedicated thread. Writes are queued and
+      drained in batches: each write runs in its own SAVEPOINT (so one
+      duplicate does not fail its neighbours) and the batch shares one
+      COMMIT. Callers are acknowledged only after that commit.
+    - A small pool of reader threads, each with its own connection.
+
+    Connections are opened lazily and released by close(). Blocking
+    sqlite3 calls run on the store's own threads, so the store can be
+    used from any event loop.
     """
 
-    def __init__(self, db_path: str | Path):
+    def __init__(
+        self,
+        db_path: str | Path,
+        reader_pool_size: int = 4,
+        write_batch_max: int = 128,
+    ):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.reader_pool_size = max(1, reader_pool_size)
+        self.write_batch_max = max(1, write_batch_max)
         self._initialized = False
+        self._lifecycle_lock = threading.Lock()
+        self._init_future: Optional[concurrent.futures.Future] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._readers: Optional[ThreadPoolExecutor] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._reader_local = threading.local()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._write_queue: "queue.SimpleQueue[tuple[Callable, concurrent.futures.Future]]" = (
+            queue.SimpleQueue()
+        )
+
+    # === Connections ===
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,  # explicit transactions
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        return conn
+
+    def _open_writer(self) -> None:
+        """Runs on the writer thread: open the writer connection and create the schema."""
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        self._writer_conn = conn
+
+    def _reader_conn(self) -> sqlite3.Connection:
+        """Runs on a reader thread: that thread's connection (opened on first use)."""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._reader_local.conn = conn
+            with self._lifecycle_lock:
+                self._reader_conns.append(conn)
+        return conn
 
     async def _ensure_initialized(self) -> None:
-        """Initialize database schema."""
-        if self._initialized:
-            return
+        """Start the writer/reader threads and initialize the schema (once)."""
+        if not self._initialized:
+            with self._lifecycle_lock:
+                if self._init_future is None:
+                    self._writer = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="signal-store-writer"
+                    )
+                    self._readers = ThreadPoolExecutor(
+                        max_workers=self.reader_pool_size,
+                        thread_name_prefix="signal-store-reader",
+                    )
+                    self._init_future = self._writer.submit(self._open_writer)
+                init_future = self._init_future
+            await asyncio.wrap_future(init_future)
+            self._initialized = True
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute("PRAGMA busy_timeout=10000")  # 10s wait for concurrent writers
-
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS processed_signals (
-                    signal_id TEXT PRIMARY KEY,
-                    trace_id TEXT NOT NULL,
-                    source_event_id TEXT NOT NULL,
-                    ack_id TEXT NOT NULL UNIQUE,
-                    processed_at TEXT NOT NULL,
-                    emitted_at TEXT NOT NULL,
-                    partition_date TEXT NOT NULL,
-                    source TEXT NOT NULL,
-                    signal_data TEXT NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+    async def _read(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        await self._ensure_initialized()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, lambda: fn(self._reader_conn()))
+
+    async def _write(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Queue a write; resolves after the batch containing it has committed."""
+        await self._ensure_initialized()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._write_queue.put((fn, future))
+        self._writer.submit(self._drain_writes)
+        return await asyncio.wrap_future(future)
+
+    def _drain_writes(self) -> None:
+        """Runs on the writer thread: apply queued writes with one COMMIT."""
+        batch = []
+        while len(batch) < self.write_batch_max:
+            try:
+                fn, future = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                batch.append((fn, future))
+        if not batch:
+            return
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_partition_date
-                ON processed_signals(partition_date)
-            """)
+        conn = self._writer_conn
+        outcomes: list[tuple[concurrent.futures.Future, Optional[BaseException], object]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, future in batch:
+                conn.execute("SAVEPOINT write_op")
+                try:
+                    result = fn(conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write_op")
+                    conn.execute("RELEASE write_op")
+                    outcomes.append((future, e, None))
+                else:
+                    conn.execute("RELEASE write_op")
+                    outcomes.append((future, None, result))
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.error("SignalStore write batch failed: %s", e)
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for _, future in batch:
+                future.set_exception(e)
+            return
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trace_id
-                ON processed_signals(trace_id)
-            """)
+        for future, error, result in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Drain pending writes, stop the store threads and close all connections."""
+        with self._lifecycle_lock:
+            writer, readers = self._writer, self._readers
+            self._writer = self._readers = None
+            self._init_future = None
+            self._initialized = False
+        if writer is None:
+            return
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_source
-                ON processed_signals(source)
-            """)
+        def shutdown() -> None:
+            writer.shutdown(wait=True)
+            readers.shutdown(wait=True)
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+            with self._lifecycle_lock:
+                conns, self._reader_conns = self._reader_conns, []
+            for conn in conns:
+                conn.close()
+            self._reader_local = threading.local()
 
-            await db.commit()
+        await asyncio.to_thread(shutdown)
+        logger.info("SignalStore closed: %s", self.db_path)
 
-        self._initialized = True
+    # === Queries ===
 
     async def get_by_signal_id(self, signal_id: str) -> Optional[ProcessedSignal]:
         """Get processed signal by ID (for dedupe)."""
-        await self._ensure_initialized()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
 
-            async with db.execute(
+        def query(conn: sqlite3.Connection) -> Optional[ProcessedSignal]:
+            row = conn.execute(
                 "SELECT * FROM processed_signals WHERE signal_id = ?",
                 (signal_id,),
-            ) as cursor:
-                row = await cursor.fetchone()
-
-                if row:
-                    return ProcessedSignal(
-                        signal_id=row["signal_id"],
-                        trace_id=row["trace_id"],
-                        source_event_id=row["source_event_id"],
-                        ack_id=row["ack_id"],
-                        processed_at=datetime.fromisoformat(row["processed_at"]),
-                        emitted_at=datetime.fromisoformat(row["emitted_at"]),
-                        source=row["source"],
-                        signal_data=json.loads(row["signal_data"]),
-                    )
-                return None
+            ).fetchone()
+            return _row_to_processed(row) if row else None
+
+        return await self._read(query)
 
     async def store(
         self,
@@ -129,67 +290,103 @@ class SignalStore:
 
         Returns:
             ack_id (generated if not provided)
-        """
-        await self._ensure_initialized()
 
+        Raises:
+            sqlite3.IntegrityError: signal_id already stored
+        """
         if not ack_id:
-            ack_id = f"riskcast-ack-{uuid.uuid4().hex[:16]}"
-
-        partition_date = emitted_at.date().isoformat()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA busy_timeout=10000")
-            await db.execute(
-                """
-                INSERT INTO processed_signals
-                (signal_id, trace_id, source_event_id, ack_id,
-                 processed_at, emitted_at, partition_date, source, signal_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    signal_id,
-                    trace_id,
-                    source_event_id,
-                    ack_id,
-                    processed_at.isoformat(),
-                    emitted_at.isoformat(),
-                    partition_date,
-                    source,
-                    json.dumps(signal_data),
-                ),
-            )
-            await db.commit()
-
+            ack_id = _new_ack_id()
+
+        params = (
+            signal_id,
+            trace_id,
+            source_event_id,
+            ack_id,
+            processed_at.isoformat(),
+            emitted_at.isoformat(),
+            emitted_at.date().isoformat(),
+            source,
+            json.dumps(signal_data),
+        )
+        await self._write(lambda conn: conn.execute(_INSERT_SQL, params))
         return ack_id
 
+    async def store_many(
+        self,
+        signals: list[ProcessedSignal],
+    ) -> list[tuple[str, bool]]:
+        """
+        Store a batch of processed signals in one transaction.
+
+        Dedupe is per signal_id: an id already stored (or repeated earlier
+        in the same batch) is not written again.
+
+        Args:
+            signals: Records to store; an empty ack_id is generated.
+
+        Returns:
+            (ack_id, stored) per input, in order. stored is False for
+            duplicates, whose ack_id is the original one.
+        """
+
+        def insert_all(conn: sqlite3.Connection) -> list[tuple[str, bool]]:
+            results: list[tuple[str, bool]] = []
+            for rec in signals:
+                ack_id = rec.ack_id or _new_ack_id()
+                cursor = conn.execute(
+                    _INSERT_SQL + " ON CONFLICT(signal_id) DO NOTHING",
+                    (
+                        rec.signal_id,
+                        rec.trace_id,
+                        rec.source_event_id,
+                        ack_id,
+                        rec.processed_at.isoformat(),
+                        rec.emitted_at.isoformat(),
+                        rec.emitted_at.date().isoformat(),
+                        rec.source,
+                        json.dumps(rec.signal_data),
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    results.append((ack_id, True))
+                    continue
+                row = conn.execute(
+                    "SELECT ack_id FROM processed_signals WHERE signal_id = ?",
+                    (rec.signal_id,),
+                ).fetchone()
+                results.append((row[0] if row else "unknown", False))
+            return results
+
+        return await self._write(insert_all)
+
     async def list_processed_ids(self, partition_date: str) -> list[str]:
         """List all signal_ids processed for a partition."""
-        await self._ensure_initialized()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(
-                "SELECT signal_id FROM processed_signals WHERE partition_date = ?",
-                (partition_date,),
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [row[0] for row in rows]
+        return await self._read(
+            lambda conn: [
+                row[0]
+                for row in conn.execute(
+                    "SELECT signal_id FROM processed_signals WHERE partition_date = ?",
+                    (partition_date,),
+                )
+            ]
+        )
 
     async def count_by_source(self, partition_date: str) -> dict[str, int]:
         """Count signals by source (hot_path vs reconcile)."""
-        await self._ensure_initialized()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(
-                """
-                SELECT source, COUNT(*)
-                FROM processed_signals
-                WHERE partition_date = ?
-                GROUP BY source
-            """,
-                (partition_date,),
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return {row[0]: row[1] for row in rows}
+        return await self._read(
+            lambda conn: {
+                row[0]: row[1]
+                for row in conn.execute(
+                    """
+                    SELECT source, COUNT(*)
+                    FROM processed_signals
+                    WHERE partition_date = ?
+                    GROUP BY source
+                """,
+                    (partition_date,),
+                )
+            }
+        )
 
     async def get_last_reconcile_highwater(
         self,
@@ -216,3 +413,9 @@ def get_store() -> SignalStore:
         path = os.environ.get("RISKCAST_DB_PATH", "/var/lib/riskcast/signals.db")
         _store = SignalStore(path)
     return _store
+
+
+async def close_store() -> None:
+    """Close the singleton SignalStore's connections (app shutdown)."""
+    if _store is not None:
+        await _store.close()
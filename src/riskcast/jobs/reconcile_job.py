@@ -14,10 +14,11 @@ Key improvements:
 import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 import httpx
 
@@ -104,6 +105,10 @@ class LedgerClient:
         """Get specific signal for replay."""
         return self.reader.get_signal(partition_date, signal_id)
 
+    def iter_signals(self, partition_date: str) -> Iterator:
+        """Stream all signals in partition (CRC-validated), in ledger order."""
+        return self.reader.read_partition(partition_date)
+
     def list_partitions_for_reconcile(self, since_days: int = 7) -> list[dict]:
         """
         List partitions that may need reconcile.
@@ -154,6 +159,11 @@ class ReconcileJob:
     2. Main partitions: reconcile only if sealed
     3. Late partitions: reconcile even if not sealed (within grace window)
     4. Re-reconcile: triggered by highwater increase
+
+    Replay: the partition is streamed once (in a worker thread) to collect
+    ledger ids and the missing events together; missing events are pushed
+    concurrently (up to max_concurrency in flight) over one pooled HTTP
+    client. run() reconciles up to partition_concurrency partitions at once.
     """
 
     def __init__(
@@ -163,7 +173,9 @@ class ReconcileJob:
         reconcile_store: ReconcileStateStore,
         riskcast_ingest_url: str,
         api_key: str,
-        max_replay_batch: int = 100,
+        max_replay_batch: int = 1000,
+        max_concurrency: int = 16,
+        partition_concurrency: int = 4,
     ):
         self.ledger = ledger_client
         self.signal_store = signal_store
@@ -171,6 +183,41 @@ class ReconcileJob:
         self.ingest_url = riskcast_ingest_url
         self.api_key = api_key
         self.max_replay_batch = max_replay_batch
+        self.max_concurrency = max(1, max_concurrency)
+        self.partition_concurrency = max(1, partition_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._replay_semaphore: Optional[asyncio.Semaphore] = None
+        self._sessions = 0  # open _replay_session()s sharing _client
+
+    @asynccontextmanager
+    async def _replay_session(self) -> AsyncIterator[None]:
+        """
+        Shared HTTP client and replay concurrency limit.
+
+        Reference-counted: the first session opens the client, nested and
+        concurrent ones (run(), or several direct reconcile_partition()
+        calls) reuse it, and the last one to exit closes it. Concurrent
+        partitions therefore share one connection pool and one in-flight
+        limit, and none loses the client while another is replaying.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._replay_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._sessions += 1
+        try:
+            yield
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                client, self._client = self._client, None
+                self._replay_semaphore = None
+                await client.aclose()
 
     async def reconcile_partition(self, partition_date: str) -> ReconcileResult:
         """
@@ -222,8 +269,23 @@ class ReconcileJob:
         if is_rereconcile:
             logger.warning("Re-reconciling %s: %s", partition_date, reason)
 
+        processed_ids = set(await self.signal_store.list_processed_ids(partition_date))
+
+        if is_late:
+            base_date = partition_date.replace("-late", "")
+            main_processed = set(await self.signal_store.list_processed_ids(base_date))
+            processed_ids.update(main_processed)
+
+        logger.info(
+            "Processed %s signals for %s",
+            len(processed_ids),
+            partition_date,
+        )
+
         try:
-            ledger_ids = set(self.ledger.list_signal_ids(partition_date))
+            ledger_ids, to_replay = await asyncio.to_thread(
+                self._scan_partition, partition_date, processed_ids
+            )
         except Exception as e:
             logger.exception("Failed to read ledger for %s: %s", partition_date, e)
             return ReconcileResult(
@@ -239,19 +301,6 @@ class ReconcileJob:
             partition_date,
         )
 
-        processed_ids = set(await self.signal_store.list_processed_ids(partition_date))
-
-        if is_late:
-            base_date = partition_date.replace("-late", "")
-            main_processed = set(await self.signal_store.list_processed_ids(base_date))
-            processed_ids.update(main_processed)
-
-        logger.info(
-            "Processed %s signals for %s",
-            len(processed_ids),
-            partition_date,
-        )
-
         missing_ids = ledger_ids - processed_ids
         extra_ids = list(processed_ids - ledger_ids)
         if extra_ids:
@@ -271,15 +320,16 @@ class ReconcileJob:
                 partition_date,
             )
 
-            for signal_id in list(missing_ids)[: self.max_replay_batch]:
-                try:
-                    signal = self.ledger.get_signal(partition_date, signal_id)
-                    if signal:
-                        await self._replay_signal(signal, partition_date)
-                        replayed_ids.append(signal_id)
-                        logger.debug("Replayed: %s", signal_id)
-                except Exception as e:
-                    logger.error("Failed to replay %s: %s", signal_id, e)
+            async with self._replay_session():
+                outcomes = await asyncio.gather(
+                    *(self._replay_bounded(event, partition_date) for event in to_replay)
+                )
+            for signal_id, error in outcomes:
+                if error is None:
+                    replayed_ids.append(signal_id)
+                    logger.debug("Replayed: %s", signal_id)
+                else:
+                    logger.error("Failed to replay %s: %s", signal_id, error)
                     failed_ids.append(signal_id)
 
         if failed_ids:
@@ -325,17 +375,50 @@ class ReconcileJob:
             is_rereconcile=is_rereconcile,
         )
 
+    def _scan_partition(
+        self,
+        partition_date: str,
+        processed_ids: set[str],
+    ) -> tuple[set[str], list]:
+        """
+        Single pass over the partition (blocking; run in a worker thread).
+
+        Returns (all ledger signal ids, events to replay). Events to replay
+        are the first max_replay_batch missing ones, in ledger order.
+        """
+        ledger_ids: set[str] = set()
+        to_replay: list = []
+        for event in self.ledger.iter_signals(partition_date):
+            if event.signal_id in ledger_ids:
+                continue
+            ledger_ids.add(event.signal_id)
+            if event.signal_id not in processed_ids and len(to_replay) < self.max_replay_batch:
+                to_replay.append(event)
+        return ledger_ids, to_replay
+
+    async def _replay_bounded(
+        self,
+        signal_event,
+        partition_date: str,
+    ) -> tuple[str, Optional[Exception]]:
+        """Replay one signal under the shared concurrency limit; returns (signal_id, error)."""
+        async with self._replay_semaphore:
+            try:
+                await self._replay_signal(signal_event, partition_date)
+                return signal_event.signal_id, None
+            except Exception as e:
+                return signal_event.signal_id, e
+
     async def _replay_signal(self, signal_event, partition_date: str) -> None:
         """
         Replay signal through ingest endpoint.
 
         Marks source as 'reconcile' for audit.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            payload = signal_event.model_dump(mode="json")
-            response = await client.post(
+        async with self._replay_session():
+            response = await self._client.post(
                 self.ingest_url,
-                json=payload,
+                content=signal_event.model_dump_json(),
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
@@ -345,14 +428,14 @@ class ReconcileJob:
                 },
             )
 
-            if response.status_code == 409:
-                logger.debug(
-                    "Signal already processed during replay: %s",
-                    signal_event.signal_id,
-                )
-                return
+        if response.status_code == 409:
+            logger.debug(
+                "Signal already processed during replay: %s",
+                signal_event.signal_id,
+            )
+            return
 
-            response.raise_for_status()
+        response.raise_for_status()
 
     async def run(
         self,
@@ -378,13 +461,21 @@ class ReconcileJob:
 
         logger.info("Found %s partitions to check", len(partitions))
 
-        for p in partitions:
-            if p["is_late"] and not include_late:
-                continue
+        partitions = [p for p in partitions if include_late or not p["is_late"]]
+        partition_limit = asyncio.Semaphore(self.partition_concurrency)
 
-            result = await self.reconcile_partition(p["partition_date"])
-            results.append(result)
+        async def reconcile_bounded(partition_date: str) -> ReconcileResult:
+            async with partition_limit:
+                return await self.reconcile_partition(partition_date)
+
+        async with self._replay_session():
+            results = list(
+                await asyncio.gather(
+                    *(reconcile_bounded(p["partition_date"]) for p in partitions)
+                )
+            )
 
+        for p, result in zip(partitions, results):
             if result.status == ReconcileStatus.COMPLETED:
                 if result.missing_count > 0:
                     logger.info(
@@ -1,9 +1,23 @@
-"""Pytest config for benchmarks: disable coverage fail-under when running --benchmark-only."""
+"""Pytest config for benchmarks.
 
+Disables coverage fail-under when running --benchmark-only, and
+parametrizes the `scale` fixture (events per benchmark round) from
+OMEN_BENCH_SCALES, e.g. OMEN_BENCH_SCALES=1000,10000,100000.
+"""
+
+import os
 import sys
 
 import pytest
 
+DEFAULT_SCALES = "1000"
+
+
+def bench_scales() -> list[int]:
+    """Workload sizes from OMEN_BENCH_SCALES (comma separated)."""
+    raw = os.environ.get("OMEN_BENCH_SCALES", DEFAULT_SCALES)
+    return [int(part) for part in raw.split(",") if part.strip()]
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """When running only benchmarks, do not fail on low coverage."""
@@ -15,3 +29,10 @@ def pytest_configure(config: pytest.Config) -> None:
             pass
     if benchmark_only and hasattr(config.option, "cov_fail_under"):
         config.option.cov_fail_under = 0
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run every benchmark that takes `scale` once per configured size."""
+    if "scale" in metafunc.fixturenames:
+        scales = bench_scales()
+        metafunc.parametrize("scale", scales, ids=[f"n{n}" for n in scales])
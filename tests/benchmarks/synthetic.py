@@ -0,0 +1,160 @@
+"""Deterministic synthetic workloads for the benchmark suite.
+
+Every generator takes (n, seed) and returns the same data for the same
+arguments, so timings are comparable across runs and against a saved
+baseline. Results are cached (models are treated as immutable), so a
+100k workload is built once per session, not once per benchmark. Events mix logistics scenarios, sources, liquidity levels and
+probabilities so each validation rule sees both passing and rejected
+inputs.
+"""
+
+import random
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+
+from omen.domain.models.common import EventId, GeoLocation, MarketId
+from omen.domain.models.enums import SignalStatus, SignalType
+from omen.domain.models.impact_hints import ImpactHints
+from omen.domain.models.omen_signal import (
+    ConfidenceLevel,
+    GeographicContext,
+    OmenSignal,
+    SignalCategory,
+    TemporalContext,
+)
+from omen.domain.models.raw_signal import MarketMetadata, RawSignalEvent
+from omen.domain.models.signal_event import SignalEvent
+
+# Fixed reference time: generated data must not depend on the clock
+EPOCH = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+# (title, description, keywords, (latitude, longitude, name))
+SCENARIOS = [
+    (
+        "Red Sea shipping disruption due to Houthi attacks",
+        "Carriers reroute container ships around the Cape of Good Hope",
+        ["red sea", "shipping", "houthi", "container"],
+        (15.5, 42.5, "Red Sea"),
+    ),
+    (
+        "Suez Canal transit delays exceed 48 hours",
+        "Congestion and convoy scheduling slow canal transits",
+        ["suez", "canal", "shipping", "delay"],
+        (30.5, 32.3, "Suez Canal"),
+    ),
+    (
+        "Panama Canal draft restrictions extended by drought",
+        "Low Gatun Lake levels force reduced daily transits",
+        ["panama", "canal", "drought", "freight"],
+        (9.1, -79.7, "Panama Canal"),
+    ),
+    (
+        "Port of Rotterdam dock workers strike",
+        "Terminal operations halted during labor dispute",
+        ["port", "strike", "rotterdam", "logistics"],
+        (51.9, 4.1, "Rotterdam"),
+    ),
+    (
+        "Typhoon forecast to close South China ports",
+        "Shenzhen and Hong Kong terminals prepare for closures",
+        ["typhoon", "port", "closure", "china"],
+        (22.3, 114.2, "Shenzhen"),
+    ),
+    (
+        "Strait of Hormuz tanker seizures escalate",
+        "Insurers raise war-risk premiums for Gulf transits",
+        ["hormuz", "tanker", "oil", "insurance"],
+        (26.6, 56.3, "Strait of Hormuz"),
+    ),
+    (
+        "Will the next presidential debate be rescheduled",
+        "Political market with no logistics relevance",
+        ["election", "debate"],
+        None,
+    ),
+]
+
+SOURCES = ["polymarket", "news", "ais", "commodity", "weather"]
+
+
+@lru_cache(maxsize=8)
+def raw_events(n: int, seed: int = 0) -> tuple[RawSignalEvent, ...]:
+    """n RawSignalEvents drawn from SCENARIOS (~1 in 7 irrelevant, ~1 in 10 illiquid)."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        title, description, keywords, location = SCENARIOS[rng.randrange(len(SCENARIOS))]
+        liquidity = rng.choice([250.0, 5_000.0, 50_000.0, 500_000.0, 2_000_000.0])
+        observed_at = EPOCH + timedelta(seconds=i)
+        events.append(
+            RawSignalEvent(
+                event_id=EventId(f"bench-{seed}-{i:07d}"),
+                title=f"{title} ({i % 97})",
+                description=description,
+                probability=round(rng.uniform(0.05, 0.95), 4),
+                keywords=list(keywords),
+                inferred_locations=(
+                    [GeoLocation(latitude=location[0], longitude=location[1], name=location[2])]
+                    if location
+                    else []
+                ),
+                market=MarketMetadata(
+                    source=SOURCES[i % len(SOURCES)],
+                    market_id=MarketId(f"bench-market-{i % 500}"),
+                    total_volume_usd=liquidity * rng.uniform(2, 20),
+                    current_liquidity_usd=liquidity,
+                    num_traders=rng.randrange(10, 5000),
+                ),
+                observed_at=observed_at,
+            )
+        )
+    return tuple(events)
+
+
+@lru_cache(maxsize=8)
+def omen_signals(n: int, seed: int = 0, days: int = 1) -> tuple[OmenSignal, ...]:
+    """n OmenSignals with distinct ids, spread evenly over `days` UTC days."""
+    rng = random.Random(seed)
+    categories = list(SignalCategory)
+    step = timedelta(days=days) / max(n, 1)
+    signals = []
+    for i in range(n):
+        generated_at = EPOCH + step * i
+        confidence = round(rng.uniform(0.3, 0.95), 4)
+        signals.append(
+            OmenSignal(
+                signal_id=f"OMEN-BENCH{seed:02d}{i:08d}",
+                source_event_id=f"bench-{seed}-{i:07d}",
+                trace_id=f"bench-trace-{seed}-{i}",
+                title=SCENARIOS[i % len(SCENARIOS)][0],
+                probability=round(rng.uniform(0.05, 0.95), 4),
+                probability_source=SOURCES[i % len(SOURCES)],
+                confidence_score=confidence,
+                confidence_level=ConfidenceLevel.from_score(confidence),
+                confidence_factors={},
+                category=categories[i % len(categories)],
+                geographic=GeographicContext(),
+                temporal=TemporalContext(),
+                impact_hints=ImpactHints(),
+                evidence=[],
+                ruleset_version="bench-1.0.0",
+                generated_at=generated_at,
+                signal_type=SignalType.UNCLASSIFIED,
+                status=SignalStatus.ACTIVE,
+            )
+        )
+    return tuple(signals)
+
+
+@lru_cache(maxsize=8)
+def signal_events(n: int, seed: int = 0, days: int = 1) -> tuple[SignalEvent, ...]:
+    """SignalEvents (ledger records) wrapping omen_signals(n, seed, days)."""
+    events = []
+    for signal in omen_signals(n, seed, days):
+        event = SignalEvent.from_omen_signal(
+            signal=signal,
+            input_event_hash=f"sha256:{signal.source_event_id}",
+            observed_at=signal.generated_at,
+        )
+        events.append(event.model_copy(update={"emitted_at": signal.generated_at}))
+    return tuple(events)
@@ -0,0 +1,59 @@
+"""Micro-benchmarks for memoized RawSignalEvent identity values.
+
+Run with: pytest tests/benchmarks/test_identity_hash_performance.py --benchmark-only --no-cov
+
+Compares the per-event cost of the identity reads made by one
+process_single call (Redis key, idempotency lookup, second Redis key,
+OmenSignal.from_validated_event) against recomputing the hash each time.
+"""
+
+import pytest
+
+from omen.adapters.inbound.stub_source import StubSignalSource
+from omen.domain.models.raw_signal import RawSignalEvent
+
+# Reads of input_event_hash per event on the process_single path
+READS_PER_EVENT = 4
+
+
+def _uncached_hash(event: RawSignalEvent) -> str:
+    return RawSignalEvent.input_event_hash.func(event)
+
+
+class TestIdentityHashPerformance:
+    """Memoized vs recomputed input_event_hash."""
+
+    def test_hash_reads_memoized(self, benchmark) -> None:
+        template = StubSignalSource.create_red_sea_event()
+
+        def run() -> None:
+            event = template.model_copy(update={"probability": 0.5})
+            for _ in range(READS_PER_EVENT):
+                event.input_event_hash
+
+        benchmark(run)
+
+    def test_hash_reads_recomputed(self, benchmark) -> None:
+        template = StubSignalSource.create_red_sea_event()
+
+        def run() -> None:
+            event = template.model_copy(update={"probability": 0.5})
+            for _ in range(READS_PER_EVENT):
+                _uncached_hash(event)
+
+        benchmark(run)
+
+    def test_memoized_hash_matches_recomputed(self) -> None:
+        event = StubSignalSource.create_red_sea_event()
+        assert event.input_event_hash == _uncached_hash(event)
+
+    @pytest.mark.parametrize("dumps", [3])
+    def test_model_dump_memoized(self, benchmark, dumps: int) -> None:
+        template = StubSignalSource.create_red_sea_event()
+
+        def run() -> None:
+            event = template.model_copy(update={"probability": 0.5})
+            for _ in range(dumps):
+                event.model_dump(mode="json")
+
+        benchmark(run)
@@ -0,0 +1,287 @@
+"""I/O path benchmarks: ledger, emitter, RiskCast ingest, reconcile, fan-out, API.
+
+Run with:
+  pytest tests/benchmarks/test_io_performance.py -c pytest_benchmark.ini --benchmark-only
+  OMEN_BENCH_SCALES=1000,10000,100000 make bench
+
+Real files and SQLite databases under tmp_path; RiskCast HTTP is served
+in-process (httpx.MockTransport / ASGITransport), so timings cover
+serialization, storage and concurrency but not the network. Stateful
+benchmarks build a fresh target per round in an untimed setup step.
+"""
+
+import asyncio
+import itertools
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from omen.adapters.persistence.in_memory_repository import InMemorySignalRepository
+from omen.api.routes.signals import list_signals
+from omen.infrastructure.emitter import EmitStatus, SignalEmitter
+from omen.infrastructure.ledger import AsyncLedgerWriter, LedgerReader, LedgerWriter
+from omen.infrastructure.realtime.redis_pubsub import RedisPubSubManager
+from omen.infrastructure.security.unified_auth import AuthContext
+from riskcast.api.app import app as riskcast_app
+from riskcast.api.routes.ingest import MAX_BATCH_SIZE
+from riskcast.infrastructure.reconcile_state import ReconcileStateStore
+from riskcast.infrastructure.signal_store import SignalStore
+from riskcast.jobs.reconcile_job import LedgerClient, ReconcileJob, ReconcileStatus
+
+from .synthetic import EPOCH, omen_signals, signal_events
+
+# Deselected by the default -m "not performance"; run via pytest_benchmark.ini
+pytestmark = pytest.mark.performance
+
+PARTITION = EPOCH.date().isoformat()
+ROUNDS = 3
+FANOUT_MESSAGES = 10
+
+
+def _ack(request: httpx.Request) -> httpx.Response:
+    """RiskCast stand-in: accept every signal."""
+    return httpx.Response(200, json={"ack_id": "bench-ack"})
+
+
+class _FakeWebSocket:
+    """Starlette WebSocket stand-in that encodes like the real one and drops the frame."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def send_text(self, data: str) -> None:
+        self.sent += 1
+
+    async def send_json(self, data: Any) -> None:
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+@pytest.fixture
+def round_dirs(tmp_path: Path):
+    """Fresh directory per benchmark round."""
+    counter = itertools.count()
+    return lambda: tmp_path / f"round-{next(counter)}"
+
+
+@pytest.fixture
+def sealed_ledger(tmp_path: Path, scale: int) -> Path:
+    """A ledger holding one sealed partition of `scale` events."""
+    writer = LedgerWriter(tmp_path / "sealed-ledger")
+    writer.write_batch(signal_events(scale))
+    writer.seal_partition(PARTITION)
+    writer.close()
+    return writer.base_path
+
+
+class TestLedgerPerformance:
+    """Ledger write, read and seal."""
+
+    def test_write_batch(self, scale: int, round_dirs, benchmark) -> None:
+        events = signal_events(scale)
+        benchmark.extra_info["events"] = scale
+
+        def setup():
+            return (LedgerWriter(round_dirs()),), {}
+
+        def run(writer: LedgerWriter) -> None:
+            results = writer.write_batch(events)
+            writer.close()
+            assert len(results) == scale
+
+        benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+
+    def test_read_partition(self, scale: int, sealed_ledger: Path, benchmark) -> None:
+        reader = LedgerReader(sealed_ledger)
+        benchmark.extra_info["events"] = scale
+
+        def run() -> int:
+            return sum(1 for _ in reader.read_partition(PARTITION))
+
+        assert benchmark(run) == scale
+
+    def test_seal_partition(self, scale: int, round_dirs, benchmark) -> None:
+        events = signal_events(scale)
+        benchmark.extra_info["events"] = scale
+
+        def setup():
+            writer = LedgerWriter(round_dirs())
+            writer.write_batch(events)
+            return (writer,), {}
+
+        def run(writer: LedgerWriter) -> None:
+            writer.seal_partition(PARTITION)
+            writer.close()
+
+        benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+
+
+class TestEmitterPerformance:
+    """SignalEmitter.emit: ledger write (async writer) plus hot path push."""
+
+    def test_emit_concurrent(self, scale: int, round_dirs, benchmark) -> None:
+        signals = omen_signals(scale)
+        benchmark.extra_info["events"] = scale
+
+        async def emit_all(base: Path) -> list:
+            ledger = AsyncLedgerWriter(LedgerWriter(base))
+            emitter = SignalEmitter(ledger, "http://riskcast", "bench-key")
+            emitter._client = httpx.AsyncClient(transport=httpx.MockTransport(_ack))
+            try:
+                return await asyncio.gather(
+                    *(
+                        emitter.emit(
+                            signal,
+                            input_event={"event_id": signal.source_event_id},
+                            observed_at=signal.generated_at,
+                        )
+                        for signal in signals
+                    )
+                )
+            finally:
+                await emitter.close()
+                await ledger.flush_and_close()
+
+        def setup():
+            return (round_dirs(),), {}
+
+        def run(base: Path) -> None:
+            results = asyncio.run(emit_all(base))
+            assert all(r.status == EmitStatus.DELIVERED for r in results)
+
+        benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+
+
+class TestRiskCastPerformance:
+    """RiskCast batch ingest endpoint and reconcile replay."""
+
+    def test_batch_ingest(self, scale: int, round_dirs, benchmark) -> None:
+        payloads = [event.model_dump(mode="json") for event in signal_events(scale)]
+        batches = [
+            {"events": payloads[i : i + MAX_BATCH_SIZE]}
+            for i in range(0, len(payloads), MAX_BATCH_SIZE)
+        ]
+        benchmark.extra_info["events"] = scale
+
+        async def ingest_all(db_path: Path) -> int:
+            store = SignalStore(db_path)
+            accepted = 0
+            try:
+                with patch("riskcast.api.routes.ingest.get_store", return_value=store):
+                    async with httpx.AsyncClient(
+                        transport=httpx.ASGITransport(app=riskcast_app),
+                        base_url="http://testserver",
+                    ) as client:
+                        for batch in batches:
+                            response = await client.post(
+                                "/api/v1/signals/ingest/batch", json=batch
+                            )
+                            accepted += sum(
+                                r["status_code"] == 200 for r in response.json()["results"]
+                            )
+            finally:
+                await store.close()
+            return accepted
+
+        def setup():
+            directory = round_dirs()
+            directory.mkdir()
+            return (directory / "signals.db",), {}
+
+        def run(db_path: Path) -> None:
+            assert asyncio.run(ingest_all(db_path)) == scale
+
+        benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+
+    def test_reconcile_partition(
+        self, scale: int, sealed_ledger: Path, round_dirs, benchmark
+    ) -> None:
+        benchmark.extra_info["events"] = scale
+        real_client = httpx.AsyncClient
+
+        async def reconcile(directory: Path):
+            job = ReconcileJob(
+                ledger_client=LedgerClient(str(sealed_ledger)),
+                signal_store=SignalStore(directory / "signals.db"),
+                reconcile_store=ReconcileStateStore(directory / "reconcile.db"),
+                riskcast_ingest_url="http://riskcast/api/v1/signals/ingest",
+                api_key="bench-key",
+                max_replay_batch=scale,
+            )
+            with patch(
+                "riskcast.jobs.reconcile_job.httpx.AsyncClient",
+                side_effect=lambda **kw: real_client(transport=httpx.MockTransport(_ack), **kw),
+            ):
+                return await job.reconcile_partition(PARTITION)
+
+        def setup():
+            directory = round_dirs()
+            directory.mkdir()
+            return (directory,), {}
+
+        def run(directory: Path) -> None:
+            result = asyncio.run(reconcile(directory))
+            assert result.status == ReconcileStatus.COMPLETED
+            assert result.replayed_count == scale
+
+        benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+
+
+class TestRealtimePerformance:
+    """WebSocket fan-out: FANOUT_MESSAGES signals broadcast to `scale` connections."""
+
+    def test_broadcast_to_local(self, scale: int, benchmark) -> None:
+        manager = RedisPubSubManager(redis_url="redis://unused", instance_id="bench")
+        sockets = [_FakeWebSocket() for _ in range(scale)]
+        for ws in sockets:
+            manager.add_local_connection("signals", ws)
+        messages = [
+            {"type": "signal_emitted", "data": signal.model_dump(mode="json")}
+            for signal in omen_signals(FANOUT_MESSAGES)
+        ]
+        benchmark.extra_info["connections"] = scale
+
+        async def fan_out() -> int:
+            queued = sum([await manager.broadcast_to_local("signals", m) for m in messages])
+            await manager.fanout.drain("signals")  # time delivery, not just queuing
+            return queued
+
+        # One loop for every round: per-connection writer tasks live on it
+        loop = asyncio.new_event_loop()
+        try:
+            queued = benchmark(lambda: loop.run_until_complete(fan_out()))
+        finally:
+            manager.fanout.close()
+            loop.close()
+        assert queued == scale * FANOUT_MESSAGES
+        assert all(ws.sent > 0 for ws in sockets)
+
+
+class TestApiPerformance:
+    """GET /api/v1/signals first page against an in-memory repository."""
+
+    def test_list_signals_page(self, scale: int, benchmark) -> None:
+        repository = InMemorySignalRepository()
+        repository.save_many(omen_signals(scale))
+        auth = AuthContext(user_id="bench", scopes=["read:signals"])
+        benchmark.extra_info["stored"] = scale
+
+        def run() -> dict:
+            return asyncio.run(
+                list_signals(
+                    limit=100,
+                    offset=0,
+                    cursor=None,
+                    since=None,
+                    mode=None,
+                    view="full",
+                    repository=repository,
+                    auth=auth,
+                )
+            )
+
+        page = benchmark(run)
+        assert len(page["signals"]) == min(100, scale)
@@ -0,0 +1,79 @@
+"""Per-request cost of rate limiting as the configured limit grows.
+
+Run with:
+  pytest tests/benchmarks/test_rate_limit_performance.py -c pytest_benchmark.ini --benchmark-only
+
+Each round makes REQUESTS checks for one client whose window already
+holds `limit` requests (the steady state of a busy API key). The sliding
+window counter used by unified_auth.RateLimiter should cost the same at
+every limit; the previous per-request timestamp log grows with it.
+"""
+
+import time
+
+import pytest
+
+from omen.infrastructure.security.unified_auth import RateLimiter
+
+# Deselected by the default -m "not performance"; run via pytest_benchmark.ini
+pytestmark = pytest.mark.performance
+
+LIMITS = [100, 1_000, 10_000, 100_000]
+REQUESTS = 1_000
+WINDOW_SECONDS = 60
+
+
+class _SlidingLogRateLimiter:
+    """The timestamp-list limiter unified_auth.RateLimiter used to be."""
+
+    def __init__(self):
+        self._requests: dict[str, list[float]] = {}
+
+    def is_allowed(self, key: str, max_requests: int, window_seconds: int) -> bool:
+        now = time.time()
+        window_start = now - window_seconds
+        if key in self._requests:
+            self._requests[key] = [t for t in self._requests[key] if t > window_start]
+        else:
+            self._requests[key] = []
+        if len(self._requests[key]) >= max_requests:
+            return False
+        self._requests[key].append(now)
+        return True
+
+
+def _saturate(limiter: RateLimiter, limit: int) -> None:
+    """Fill the client's window up to `limit` requests."""
+    for _ in range(limit):
+        limiter.is_allowed("client", limit, WINDOW_SECONDS)
+
+
+class TestRateLimitPerformance:
+    """REQUESTS checks against a saturated window, per configured limit."""
+
+    @pytest.mark.parametrize("limit", LIMITS, ids=[f"limit{n}" for n in LIMITS])
+    def test_sliding_window_counter(self, limit: int, benchmark) -> None:
+        limiter = RateLimiter()
+        _saturate(limiter, limit)
+        benchmark.extra_info["limit"] = limit
+
+        def run() -> int:
+            return sum(
+                limiter.is_allowed("client", limit, WINDOW_SECONDS) for _ in range(REQUESTS)
+            )
+
+        benchmark(run)
+        assert limiter.get_stats()["total_entries"] == 1
+
+    @pytest.mark.parametrize("limit", LIMITS, ids=[f"limit{n}" for n in LIMITS])
+    def test_sliding_log(self, limit: int, benchmark) -> None:
+        limiter = _SlidingLogRateLimiter()
+        limiter._requests["client"] = [time.time()] * limit  # _saturate is O(limit^2) here
+        benchmark.extra_info["limit"] = limit
+
+        def run() -> int:
+            return sum(
+                limiter.is_allowed("client", limit, WINDOW_SECONDS) for _ in range(REQUESTS)
+            )
+
+        benchmark.pedantic(run, rounds=3)
@@ -0,0 +1,149 @@
+"""Per-stage benchmarks for the OMEN pipeline.
+
+Run with:
+  pytest tests/benchmarks/test_stage_performance.py -c pytest_benchmark.ini --benchmark-only
+  OMEN_BENCH_SCALES=1000,10000,100000 make bench
+
+Every benchmark processes `scale` synthetic events per round (see
+synthetic.py), so the stage costs are directly comparable with each
+other and across scales.
+"""
+
+import pytest
+
+from omen.domain.models.common import RulesetVersion
+from omen.domain.models.context import ProcessingContext
+from omen.domain.models.omen_signal import OmenSignal
+from omen.domain.models.raw_signal import RawSignalEvent
+from omen.domain.models.validated_signal import ValidatedSignal
+from omen.domain.services.event_fingerprint import EventFingerprintCache
+from omen.domain.services.signal_enricher import SignalEnricher
+from omen.domain.services.signal_validator import SignalValidator
+
+from .synthetic import raw_events
+
+# Deselected by the default -m "not performance"; run via pytest_benchmark.ini
+pytestmark = pytest.mark.performance
+
+RULESET = RulesetVersion("v1.0.0")
+RULE_NAMES = [rule.name for rule in SignalValidator.create_full().rules]
+
+
+def _validation_context(validated: ValidatedSignal) -> dict:
+    """Enricher input as OmenPipeline builds it (default source trust, no correlation)."""
+    return {
+        "confidence_factors": {
+            "liquidity": validated.liquidity_score,
+            "geographic": next(
+                (
+                    r.score
+                    for r in validated.validation_results
+                    if r.rule_name == "geographic_relevance"
+                ),
+                0.5,
+            ),
+            "source_reliability": 0.85,
+            "correlation_adjustment": 0.0,
+        },
+        "validation_results": validated.validation_results,
+    }
+
+
+@pytest.fixture
+def events(scale: int) -> tuple[RawSignalEvent, ...]:
+    return raw_events(scale)
+
+
+@pytest.fixture
+def validated(events) -> list[tuple[RawSignalEvent, ValidatedSignal]]:
+    """Events that pass the full validator, with their ValidatedSignal."""
+    outcomes = SignalValidator.create_full().validate_batch(
+        events, ProcessingContext.create(RULESET)
+    )
+    return [
+        (event, outcome.signal)
+        for event, outcome in zip(events, outcomes)
+        if outcome.passed
+    ]
+
+
+class TestValidationPerformance:
+    """Validation rules, one at a time and as the full validator."""
+
+    @pytest.mark.parametrize("rule_name", RULE_NAMES)
+    def test_rule(self, rule_name: str, events, benchmark) -> None:
+        rule = next(r for r in SignalValidator.create_full().rules if r.name == rule_name)
+        benchmark.extra_info["events"] = len(events)
+
+        def run() -> None:
+            for event in events:
+                rule.apply(event)
+
+        benchmark(run)
+
+    def test_validate_batch(self, events, benchmark) -> None:
+        validator = SignalValidator.create_full()
+        context = ProcessingContext.create(RULESET)
+        benchmark.extra_info["events"] = len(events)
+
+        outcomes = benchmark(validator.validate_batch, events, context)
+        assert len(outcomes) == len(events)
+
+
+class TestSignalBuildPerformance:
+    """Enrichment and OmenSignal construction for validated events."""
+
+    def test_enrich(self, validated, benchmark) -> None:
+        enricher = SignalEnricher()
+        inputs = [(event, _validation_context(signal)) for event, signal in validated]
+        benchmark.extra_info["events"] = len(inputs)
+
+        def run() -> list[dict]:
+            return [enricher.enrich(event, context) for event, context in inputs]
+
+        assert len(benchmark(run)) == len(inputs)
+
+    def test_from_validated_event(self, validated, benchmark) -> None:
+        enricher = SignalEnricher()
+        inputs = [
+            (signal, enricher.enrich(event, _validation_context(signal)))
+            for event, signal in validated
+        ]
+        benchmark.extra_info["events"] = len(inputs)
+
+        def run() -> list[OmenSignal]:
+            return [
+                OmenSignal.from_validated_event(signal, enrichment)
+                for signal, enrichment in inputs
+            ]
+
+        assert len(benchmark(run)) == len(inputs)
+
+
+class TestFingerprintCachePerformance:
+    """Cross-source fingerprint cache: insert and LSH similarity lookup."""
+
+    def test_add(self, events, benchmark) -> None:
+        benchmark.extra_info["events"] = len(events)
+
+        def run() -> EventFingerprintCache:
+            cache = EventFingerprintCache(max_size=len(events))
+            for event in events:
+                cache.add(event)
+            return cache
+
+        benchmark(run)
+
+    def test_find_similar(self, events, benchmark) -> None:
+        cache = EventFingerprintCache(max_size=len(events))
+        for event in events:
+            cache.add(event)
+        benchmark.extra_info["events"] = len(events)
+
+        def run() -> int:
+            return sum(
+                len(cache.find_similar(event, exclude_source=event.market.source))
+                for event in events
+            )
+
+        assert benchmark(run) > 0
@@ -8,6 +8,7 @@ All fixtures use current domain models:
 
 import os
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -29,6 +30,11 @@ os.environ.setdefault("OMEN_SECURITY_API_KEYS", "test-key-1,test-key-2,test-admi
 os.environ.setdefault("OMEN_SECURITY_RATE_LIMIT_ENABLED", "false")
 os.environ.setdefault("OMEN_SECURITY_JWT_ENABLED", "false")
 os.environ.setdefault("OMEN_SECURITY_CORS_ENABLED", "false")
+# Keep the audit file sink out of the working tree
+os.environ.setdefault(
+    "OMEN_AUDIT_LOG_PATH",
+    str(Path(tempfile.mkdtemp(prefix="omen-test-audit-")) / "audit.log"),
+)
 
 from omen.domain.models.common import (
     EventId,
@@ -115,3 +115,30 @@ async def test_concurrent_ingest_dedupe(tmp_path: Path):
     ids = await store.list_processed_ids(rec.emitted_at.date().isoformat())
     count = sum(1 for i in ids if i == "OMEN-CONCURRENT-DEDUPE")
     assert count == 1, f"DB must contain exactly 1 row for signal_id, got {count}"
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_per_item_ack_and_duplicate(tmp_path: Path):
+    """Batch ingest: per-item 200/409/400 with original ack_id for duplicates."""
+    store = SignalStore(tmp_path / "signals.db")
+    existing = _make_event_payload("OMEN-BATCH-EXISTING")
+    fresh = _make_event_payload("OMEN-BATCH-NEW")
+
+    with patch("riskcast.api.routes.ingest.get_store", return_value=store):
+        transport = ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            first = await client.post("/api/v1/signals/ingest", json=existing)
+            assert first.status_code == 200
+            response = await client.post(
+                "/api/v1/signals/ingest/batch",
+                json={"events": [existing, fresh, {"signal_id": "OMEN-BAD"}]},
+            )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status_code"] for r in results] == [409, 200, 400]
+    assert results[0]["ack_id"] == first.json()["ack_id"]
+    assert results[0]["duplicate"] is True
+    assert results[2]["signal_id"] == "OMEN-BAD"
+    rec = await store.get_by_signal_id("OMEN-BATCH-NEW")
+    assert rec is not None and rec.ack_id == results[1]["ack_id"]
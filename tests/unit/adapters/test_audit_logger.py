@@ -0,0 +1,124 @@
+"""
+Tests for batched audit writes (executemany argument shaping).
+
+Uses a fake asyncpg connection; no database is required.
+"""
+
+import json
+import re
+from uuid import uuid4
+
+import pytest
+
+from omen.adapters.persistence.audit_logger import (
+    AuditEntry,
+    AuditLogger,
+    OperationType,
+    _INSERT_ATTESTATION_SQL,
+    _INSERT_ENTRY_SQL,
+    _attestation_args,
+    _entry_args,
+    log_attestations,
+)
+from omen.domain.models.attestation import SignalAttestation, SourceType
+
+
+class _FakeConn:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches: list[tuple[str, list]] = []
+
+    async def executemany(self, query, args):
+        if self.fail:
+            raise RuntimeError("connection lost")
+        self.batches.append((query, list(args)))
+
+
+def _placeholders(sql: str) -> int:
+    return len(set(re.findall(r"\$(\d+)", sql)))
+
+
+def _entry(target_id: str, **overrides) -> AuditEntry:
+    fields = dict(
+        operation_type=OperationType.UPSERT,
+        target_schema="live",
+        target_id=target_id,
+        new_value={"signal_id": target_id},
+        attestation_id=uuid4(),
+        source_type="REAL",
+        trace_id="req-1",
+        performed_by="system",
+    )
+    fields.update(overrides)
+    return AuditEntry(**fields)
+
+
+def test_entry_args_match_insert_placeholders():
+    entry = _entry("OMEN-A1", old_value={"v": 1}, metadata={"batch": 2})
+    args = _entry_args(entry)
+
+    assert len(args) == _placeholders(_INSERT_ENTRY_SQL)
+    assert args[0] == entry.id
+    assert args[3] == "UPSERT"
+    assert args[4:7] == ("live", "signals", "OMEN-A1")
+    assert json.loads(args[10]) == {"v": 1}
+    assert json.loads(args[11]) == {"signal_id": "OMEN-A1"}
+    assert args[12] == entry.attestation_id
+    assert args[13] == "REAL"
+    assert json.loads(args[15]) == {"batch": 2}
+    assert args[16] == entry.logged_at
+
+
+def test_entry_args_empty_values_are_null():
+    args = _entry_args(_entry("OMEN-A1", new_value=None))
+    assert args[10] is None and args[11] is None and args[15] is None
+
+
+def test_attestation_args_match_insert_placeholders():
+    attestation = SignalAttestation(signal_id="OMEN-A1", source_id="mock-feed")
+    args = _attestation_args(attestation)
+
+    assert len(args) == _placeholders(_INSERT_ATTESTATION_SQL)
+    assert args[:4] == (attestation.id, "OMEN-A1", "mock-feed", SourceType.MOCK.value)
+
+
+@pytest.mark.asyncio
+async def test_write_entries_is_one_executemany():
+    conn = _FakeConn()
+    entries = [_entry("OMEN-A1"), _entry("OMEN-B2")]
+
+    await AuditLogger(conn).write_entries(entries)
+
+    (query, rows), = conn.batches
+    assert query == _INSERT_ENTRY_SQL
+    assert rows == [_entry_args(e) for e in entries]
+
+
+@pytest.mark.asyncio
+async def test_write_entries_empty_is_noop():
+    conn = _FakeConn()
+    await AuditLogger(conn).write_entries([])
+    assert conn.batches == []
+
+
+@pytest.mark.asyncio
+async def test_write_entries_swallows_errors_outside_development(monkeypatch):
+    monkeypatch.setenv("OMEN_ENV", "test")
+    await AuditLogger(_FakeConn(fail=True)).write_entries([_entry("OMEN-A1")])
+
+
+@pytest.mark.asyncio
+async def test_log_attestations_is_one_executemany_and_raises():
+    attestations = [
+        SignalAttestation(signal_id="OMEN-A1", source_id="mock-feed"),
+        SignalAttestation(signal_id="OMEN-B2", source_id="mock-feed"),
+    ]
+    conn = _FakeConn()
+    await log_attestations(conn, attestations)
+
+    (query, rows), = conn.batches
+    assert query == _INSERT_ATTESTATION_SQL
+    assert [r[1] for r in rows] == ["OMEN-A1", "OMEN-B2"]
+
+    with pytest.raises(RuntimeError):
+        await log_attestations(_FakeConn(fail=True), attestations)
@@ -0,0 +1,110 @@
+"""
+Tests for InMemorySignalRepository: time-ordered index, upserts, keyset pages.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omen.adapters.persistence.in_memory_repository import InMemorySignalRepository
+from omen.api.pagination import CursorData, cursor_keyset, decode_cursor, encode_cursor
+from omen.application.ports.signal_repository import SignalRepository
+from omen.domain.models.omen_signal import OmenSignal
+
+
+BASE = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def template(pipeline, high_quality_event) -> OmenSignal:
+    result = pipeline.process_single(high_quality_event)
+    assert result.signals
+    return result.signals[0]
+
+
+def _signal(template: OmenSignal, n: int, minutes: int, event: str | None = None) -> OmenSignal:
+    return template.model_copy(
+        update={
+            "signal_id": f"OMEN-{n:04d}",
+            "input_event_hash": f"hash-{n}",
+            "source_event_id": event or f"event-{n}",
+            "generated_at": BASE + timedelta(minutes=minutes),
+        }
+    )
+
+
+def test_find_recent_is_newest_first_with_offset_and_since(template):
+    repo = InMemorySignalRepository()
+    for n, minutes in enumerate([5, 1, 9, 3, 7]):
+        repo.save(_signal(template, n, minutes))
+
+    assert [s.signal_id for s in repo.find_recent()] == [
+        "OMEN-0002", "OMEN-0004", "OMEN-0000", "OMEN-0003", "OMEN-0001",
+    ]
+    assert [s.signal_id for s in repo.find_recent(limit=2, offset=1)] == [
+        "OMEN-0004", "OMEN-0000",
+    ]
+    since = BASE + timedelta(minutes=5)
+    assert [s.signal_id for s in repo.find_recent(since=since)] == [
+        "OMEN-0002", "OMEN-0004", "OMEN-0000",
+    ]
+    assert repo.count() == 5
+    assert repo.count(since=since) == 3
+    assert repo.find_recent(offset=10) == []
+
+
+def test_upsert_replaces_signal_in_every_index(template):
+    repo = InMemorySignalRepository()
+    repo.save(_signal(template, 1, 1, event="e"))
+    repo.save(_signal(template, 2, 2, event="e"))
+    moved = _signal(template, 1, 10, event="e").model_copy(update={"input_event_hash": "new"})
+    repo.save_many([moved])
+
+    assert repo.count() == 2
+    assert [s.signal_id for s in repo.find_recent()] == ["OMEN-0001", "OMEN-0002"]
+    assert repo.find_by_id("OMEN-0001").generated_at == moved.generated_at
+    assert repo.find_by_hash("hash-1") is None
+    assert repo.find_by_hash("new") is moved
+    assert sorted(s.signal_id for s in repo.find_by_event_id("e")) == ["OMEN-0001", "OMEN-0002"]
+
+
+def test_find_page_walks_keyset_cursors_without_gaps(template):
+    repo = InMemorySignalRepository()
+    # Two signals share a timestamp: ties are broken by signal_id
+    for n, minutes in enumerate([1, 2, 2, 3, 4, 5, 6]):
+        repo.save(_signal(template, n, minutes))
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page = repo.find_page(limit=3, after=after)
+        if not page:
+            break
+        seen.extend(s.signal_id for s in page)
+        last = page[-1]
+        cursor = encode_cursor(
+            CursorData(last_id=last.signal_id, last_timestamp=last.generated_at.isoformat())
+        )
+        after = cursor_keyset(decode_cursor(cursor))
+
+    assert seen == [s.signal_id for s in repo.find_recent()]
+    assert seen[-3:] == ["OMEN-0002", "OMEN-0001", "OMEN-0000"]
+
+
+def test_find_page_matches_port_default(template):
+    repo = InMemorySignalRepository()
+    for n in range(250):
+        repo.save(_signal(template, n, n % 40))
+    after = (BASE + timedelta(minutes=20), "OMEN-0100")
+    since = BASE + timedelta(minutes=5)
+
+    expected = SignalRepository.find_page(repo, limit=30, after=after, since=since)
+
+    assert repo.find_page(limit=30, after=after, since=since) == expected
+    assert len(expected) == 30
+
+
+def test_cursor_keyset_rejects_incomplete_cursor():
+    assert cursor_keyset(None) is None
+    assert cursor_keyset(CursorData(last_id="OMEN-1")) is None
+    assert cursor_keyset(CursorData(last_id="OMEN-1", last_timestamp="nope")) is None
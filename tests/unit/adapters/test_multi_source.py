@@ -0,0 +1,179 @@
+"""
+Tests for MultiSourceAggregator.fetch_all_async: concurrency, deadlines, merge order.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from omen.adapters.inbound.multi_source import MultiSourceAggregator, SourceConfig
+from omen.application.ports.signal_source import SignalSource
+from omen.domain.models.raw_signal import MarketMetadata, RawSignalEvent
+
+
+BASE = datetime(2026, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _event(source: str, minutes: int) -> RawSignalEvent:
+    return RawSignalEvent(
+        event_id=f"{source}-{minutes}",
+        title=f"{source} event {minutes}",
+        probability=0.5,
+        observed_at=BASE + timedelta(minutes=minutes),
+        market=MarketMetadata(
+            source=source,
+            market_id=f"m-{source}-{minutes}",
+            total_volume_usd=100000.0,
+            current_liquidity_usd=10000.0,
+        ),
+    )
+
+
+class _FakeSource(SignalSource):
+    def __init__(self, name: str, minutes: list[int], delay: float = 0.0):
+        self.name = name
+        self.minutes = minutes
+        self.delay = delay
+        self.fail = False
+        self.calls = 0
+
+    @property
+    def source_name(self) -> str:
+        return self.name
+
+    def fetch_events(self, limit: int = 100) -> Iterator[RawSignalEvent]:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        return iter([_event(self.name, m) for m in self.minutes[:limit]])
+
+    async def fetch_events_async(self, limit: int = 100) -> AsyncIterator[RawSignalEvent]:
+        await asyncio.sleep(self.delay)
+        for m in self.minutes[:limit]:
+            yield _event(self.name, m)
+
+    def fetch_by_id(self, market_id: str) -> RawSignalEvent | None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_async_runs_sources_concurrently_and_merges_newest_first():
+    aggregator = MultiSourceAggregator()
+    aggregator.register_source(_FakeSource("a", [5, 1, 9], delay=0.2))
+    aggregator.register_source(_FakeSource("b", [3, 7], delay=0.2))
+    aggregator.register_source(
+        _FakeSource("c", [8, 2], delay=0.2),
+        SourceConfig(name="c", native_async=True),
+    )
+
+    started = time.monotonic()
+    events = await aggregator.fetch_all_async()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [e.event_id for e in events] == ["a-9", "c-8", "b-7", "a-5", "b-3", "c-2", "a-1"]
+
+
+@pytest.mark.asyncio
+async def test_merge_matches_sync_fetch_all_including_ties():
+    aggregator = MultiSourceAggregator()
+    aggregator.register_source(_FakeSource("a", [4, 2, 4]))
+    aggregator.register_source(_FakeSource("b", [4, 3]))
+
+    assert [e.event_id for e in await aggregator.fetch_all_async()] == [
+        e.event_id for e in aggregator.fetch_all()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_deadline_falls_back_to_stale_cache_and_late_result_refreshes_it():
+    slow = _FakeSource("slow", [1, 2])
+    aggregator = MultiSourceAggregator()
+    aggregator.register_source(_FakeSource("fast", [3]))
+    aggregator.register_source(slow, SourceConfig(name="slow", timeout_seconds=0.1))
+
+    await aggregator.fetch_all_async()
+    slow.minutes = [10]
+    slow.delay = 0.3
+    events, results = await aggregator.fetch_all_with_metadata_async()
+
+    assert results["fast"].is_fallback is False
+    assert results["slow"].is_fallback is True
+    assert "deadline" in results["slow"].fallback_reason
+    assert [e.event_id for e in events] == ["fast-3", "slow-2", "slow-1"]
+
+    await asyncio.sleep(0.4)
+    cached = aggregator._fallback_caches["slow"].get_stale("slow_events_50")
+    assert [e.event_id for e in cached.data] == ["slow-10"]
+
+
+@pytest.mark.asyncio
+async def test_failed_source_without_cache_reports_unavailable():
+    broken = _FakeSource("broken", [1])
+    broken.fail = True
+    aggregator = MultiSourceAggregator()
+    aggregator.register_source(broken)
+    aggregator.register_source(_FakeSource("ok", [2]))
+
+    events, results = await aggregator.fetch_all_with_metadata_async()
+
+    assert [e.event_id for e in events] == ["ok-2"]
+    assert results["broken"].data_freshness == "unavailable"
+    assert results["broken"].fallback_reason.startswith("No cache")
+
+
+@pytest.mark.asyncio
+async def test_sync_sources_share_bounded_pool():
+    peak = 0
+    in_flight = 0
+    lock = threading.Lock()
+
+    class _Counting(_FakeSource):
+        def fetch_events(self, limit: int = 100):
+            nonlocal peak, in_flight
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                return super().fetch_events(limit)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+    aggregator = MultiSourceAggregator(max_fetch_workers=2)
+    for i in range(5):
+        aggregator.register_source(_Counting(f"s{i}", [i], delay=0.05))
+
+    events = await aggregator.fetch_all_async(sources=["s0", "s1", "s2", "s3"])
+
+    assert peak == 2
+    assert [e.event_id for e in events] == ["s3-3", "s2-2", "s1-1", "s0-0"]
+
+
+@pytest.mark.asyncio
+async def test_multi_source_signals_route_awaits_concurrent_fetch(monkeypatch):
+    from omen.api.routes import multi_source as route
+
+    aggregator = MultiSourceAggregator()
+    for name in ("a", "b", "c"):
+        aggregator.register_source(_FakeSource(name, [1], delay=0.2))
+
+    def _blocking_fetch_all(*args, **kwargs):
+        raise AssertionError("route must not call the blocking fetch_all")
+
+    monkeypatch.setattr(aggregator, "fetch_all", _blocking_fetch_all)
+    monkeypatch.setattr(route, "get_multi_source_aggregator", lambda: aggregator)
+
+    started = time.monotonic()
+    response = await route.get_multi_source_signals(
+        limit_per_source=20, sources="a,b,c", auth=None
+    )
+
+    assert time.monotonic() - started < 0.5
+    assert response.total == 3
+    assert response.by_source == {"a": 1, "b": 1, "c": 1}
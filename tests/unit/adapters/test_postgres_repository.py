@@ -0,0 +1,362 @@
+"""
+Tests for PostgresSignalRepository query building and row mapping.
+
+Uses a fake asyncpg pool; no database is required.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from omen.adapters.persistence.postgres_repository import (
+    SCHEMA_SIGNAL_COLUMNS,
+    SIGNAL_COLUMNS,
+    PostgresSignalRepository,
+    SignalSummary,
+    _last_per_signal_id,
+    _schema_signal_row,
+    _signal_filters,
+    _signal_row,
+    _where,
+)
+from omen.adapters.persistence.schema_router import GateCheckResult, GateStatus, Schema
+from omen.domain.models.attestation import SignalAttestation, SourceType, VerificationMethod
+from omen.domain.models.omen_signal import (
+    ConfidenceLevel,
+    EvidenceItem,
+    GeographicContext,
+    OmenSignal,
+    SignalCategory,
+    TemporalContext,
+)
+
+
+T0 = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+class _FakeConn:
+    def __init__(self, rows=None, value=None):
+        self.rows = rows or []
+        self.value = value
+        self.calls: list[tuple[str, str, tuple]] = []
+        self.copied: list[tuple[str, list, list]] = []
+        self.transactions = 0
+
+    async def fetch(self, query, *args):
+        self.calls.append(("fetch", query, args))
+        return self.rows
+
+    async def fetchval(self, query, *args):
+        self.calls.append(("fetchval", query, args))
+        return self.value
+
+    async def execute(self, query, *args):
+        self.calls.append(("execute", query, args))
+
+    async def executemany(self, query, args):
+        self.calls.append(("executemany", query, tuple(args)))
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.append((table, list(records), list(columns)))
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+
+class _FakePool:
+    def __init__(self, conn: _FakeConn):
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def _repo(conn: _FakeConn) -> PostgresSignalRepository:
+    repo = PostgresSignalRepository(dsn="postgresql://test")
+    repo._pool = _FakePool(conn)
+    repo._initialized = True
+    return repo
+
+
+def _signal(signal_id: str = "OMEN-A1", title: str = "Red Sea disruption") -> OmenSignal:
+    return OmenSignal(
+        signal_id=signal_id,
+        source_event_id="poly-1",
+        title=title,
+        description="Shipping risk",
+        probability=0.7,
+        probability_source="polymarket",
+        probability_is_estimate=False,
+        confidence_score=0.8,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_factors={"liquidity": 0.9},
+        category=SignalCategory.GEOPOLITICAL,
+        tags=["red-sea"],
+        keywords_matched=[],
+        geographic=GeographicContext(regions=["Red Sea"], chokepoints=[]),
+        temporal=TemporalContext(event_horizon=None, resolution_date=None),
+        evidence=[EvidenceItem(source="Polymarket", source_type="market", url=None)],
+        validation_scores=[],
+        trace_id="trace-1",
+        ruleset_version="1.0.0",
+        source_url=None,
+        generated_at=T0,
+    )
+
+
+def _attestation(signal_id: str, source_type: SourceType = SourceType.REAL) -> SignalAttestation:
+    return SignalAttestation(
+        signal_id=signal_id,
+        source_id="polymarket",
+        source_type=source_type,
+        verification_method=(
+            VerificationMethod.API_RESPONSE_HASH
+            if source_type == SourceType.REAL
+            else VerificationMethod.MOCK_SOURCE_REGISTRY
+        ),
+        api_response_hash="sha256:abc",
+    )
+
+
+def _summary_row(**overrides) -> dict:
+    row = {
+        "signal_id": "OMEN-A1",
+        "generated_at": T0,
+        "title": "Red Sea disruption",
+        "probability": 0.7,
+        "confidence_score": 0.8,
+        "confidence_level": "HIGH",
+        "signal_type": "GEOPOLITICAL_CONFLICT",
+        "status": "ACTIVE",
+        "category": "GEOPOLITICAL",
+    }
+    row.update(overrides)
+    return row
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Keyset SQL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def test_signal_filters_empty():
+    conditions, params = _signal_filters()
+    assert conditions == []
+    assert params == []
+    assert _where(conditions) == ""
+
+
+def test_signal_filters_numbers_params_in_order():
+    conditions, params = _signal_filters(
+        source_type=SourceType.REAL,
+        signal_type="PRICE_MOVEMENT",
+        since=T0,
+        after=(T0, "OMEN-Z9"),
+    )
+    assert conditions == [
+        "source_type = $1::source_type",
+        "signal_type = $2",
+        "generated_at >= $3",
+        "(generated_at, signal_id) < ($4, $5)",
+    ]
+    assert params == [SourceType.REAL.value, "PRICE_MOVEMENT", T0, T0, "OMEN-Z9"]
+    assert _where(conditions) == "WHERE " + " AND ".join(conditions)
+
+
+def test_signal_filters_keyset_only():
+    conditions, params = _signal_filters(after=(T0, "OMEN-Z9"))
+    assert _where(conditions) == "WHERE (generated_at, signal_id) < ($1, $2)"
+    assert params == [T0, "OMEN-Z9"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SignalSummary
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def test_summary_from_schema_row():
+    summary = SignalSummary.from_row(_summary_row(source_type="REAL"))
+    assert summary.signal_id == "OMEN-A1"
+    assert summary.generated_at == T0
+    assert summary.source_type == "REAL"
+    assert summary.source_event_id is None
+    assert summary.trace_id is None
+
+
+def test_summary_from_omen_signals_row():
+    summary = SignalSummary.from_row(
+        _summary_row(source_event_id="poly-1", trace_id="abc123", probability_source="polymarket")
+    )
+    assert summary.source_type is None
+    assert summary.probability_source == "polymarket"
+    assert summary.source_event_id == "poly-1"
+    assert summary.trace_id == "abc123"
+    assert summary.confidence_level == "HIGH"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Summary page and counts
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_find_summaries_async_seeks_past_cursor():
+    conn = _FakeConn(rows=[_summary_row(source_event_id="poly-1", trace_id="t")])
+    summaries = await _repo(conn).find_summaries_async(limit=11, after=(T0, "OMEN-Z9"))
+
+    assert [s.signal_id for s in summaries] == ["OMEN-A1"]
+    _, query, args = conn.calls[0]
+    assert "payload" not in query
+    assert "FROM omen_signals" in query
+    assert "(generated_at, signal_id) < ($1, $2)" in query
+    assert "ORDER BY generated_at DESC, signal_id DESC" in query
+    assert "LIMIT $3" in query
+    assert args == (T0, "OMEN-Z9", 11)
+
+
+@pytest.mark.asyncio
+async def test_count_async_estimate_reads_plan():
+    conn = _FakeConn(value='[{"Plan": {"Plan Rows": 1234}}]')
+    assert await _repo(conn).count_async(since=T0, estimate=True) == 1234
+
+    _, query, args = conn.calls[0]
+    assert query.startswith("EXPLAIN (FORMAT JSON) SELECT 1 FROM omen_signals")
+    assert "generated_at >= $1" in query
+    assert args == (T0,)
+
+
+@pytest.mark.asyncio
+async def test_count_async_exact_by_default():
+    conn = _FakeConn(value=42)
+    assert await _repo(conn).count_async() == 42
+    assert conn.calls[0][1].strip() == "SELECT COUNT(*) FROM omen_signals"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Bulk save row builders
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def test_signal_row_matches_columns():
+    signal = _signal()
+    row = dict(zip(SIGNAL_COLUMNS, _signal_row(signal)))
+
+    assert len(_signal_row(signal)) == len(SIGNAL_COLUMNS)
+    assert row["signal_id"] == "OMEN-A1"
+    assert row["trace_id"] == "trace-1"
+    assert row["confidence_level"] == "HIGH"
+    assert row["category"] == "GEOPOLITICAL"
+    assert json.loads(row["tags"]) == ["red-sea"]
+    assert json.loads(row["geographic"])["regions"] == ["Red Sea"]
+    assert json.loads(row["evidence"])[0]["source"] == "Polymarket"
+    assert OmenSignal.model_validate_json(row["payload"]) == signal
+    assert row["generated_at"] == T0
+    assert row["probability_source"] == "polymarket"
+
+
+def test_signal_row_trace_id_override():
+    row = dict(zip(SIGNAL_COLUMNS, _signal_row(_signal(), trace_id="req-9")))
+    assert row["trace_id"] == "req-9"
+
+
+def test_schema_signal_row_inserts_attestation_columns():
+    signal = _signal()
+    attestation = _attestation(signal.signal_id)
+    values = _schema_signal_row(signal, attestation, trace_id="req-9")
+    row = dict(zip(SCHEMA_SIGNAL_COLUMNS, values))
+
+    assert len(values) == len(SCHEMA_SIGNAL_COLUMNS)
+    assert row["source_type"] == "REAL"
+    assert row["attestation_id"] == attestation.id
+    assert row["ingested_from"] == "polymarket"
+    assert row["api_response_hash"] == "sha256:abc"
+    assert row["trace_id"] == "req-9"
+    # Shared columns keep their values after the inserted ones; the schema
+    # tables have no probability_source column
+    base = dict(zip(SIGNAL_COLUMNS, _signal_row(signal, "req-9")))
+    assert "probability_source" not in row
+    assert all(row[c] == base[c] for c in SIGNAL_COLUMNS if c != "probability_source")
+
+
+def test_last_per_signal_id_keeps_last_occurrence():
+    rows = [("a", 1), ("b", 1), ("a", 2), ("c", 1), ("b", 2)]
+    assert _last_per_signal_id(rows) == [("a", 2), ("b", 2), ("c", 1)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Bulk saves
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_save_many_async_copies_deduped_rows_in_one_transaction():
+    conn = _FakeConn()
+    await _repo(conn).save_many_async(
+        [_signal("OMEN-A1", "first"), _signal("OMEN-B2"), _signal("OMEN-A1", "second")]
+    )
+
+    assert conn.transactions == 1
+    (table, records, columns), = conn.copied
+    assert table == "_signals_stage"
+    assert columns == list(SIGNAL_COLUMNS)
+    assert [(r[0], r[4]) for r in records] == [("OMEN-A1", "second"), ("OMEN-B2", "Red Sea disruption")]
+
+    statements = [q for kind, q, _ in conn.calls if kind == "execute"]
+    assert "CREATE TEMP TABLE _signals_stage ON COMMIT DROP" in statements[0]
+    assert "FROM omen_signals WITH NO DATA" in statements[0]
+    assert "INSERT INTO omen_signals" in statements[1]
+    assert "ON CONFLICT (signal_id) DO UPDATE SET payload = EXCLUDED.payload" in statements[1]
+
+
+@pytest.mark.asyncio
+async def test_save_many_async_empty_is_noop():
+    conn = _FakeConn()
+    await _repo(conn).save_many_async([])
+    assert conn.calls == [] and conn.copied == []
+
+
+@pytest.mark.asyncio
+async def test_save_many_with_attestation_routes_and_audits_per_schema():
+    conn = _FakeConn(rows=[{"signal_id": "OMEN-A1", "payload": '{"old": true}'}])
+    gate = GateCheckResult(
+        status=GateStatus.ALLOWED,
+        block_reasons=[],
+        real_source_count=1,
+        total_source_count=1,
+        real_source_ratio=1.0,
+        mock_sources=[],
+        real_sources=["polymarket"],
+        checked_at=T0,
+    )
+    items = [
+        (_signal("OMEN-A1"), _attestation("OMEN-A1", SourceType.REAL)),
+        (_signal("OMEN-B2"), _attestation("OMEN-B2", SourceType.MOCK)),
+        (_signal("OMEN-A1", "again"), _attestation("OMEN-A1", SourceType.REAL)),
+    ]
+
+    decisions = await _repo(conn).save_many_with_attestation(
+        items, gate_result=gate, trace_id="req-1", performed_by="test"
+    )
+
+    assert [d.schema for d in decisions] == [Schema.LIVE, Schema.DEMO, Schema.LIVE]
+    assert conn.transactions == 1
+
+    # One COPY per schema; the repeated signal_id keeps its last row
+    copied = {records[0][0]: records for _, records, _ in conn.copied}
+    assert len(conn.copied) == 2
+    assert [r[0] for r in copied["OMEN-A1"]] == ["OMEN-A1"]
+    assert copied["OMEN-A1"][0][SCHEMA_SIGNAL_COLUMNS.index("title")] == "again"
+
+    batches = [args for kind, q, args in conn.calls if kind == "executemany"]
+    # Attestations for live, attestations for demo, then all audit entries
+    assert [len(b) for b in batches] == [1, 1, 2]
+    audit_rows = {row[6]: row for row in batches[-1]}
+    assert json.loads(audit_rows["OMEN-A1"][10]) == {"old": True}
+    assert audit_rows["OMEN-B2"][10] is None
+    assert audit_rows["OMEN-A1"][2] == "req-1"
+    assert audit_rows["OMEN-A1"][4] == "live"
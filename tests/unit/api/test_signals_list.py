@@ -0,0 +1,175 @@
+"""
+Tests for the signals routes with an async (PostgreSQL-style) repository.
+
+The sync SignalRepository methods of PostgresSignalRepository wrap
+run_until_complete and cannot run inside the request's event loop, so the
+route must await the async methods instead.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omen.adapters.persistence.postgres_repository import SignalSummary
+from omen.api.pagination import decode_cursor
+from omen.api.routes.signals import _save_many, list_signals
+from omen.application.ports.signal_repository import AsyncSignalRepository
+from omen.domain.models.omen_signal import (
+    ConfidenceLevel,
+    GeographicContext,
+    OmenSignal,
+    SignalCategory,
+    TemporalContext,
+)
+
+
+T0 = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _signal(i: int) -> OmenSignal:
+    return OmenSignal(
+        signal_id=f"OMEN-{i:04d}",
+        source_event_id=f"poly-{i}",
+        title=f"Signal {i}",
+        probability=0.5,
+        probability_source="polymarket",
+        confidence_score=0.7,
+        confidence_level=ConfidenceLevel.MEDIUM,
+        confidence_factors={"liquidity": 0.7},
+        category=SignalCategory.ECONOMIC,
+        geographic=GeographicContext(),
+        temporal=TemporalContext(),
+        trace_id=f"trace-{i}",
+        ruleset_version="1.0.0",
+        generated_at=T0 - timedelta(minutes=i),
+    )
+
+
+def _summary(signal: OmenSignal) -> SignalSummary:
+    return SignalSummary(
+        signal_id=signal.signal_id,
+        generated_at=signal.generated_at,
+        title=signal.title,
+        probability=signal.probability,
+        confidence_score=signal.confidence_score,
+        confidence_level=signal.confidence_level.value,
+        signal_type=signal.signal_type.value,
+        status=signal.status.value,
+        category=signal.category.value,
+        source_event_id=signal.source_event_id,
+        trace_id=signal.trace_id,
+        probability_source=signal.probability_source,
+    )
+
+
+class _AsyncRepo:
+    """Async-only repository; any sync call fails the test."""
+
+    def __init__(self, signals: list[OmenSignal], estimate: int = 5000):
+        self.signals = signals
+        self.estimate = estimate
+        self.calls: list[tuple] = []
+
+    def _after(self, items, after):
+        if after is None:
+            return items
+        return [s for s in items if (s.generated_at, s.signal_id) < after]
+
+    async def save_async(self, signal):
+        raise AssertionError("unexpected save")
+
+    async def save_many_async(self, signals):
+        self.calls.append(("save_many_async", len(signals)))
+
+    async def find_by_id_async(self, signal_id):
+        return None
+
+    async def find_by_hash_async(self, input_event_hash):
+        return None
+
+    async def find_recent_async(self, limit=100, since=None, offset=0):
+        self.calls.append(("find_recent_async", limit, offset))
+        return self.signals[offset:offset + limit]
+
+    async def find_page_async(self, limit=100, after=None, since=None):
+        self.calls.append(("find_page_async", limit, after))
+        return self._after(self.signals, after)[:limit]
+
+    async def find_summaries_async(self, limit=100, after=None, since=None):
+        self.calls.append(("find_summaries_async", limit, after))
+        return [_summary(s) for s in self._after(self.signals, after)[:limit]]
+
+    async def count_async(self, since=None, estimate=False):
+        self.calls.append(("count_async", estimate))
+        return self.estimate if estimate else len(self.signals)
+
+    def __getattr__(self, name):
+        raise AssertionError(f"sync repository method called: {name}")
+
+
+async def _list(repo, **kwargs):
+    params = dict(limit=2, offset=0, cursor=None, since=None, mode=None, view="full")
+    params.update(kwargs)
+    return await list_signals(repository=repo, auth=None, **params)
+
+
+@pytest.mark.asyncio
+async def test_keyset_page_is_full_shape_with_exact_total():
+    repo = _AsyncRepo([_signal(i) for i in range(5)])
+    assert isinstance(repo, AsyncSignalRepository)
+
+    body = await _list(repo)
+
+    assert [s["signal_id"] for s in body["signals"]] == ["OMEN-0000", "OMEN-0001"]
+    assert body["total"] == 5
+    assert body["total_is_estimate"] is False
+    assert "confidence_factors" in body["signals"][0]
+    assert body["signals"][0]["data_provenance"]["provider_name"] == "polymarket"
+    assert repo.calls == [("find_page_async", 3, None), ("count_async", False)]
+
+    cursor = decode_cursor(body["next_cursor"])
+    assert cursor.last_id == "OMEN-0001"
+
+    second = await _list(repo, cursor=body["next_cursor"])
+    assert [s["signal_id"] for s in second["signals"]] == ["OMEN-0002", "OMEN-0003"]
+
+
+@pytest.mark.asyncio
+async def test_offset_and_keyset_pages_share_item_schema():
+    repo = _AsyncRepo([_signal(i) for i in range(5)])
+
+    first = await _list(repo)
+    offset = await _list(repo, offset=2)
+    live = await _list(repo, mode="live")
+
+    assert offset["total"] == 5 and offset["total_is_estimate"] is False
+    assert [s["signal_id"] for s in offset["signals"]] == ["OMEN-0002", "OMEN-0003"]
+    keys = set(first["signals"][0])
+    assert set(offset["signals"][0]) == keys
+    assert set(live["signals"][0]) == keys
+
+
+@pytest.mark.asyncio
+async def test_summary_view_is_opt_in_and_flags_estimate():
+    repo = _AsyncRepo([_signal(i) for i in range(5)], estimate=5000)
+
+    body = await _list(repo, view="summary")
+    offset = await _list(repo, view="summary", offset=2)
+
+    assert body["total"] == 5000
+    assert body["total_is_estimate"] is True
+    assert "confidence_factors" not in body["signals"][0]
+    assert body["signals"][0]["data_provenance"]["provider_name"] == "polymarket"
+    assert repo.calls[:2] == [("find_summaries_async", 3, None), ("count_async", True)]
+
+    # Offset pages in summary view keep the summary shape and an exact total
+    assert offset["total"] == 5 and offset["total_is_estimate"] is False
+    assert set(offset["signals"][0]) == set(body["signals"][0])
+    assert offset["signals"][0]["category"] == body["signals"][0]["category"] == "ECONOMIC"
+
+
+@pytest.mark.asyncio
+async def test_save_many_awaits_async_repository():
+    repo = _AsyncRepo([])
+    await _save_many(repo, [object(), object()])
+    assert repo.calls == [("save_many_async", 2)]
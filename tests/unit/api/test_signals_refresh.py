@@ -0,0 +1,101 @@
+"""
+Tests for POST /signals/refresh batch processing.
+
+The route must run the fetched events through SignalOnlyPipeline.process_batch
+(one validate_batch pass, one bulk idempotency lookup, one bulk save) rather
+than per-event processing.
+"""
+
+import pytest
+
+from omen.adapters.inbound.polymarket import source as polymarket_source
+from omen.adapters.persistence.in_memory_repository import InMemorySignalRepository
+from omen.api.routes.signals import refresh_live_signals
+from omen.application.signal_pipeline import SignalOnlyPipeline
+from omen.domain.rules.validation.liquidity_rule import LiquidityValidationRule
+from omen.domain.services.signal_enricher import SignalEnricher
+from omen.domain.services.signal_validator import SignalValidator
+
+
+class _CountingRepository(InMemorySignalRepository):
+    def __init__(self):
+        super().__init__()
+        self.calls: list[str] = []
+
+    def find_by_hash(self, input_event_hash):
+        raise AssertionError("per-event idempotency lookup")
+
+    def find_by_hashes(self, input_event_hashes):
+        self.calls.append("find_by_hashes")
+        return super().find_by_hashes(input_event_hashes)
+
+    def save(self, signal):
+        raise AssertionError("per-event save")
+
+    def save_many(self, signals):
+        self.calls.append("save_many")
+        super().save_many(signals)
+
+
+@pytest.fixture
+def events(high_quality_event, monkeypatch):
+    events = [
+        high_quality_event.model_copy(update={"event_id": f"refresh-{i}"}) for i in range(3)
+    ]
+
+    class _Source:
+        def __init__(self, logistics_only=False):
+            pass
+
+        def fetch_events(self, limit):
+            return iter(events)
+
+    monkeypatch.setattr(polymarket_source, "PolymarketSignalSource", _Source)
+    return events
+
+
+def _pipeline(monkeypatch) -> tuple[SignalOnlyPipeline, list[int]]:
+    validator = SignalValidator(rules=[LiquidityValidationRule(min_liquidity_usd=1000.0)])
+    batches: list[int] = []
+    validate_batch = validator.validate_batch
+
+    def counting_validate_batch(signals, context):
+        batches.append(len(signals))
+        return validate_batch(signals, context)
+
+    monkeypatch.setattr(validator, "validate_batch", counting_validate_batch)
+    monkeypatch.setattr(validator, "validate", None)  # per-event path must not run
+    return SignalOnlyPipeline(validator=validator, enricher=SignalEnricher()), batches
+
+
+async def _refresh(pipeline, repository):
+    return await refresh_live_signals(
+        limit=50, min_liquidity=1000, pipeline=pipeline, repository=repository, auth=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_takes_the_batch_path(events, monkeypatch):
+    pipeline, batches = _pipeline(monkeypatch)
+    repository = _CountingRepository()
+
+    body = await _refresh(pipeline, repository)
+
+    assert body["signals_created"] == 3
+    assert batches == [3]
+    assert repository.calls == ["find_by_hashes", "save_many"]
+    assert repository.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_already_stored_events(events, monkeypatch):
+    pipeline, batches = _pipeline(monkeypatch)
+    repository = _CountingRepository()
+    await _refresh(pipeline, repository)
+
+    body = await _refresh(pipeline, repository)
+
+    assert body["signals_created"] == 0
+    assert body["events_deduplicated"] == 3
+    assert batches == [3, 0]
+    assert repository.count() == 3
@@ -3,10 +3,12 @@
 import pytest
 
 from omen.application.pipeline import OmenPipeline, PipelineConfig
+from omen.application.signal_pipeline import SignalOnlyPipeline
 from omen.domain.services.signal_validator import SignalValidator
 from omen.domain.rules.validation.liquidity_rule import LiquidityValidationRule
 from omen.adapters.persistence.in_memory_repository import InMemorySignalRepository
 from omen.adapters.outbound.console_publisher import ConsolePublisher
+from omen.domain.services.signal_enricher import SignalEnricher
 
 
 def test_process_single_valid_event(pipeline, high_quality_event):
@@ -99,3 +101,156 @@ def test_deterministic_trace_id_is_stable(pipeline, high_quality_event):
     r2 = pipeline.process_single(high_quality_event)
     assert r1.signals and r2.signals
     assert r1.signals[0].trace_id == r2.signals[0].trace_id
+
+
+def _fresh_pipeline() -> OmenPipeline:
+    return OmenPipeline(
+        validator=SignalValidator(rules=[LiquidityValidationRule(min_liquidity_usd=1000.0)]),
+        enricher=SignalEnricher(),
+        repository=InMemorySignalRepository(),
+        publisher=ConsolePublisher(),
+        config=PipelineConfig.default(),
+        enable_correlation=False,
+    )
+
+
+def test_process_batch_matches_process_single(
+    high_quality_event, low_liquidity_event, processing_context
+):
+    """Batch path returns the same per-event outcome as the per-event path."""
+    events = [high_quality_event, low_liquidity_event, high_quality_event]
+
+    single = _fresh_pipeline()
+    expected = [single.process_single(e, context=processing_context) for e in events]
+    batch = _fresh_pipeline().process_batch(events, context=processing_context)
+
+    assert len(batch) == len(expected)
+    for got, want in zip(batch, expected):
+        assert got.success == want.success
+        assert got.cached == want.cached
+        assert [s.signal_id for s in got.signals] == [s.signal_id for s in want.signals]
+        assert [s.model_dump() for s in got.signals] == [s.model_dump() for s in want.signals]
+        assert [f.rule_name for f in got.validation_failures] == [
+            f.rule_name for f in want.validation_failures
+        ]
+
+
+def test_process_batch_uses_bulk_lookup_and_save(high_quality_event):
+    """Batch path does one idempotency lookup and one bulk persist per round."""
+    calls = {"find_by_hash": 0, "find_by_hashes": 0, "save": 0, "save_many": 0}
+
+    class CountingRepository(InMemorySignalRepository):
+        def find_by_hash(self, input_event_hash):
+            calls["find_by_hash"] += 1
+            return super().find_by_hash(input_event_hash)
+
+        def find_by_hashes(self, input_event_hashes):
+            calls["find_by_hashes"] += 1
+            return super().find_by_hashes(input_event_hashes)
+
+        def save(self, signal):
+            calls["save"] += 1
+            super().save(signal)
+
+        def save_many(self, signals):
+            calls["save_many"] += 1
+            super().save_many(signals)
+
+    events = [
+        high_quality_event.model_copy(update={"event_id": f"batch-{i}"}) for i in range(5)
+    ]
+    repo = CountingRepository()
+    pipeline = OmenPipeline(
+        validator=SignalValidator(rules=[LiquidityValidationRule(min_liquidity_usd=1000.0)]),
+        enricher=SignalEnricher(),
+        repository=repo,
+        config=PipelineConfig.default(),
+        enable_correlation=False,
+    )
+    results = pipeline.process_batch(events)
+
+    assert all(r.success and r.signals for r in results)
+    assert calls == {"find_by_hash": 0, "find_by_hashes": 1, "save": 0, "save_many": 1}
+    assert repo.count() == 5
+
+
+def _signal_only_pipeline() -> SignalOnlyPipeline:
+    return SignalOnlyPipeline(
+        validator=SignalValidator(rules=[LiquidityValidationRule(min_liquidity_usd=1000.0)]),
+        enricher=SignalEnricher(),
+    )
+
+
+def test_signal_only_batch_validates_once_and_matches_process(
+    high_quality_event, low_liquidity_event, processing_context
+):
+    """SignalOnlyPipeline.process_batch goes through validate_batch, not per-event validate."""
+    events = [high_quality_event, low_liquidity_event]
+    expected = [
+        _signal_only_pipeline().process(e, context=processing_context) for e in events
+    ]
+
+    pipeline = _signal_only_pipeline()
+    pipeline._validator.validate = None  # the batch path must not call it
+    batch = pipeline.process_batch(events, context=processing_context)
+
+    assert [r.success for r in batch] == [r.success for r in expected] == [True, False]
+    assert batch[0].signal.model_dump() == expected[0].signal.model_dump()
+    assert batch[1].rejection_reason == expected[1].rejection_reason
+
+
+def test_signal_only_batch_skips_existing_hashes(high_quality_event, low_liquidity_event):
+    stored = _signal_only_pipeline().process(high_quality_event).signal
+
+    results = _signal_only_pipeline().process_batch(
+        [high_quality_event, low_liquidity_event],
+        existing={high_quality_event.input_event_hash: stored},
+    )
+
+    assert results[0].deduplicated and results[0].signal is stored
+    assert not results[1].deduplicated and not results[1].success
+
+
+@pytest.mark.asyncio
+async def test_process_single_async_uses_async_repository(high_quality_event):
+    """Async path awaits AsyncSignalRepository methods instead of the blocking sync ones."""
+    calls = {"find_by_hash_async": 0, "save_async": 0}
+
+    class AsyncOnlyRepository(InMemorySignalRepository):
+        def find_by_hash(self, input_event_hash):
+            raise AssertionError("sync find_by_hash called from the event loop")
+
+        def save(self, signal):
+            raise AssertionError("sync save called from the event loop")
+
+        async def save_async(self, signal):
+            calls["save_async"] += 1
+            super().save(signal)
+
+        async def find_by_id_async(self, signal_id):
+            return super().find_by_id(signal_id)
+
+        async def find_by_hash_async(self, input_event_hash):
+            calls["find_by_hash_async"] += 1
+            return super().find_by_hash(input_event_hash)
+
+        async def find_recent_async(self, limit=100, since=None):
+            return super().find_recent(limit=limit, since=since)
+
+    repo = AsyncOnlyRepository()
+    pipeline = OmenPipeline(
+        validator=SignalValidator(rules=[LiquidityValidationRule(min_liquidity_usd=1000.0)]),
+        enricher=SignalEnricher(),
+        repository=repo,
+        publisher=ConsolePublisher(),
+        config=PipelineConfig.default(),
+        enable_correlation=False,
+    )
+
+    r1 = await pipeline.process_single_async(high_quality_event)
+    r2 = await pipeline.process_single_async(high_quality_event)
+
+    assert r1.success and r1.signals and not r1.cached
+    assert r2.success and r2.cached
+    assert r2.signals[0].signal_id == r1.signals[0].signal_id
+    assert calls == {"find_by_hash_async": 2, "save_async": 1}
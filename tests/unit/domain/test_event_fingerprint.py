@@ -0,0 +1,136 @@
+"""
+Tests for EventFingerprintCache: LSH candidate lookup, similarity and eviction.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from omen.domain.models.raw_signal import RawSignalEvent, MarketMetadata
+from omen.domain.services.event_fingerprint import EventFingerprint, EventFingerprintCache
+
+
+OBSERVED_AT = datetime(2026, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _event(
+    event_id: str,
+    title: str,
+    source: str = "polymarket",
+    keywords: list[str] | None = None,
+) -> RawSignalEvent:
+    return RawSignalEvent(
+        event_id=event_id,
+        title=title,
+        probability=0.5,
+        keywords=keywords or [],
+        observed_at=OBSERVED_AT,
+        market=MarketMetadata(
+            source=source,
+            market_id=f"m-{event_id}",
+            total_volume_usd=100000.0,
+            current_liquidity_usd=10000.0,
+        ),
+    )
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock(datetime(2026, 2, 1, 12, 0, 0, tzinfo=timezone.utc))
+
+
+def _cache(clock: _Clock, **kwargs) -> EventFingerprintCache:
+    cache = EventFingerprintCache(**kwargs)
+    cache._now = clock
+    return cache
+
+
+def test_find_similar_reflects_content_overlap(clock):
+    cache = _cache(clock)
+    cache.add(_event("a", "Red Sea shipping disruption by Houthi attacks", keywords=["red sea", "shipping"]))
+    cache.add(_event("b", "Fed raises interest rates in March", keywords=["fed"]))
+
+    query = _event(
+        "q", "Houthi attacks cause Red Sea shipping disruption",
+        source="news", keywords=["red sea", "shipping"],
+    )
+    matches = cache.find_similar(query, min_similarity=0.6)
+
+    assert [m["event_id"] for m in matches] == ["a"]
+    expected = EventFingerprint.jaccard(
+        EventFingerprint.shingles(query),
+        EventFingerprint.shingles(_event("a", "Red Sea shipping disruption by Houthi attacks", keywords=["red sea", "shipping"])),
+    )
+    assert matches[0]["similarity"] == pytest.approx(expected)
+    assert set(matches[0]) == {"event_id", "source", "title", "similarity", "fingerprint"}
+
+
+def test_find_similar_excludes_source_and_self(clock):
+    cache = _cache(clock)
+    cache.add(_event("a", "Suez canal blocked by container ship", source="news"))
+    query = _event("q", "Suez canal blocked by container ship", source="news")
+    cache.add(query)
+
+    assert cache.find_similar(query, exclude_source="news") == []
+    assert [m["event_id"] for m in cache.find_similar(query)] == ["a"]
+
+
+def test_lsh_matches_brute_force_above_threshold(clock):
+    cache = _cache(clock, max_size=10_000)
+    words = [f"word{i}" for i in range(40)]
+    events = [
+        _event(f"e{i}", " ".join(words[(i * 3) % 30:(i * 3) % 30 + 8]), source=f"s{i % 3}")
+        for i in range(200)
+    ]
+    for event in events:
+        cache.add(event)
+
+    query = _event("q", " ".join(words[3:11]), source="other")
+    query_shingles = EventFingerprint.shingles(query)
+    expected = {
+        e.event_id for e in events
+        if EventFingerprint.jaccard(query_shingles, EventFingerprint.shingles(e)) >= 0.7
+    }
+
+    assert expected
+    assert {m["event_id"] for m in cache.find_similar(query, min_similarity=0.7)} == expected
+
+
+def test_size_bound_evicts_oldest_first(clock):
+    cache = _cache(clock, max_size=3)
+    for i in range(5):
+        cache.add(_event(f"e{i}", f"Port strike number {i} closes terminal"))
+        clock.now += timedelta(minutes=1)
+
+    assert cache.size == 3
+    assert set(cache._cache) == {"e2", "e3", "e4"}
+
+
+def test_expired_buckets_are_dropped(clock):
+    cache = _cache(clock, ttl_hours=24)
+    cache.add(_event("old", "Panama canal drought restricts transits"))
+    clock.now += timedelta(hours=30)
+    cache.add(_event("new", "Panama canal drought restricts transits"))
+
+    assert cache.size == 1
+    query = _event("q", "Panama canal drought restricts transits", source="news")
+    assert [m["event_id"] for m in cache.find_similar(query)] == ["new"]
+
+
+def test_readding_event_replaces_previous_entry(clock):
+    cache = _cache(clock)
+    cache.add(_event("a", "Rotterdam port congestion rises"))
+    cache.add(_event("a", "Singapore bunker prices spike"))
+
+    assert cache.size == 1
+    assert sum(len(ids) for ids in cache._fingerprint_to_events.values()) == 1
+    query = _event("q", "Rotterdam port congestion rises", source="news")
+    assert cache.find_similar(query) == []
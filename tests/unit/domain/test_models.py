@@ -90,3 +90,29 @@ def test_explanation_step():
     )
     assert step.rule_name == "test_rule"
     assert step.confidence_contribution == 0.9
+
+
+def test_raw_signal_identity_hash_is_memoized(high_quality_event):
+    """input_event_hash and search_text are computed once; copies with updates recompute."""
+    first = high_quality_event.input_event_hash
+    assert high_quality_event.__dict__["input_event_hash"] == first
+    assert high_quality_event.input_event_hash is first
+    assert high_quality_event.model_dump()["input_event_hash"] == first
+    assert high_quality_event.search_text == (
+        f"{high_quality_event.title} {high_quality_event.description or ''}".lower()
+    )
+
+    changed = high_quality_event.model_copy(update={"title": "Suez Canal closure"})
+    assert changed.input_event_hash != first
+    assert changed.search_text.startswith("suez canal closure")
+    assert high_quality_event.model_copy().input_event_hash == first
+
+    rebuilt = RawSignalEvent.model_validate(high_quality_event.model_dump())
+    assert rebuilt.input_event_hash == first
+
+    copied = high_quality_event.model_copy()
+    for name in ("input_event_hash", "search_text"):
+        copied.__dict__.pop(name, None)
+    assert "input_event_hash" not in copied.__dict__
+    # Memoized values live in __dict__ but do not take part in equality
+    assert copied == high_quality_event
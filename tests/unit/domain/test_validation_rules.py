@@ -91,3 +91,36 @@ def test_threshold_is_configurable(low_liquidity_event):
     loose = LiquidityValidationRule(min_liquidity_usd=10.0)
     assert strict.apply(low_liquidity_event).status == ValidationStatus.REJECTED_LOW_LIQUIDITY
     assert loose.apply(low_liquidity_event).status == ValidationStatus.PASSED
+
+
+def test_keyword_matcher_matches_regex_word_boundaries():
+    """Shared matcher reports the same whole-word hits as per-keyword \\b regexes."""
+    import re
+
+    from omen.domain.rules.validation.keywords import KeywordMatcher
+
+    vocabulary = ["port", "port said", "strait", "taiwan strait", "bab el-mandeb", "war"]
+    matcher = KeywordMatcher(vocabulary)
+    for text in [
+        "sport fans at port said",
+        "taiwan strait tension",
+        "bab el-mandeb closure",
+        "software warning: war",
+        "port_ and _port",
+    ]:
+        words = {kw for _, kw, whole in matcher.scan(text) if whole}
+        substrings = {kw for _, kw, _ in matcher.scan(text)}
+        assert words == {
+            kw for kw in vocabulary if re.search(r"\b" + re.escape(kw) + r"\b", text)
+        }
+        assert substrings == {kw for kw in vocabulary if kw in text}
+
+
+def test_get_matched_keywords_is_whole_word_and_ordered():
+    """Logistics keyword extraction ignores substrings and is deterministic."""
+    from omen.domain.rules.validation.keywords import get_matched_keywords
+
+    assert get_matched_keywords("Sports striker transfer") == []
+    first = get_matched_keywords("Red Sea shipping and port strike")
+    assert set(first) == {"red sea", "shipping", "port", "strike"}
+    assert first == get_matched_keywords("Red Sea shipping and port strike")
@@ -1,5 +1,6 @@
 """Unit tests for SignalEmitter (dual-path, ledger-first)."""
 
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -251,3 +252,171 @@ async def test_ledger_only_when_circuit_open(tmp_path: Path):
     assert "Circuit open" in (result.error or "")
     # Circuit was open: no additional HTTP call for second emit
     assert post_after == post_before
+
+
+@pytest.mark.asyncio
+async def test_batched_emit_sends_one_request_with_per_item_results(tmp_path: Path):
+    """Micro-batching: concurrent emits share one batch POST; 409 stays per item."""
+    import asyncio
+    import json
+
+    from omen.infrastructure.emitter import BatchConfig
+
+    ledger = LedgerWriter(tmp_path)
+    async with SignalEmitter(
+        ledger=ledger,
+        riskcast_url="http://localhost:9999",
+        api_key="test-key",
+        batch_config=BatchConfig(max_batch_size=3, max_delay_ms=1000),
+    ) as emitter:
+
+        async def batch_post(url, content, headers):
+            events = json.loads(content)["events"]
+            response = MagicMock()
+            response.status_code = 200
+            response.json = MagicMock(
+                return_value={
+                    "results": [
+                        {"signal_id": e["signal_id"], "status_code": 409, "ack_id": "orig"}
+                        if e["signal_id"] == "OMEN-B1"
+                        else {"signal_id": e["signal_id"], "status_code": 200, "ack_id": f"ack-{e['signal_id']}"}
+                        for e in events
+                    ]
+                }
+            )
+            return response
+
+        post = AsyncMock(side_effect=batch_post)
+        emitter._client.post = post
+
+        results = await asyncio.gather(
+            *[
+                emitter.emit(
+                    signal=_make_minimal_signal(f"OMEN-B{i}"),
+                    input_event={"i": i},
+                    observed_at=datetime.now(timezone.utc),
+                )
+                for i in range(3)
+            ]
+        )
+
+    assert post.await_count == 1
+    assert [r.status for r in results] == [
+        EmitStatus.DELIVERED,
+        EmitStatus.DUPLICATE,
+        EmitStatus.DELIVERED,
+    ]
+    assert results[0].hot_path_ack_id == "ack-OMEN-B0"
+    assert results[1].hot_path_ack_id == "orig"
+
+
+@pytest.mark.asyncio
+async def test_batched_emit_flushes_after_max_delay(tmp_path: Path):
+    """Micro-batching: a partial batch is pushed once max_delay_ms elapses."""
+    from omen.infrastructure.emitter import BatchConfig
+
+    ledger = LedgerWriter(tmp_path)
+    async with SignalEmitter(
+        ledger=ledger,
+        riskcast_url="http://localhost:9999",
+        api_key="test-key",
+        batch_config=BatchConfig(max_batch_size=50, max_delay_ms=5),
+    ) as emitter:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json = MagicMock(
+            return_value={"results": [{"status_code": 200, "ack_id": "ack-1"}]}
+        )
+        post = AsyncMock(return_value=mock_response)
+        emitter._client.post = post
+
+        result = await emitter.emit(
+            signal=_make_minimal_signal("OMEN-DELAY"),
+            input_event={},
+            observed_at=datetime.now(timezone.utc),
+        )
+
+    assert result.status == EmitStatus.DELIVERED
+    assert result.hot_path_ack_id == "ack-1"
+    assert post.await_count == 1
+    assert post.await_args.args[0].endswith("/api/v1/signals/ingest/batch")
+
+
+@pytest.mark.asyncio
+async def test_emit_with_async_ledger_writes_on_io_thread_before_hot_path(tmp_path: Path):
+    """AsyncLedgerWriter: ledger I/O runs off the loop; each frame is on disk before its push."""
+    import asyncio
+
+    from omen.infrastructure.ledger import AsyncLedgerWriter, LedgerReader
+
+    ledger = AsyncLedgerWriter(LedgerWriter(tmp_path))
+    batches: list[tuple[str, int]] = []
+    write_batch = ledger.writer.write_batch
+
+    def spy(events):
+        batches.append((threading.current_thread().name, len(events)))
+        return write_batch(events)
+
+    ledger.writer.write_batch = spy
+    pushed_before_durable: list[str] = []
+
+    async def post(url, content=None, headers=None):
+        signal_id = headers["X-Idempotency-Key"]
+        partition = LedgerReader(tmp_path).list_partitions()[0].partition_date
+        if signal_id not in LedgerReader(tmp_path).list_signal_ids(partition):
+            pushed_before_durable.append(signal_id)
+        response = MagicMock()
+        response.status_code = 200
+        response.json = MagicMock(return_value={"ack_id": f"ack-{signal_id}"})
+        return response
+
+    async with SignalEmitter(
+        ledger=ledger,
+        riskcast_url="http://localhost:9999",
+        api_key="test-key",
+    ) as emitter:
+        emitter._client.post = post
+        results = await asyncio.gather(
+            *[
+                emitter.emit(
+                    signal=_make_minimal_signal(f"OMEN-AW{i}"),
+                    input_event={"i": i},
+                    observed_at=datetime.now(timezone.utc),
+                )
+                for i in range(8)
+            ]
+        )
+    await ledger.flush_and_close()
+
+    assert [r.status for r in results] == [EmitStatus.DELIVERED] * 8
+    assert all(r.ledger_partition for r in results)
+    assert pushed_before_durable == []
+    assert {name for name, _ in batches} == {"ledger-writer"}
+    assert sum(size for _, size in batches) == 8
+
+
+@pytest.mark.asyncio
+async def test_emit_with_async_ledger_failure_returns_failed(tmp_path: Path):
+    """A failed write on the I/O thread fails its durability future -> FAILED, no push."""
+    from omen.infrastructure.ledger import AsyncLedgerWriter, LedgerWriteError
+
+    ledger = AsyncLedgerWriter(LedgerWriter(tmp_path))
+    ledger.writer.write_batch = lambda events: [LedgerWriteError("disk full")] * len(events)
+
+    async with SignalEmitter(
+        ledger=ledger,
+        riskcast_url="http://localhost:9999",
+        api_key="test-key",
+    ) as emitter:
+        post = AsyncMock()
+        emitter._client.post = post
+        result = await emitter.emit(
+            signal=_make_minimal_signal("OMEN-AWFAIL"),
+            input_event={},
+            observed_at=datetime.now(timezone.utc),
+        )
+    await ledger.flush_and_close()
+
+    assert result.status == EmitStatus.FAILED
+    assert "disk full" in (result.error or "")
+    post.assert_not_awaited()
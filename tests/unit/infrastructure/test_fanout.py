@@ -0,0 +1,161 @@
+"""Unit tests for encode-once WebSocket fan-out and slow-consumer policies."""
+
+import asyncio
+import json
+
+import pytest
+
+from omen.infrastructure.realtime.distributed_connection_manager import (
+    DistributedConnectionManager,
+)
+from omen.infrastructure.realtime.fanout import SlowConsumerPolicy, WebSocketFanout
+from omen.infrastructure.realtime.redis_pubsub import RedisPubSubManager
+
+
+class FakeWebSocket:
+    """Records frames; send_text blocks while `gate` is clear."""
+
+    def __init__(self, blocked: bool = False, fail: bool = False):
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+        self.fail = fail
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection closed")
+        await self.gate.wait()
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+    @property
+    def messages(self) -> list[dict]:
+        return [json.loads(f) for f in self.frames]
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_for_all_connections():
+    fanout = WebSocketFanout()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for ws in sockets:
+        fanout.add("signals", ws)
+
+    assert fanout.broadcast("signals", {"type": "signal", "data": {"id": 1}}) == 3
+    await fanout.drain("signals")
+
+    assert all(ws.messages == [{"type": "signal", "data": {"id": 1}}] for ws in sockets)
+    assert sockets[0].frames[0] is sockets[1].frames[0] is sockets[2].frames[0]
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_others():
+    fanout = WebSocketFanout()
+    slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+    fanout.add("prices", slow)
+    fanout.add("prices", fast)
+
+    for i in range(3):
+        fanout.broadcast("prices", {"n": i})
+    await asyncio.wait_for(fanout._senders["prices"][fast].drain(), timeout=1)
+
+    assert [m["n"] for m in fast.messages] == [0, 1, 2]
+    assert slow.frames == []
+    slow.gate.set()
+    await fanout.drain()
+    assert [m["n"] for m in slow.messages] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_newest_frames():
+    fanout = WebSocketFanout(max_queue=2, policy=SlowConsumerPolicy.DROP_OLDEST)
+    ws = FakeWebSocket(blocked=True)
+    fanout.add("signals", ws)
+
+    fanout.broadcast("signals", {"n": 0})
+    await _settle()  # writer picks up n=0 and blocks in send_text
+    for i in range(1, 5):
+        fanout.broadcast("signals", {"n": i})
+    ws.gate.set()
+    await fanout.drain()
+
+    assert [m["n"] for m in ws.messages] == [0, 3, 4]
+    assert fanout.dropped("signals") == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_queued_frame_with_same_key():
+    fanout = WebSocketFanout(policy=SlowConsumerPolicy.COALESCE)
+    ws = FakeWebSocket(blocked=True)
+    fanout.add("prices", ws)
+
+    fanout.broadcast("prices", {"signal_id": "A", "p": 0.1}, key="A")
+    await _settle()
+    fanout.broadcast("prices", {"signal_id": "A", "p": 0.2}, key="A")
+    fanout.broadcast("prices", {"signal_id": "B", "p": 0.5}, key="B")
+    fanout.broadcast("prices", {"signal_id": "A", "p": 0.3}, key="A")
+    ws.gate.set()
+    await fanout.drain()
+
+    assert [(m["signal_id"], m["p"]) for m in ws.messages] == [
+        ("A", 0.1),
+        ("A", 0.3),
+        ("B", 0.5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_and_removes_slow_consumer():
+    fanout = WebSocketFanout(max_queue=2, policy=SlowConsumerPolicy.DISCONNECT)
+    slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+    fanout.add("signals", slow)
+    fanout.add("signals", fast)
+
+    for i in range(3):
+        assert fanout.broadcast("signals", {"n": i}) == 2
+        await _settle()  # fast drains; slow holds n=0 in flight and queues the rest
+    assert fanout.broadcast("signals", {"n": 3}) == 1  # slow queue full -> disconnected
+    await _settle()
+
+    assert slow.closed_with == 1013
+    assert fanout.connections("signals") == {fast}
+    await fanout.drain()
+    assert [m["n"] for m in fast.messages] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_send_removes_connection():
+    fanout = WebSocketFanout()
+    fanout.add("signals", FakeWebSocket(fail=True))
+
+    fanout.broadcast("signals", {"n": 0})
+    await _settle()
+
+    assert fanout.count("signals") == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_price_broadcast_coalesces_per_signal():
+    pubsub = RedisPubSubManager(redis_url="", instance_id="test")
+    manager = DistributedConnectionManager(pubsub=pubsub)
+    ws = FakeWebSocket(blocked=True)
+    pubsub.add_local_connection(manager.CHANNEL_PRICES, ws)
+
+    assert await manager.broadcast_price({"signal_id": "OMEN-1", "probability": 0.4}) == 1
+    await _settle()
+    await manager.broadcast_price({"signal_id": "OMEN-1", "probability": 0.5})
+    await manager.broadcast_price({"signal_id": "OMEN-1", "probability": 0.6})
+    ws.gate.set()
+    await pubsub.fanout.drain()
+
+    assert [m["data"]["probability"] for m in ws.messages] == [0.4, 0.6]
+    assert all(m["type"] == "price" for m in ws.messages)
+    pubsub.fanout.close()
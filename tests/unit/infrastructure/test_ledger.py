@@ -144,6 +144,124 @@ def test_rollover_creates_new_segment(tmp_path: Path):
         wmod.MAX_SEGMENT_RECORDS = original_max
 
 
+def test_rollover_and_seal_write_segment_index(tmp_path: Path):
+    """Sealed segments get a sidecar index mapping ids to frame offsets."""
+    import omen.infrastructure.ledger.writer as wmod
+    from omen.infrastructure.ledger.segment_index import SegmentIndex, read_frames_at
+
+    original_max = wmod.MAX_SEGMENT_RECORDS
+    try:
+        wmod.MAX_SEGMENT_RECORDS = 3
+        writer = LedgerWriter(tmp_path)
+        for i in range(5):
+            result = writer.write(_make_event(f"OMEN-IX{i:03d}", trace_id=f"trace-{i}"))
+        partition_dir = tmp_path / (result.ledger_partition or "")
+
+        first = SegmentIndex.load(partition_dir / "signals-001.idx")
+        assert first is not None
+        assert set(first.signals) == {"OMEN-IX000", "OMEN-IX001", "OMEN-IX002"}
+        assert not (partition_dir / "signals-002.idx").exists()
+
+        writer.seal_partition(result.ledger_partition or "")
+        second = SegmentIndex.load(partition_dir / "signals-002.idx")
+        assert second is not None
+        assert second.traces["trace-4"] == [second.signals["OMEN-IX004"]]
+        [(offset, payload)] = read_frames_at(
+            partition_dir / "signals-002.wal", [second.signals["OMEN-IX004"]]
+        )
+        assert b"OMEN-IX004" in payload
+    finally:
+        wmod.MAX_SEGMENT_RECORDS = original_max
+
+
+def test_seal_takes_manifest_counts_and_checksums_from_running_counters(tmp_path: Path):
+    """Sealing does not re-read segments: counts and CRCs come from the writer's indexes."""
+    import builtins
+    import json
+    import zlib
+
+    import omen.infrastructure.ledger.writer as wmod
+    from omen.infrastructure.ledger.segment_index import SegmentIndex
+
+    original_max = wmod.MAX_SEGMENT_RECORDS
+    try:
+        wmod.MAX_SEGMENT_RECORDS = 3
+        writer = LedgerWriter(tmp_path)
+        for i in range(5):
+            result = writer.write(_make_event(f"OMEN-RC{i}"))
+        partition = result.ledger_partition or ""
+        with patch.object(SegmentIndex, "build", side_effect=AssertionError("rescan")), patch(
+            "omen.infrastructure.ledger.writer.open", wraps=builtins.open, create=True
+        ) as opened:
+            writer.seal_partition(partition)
+    finally:
+        wmod.MAX_SEGMENT_RECORDS = original_max
+
+    assert not [c for c in opened.call_args_list if str(c.args[0]).endswith(".wal")]
+    manifest = json.loads((tmp_path / partition / "_manifest.json").read_text())
+    assert [s["record_count"] for s in manifest["segments"]] == [3, 2]
+    for entry in manifest["segments"]:
+        content = (tmp_path / partition / entry["file"]).read_bytes()
+        assert entry["checksum"] == f"crc32:{zlib.crc32(content) & 0xFFFFFFFF:08x}"
+
+
+def test_restarted_writer_resumes_counters_from_index_checkpoint(tmp_path: Path):
+    """A new writer extends the active segment's checkpointed sidecar instead of rescanning."""
+    import omen.infrastructure.ledger.segment_index as smod
+    import omen.infrastructure.ledger.writer as wmod
+
+    with patch.object(wmod, "INDEX_CHECKPOINT_RECORDS", 2):
+        writer = LedgerWriter(tmp_path)
+        for i in range(3):
+            result = writer.write(_make_event(f"OMEN-CP{i}"))
+    segment = tmp_path / (result.ledger_partition or "") / "signals-001.wal"
+    checkpoint = smod.SegmentIndex.load(smod.index_path_for(segment))
+    assert checkpoint is not None and checkpoint.frame_count == 2
+
+    with patch.object(smod, "iter_frames", wraps=smod.iter_frames) as scanned:
+        restarted = LedgerWriter(tmp_path).write(_make_event("OMEN-CP3"))
+
+    assert [c.args[1] for c in scanned.call_args_list] == [checkpoint.size_bytes]
+    assert restarted.ledger_sequence == (1 << 32) | 4
+
+
+def test_seal_checksum_falls_back_to_file_after_torn_tail(tmp_path: Path):
+    """A gap in the running checksum (torn frame, then more appends) is recomputed from disk."""
+    import json
+    import zlib
+
+    writer = LedgerWriter(tmp_path)
+    result = writer.write(_make_event("OMEN-TT0"))
+    segment = tmp_path / (result.ledger_partition or "") / "signals-001.wal"
+    with open(segment, "ab") as f:
+        f.write(b"\x00\x00")  # torn header from a crashed writer
+    LedgerWriter(tmp_path).write(_make_event("OMEN-TT1"))
+    LedgerWriter(tmp_path).seal_partition(result.ledger_partition or "")
+
+    manifest = json.loads((segment.parent / "_manifest.json").read_text())
+    expected = f"crc32:{zlib.crc32(segment.read_bytes()) & 0xFFFFFFFF:08x}"
+    assert manifest["segments"][0]["checksum"] == expected
+
+
+def test_get_signal_rebuilds_missing_index(tmp_path: Path):
+    """Reader rebuilds missing sidecars and sees records appended afterwards."""
+    writer = LedgerWriter(tmp_path)
+    result = writer.write(_make_event("OMEN-LZ001", trace_id="trace-lz"))
+    partition = result.ledger_partition or ""
+    reader = LedgerReader(tmp_path)
+
+    assert not list((tmp_path / partition).glob("*.idx"))
+    assert reader.get_signal(partition, "OMEN-LZ001") is not None
+    assert reader.get_signal(partition, "OMEN-LZ002") is None
+
+    writer.write(_make_event("OMEN-LZ002", trace_id="trace-lz"))
+    assert reader.get_signal(partition, "OMEN-LZ002") is not None
+    assert [e.signal_id for e in reader.query_by_trace_ids(["trace-lz"])] == [
+        "OMEN-LZ001",
+        "OMEN-LZ002",
+    ]
+
+
 def test_current_pointer_exists(tmp_path: Path):
     """_CURRENT file points to active segment."""
     writer = LedgerWriter(tmp_path)
@@ -245,6 +363,216 @@ def test_query_by_category(tmp_path: Path):
         assert e.signal.category == SignalCategory.GEOPOLITICAL
 
 
+def _write_sealed_day(tmp_path: Path) -> tuple[LedgerWriter, str]:
+    """Seal one partition of 6 events in 3 segments (2 each), one hour apart."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    categories = [
+        SignalCategory.GEOPOLITICAL,
+        SignalCategory.GEOPOLITICAL,
+        SignalCategory.OTHER,
+        SignalCategory.OTHER,
+        SignalCategory.OTHER,
+        SignalCategory.WEATHER,
+    ]
+    original_max = wmod.MAX_SEGMENT_RECORDS
+    try:
+        wmod.MAX_SEGMENT_RECORDS = 2
+        writer = LedgerWriter(tmp_path)
+        for i, category in enumerate(categories):
+            event = _make_event(f"OMEN-PR{i}", trace_id=f"trace-pr{i}", category=category)
+            event = event.model_copy(
+                update={"emitted_at": datetime(2026, 1, 5, 8 + i, tzinfo=timezone.utc)}
+            )
+            writer.write(event)
+        writer.seal_partition("2026-01-05")
+    finally:
+        wmod.MAX_SEGMENT_RECORDS = original_max
+    return writer, "2026-01-05"
+
+
+def test_sealed_manifest_carries_segment_stats(tmp_path: Path):
+    """Sealed manifest lists emitted_at range, category histogram and trace bloom per segment."""
+    import json
+
+    from omen.infrastructure.ledger.bloom import BloomFilter
+
+    _, partition = _write_sealed_day(tmp_path)
+    manifest = json.loads((tmp_path / partition / "_manifest.json").read_text())
+    first, second, third = manifest["segments"][:3]
+
+    assert first["min_emitted_at"] == "2026-01-05T08:00:00+00:00"
+    assert first["max_emitted_at"] == "2026-01-05T09:00:00+00:00"
+    assert first["categories"] == {"GEOPOLITICAL": 2}
+    assert third["categories"] == {"OTHER": 1, "WEATHER": 1}
+    bloom = BloomFilter.from_dict(second["trace_bloom"])
+    assert "trace-pr2" in bloom and "trace-pr3" in bloom
+
+
+def test_queries_skip_sealed_segments_using_manifest_stats(tmp_path: Path):
+    """Time, category and trace queries only open segments that can match."""
+    _, partition = _write_sealed_day(tmp_path)
+    reader = LedgerReader(tmp_path)
+    opened: list[str] = []
+    read_segment = reader._read_segment
+    get_index = reader._get_segment_index
+
+    def spy_read(segment, validate, prefilter=None):
+        opened.append(segment.name)
+        return read_segment(segment, validate, prefilter)
+
+    def spy_index(segment):
+        opened.append(segment.name)
+        return get_index(segment)
+
+    with patch.object(reader, "_read_segment", spy_read), patch.object(
+        reader, "_get_segment_index", spy_index
+    ):
+        events = list(
+            reader.query_by_time_range(
+                datetime(2026, 1, 5, 10, 30, tzinfo=timezone.utc),
+                datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc),
+            )
+        )
+        assert [e.signal_id for e in events] == ["OMEN-PR3", "OMEN-PR4"]
+        assert opened == ["signals-002.wal", "signals-003.wal"]
+
+        opened.clear()
+        day = date(2026, 1, 5)
+        events = list(reader.query_by_category("GEOPOLITICAL", day, day))
+        assert [e.signal_id for e in events] == ["OMEN-PR0", "OMEN-PR1"]
+        assert opened == ["signals-001.wal"]
+
+        opened.clear()
+        events = reader.query_by_trace_ids(["trace-pr5"])
+        assert [e.signal_id for e in events] == ["OMEN-PR5"]
+        assert "signals-003.wal" in opened and "signals-001.wal" not in opened
+
+
+def test_time_range_prefilter_skips_decoding_out_of_range_records(tmp_path: Path):
+    """Records in an unsealed segment are decoded only if their raw emitted_at is in range."""
+    writer = LedgerWriter(tmp_path)
+    for i in range(4):
+        event = _make_event(f"OMEN-PF{i}").model_copy(
+            update={"emitted_at": datetime(2026, 1, 6, 8 + i, tzinfo=timezone.utc)}
+        )
+        writer.write(event)
+    reader = LedgerReader(tmp_path)
+
+    with patch("omen.infrastructure.ledger.reader.SignalEvent", wraps=SignalEvent) as decoded:
+        events = list(
+            reader.query_by_time_range(
+                datetime(2026, 1, 6, 9, tzinfo=timezone.utc),
+                datetime(2026, 1, 6, 9, 30, tzinfo=timezone.utc),
+            )
+        )
+
+    assert [e.signal_id for e in events] == ["OMEN-PF1"]
+    assert decoded.call_count == 1
+
+
+def test_columnar_export_on_seal_matches_decoded_records(tmp_path: Path):
+    """Sealing with columnar_export writes mmap-able columns that agree with read_partition."""
+    pytest.importorskip("numpy")
+
+    writer = LedgerWriter(tmp_path, columnar_export=True)
+    for i, (category, probability) in enumerate(
+        [
+            (SignalCategory.GEOPOLITICAL, 0.05),
+            (SignalCategory.WEATHER, 0.55),
+            (SignalCategory.GEOPOLITICAL, 0.95),
+            (SignalCategory.OTHER, 1.0),
+        ]
+    ):
+        event = _make_event(f"OMEN-COL{i}", category=category)
+        event = event.model_copy(
+            update={
+                "emitted_at": datetime(2026, 1, 8, 23 if i == 3 else 10, tzinfo=timezone.utc),
+                "signal": event.signal.model_copy(update={"probability": probability}),
+            }
+        )
+        writer.write(event)
+    writer.seal_partition("2026-01-08")
+    reader = LedgerReader(tmp_path)
+    events = list(reader.read_partition("2026-01-08"))
+
+    columns = reader.read_columns("2026-01-08")
+
+    assert columns is not None and len(columns) == 4
+    assert [columns.signal_ids[c] for c in columns.signal_id] == [e.signal_id for e in events]
+    assert columns.probability.tolist() == [e.signal.probability for e in events]
+    assert columns.emitted_at_datetime64()[0].item() == events[0].emitted_at.replace(tzinfo=None)
+    assert columns.sources == ["test"]
+    assert columns.daily_counts() == {"2026-01-08": 4}
+    assert columns.category_counts() == {"GEOPOLITICAL": 2, "WEATHER": 1, "OTHER": 1}
+    assert columns.confidence_histogram() == [0, 0, 0, 0, 0, 0, 0, 4, 0, 0]
+    buckets = columns.calibration_buckets(outcomes={"OMEN-COL2": True, "OMEN-COL3": False})
+    assert [b["count"] for b in buckets] == [1, 0, 0, 0, 0, 1, 0, 0, 0, 2]
+    assert buckets[9]["predicted_avg"] == pytest.approx(0.975)
+    assert buckets[9]["resolved"] == 2 and buckets[9]["actual_rate"] == 0.5
+    assert buckets[0]["actual_rate"] is None
+    assert reader.read_columns("2026-01-09") is None
+
+
+def test_partition_segments_lists_main_then_late_in_read_order(tmp_path: Path):
+    writer, _ = _write_sealed_day(tmp_path)
+    late = _make_event("OMEN-LATE1").model_copy(
+        update={"emitted_at": datetime(2026, 1, 5, 20, tzinfo=timezone.utc)}
+    )
+    assert writer.write(late).ledger_partition == "2026-01-05-late"
+    reader = LedgerReader(tmp_path)
+
+    segments = reader.partition_segments("2026-01-05")
+    main = reader.partition_segments("2026-01-05", include_late=False)
+
+    assert len(main) >= 3 and main == sorted(main)
+    assert {s.parent.name for s in main} == {"2026-01-05"}
+    assert segments[: len(main)] == main
+    assert [s.parent.name for s in segments[len(main):]] == ["2026-01-05-late"]
+
+
+def test_versioned_replay_streams_segments_in_sequence_order(tmp_path: Path):
+    """Parallel replay matches the sequential reader across partitions and segments."""
+    from omen.infrastructure.ledger import VersionedLedgerReader
+
+    _write_sealed_day(tmp_path)
+    late = _make_event("OMEN-LATE0").model_copy(
+        update={"emitted_at": datetime(2026, 1, 7, 9, tzinfo=timezone.utc)}
+    )
+    LedgerWriter(tmp_path).write(late)
+    reader = LedgerReader(tmp_path)
+    versioned = VersionedLedgerReader(reader)
+    expected = [e.signal_id for e in versioned.read_partition("2026-01-05")] + ["OMEN-LATE0"]
+
+    parallel = versioned.replay(["2026-01-05", "2026-01-07"], workers=2, max_pending=1)
+    inline = versioned.replay(["2026-01-05", "2026-01-07"], workers=1)
+
+    assert [e.signal_id for e in parallel] == expected
+    assert [e.signal_id for e in inline] == expected
+    assert expected[:6] == [f"OMEN-PR{i}" for i in range(6)]
+
+
+def test_versioned_replay_skips_corrupt_records_and_migrates(tmp_path: Path):
+    """Replay drops CRC-invalid frames and migrates records to the target schema."""
+    from omen.domain.schema.registry import SchemaVersion
+    from omen.infrastructure.ledger import VersionedLedgerReader
+
+    writer = LedgerWriter(tmp_path)
+    for i in range(3):
+        result = writer.write(_make_event(f"OMEN-RP{i}"))
+    segment = next((tmp_path / result.ledger_partition).glob("signals-*.wal"))
+    data = bytearray(segment.read_bytes())
+    data[FRAME_HEADER_SIZE + 5] ^= 0xFF  # corrupt the first payload
+    segment.write_bytes(bytes(data))
+    versioned = VersionedLedgerReader(LedgerReader(tmp_path))
+
+    with patch.object(SchemaVersion, "current", return_value=SchemaVersion.V1_1_0):
+        events = list(versioned.replay([result.ledger_partition], workers=1))
+
+    assert [e.signal_id for e in events] == ["OMEN-RP1", "OMEN-RP2"]
+    assert all(e.schema_version == "1.1.0" for e in events)
+
+
 def test_ledger_crash_tail_returns_n_minus_1_valid_records(tmp_path: Path):
     """
     MANDATORY: Ledger crash-tail test.
@@ -324,6 +652,287 @@ def test_ledger_sequence_monotonic_across_rollover(tmp_path: Path):
         wmod.MAX_SEGMENT_RECORDS = original_max
 
 
+def test_group_commit_shares_fsync_across_concurrent_writers(tmp_path: Path):
+    """Group commit: concurrent writes are durable on return with fewer fsyncs."""
+    import threading
+
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=20)
+    real_fsync = os.fsync
+    fsyncs: list[int] = []
+
+    def counting_fsync(fd):
+        fsyncs.append(fd)
+        real_fsync(fd)
+
+    results = []
+    with patch.object(wmod.os, "fsync", side_effect=counting_fsync):
+        threads = [
+            threading.Thread(
+                target=lambda i=i: results.append(writer.write(_make_event(f"OMEN-GC{i:03d}")))
+            )
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        data_fsyncs = len(fsyncs)
+        writer.close()
+
+    assert len(results) == 20
+    assert 1 <= data_fsyncs < 20
+    partition = results[0].ledger_partition or ""
+    ids = LedgerReader(tmp_path).list_signal_ids(partition)
+    assert sorted(ids) == [f"OMEN-GC{i:03d}" for i in range(20)]
+    sequences = sorted(r.ledger_sequence for r in results)
+    assert len(set(sequences)) == 20
+
+
+def test_write_batch_shares_one_fsync_per_segment(tmp_path: Path):
+    """write_batch appends in order and fsyncs each touched segment once."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path)
+    first = writer.write(_make_event("OMEN-WB-FIRST"))  # segment and _CURRENT exist
+    fsyncs: list[int] = []
+
+    with patch.object(wmod.os, "fsync", side_effect=fsyncs.append):
+        results = writer.write_batch([_make_event(f"OMEN-WB{i}") for i in range(5)])
+
+    assert len(fsyncs) == 1
+    assert [r.signal_id for r in results] == [f"OMEN-WB{i}" for i in range(5)]
+    sequences = [first.ledger_sequence] + [r.ledger_sequence for r in results]
+    assert sequences == sorted(sequences) and len(set(sequences)) == 6
+    ids = LedgerReader(tmp_path).list_signal_ids(first.ledger_partition or "")
+    assert ids == ["OMEN-WB-FIRST"] + [f"OMEN-WB{i}" for i in range(5)]
+
+
+def test_write_batch_reports_fsync_failure_per_event(tmp_path: Path):
+    """If the covering fsync fails, every event in that segment comes back as an error."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path)
+    writer.write(_make_event("OMEN-WBF-FIRST"))
+
+    with patch.object(wmod.os, "fsync", side_effect=OSError(5, "EIO")):
+        results = writer.write_batch([_make_event("OMEN-WBF0"), _make_event("OMEN-WBF1")])
+
+    assert all(isinstance(r, LedgerWriteError) for r in results)
+
+
+def test_group_commit_fsync_failure_raises(tmp_path: Path):
+    """Group commit: a failed batch fsync surfaces as LedgerWriteError."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=0)
+    writer.write(_make_event("OMEN-GCOK"))
+    with patch.object(wmod.os, "fsync", side_effect=OSError(5, "I/O error")):
+        with pytest.raises(LedgerWriteError):
+            writer.write(_make_event("OMEN-GCFAIL"))
+    writer.close()
+
+
+def test_group_commit_rollover_fsync_failure_fails_pending_waiters(tmp_path: Path):
+    """Group commit: if the fsync at rollover fails, frames waiting on that segment fail too."""
+    import threading
+    import time
+
+    import omen.infrastructure.ledger.writer as wmod
+
+    original_max = wmod.MAX_SEGMENT_RECORDS
+    try:
+        wmod.MAX_SEGMENT_RECORDS = 4
+        writer = LedgerWriter(
+            tmp_path,
+            group_commit=True,
+            group_commit_max_delay_ms=300,
+            group_commit_max_batch=100,
+        )
+        writer.write(_make_event("OMEN-RF-OK"))  # frame 1; segment and _CURRENT exist
+
+        outcomes: dict[str, object] = {}
+
+        def _write(signal_id: str) -> None:
+            try:
+                outcomes[signal_id] = writer.write(_make_event(signal_id))
+            except LedgerWriteError as e:
+                outcomes[signal_id] = e
+
+        with patch.object(wmod.os, "fsync", side_effect=OSError(5, "EIO")):
+            # Frames 2 and 3 wait in the group commit window...
+            waiters = [
+                threading.Thread(target=_write, args=(f"OMEN-RF{i}",)) for i in (2, 3)
+            ]
+            for t in waiters:
+                t.start()
+            deadline = time.monotonic() + 5
+            while writer._appended_ticket < 3 and time.monotonic() < deadline:
+                time.sleep(0.005)
+            # ...when frame 4 rolls the segment over and its closing fsync fails
+            with pytest.raises(LedgerWriteError):
+                writer.write(_make_event("OMEN-RF4"))
+            for t in waiters:
+                t.join()
+
+        assert isinstance(outcomes["OMEN-RF2"], LedgerWriteError)
+        assert isinstance(outcomes["OMEN-RF3"], LedgerWriteError)
+        assert writer._failed_tickets == {}
+        writer.close()
+    finally:
+        wmod.MAX_SEGMENT_RECORDS = original_max
+
+
+def test_group_commit_earlier_failed_flush_is_not_acked_later(tmp_path: Path):
+    """Group commit: a frame whose flush failed stays failed after later flushes."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=0)
+    writer.write(_make_event("OMEN-FF-OK"))
+
+    # Two flushes fail before either frame's waiter checks its ticket
+    _, _, first = writer._append_event(_make_event("OMEN-FF1"))
+    with patch.object(wmod.os, "fsync", side_effect=OSError(5, "EIO")):
+        writer._group_fsync()
+    _, _, second = writer._append_event(_make_event("OMEN-FF2"))
+    with patch.object(wmod.os, "fsync", side_effect=OSError(5, "EIO")):
+        writer._group_fsync()
+
+    for ticket in (first, second):
+        with pytest.raises(OSError):
+            writer._wait_durable(ticket)
+    writer.write(_make_event("OMEN-FF-AFTER"))
+    writer.close()
+
+
+def test_group_commit_fsync_failure_only_fails_that_segment(tmp_path: Path):
+    """Group commit: frames in a segment whose fsync succeeded are acked."""
+    import omen.infrastructure.ledger.writer as wmod
+
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=0)
+    ok = _make_event("OMEN-SEG-OK")
+    bad = _make_event("OMEN-SEG-BAD")
+    bad = bad.model_copy(update={"emitted_at": datetime(2026, 1, 2, tzinfo=timezone.utc)})
+    writer.write(ok)
+    writer.write(bad)
+
+    _, ok_segment, ok_ticket = writer._append_event(ok)
+    _, bad_segment, bad_ticket = writer._append_event(bad)
+    assert ok_segment != bad_segment
+    bad_fd = writer._open_segments[str(bad_segment)].fileno()
+    real_fstat = os.fstat
+
+    def failing_fsync(fd):
+        if os.path.samestat(real_fstat(fd), real_fstat(bad_fd)):
+            raise OSError(5, "EIO")
+
+    with patch.object(wmod.os, "fsync", side_effect=failing_fsync):
+        writer._wait_durable(ok_ticket)
+        with pytest.raises(OSError):
+            writer._wait_durable(bad_ticket)
+    writer.close()
+
+
+class _ShortWriteHandle:
+    """Segment handle that writes at most `chunk` bytes per call, then optionally fails."""
+
+    def __init__(self, f, chunk: int, fail_after: int | None = None):
+        self._f = f
+        self._chunk = chunk
+        self._calls_left = fail_after
+
+    def write(self, data):
+        if self._calls_left is not None:
+            if self._calls_left == 0:
+                raise OSError(28, "No space left on device")
+            self._calls_left -= 1
+        return self._f.write(bytes(data[: self._chunk]))
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+def _wrap_open_segment(writer: LedgerWriter, **kwargs) -> None:
+    (key, handle), = writer._open_segments.items()
+    writer._open_segments[key] = _ShortWriteHandle(handle, **kwargs)
+
+
+def _unwrap_open_segment(writer: LedgerWriter) -> None:
+    (key, handle), = writer._open_segments.items()
+    writer._open_segments[key] = handle._f
+
+
+def test_group_commit_retries_short_writes(tmp_path: Path):
+    """Group commit: a short write on the unbuffered handle is completed, not torn."""
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=0)
+    first = writer.write(_make_event("OMEN-SW-OK"))
+    _wrap_open_segment(writer, chunk=7)
+    writer.write(_make_event("OMEN-SW-SHORT"))
+    writer.close()
+
+    signals = list(LedgerReader(tmp_path).read_partition(first.ledger_partition, validate=True))
+    assert [s.signal_id for s in signals] == ["OMEN-SW-OK", "OMEN-SW-SHORT"]
+
+
+def test_group_commit_failed_write_truncates_torn_frame(tmp_path: Path):
+    """Group commit: a write failing mid-frame is truncated and gets no ticket."""
+    writer = LedgerWriter(tmp_path, group_commit=True, group_commit_max_delay_ms=0)
+    first = writer.write(_make_event("OMEN-TW-OK"))
+    segment = next((tmp_path / first.ledger_partition).glob("*.wal"))
+    size = segment.stat().st_size
+    ticket = writer._appended_ticket
+
+    _wrap_open_segment(writer, chunk=5, fail_after=2)
+    with pytest.raises(LedgerWriteError):
+        writer.write(_make_event("OMEN-TW-TORN"))
+    assert segment.stat().st_size == size
+    assert writer._appended_ticket == ticket
+
+    _unwrap_open_segment(writer)  # the disk has room again
+    writer.write(_make_event("OMEN-TW-AFTER"))
+    writer.close()
+    signals = list(LedgerReader(tmp_path).read_partition(first.ledger_partition, validate=True))
+    assert [s.signal_id for s in signals] == ["OMEN-TW-OK", "OMEN-TW-AFTER"]
+
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_partition_lock_held_elsewhere_times_out(tmp_path: Path, group_commit: bool):
+    """A partition locked by another writer fails with LedgerWriteError instead of hanging."""
+    import threading
+
+    from filelock import FileLock
+
+    import omen.infrastructure.ledger.writer as wmod
+
+    event = _make_event("OMEN-LOCKED")
+    partition_dir = tmp_path / event.emitted_at.date().isoformat()
+    partition_dir.mkdir()
+    held, release = threading.Event(), threading.Event()
+
+    def other_writer() -> None:
+        with FileLock(str(partition_dir / "_LOCK")):
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=other_writer)
+    holder.start()
+    original_timeout = wmod.PARTITION_LOCK_TIMEOUT_S
+    try:
+        wmod.PARTITION_LOCK_TIMEOUT_S = 0.05
+        assert held.wait(5)
+        writer = LedgerWriter(tmp_path, group_commit=group_commit)
+        with pytest.raises(LedgerWriteError, match="locked by another writer"):
+            writer.write(event)
+        assert isinstance(writer.write_batch([event])[0], LedgerWriteError)
+    finally:
+        wmod.PARTITION_LOCK_TIMEOUT_S = original_timeout
+        release.set()
+        holder.join()
+    writer.write(event)
+    writer.close()
+
+
 def test_atomic_write_text_fsync_order(tmp_path: Path):
     """T2: _atomic_write_text calls fsync(temp) before replace, then fsync(dir) after replace."""
     path = tmp_path / "f"
@@ -1,8 +1,13 @@
-"""Tests for real-time price streamer (register/subscribe mapping)."""
+"""Tests for real-time price streamer (register/subscribe mapping, conflating stream)."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
 
 import pytest
 from unittest.mock import AsyncMock, patch
 
+from omen.adapters.inbound.polymarket.websocket_client import PriceUpdate
 from omen.infrastructure.realtime.price_streamer import (
     PriceStreamer,
     get_price_streamer,
@@ -61,6 +66,87 @@ class TestPriceStreamer:
         assert update.change_percent == 14.28
 
 
+def _tick(token_id: str, price: float) -> PriceUpdate:
+    return PriceUpdate(
+        market_id="m",
+        token_id=token_id,
+        price=price,
+        side="buy",
+        size=1.0,
+        timestamp=datetime(2026, 1, 28, 12, 0, tzinfo=timezone.utc),
+    )
+
+
+class TestConflatingStream:
+    """Shared change log: latest update per signal, drained per cursor."""
+
+    def _streamer(self) -> PriceStreamer:
+        streamer = PriceStreamer()
+        streamer.register_signal("OMEN-A", "tok-a", 0.5)
+        streamer.register_signal("OMEN-B", "tok-b", 0.5)
+        return streamer
+
+    def test_changes_since_keeps_latest_per_signal_in_change_order(self):
+        streamer = self._streamer()
+        cursor = streamer.cursor
+        for token, price in [("tok-a", 0.6), ("tok-b", 0.4), ("tok-a", 0.7), ("tok-x", 0.9)]:
+            streamer._record(_tick(token, price))
+
+        changed = streamer.changes_since(cursor)
+        assert [(u.signal_id, u.new_probability) for u in changed] == [
+            ("OMEN-B", 0.4),
+            ("OMEN-A", 0.7),
+        ]
+        assert changed[1].old_probability == 0.6
+        assert streamer.changes_since(streamer.cursor) == []
+
+    @pytest.mark.asyncio
+    async def test_subscribers_drain_at_own_pace_with_shared_encoding(self):
+        streamer = self._streamer()
+        fast_cursor = slow_cursor = streamer.cursor
+
+        streamer._record(_tick("tok-a", 0.6))
+        fast, fast_cursor = await streamer.drain(fast_cursor)
+        streamer._record(_tick("tok-a", 0.65))
+        streamer._record(_tick("tok-b", 0.45))
+        fast_2, fast_cursor = await streamer.drain(fast_cursor)
+        slow, slow_cursor = await streamer.drain(slow_cursor)
+
+        assert [u.new_probability for u in fast] == [0.6]
+        assert [u.new_probability for u in fast_2] == [0.65, 0.45]
+        assert slow == fast_2 and slow_cursor == fast_cursor == streamer.cursor
+        assert slow[0].sse_data is fast_2[0].sse_data
+        assert json.loads(slow[0].sse_data)["probability"] == 0.65
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_next_change_or_times_out(self):
+        streamer = self._streamer()
+        cursor = streamer.cursor
+
+        assert await streamer.drain(cursor, timeout=0.01) == ([], cursor)
+        waiter = asyncio.create_task(streamer.drain(cursor, timeout=1))
+        await asyncio.sleep(0)
+        streamer._record(_tick("tok-b", 0.3))
+        updates, new_cursor = await waiter
+        assert [u.signal_id for u in updates] == ["OMEN-B"]
+        assert new_cursor == streamer.cursor
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_in_their_own_task(self):
+        streamer = self._streamer()
+        seen = []
+        streamer.on_update(lambda u: seen.append(u.signal_id))
+        task = asyncio.create_task(streamer._callback_loop())
+        await asyncio.sleep(0)
+
+        streamer._record(_tick("tok-a", 0.55))
+        assert seen == []  # not run inline on the tick
+        await asyncio.sleep(0.01)
+        assert seen == ["OMEN-A"]
+        task.cancel()
+        await task
+
+
 class TestGetPriceStreamer:
     """Singleton accessor."""
 
@@ -0,0 +1,218 @@
+"""Tests for the batched, hash-chained audit file sink."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from omen.infrastructure.security.enhanced_audit import (
+    AuditChainError,
+    AuditEvent,
+    AuditEventType,
+    AuditFileSink,
+    AuditSeverity,
+    EnhancedAuditLogger,
+    get_audit_logger,
+    shutdown_audit_logger,
+    verify_audit_chain,
+)
+
+
+def _event(n: int, severity: AuditSeverity = AuditSeverity.INFO) -> AuditEvent:
+    return AuditEvent(
+        event_type=AuditEventType.API_REQUEST,
+        severity=severity,
+        description=f"request {n}",
+        details={"n": n},
+    )
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def test_sink_writes_chained_records_in_order(tmp_path: Path):
+    path = tmp_path / "audit.log"
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    for i in range(50):
+        assert sink.submit(_event(i))
+    sink.close()
+
+    records = _records(path)
+    assert [r["details"]["n"] for r in records] == list(range(50))
+    assert [r["seq"] for r in records] == list(range(1, 51))
+    assert records[1]["prev_hash"] == records[0]["hash"]
+    assert verify_audit_chain(str(path)) == 50
+    assert sink.get_stats()["written"] == 50
+
+
+def test_sink_batches_writes_per_interval(tmp_path: Path):
+    sink = AuditFileSink(str(tmp_path / "audit.log"), flush_interval=0.5)
+    for i in range(100):
+        sink.submit(_event(i))
+    assert sink.flush(timeout=5)
+    sink.close()
+    # Everything was queued within one interval: far fewer writes than events
+    assert sink.get_stats()["batches"] <= 2
+
+
+def test_chain_continues_across_restarts(tmp_path: Path):
+    path = tmp_path / "audit.log"
+    path.write_text('{"legacy": "unchained line"}\n')
+    for start in (0, 10):
+        sink = AuditFileSink(str(path), flush_interval=0.01)
+        for i in range(start, start + 10):
+            sink.submit(_event(i))
+        sink.close()
+
+    assert verify_audit_chain(str(path)) == 20
+    assert _records(path)[-1]["seq"] == 20
+
+
+def test_two_sinks_on_one_file_share_the_chain(tmp_path: Path):
+    """Two writers (e.g. two gunicorn workers) extend one chain, not two forks."""
+    path = tmp_path / "audit.log"
+    a = AuditFileSink(str(path), flush_interval=0.01)
+    b = AuditFileSink(str(path), flush_interval=0.01)
+    for i in range(10):
+        for sink in (a, b):
+            sink.submit(_event(i))
+            assert sink.flush(timeout=5)
+    a.close()
+    b.close()
+
+    assert verify_audit_chain(str(path)) == 20
+    assert [r["seq"] for r in _records(path)] == list(range(1, 21))
+
+
+def test_chain_continues_past_torn_final_line(tmp_path: Path):
+    path = tmp_path / "audit.log"
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    for i in range(3):
+        sink.submit(_event(i))
+    sink.close()
+    last = _records(path)[-1]
+    with open(path, "a") as f:
+        f.write('{"seq": 4, "hash": "trunc')  # crash mid-write
+
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    sink.submit(_event(3))
+    sink.close()
+
+    lines = path.read_text().splitlines()
+    resumed = json.loads(lines[-1])
+    assert lines[-2].startswith('{"seq": 4, "hash": "trunc')
+    assert resumed["seq"] == last["seq"] + 1
+    assert resumed["prev_hash"] == last["hash"]
+
+
+def test_chain_head_found_past_large_final_record(tmp_path: Path):
+    path = tmp_path / "audit.log"
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    sink.submit(_event(0))
+    big = _event(1)
+    big.details["blob"] = "x" * 200_000
+    sink.submit(big)
+    sink.close()
+
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    sink.submit(_event(2))
+    sink.close()
+
+    assert verify_audit_chain(str(path)) == 3
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    [
+        lambda lines: lines[:3] + lines[4:],  # deleted record
+        lambda lines: [lines[0], lines[2], lines[1]] + lines[3:],  # reordered
+        lambda lines: lines[:2] + [lines[2].replace("request 2", "request X")] + lines[3:],
+    ],
+    ids=["deleted", "reordered", "edited"],
+)
+def test_verify_detects_tampering(tmp_path: Path, tamper):
+    path = tmp_path / "audit.log"
+    sink = AuditFileSink(str(path), flush_interval=0.01)
+    for i in range(6):
+        sink.submit(_event(i))
+    sink.close()
+
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(tamper(lines)) + "\n")
+    with pytest.raises(AuditChainError):
+        verify_audit_chain(str(path))
+
+
+def test_overflow_is_counted_and_recorded_in_chain(tmp_path: Path, monkeypatch):
+    path = tmp_path / "audit.log"
+    sink = AuditFileSink(str(path), max_queue=3, max_batch=1, block_timeout=0.01)
+    entered, gate = threading.Event(), threading.Event()
+    original = sink._write_batch
+
+    def stalled_write(batch):
+        entered.set()
+        gate.wait(5)
+        original(batch)
+
+    monkeypatch.setattr(sink, "_write_batch", stalled_write)
+
+    sink.submit(_event(0))  # taken by the writer, which then stalls
+    assert entered.wait(5)
+    accepted = [sink.submit(_event(i)) for i in range(1, 6)]
+    assert accepted == [True, True, True, False, False]
+    assert not sink.submit(_event(6, AuditSeverity.CRITICAL))  # waited, then dropped
+
+    stats = sink.get_stats()
+    assert stats["dropped"] == 3
+    assert stats["blocked"] == 1
+    assert stats["high_water"] == 3
+
+    gate.set()
+    sink.close()
+    records = _records(path)
+    overflow = [r for r in records if r["event_type"] == "audit.overflow"]
+    assert overflow and overflow[0]["details"]["dropped"] == 3
+    assert verify_audit_chain(str(path)) == len(records) == 5
+
+
+def test_submit_after_close_is_counted_as_dropped(tmp_path: Path):
+    sink = AuditFileSink(str(tmp_path / "audit.log"))
+    sink.close()
+    assert sink.submit(_event(0)) is False
+    assert sink.get_stats()["dropped"] == 1
+
+
+def test_logger_uses_sink_and_flushes(tmp_path: Path):
+    path = tmp_path / "nested" / "audit.log"
+    audit = EnhancedAuditLogger(logger_name="omen.audit.test", log_file_path=str(path))
+    audit.log_auth_success("user-1", actor_ip="10.0.0.1")
+    audit.log_auth_failure(None, reason="bad key")
+    assert audit.flush(timeout=5)
+
+    records = _records(path)
+    assert [r["event_type"] for r in records] == ["auth.login.success", "auth.login.failure"]
+    assert audit.get_stats()["written"] == 2
+    audit.close()
+
+
+def test_logger_without_file_falls_back_to_logging(caplog):
+    audit = EnhancedAuditLogger(logger_name="omen.audit.nofile", log_to_file=False)
+    with caplog.at_level("INFO", logger="omen.audit.nofile"):
+        audit.log_auth_failure(None, reason="bad key")
+    assert "auth.login.failure" in caplog.text
+    assert audit.get_stats() == {}
+
+
+def test_singleton_honours_audit_log_path_env(tmp_path: Path, monkeypatch):
+    path = tmp_path / "env" / "audit.log"
+    monkeypatch.setenv("OMEN_AUDIT_LOG_PATH", str(path))
+    shutdown_audit_logger()
+    try:
+        audit = get_audit_logger()
+        audit.log_auth_success("user-1")
+        assert audit.flush(timeout=5)
+        assert [r["event_type"] for r in _records(path)] == ["auth.login.success"]
+    finally:
+        shutdown_audit_logger()
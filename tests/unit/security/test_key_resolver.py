@@ -0,0 +1,161 @@
+"""Tests for hash-indexed API key resolution and its verification cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from omen.infrastructure.security import key_resolver
+from omen.infrastructure.security.api_key_manager import (
+    ApiKeyManager as StoredKeyManager,
+    InMemoryApiKeyStorage,
+)
+from omen.infrastructure.security.key_resolver import ApiKeyResolver, ResolvedKey
+from omen.infrastructure.security.key_rotation import ApiKeyManager, InMemoryApiKeyStore
+from omen.infrastructure.security.unified_auth import _resolve_api_key
+
+PRINCIPAL = ResolvedKey("key_1", ("read:signals",))
+
+
+class CountingVerifier:
+    def __init__(self, principal: ResolvedKey | None = PRINCIPAL):
+        self.principal = principal
+        self.calls = 0
+
+    def __call__(self, api_key: str) -> ResolvedKey | None:
+        self.calls += 1
+        return self.principal
+
+
+@pytest.fixture
+def global_resolver(monkeypatch) -> ApiKeyResolver:
+    resolver = ApiKeyResolver()
+    monkeypatch.setattr(key_resolver, "_key_resolver", resolver)
+    return resolver
+
+
+def test_static_keys_resolve_without_verify():
+    resolver = ApiKeyResolver()
+    config = object()
+    resolver.set_static_keys({"static-key": PRINCIPAL}, source=config)
+    verify = CountingVerifier(None)
+
+    assert resolver.resolve("static-key", verify) is PRINCIPAL
+    assert resolver.resolve("other-key", verify) is None
+    assert verify.calls == 1
+    assert resolver.has_static_source(config)
+    assert not resolver.has_static_source(object())
+
+
+def test_verified_key_is_cached_until_ttl(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(key_resolver.time, "monotonic", lambda: clock["now"])
+    resolver = ApiKeyResolver(ttl_seconds=30)
+    verify = CountingVerifier()
+
+    assert resolver.resolve("k", verify) is PRINCIPAL
+    clock["now"] = 129.0
+    assert resolver.resolve("k", verify) is PRINCIPAL
+    assert verify.calls == 1
+    clock["now"] = 131.0
+    resolver.resolve("k", verify)
+    assert verify.calls == 2
+    assert resolver.get_stats()["cache_hits"] == 1
+
+
+def test_failed_verification_is_not_cached():
+    resolver = ApiKeyResolver()
+    verify = CountingVerifier(None)
+    resolver.resolve("bad", verify)
+    resolver.resolve("bad", verify)
+    assert verify.calls == 2
+    assert resolver.get_stats()["cached_keys"] == 0
+
+
+def test_key_expiry_bounds_cache_lifetime():
+    resolver = ApiKeyResolver(ttl_seconds=60)
+    expired = ResolvedKey("key_2", (), expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    verify = CountingVerifier(expired)
+    resolver.resolve("k", verify)
+    resolver.resolve("k", verify)
+    assert verify.calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    resolver = ApiKeyResolver(max_entries=2)
+    verify = CountingVerifier()
+    resolver.resolve("a", verify)
+    resolver.resolve("b", verify)
+    resolver.resolve("a", verify)  # a is now most recent
+    resolver.resolve("c", verify)  # evicts b
+    calls = verify.calls
+    resolver.resolve("a", verify)
+    assert verify.calls == calls
+    resolver.resolve("b", verify)
+    assert verify.calls == calls + 1
+
+
+def test_changing_verify_source_drops_cache():
+    resolver = ApiKeyResolver()
+    verify = CountingVerifier()
+    resolver.resolve("k", verify, source="manager-1")
+    resolver.resolve("k", verify, source="manager-2")
+    assert verify.calls == 2
+
+
+def test_api_key_manager_revoke_invalidates(global_resolver):
+    manager = StoredKeyManager(InMemoryApiKeyStorage())
+    plaintext, record = manager.generate_key(name="svc")
+
+    def verify(key):
+        found = manager.verify_key(key)
+        return ResolvedKey(found.key_id, tuple(found.scopes)) if found else None
+
+    assert global_resolver.resolve(plaintext, verify, source=manager).key_id == record.key_id
+    manager.revoke_key(record.key_id)
+    assert global_resolver.resolve(plaintext, verify, source=manager) is None
+
+
+def test_api_key_manager_delete_invalidates(global_resolver):
+    manager = StoredKeyManager(InMemoryApiKeyStorage())
+    plaintext, record = manager.generate_key(name="svc")
+    global_resolver.resolve(plaintext, lambda key: ResolvedKey(record.key_id, ()))
+    manager.delete_key(record.key_id)
+    assert global_resolver.get_stats()["cached_keys"] == 0
+
+
+def test_key_rotation_invalidates_old_key(global_resolver):
+    manager = ApiKeyManager(InMemoryApiKeyStore())
+    plaintext, old = manager.generate_key()
+
+    def verify(key):
+        found = manager.verify_key(key)
+        return ResolvedKey(found.key_id, ()) if found else None
+
+    assert global_resolver.resolve(plaintext, verify) is not None
+    manager.rotate_key(old.key_id)
+    assert global_resolver.resolve(plaintext, verify) is None
+
+
+def test_authenticate_resolution_uses_config_and_manager(global_resolver, monkeypatch):
+    config = MagicMock()
+    config.get_api_keys.return_value = ["configured-key"]
+    monkeypatch.setattr(
+        "omen.infrastructure.security.config.get_security_config", lambda: config
+    )
+    manager = StoredKeyManager(InMemoryApiKeyStorage())
+    monkeypatch.setattr(
+        "omen.infrastructure.security.api_key_manager.get_api_key_manager", lambda: manager
+    )
+    plaintext, record = manager.generate_key(name="svc")
+
+    static = _resolve_api_key("configured-key")
+    assert static.key_id.startswith("api_user_")
+    assert "read:signals" in static.scopes
+    assert _resolve_api_key(plaintext).key_id == record.key_id
+    assert _resolve_api_key(plaintext).key_id == record.key_id
+    assert global_resolver.get_stats()["cache_hits"] == 1
+    assert _resolve_api_key("unknown-key") is None
+
+    manager.revoke_key(record.key_id)
+    assert _resolve_api_key(plaintext) is None
@@ -47,3 +47,183 @@ async def test_limiter_per_client():
     assert a1 is True and a2 is True
     b1, _ = await limiter.check("c1")
     assert b1 is False
+
+
+# --- Sliding window counter (shared by unified_auth and RedisRateLimiter) ---
+
+from omen.infrastructure.security.rate_limit import SlidingWindowRateLimiter
+from omen.infrastructure.security.redis_rate_limit import RedisRateLimiter
+from omen.infrastructure.security.unified_auth import RateLimiter
+
+
+def test_sliding_window_limits_within_window():
+    """limit requests pass in a window; the next is denied until it rolls."""
+    limiter = SlidingWindowRateLimiter()
+    results = [limiter.hit("k", 3, 60, now=1200.0 + i).allowed for i in range(4)]
+    assert results == [True, True, True, False]
+    assert limiter.remaining("k", 3, 60, now=1210.0) == 0
+
+
+def test_sliding_window_weights_previous_window():
+    """Half-way into the next window, half of the previous count still applies."""
+    limiter = SlidingWindowRateLimiter()
+    for _ in range(10):
+        assert limiter.hit("k", 10, 60, now=1200.0).allowed
+    # 30s into the next window: estimate 10 * 0.5 = 5
+    assert limiter.remaining("k", 10, 60, now=1290.0) == 5
+    allowed = [limiter.hit("k", 10, 60, now=1290.0).allowed for _ in range(6)]
+    assert allowed == [True] * 5 + [False]
+    # Two windows later the old counts are gone
+    assert limiter.remaining("k", 10, 60, now=1400.0) == 10
+
+
+def test_sliding_window_denied_requests_not_counted():
+    limiter = SlidingWindowRateLimiter()
+    for _ in range(2):
+        assert limiter.hit("k", 2, 60, now=1200.0).allowed
+    for _ in range(5):
+        assert not limiter.hit("k", 2, 60, now=1201.0).allowed
+    # Only the two allowed requests carry into the next window (2 * 0.5)
+    assert limiter.remaining("k", 2, 60, now=1290.0) == 1
+
+
+def test_sliding_window_memory_is_constant_per_key():
+    limiter = SlidingWindowRateLimiter()
+    for i in range(1000):
+        limiter.hit("k", 100_000, 60, now=1200.0 + i * 0.01)
+    assert limiter.get_stats() == {"tracked_keys": 1, "total_entries": 1}
+
+
+def test_sliding_window_sweeps_idle_keys():
+    limiter = SlidingWindowRateLimiter()
+    limiter.SWEEP_EVERY = 2
+    limiter.hit("idle", 10, 60, now=1200.0)
+    limiter.hit("busy", 10, 60, now=1400.0)
+    assert limiter.get_stats()["tracked_keys"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_check_matches_token_bucket_contract():
+    limiter = SlidingWindowRateLimiter(requests_per_window=1, window_seconds=60)
+    allowed, headers = await limiter.check("c1")
+    assert allowed is True
+    assert headers["X-RateLimit-Limit"] == "1"
+    assert headers["X-RateLimit-Remaining"] == "0"
+    allowed, headers = await limiter.check("c1")
+    assert allowed is False
+    assert int(headers["Retry-After"]) >= 1
+
+
+def test_unified_auth_rate_limiter_api():
+    limiter = RateLimiter()
+    assert limiter.is_allowed("key", 2, 60)
+    assert limiter.get_remaining("key", 2, 60) == 1
+    assert limiter.is_allowed("key", 2, 60)
+    assert not limiter.is_allowed("key", 2, 60)
+    assert limiter.get_remaining("other", 2, 60) == 2
+    assert limiter.get_stats()["tracked_keys"] == 1
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis"):
+        self._redis = redis
+        self._ops: list = []
+
+    def incr(self, key):
+        self._ops.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self._ops.append(("expire", key, seconds))
+
+    def get(self, key):
+        self._ops.append(("get", key))
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        return [getattr(self._redis, "_" + op[0])(*op[1:]) for op in self._ops]
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio for RedisRateLimiter (values as str)."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttl: dict[str, int] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def _incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def _expire(self, key, seconds):
+        self.ttl[key] = seconds
+        return True
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    async def decr(self, key):
+        self.round_trips += 1
+        self.data[key] = str(int(self.data.get(key, 0)) - 1)
+
+    async def mget(self, *keys):
+        self.round_trips += 1
+        return [self.data.get(k) for k in keys]
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for k in keys:
+            self.data.pop(k, None)
+
+
+def _redis_limiter(limit: int) -> RedisRateLimiter:
+    limiter = RedisRateLimiter(redis_url="redis://unused", requests_per_minute=limit)
+    limiter._redis = _FakeRedis()
+    limiter._initialized = True
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_one_round_trip_per_allowed_request(monkeypatch):
+    monkeypatch.setattr("omen.infrastructure.security.redis_rate_limit.time.time", lambda: 1200.0)
+    limiter = _redis_limiter(2)
+
+    assert (await limiter.is_allowed("c"))[0] is True
+    allowed, headers = await limiter.is_allowed("c")
+    assert allowed is True
+    assert limiter._redis.round_trips == 2
+    assert headers["X-RateLimit-Remaining"] == "0"
+    assert headers["X-RateLimit-Reset"] == "1260"
+
+    allowed, headers = await limiter.is_allowed("c")
+    assert allowed is False
+    assert "Retry-After" in headers
+    # Denied request is un-counted; the counter lives for two windows
+    assert limiter._redis.data == {"omen:ratelimit:c:20": "2"}
+    assert limiter._redis.ttl["omen:ratelimit:c:20"] == 120
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_matches_in_memory_limiter(monkeypatch):
+    """Same decisions as SlidingWindowRateLimiter for the same request times."""
+    clock = {"now": 0.0}
+    monkeypatch.setattr(
+        "omen.infrastructure.security.redis_rate_limit.time.time", lambda: clock["now"]
+    )
+    redis_limiter = _redis_limiter(5)
+    memory_limiter = SlidingWindowRateLimiter()
+
+    for i in range(60):
+        clock["now"] = 1200.0 + i * 4.5
+        from_redis = [(await redis_limiter.is_allowed("c"))[0] for _ in range(3)]
+        in_memory = [memory_limiter.hit("c", 5, 60, now=clock["now"]).allowed for _ in range(3)]
+        assert from_redis == in_memory
+
+    usage = await redis_limiter.get_usage("c")
+    assert usage["remaining"] == memory_limiter.remaining("c", 5, 60, now=clock["now"])
+
+    await redis_limiter.reset("c")
+    assert (await redis_limiter.get_usage("c"))["current_requests"] == 0
@@ -0,0 +1,192 @@
+"""Unit tests for RiskCast ReconcileJob replay (single pass, concurrent, shared client)."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from omen.domain.models.enums import SignalStatus, SignalType
+from omen.domain.models.impact_hints import ImpactHints
+from omen.domain.models.omen_signal import (
+    ConfidenceLevel,
+    GeographicContext,
+    OmenSignal,
+    SignalCategory,
+    TemporalContext,
+)
+from omen.domain.models.signal_event import SignalEvent
+from omen.infrastructure.ledger import LedgerWriter
+from riskcast.infrastructure.reconcile_state import ReconcileStateStore
+from riskcast.infrastructure.signal_store import SignalStore
+from riskcast.jobs.reconcile_job import LedgerClient, ReconcileJob, ReconcileStatus
+
+
+def _make_event(signal_id: str, emitted_at: datetime) -> SignalEvent:
+    signal = OmenSignal(
+        signal_id=signal_id,
+        source_event_id="reconcile-test",
+        trace_id=f"trace-{signal_id}",
+        title="Reconcile Test",
+        probability=0.5,
+        probability_source="test",
+        confidence_score=0.7,
+        confidence_level=ConfidenceLevel.MEDIUM,
+        confidence_factors={},
+        category=SignalCategory.OTHER,
+        geographic=GeographicContext(),
+        temporal=TemporalContext(),
+        impact_hints=ImpactHints(),
+        evidence=[],
+        ruleset_version="1.0.0",
+        generated_at=emitted_at,
+        signal_type=SignalType.UNCLASSIFIED,
+        status=SignalStatus.ACTIVE,
+    )
+    event = SignalEvent.from_omen_signal(
+        signal=signal,
+        input_event_hash="sha256:reconcile",
+        observed_at=emitted_at,
+    )
+    return event.model_copy(update={"emitted_at": emitted_at})
+
+
+async def _setup(tmp_path: Path, partitions: int, per_partition: int, processed: int):
+    writer = LedgerWriter(tmp_path / "ledger")
+    store = SignalStore(tmp_path / "signals.db")
+    dates = []
+    for d in range(partitions):
+        emitted_at = datetime.now(timezone.utc) - timedelta(days=d + 1)
+        dates.append(emitted_at.date().isoformat())
+        for i in range(per_partition):
+            event = writer.write(_make_event(f"OMEN-RC{d}-{i:03d}", emitted_at))
+            if i < processed:
+                await store.store(
+                    signal_id=event.signal_id,
+                    trace_id=event.deterministic_trace_id,
+                    source_event_id=event.source_event_id,
+                    ack_id=None,
+                    processed_at=emitted_at,
+                    emitted_at=emitted_at,
+                    source="hot_path",
+                    signal_data={},
+                )
+        writer.seal_partition(dates[-1])
+    return store, dates
+
+
+@pytest.mark.asyncio
+async def test_run_replays_missing_concurrently_over_one_client(tmp_path: Path):
+    """run(): every missing signal replayed once, with bounded concurrency and one client."""
+    store, dates = await _setup(tmp_path, partitions=2, per_partition=12, processed=2)
+    in_flight = 0
+    peak = 0
+    posted: list[str] = []
+    clients = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        posted.append(json.loads(request.content)["signal_id"])
+        return httpx.Response(200, json={"ack_id": "ack"})
+
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    job = ReconcileJob(
+        ledger_client=LedgerClient(str(tmp_path / "ledger")),
+        signal_store=store,
+        reconcile_store=ReconcileStateStore(tmp_path / "reconcile.db"),
+        riskcast_ingest_url="http://riskcast/api/v1/signals/ingest",
+        api_key="key",
+        max_concurrency=4,
+    )
+    with patch("riskcast.jobs.reconcile_job.httpx.AsyncClient", side_effect=client_factory):
+        results = await job.run(since_days=7)
+
+    assert [r.status for r in results] == [ReconcileStatus.COMPLETED] * 2
+    assert sorted(r.partition for r in results) == sorted(dates)
+    assert sum(r.replayed_count for r in results) == 20
+    assert len(posted) == len(set(posted)) == 20
+    assert 1 < peak <= 4
+    assert len(clients) == 1 and clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_reconcile_partition_caps_replay_and_reports_failures(tmp_path: Path):
+    """reconcile_partition(): cap respected, per-signal failures -> PARTIAL."""
+    store, dates = await _setup(tmp_path, partitions=1, per_partition=6, processed=0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        signal_id = json.loads(request.content)["signal_id"]
+        if signal_id.endswith("001"):
+            return httpx.Response(500)
+        if signal_id.endswith("002"):
+            return httpx.Response(409, json={"ack_id": "orig", "duplicate": True})
+        return httpx.Response(200, json={"ack_id": "ack"})
+
+    real_client = httpx.AsyncClient
+    job = ReconcileJob(
+        ledger_client=LedgerClient(str(tmp_path / "ledger")),
+        signal_store=store,
+        reconcile_store=ReconcileStateStore(tmp_path / "reconcile.db"),
+        riskcast_ingest_url="http://riskcast/api/v1/signals/ingest",
+        api_key="key",
+        max_replay_batch=4,
+    )
+    with patch(
+        "riskcast.jobs.reconcile_job.httpx.AsyncClient",
+        side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+    ):
+        result = await job.reconcile_partition(dates[0])
+
+    assert result.status == ReconcileStatus.PARTIAL
+    assert result.missing_count == 6
+    assert result.failed_ids == ["OMEN-RC0-001"]
+    assert sorted(result.replayed_ids) == ["OMEN-RC0-000", "OMEN-RC0-002", "OMEN-RC0-003"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reconcile_partition_calls_share_client_until_last_exits(tmp_path: Path):
+    """Direct concurrent reconcile_partition(): the first to finish must not close the client."""
+    store, dates = await _setup(tmp_path, partitions=2, per_partition=8, processed=0)
+    clients = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        signal_id = json.loads(request.content)["signal_id"]
+        # Partition 0 replays slowly, so partition 1 finishes while it is in flight
+        await asyncio.sleep(0.02 if signal_id.startswith("OMEN-RC0") else 0)
+        return httpx.Response(200, json={"ack_id": "ack"})
+
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    job = ReconcileJob(
+        ledger_client=LedgerClient(str(tmp_path / "ledger")),
+        signal_store=store,
+        reconcile_store=ReconcileStateStore(tmp_path / "reconcile.db"),
+        riskcast_ingest_url="http://riskcast/api/v1/signals/ingest",
+        api_key="key",
+        max_concurrency=2,
+    )
+    with patch("riskcast.jobs.reconcile_job.httpx.AsyncClient", side_effect=client_factory):
+        results = await asyncio.gather(*(job.reconcile_partition(d) for d in dates))
+
+    assert [r.status for r in results] == [ReconcileStatus.COMPLETED] * 2
+    assert [r.failed_ids for r in results] == [[], []]
+    assert len(clients) == 1 and clients[0].is_closed
+    assert job._client is None and job._sessions == 0
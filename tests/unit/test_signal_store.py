@@ -118,3 +118,74 @@ async def test_ack_id_uuid_no_collision(tmp_path: Path):
         )
         acks.add(ack)
     assert len(acks) == 5
+
+
+@pytest.mark.asyncio
+async def test_store_many_dedupes_per_signal_id(tmp_path: Path):
+    """store_many stores new ids in one call and returns original ack_id for duplicates."""
+    store = SignalStore(tmp_path / "signals.db")
+    now = datetime.utcnow()
+    first_ack = await store.store(
+        signal_id="OMEN-M1",
+        trace_id="t1",
+        source_event_id="e1",
+        ack_id=None,
+        processed_at=now,
+        emitted_at=now,
+        source="hot_path",
+        signal_data={},
+    )
+
+    def rec(signal_id: str) -> ProcessedSignal:
+        return ProcessedSignal(
+            signal_id=signal_id,
+            trace_id="t",
+            source_event_id="e",
+            ack_id="",
+            processed_at=now,
+            emitted_at=now,
+            source="hot_path",
+            signal_data={"id": signal_id},
+        )
+
+    results = await store.store_many([rec("OMEN-M1"), rec("OMEN-M2"), rec("OMEN-M2")])
+
+    assert results[0] == (first_ack, False)
+    assert results[1][1] is True and results[1][0].startswith("riskcast-ack-")
+    assert results[2] == (results[1][0], False)
+    ids = await store.list_processed_ids(now.date().isoformat())
+    assert sorted(ids) == ["OMEN-M1", "OMEN-M2"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_connection_and_survive_close(tmp_path: Path):
+    """Concurrent stores are acked after commit; duplicates fail alone; store reopens after close."""
+    import asyncio
+    import sqlite3
+
+    store = SignalStore(tmp_path / "signals.db", reader_pool_size=2)
+    now = datetime.utcnow()
+
+    async def store_one(signal_id: str):
+        return await store.store(
+            signal_id=signal_id,
+            trace_id="t",
+            source_event_id="e",
+            ack_id=None,
+            processed_at=now,
+            emitted_at=now,
+            source="hot_path",
+            signal_data={},
+        )
+
+    results = await asyncio.gather(
+        *[store_one(f"OMEN-C{i % 10}") for i in range(20)],
+        return_exceptions=True,
+    )
+    duplicates = [r for r in results if isinstance(r, sqlite3.IntegrityError)]
+    assert len(duplicates) == 10
+    assert len(await store.list_processed_ids(now.date().isoformat())) == 10
+
+    await store.close()
+    assert await store.count_by_source(now.date().isoformat()) == {"hot_path": 10}
+    await store.close()